@@ -16,6 +16,13 @@ USAGE:
     python main.py --help            # Show command-line options
     python main.py --demo            # Launch with demo data
     python main.py --symbol AAPL     # Analyze specific symbol (command-line mode)
+    python main.py --watchlist names.txt  # Scan a watchlist file concurrently
+    python main.py --watchlist names.txt --metrics-out metrics.prom --metrics-format prometheus
+    python main.py --symbol AAPL --record recordings/    # Capture live provider responses
+    python main.py --watchlist names.txt --replay recordings/ --replay-latency-scale 1  # Offline replay
+    python main.py --synthetic-universe 2000 --synthetic 42 --earnings --trading-decision  # Load test
+    python main.py --serve 127.0.0.1:8765 --earnings   # Resident JSON API with warm caches
+    python main.py --watchlist names.txt --schedule --trading-decision  # Analyze as entry windows open
 
 DISCLAIMER: 
 This software is provided solely for educational and research purposes. 
@@ -27,8 +34,11 @@ before making any investment decisions.
 
 import os
 import sys
+import json
+import time
 import logging
 import argparse
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -77,11 +87,12 @@ except ImportError as e:
     sys.exit(1)
 
 try:
-    from options_trader.core.analyzer import analyze_symbol
+    from options_trader.core.analyzer import analyze_symbol, analyze_watchlist
 except ImportError as e:
     print(f"Core analyzer not available: {e}")
     print("Some features may not work. Install missing dependencies with: pip install -r requirements.txt")
     analyze_symbol = None
+    analyze_watchlist = None
 
 try:
     from options_trader.gui.interface import run_gui
@@ -213,6 +224,203 @@ def analyze_symbol_cli(symbol: str, expirations: int = 2, demo: bool = False,
         print("Check the log file for more details.")
 
 
+def load_watchlist(path: str) -> list:
+    """
+    Load symbols from a watchlist file.
+    
+    Accepts one symbol per line and/or comma-separated symbols. Blank lines
+    and '#' comments are ignored.
+    
+    Args:
+        path: Path to the watchlist file
+        
+    Returns:
+        List of unique symbols in file order
+    """
+    symbols = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0]
+        for token in line.replace(",", " ").split():
+            symbol = token.strip().upper()
+            if symbol not in symbols:
+                symbols.append(symbol)
+    return symbols
+
+
+def analyze_watchlist_cli(watchlist_file: str, expirations: int = 2, demo: bool = False,
+                          earnings: bool = False, trade_construction: bool = False,
+                          position_sizing: bool = False, trading_decision: bool = False,
+                          structure: str = None, account_size: float = None,
+                          risk_per_trade: float = None, workers: int = None,
+                          output: str = None, symbols: list = None) -> None:
+    """
+    Scan a watchlist file and print one summary line per symbol as results arrive.
+    
+    Args:
+        watchlist_file: Path to the watchlist file
+        expirations: Number of expirations to check per symbol
+        demo: Use demo data
+        earnings: Include earnings analysis
+        trade_construction: Include trade construction & P&L analysis (Module 2)
+        position_sizing: Include position sizing & risk management (Module 3)
+        trading_decision: Include trading decision automation (Module 4)
+        structure: Trade structure preference ('calendar', 'straddle', 'auto')
+        account_size: Override account size for position sizing
+        risk_per_trade: Override risk per trade percentage
+        workers: Worker pool size (None for default)
+        output: Optional JSON Lines file receiving each full result
+        symbols: Symbols to scan instead of reading watchlist_file (which then only labels the scan)
+    """
+    if symbols is None:
+        try:
+            symbols = load_watchlist(watchlist_file)
+        except Exception as e:
+            print(f"❌ Could not read watchlist {watchlist_file}: {e}")
+            logger.error(f"Failed to read watchlist {watchlist_file}: {e}")
+            return
+    
+    if not symbols:
+        print(f"❌ Watchlist {watchlist_file} contains no symbols")
+        return
+    
+    print(f"\n📋 WATCHLIST SCAN - {len(symbols)} symbols from {watchlist_file}")
+    print("=" * 72)
+    
+    start_time = time.time()
+    completed = errors = recommended = 0
+    output_handle = open(output, "w", encoding="utf-8") if output else None
+    
+    try:
+        for symbol, result in analyze_watchlist(
+            symbols,
+            expirations_to_check=expirations,
+            use_demo=demo,
+            max_workers=workers,
+            include_earnings=earnings,
+            include_trade_construction=trade_construction,
+            include_position_sizing=position_sizing,
+            include_trading_decision=trading_decision,
+            trade_structure=structure,
+            account_size=account_size,
+            risk_per_trade=risk_per_trade
+        ):
+            completed += 1
+            
+            if output_handle:
+                output_handle.write(json.dumps({"symbol": symbol, "result": result}, default=str) + "\n")
+                output_handle.flush()
+            
+            if "error" in result:
+                errors += 1
+                print(f"[{completed:>4}/{len(symbols)}] {symbol:<8} ❌ {result['error']}")
+                continue
+            
+            calendar = result.get("calendar_spread_analysis", {})
+            signals = calendar.get("signal_count")
+            signal_text = f"{signals}/3" if signals is not None else "n/a"
+            decision = result.get("trading_decision", {}).get("decision")
+            if decision == "RECOMMENDED":
+                recommended += 1
+            
+            print(f"[{completed:>4}/{len(symbols)}] {symbol:<8} ${result['price']:>9.2f}  "
+                  f"signals {signal_text:<4} {decision or calendar.get('recommendation', calendar.get('error', ''))}")
+    finally:
+        if output_handle:
+            output_handle.close()
+    
+    elapsed = time.time() - start_time
+    print("=" * 72)
+    print(f"Scanned {completed} symbols in {elapsed:.1f}s ({errors} errors"
+          + (f", {recommended} recommended" if trading_decision else "") + ")")
+    if output:
+        print(f"Full results written to {output}")
+    print("⚠️  FOR EDUCATIONAL PURPOSES ONLY\n")
+
+
+def schedule_watchlist_cli(watchlist_file: str, expirations: int = 2, demo: bool = False,
+                           trade_construction: bool = False, position_sizing: bool = False,
+                           trading_decision: bool = False, structure: str = None,
+                           account_size: float = None, risk_per_trade: float = None,
+                           workers: int = None, output: str = None, symbols: list = None) -> None:
+    """
+    Track a watchlist and analyze each symbol when its earnings entry window opens.
+    
+    Runs until interrupted. Earnings analysis is always included since the
+    windows come from it.
+    
+    Args:
+        watchlist_file: Path to the watchlist file
+        expirations: Number of expirations to check per symbol
+        demo: Use demo data
+        trade_construction: Include trade construction & P&L analysis (Module 2)
+        position_sizing: Include position sizing & risk management (Module 3)
+        trading_decision: Include trading decision automation (Module 4)
+        structure: Trade structure preference ('calendar', 'straddle', 'auto')
+        account_size: Override account size for position sizing
+        risk_per_trade: Override risk per trade percentage
+        workers: Worker threads for due events (None for default)
+        output: Optional JSON Lines file receiving each entry analysis
+        symbols: Symbols to track instead of reading watchlist_file (which then only labels the run)
+    """
+    from options_trader.core.data_service import DataService
+    from options_trader.core.scheduler import EarningsWindowScheduler
+    
+    if symbols is None:
+        try:
+            symbols = load_watchlist(watchlist_file)
+        except Exception as e:
+            print(f"❌ Could not read watchlist {watchlist_file}: {e}")
+            logger.error(f"Failed to read watchlist {watchlist_file}: {e}")
+            return
+    
+    output_handle = open(output, "a", encoding="utf-8") if output else None
+    output_lock = threading.Lock()
+    
+    def on_entry(symbol: str, result: dict) -> None:
+        with output_lock:
+            if output_handle:
+                output_handle.write(json.dumps({"symbol": symbol, "result": result}, default=str) + "\n")
+                output_handle.flush()
+            if "error" in result:
+                print(f"{datetime.now():%H:%M:%S} ENTRY {symbol:<8} ❌ {result['error']}")
+                return
+            calendar = result.get("calendar_spread_analysis", {})
+            decision = result.get("trading_decision", {}).get("decision")
+            print(f"{datetime.now():%H:%M:%S} ENTRY {symbol:<8} ${result['price']:>9.2f}  "
+                  f"signals {calendar.get('signal_count', 'n/a')}/3 {decision or calendar.get('recommendation', '')}")
+    
+    def on_exit(symbol: str, windows) -> None:
+        print(f"{datetime.now():%H:%M:%S} EXIT  {symbol:<8} window open until {windows.exit_end:%H:%M %Z}")
+    
+    scheduler = EarningsWindowScheduler(
+        DataService(use_demo=demo),
+        symbols=symbols,
+        analysis_options=dict(
+            expirations_to_check=expirations, include_earnings=True,
+            include_trade_construction=trade_construction, include_position_sizing=position_sizing,
+            include_trading_decision=trading_decision, trade_structure=structure,
+            account_size=account_size, risk_per_trade=risk_per_trade
+        ),
+        on_entry=on_entry,
+        on_exit=on_exit,
+        max_workers=workers
+    )
+    print(f"\n⏰ EARNINGS SCHEDULER - tracking {scheduler.stats()['tracked']} symbols from {watchlist_file}")
+    print("Analysis runs as each entry window opens (Ctrl+C to stop)")
+    print("=" * 72)
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        scheduler.stop()
+    finally:
+        if output_handle:
+            output_handle.close()
+    stats = scheduler.stats()
+    print("=" * 72)
+    print(f"Scheduler stopped: {stats['fired']['entry']} entries, {stats['fired']['exit']} exits")
+    print("⚠️  FOR EDUCATIONAL PURPOSES ONLY\n")
+
+
 def _format_basic_output(result: dict, symbol: str, earnings: bool, trade_construction: bool, 
                         position_sizing: bool, trading_decision: bool) -> None:
     """
@@ -307,6 +515,28 @@ def _format_basic_output(result: dict, symbol: str, earnings: bool, trade_constr
     print(f"{'='*60}\n")
 
 
+def write_metrics(path: str, fmt: str = "json") -> None:
+    """
+    Dump cumulative stage/provider/cache metrics for this process.
+    
+    Args:
+        path: Destination file
+        fmt: 'json' or 'prometheus' (text exposition format)
+    """
+    from options_trader.providers.metrics import MetricsRegistry
+    
+    registry = MetricsRegistry.shared()
+    text = registry.to_prometheus() if fmt == "prometheus" else registry.to_json()
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"Metrics written to {path} ({fmt})")
+        logger.info(f"Metrics written to {path} ({fmt})")
+    except OSError as e:
+        print(f"❌ Could not write metrics to {path}: {e}")
+        logger.error(f"Failed to write metrics to {path}: {e}")
+
+
 def main():
     """Main entry point with command-line argument parsing."""
     parser = argparse.ArgumentParser(
@@ -316,6 +546,9 @@ def main():
     
     parser.add_argument("--version", action="store_true", help="Show version information")
     parser.add_argument("--symbol", type=str, help="Symbol to analyze (command-line mode)")
+    parser.add_argument("--watchlist", type=str, help="Watchlist file to scan (one symbol per line or comma-separated)")
+    parser.add_argument("--workers", type=int, help="Worker threads for --watchlist scans (default: 8)")
+    parser.add_argument("--output", type=str, help="Write full --watchlist results to this JSON Lines file")
     parser.add_argument("--expirations", type=int, default=2, help="Number of expirations to check (default: 2)")
     parser.add_argument("--demo", action="store_true", help="Use demo data instead of live APIs")
     parser.add_argument("--earnings", action="store_true", help="Include earnings analysis (Module 1)")
@@ -326,6 +559,21 @@ def main():
                        help="Trade structure: calendar (default), straddle, or auto-select")
     parser.add_argument("--account-size", type=float, help="Override account size for position sizing calculations")
     parser.add_argument("--risk-per-trade", type=float, help="Override risk per trade percentage (e.g., 0.02 for 2 percent)")
+    parser.add_argument("--metrics-out", type=str, help="Write cumulative timing histograms and counters to this file after the run")
+    parser.add_argument("--metrics-format", type=str, choices=["json", "prometheus"], default="json",
+                       help="Format for --metrics-out (default: json)")
+    parser.add_argument("--record", type=str, metavar="DIR", help="Record live provider responses to DIR")
+    parser.add_argument("--replay", type=str, metavar="DIR", help="Replay recorded provider responses from DIR (offline)")
+    parser.add_argument("--replay-latency", type=float, help="Fixed delay in seconds added to every replayed call")
+    parser.add_argument("--replay-latency-scale", type=float, help="Replay with this multiple of the recorded latencies")
+    parser.add_argument("--replay-error-rate", type=float, help="Fraction of replayed calls that fail (0-1)")
+    parser.add_argument("--synthetic", type=int, metavar="SEED", help="Use a deterministic synthetic market with this seed (no network)")
+    parser.add_argument("--synthetic-universe", type=int, metavar="N", help="Scan N generated symbols of the synthetic market (load testing)")
+    parser.add_argument("--synthetic-strikes", type=int, help="Strikes per expiration in the synthetic market (default: 120)")
+    parser.add_argument("--schedule", action="store_true",
+                        help="With --watchlist: keep running and analyze each symbol as its earnings entry window opens")
+    parser.add_argument("--serve", nargs="?", const="", metavar="ADDRESS",
+                        help="Run a resident analysis server (host:port, port or unix:/path; default 127.0.0.1:8765)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     
     args = parser.parse_args()
@@ -338,13 +586,104 @@ def main():
         print_version()
         return
     
+    # Record/replay settings are read by every DataService created below
+    for value, env_name in ((args.record, "PROVIDER_RECORD_DIR"), (args.replay, "PROVIDER_REPLAY_DIR"),
+                            (args.replay_latency, "REPLAY_LATENCY_SEC"),
+                            (args.replay_latency_scale, "REPLAY_LATENCY_SCALE"),
+                            (args.replay_error_rate, "REPLAY_ERROR_RATE"),
+                            (args.synthetic, "SYNTHETIC_MARKET_SEED"),
+                            (args.synthetic_strikes, "SYNTHETIC_STRIKES")):
+        if value is not None:
+            os.environ[env_name] = str(value)
+    
     logger.info("=" * 50)
     logger.info("Advanced Options Calculator starting")
     logger.info(f"Version: {__version__}")
     logger.info(f"Arguments: {sys.argv[1:]}")
     
+    watchlist_symbols = None
+    if args.synthetic_universe:
+        from options_trader.providers.synthetic import synthetic_universe
+        seed = args.synthetic if args.synthetic is not None else 0
+        os.environ.setdefault("SYNTHETIC_MARKET_SEED", str(seed))
+        watchlist_symbols = synthetic_universe(args.synthetic_universe, seed)
+        args.watchlist = f"synthetic universe (seed {seed})"
+    
     try:
-        if args.symbol:
+        if args.serve is not None:
+            # Resident API server mode
+            if analyze_symbol is None:
+                print("❌ Server mode is not available due to missing dependencies.")
+                print("Install required packages with: pip install -r requirements.txt")
+                sys.exit(1)
+            
+            from options_trader.core.server import run_server
+            logger.info(f"Running analysis server: {args.serve or 'default address'}")
+            run_server(
+                address=args.serve or None,
+                max_workers=args.workers,
+                defaults={
+                    "demo": args.demo,
+                    "expirations": args.expirations,
+                    "earnings": args.earnings,
+                    "trade_construction": getattr(args, 'trade_construction', False),
+                    "position_sizing": getattr(args, 'position_sizing', False),
+                    "trading_decision": getattr(args, 'trading_decision', False),
+                    "structure": getattr(args, 'structure', None),
+                    "account_size": getattr(args, 'account_size', None),
+                    "risk_per_trade": getattr(args, 'risk_per_trade', None)
+                }
+            )
+            if args.metrics_out:
+                write_metrics(args.metrics_out, args.metrics_format)
+        elif args.watchlist and args.schedule:
+            # Earnings window scheduler mode
+            if analyze_symbol is None:
+                print("❌ Scheduling is not available due to missing dependencies.")
+                print("Install required packages with: pip install -r requirements.txt")
+                sys.exit(1)
+            
+            logger.info(f"Running earnings scheduler: {args.watchlist}")
+            schedule_watchlist_cli(
+                watchlist_file=args.watchlist,
+                expirations=args.expirations,
+                demo=args.demo,
+                trade_construction=getattr(args, 'trade_construction', False),
+                position_sizing=getattr(args, 'position_sizing', False),
+                trading_decision=getattr(args, 'trading_decision', False),
+                structure=getattr(args, 'structure', None),
+                account_size=getattr(args, 'account_size', None),
+                risk_per_trade=getattr(args, 'risk_per_trade', None),
+                workers=args.workers,
+                output=args.output,
+                symbols=watchlist_symbols
+            )
+        elif args.watchlist:
+            # Batch watchlist mode
+            if analyze_watchlist is None:
+                print("❌ Watchlist scanning is not available due to missing dependencies.")
+                print("Install required packages with: pip install -r requirements.txt")
+                sys.exit(1)
+            
+            logger.info(f"Running watchlist scan: {args.watchlist}")
+            analyze_watchlist_cli(
+                watchlist_file=args.watchlist,
+                expirations=args.expirations,
+                demo=args.demo,
+                earnings=args.earnings,
+                trade_construction=getattr(args, 'trade_construction', False),
+                position_sizing=getattr(args, 'position_sizing', False),
+                trading_decision=getattr(args, 'trading_decision', False),
+                structure=getattr(args, 'structure', None),
+                account_size=getattr(args, 'account_size', None),
+                risk_per_trade=getattr(args, 'risk_per_trade', None),
+                workers=args.workers,
+                output=args.output,
+                symbols=watchlist_symbols
+            )
+            if args.metrics_out:
+                write_metrics(args.metrics_out, args.metrics_format)
+        elif args.symbol:
             # Command-line mode
             if analyze_symbol is None:
                 print("❌ Command-line analysis is not available due to missing dependencies.")
@@ -364,6 +703,8 @@ def main():
                 account_size=getattr(args, 'account_size', None),
                 risk_per_trade=getattr(args, 'risk_per_trade', None)
             )
+            if args.metrics_out:
+                write_metrics(args.metrics_out, args.metrics_format)
         else:
             # GUI mode
             if not HAS_GUI or run_gui is None:
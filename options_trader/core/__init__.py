@@ -9,6 +9,9 @@ Core modules for options trading analysis:
 - analysis: Volatility analysis and term structure modeling
 - earnings: Earnings calendar and timing window management
 - analyzer: Main symbol analysis orchestration
+- pipeline: Dependency-driven stage scheduler used by the analyzer
+- server: Resident analysis daemon with a local HTTP/JSON API
+- scheduler: Timer-heap scheduler acting on each symbol's earnings windows
 """
 
 # Always available imports
@@ -25,6 +28,14 @@ except ImportError as e:
     logger = logging.getLogger(__name__)
     logger.warning(f"Some analysis functions unavailable due to missing dependencies: {e}")
 
+try:
+    from .volatility import rolling_yang_zhang, realized_vol_term_structure, RollingYangZhang
+    __all__.extend(["rolling_yang_zhang", "realized_vol_term_structure", "RollingYangZhang"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Realized volatility engine unavailable due to missing dependencies: {e}")
+
 try:
     from .earnings import EarningsCalendar, EarningsEvent
     __all__.extend(["EarningsCalendar", "EarningsEvent"])
@@ -34,13 +45,45 @@ except ImportError as e:
     logger.warning(f"Earnings calendar unavailable due to missing dependencies: {e}")
 
 try:
-    from .analyzer import analyze_symbol
-    __all__.extend(["analyze_symbol"])
+    from .history_store import HistoryStore
+    __all__.extend(["HistoryStore"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"History store unavailable due to missing dependencies: {e}")
+
+try:
+    from .pipeline import Pipeline, PipelineAbort, PipelineRun, Stage
+    __all__.extend(["Pipeline", "PipelineAbort", "PipelineRun", "Stage"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Stage pipeline unavailable due to missing dependencies: {e}")
+
+try:
+    from .analyzer import analyze_symbol, analyze_watchlist
+    __all__.extend(["analyze_symbol", "analyze_watchlist"])
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
     logger.warning(f"Symbol analyzer unavailable due to missing dependencies: {e}")
 
+try:
+    from .server import AnalysisServer, run_server
+    __all__.extend(["AnalysisServer", "run_server"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Analysis server unavailable due to missing dependencies: {e}")
+
+try:
+    from .scheduler import EarningsWindowScheduler
+    __all__.extend(["EarningsWindowScheduler"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Earnings scheduler unavailable due to missing dependencies: {e}")
+
 # Module 2: Trade Construction & P&L Engine (conditional imports)
 try:
     from .trade_construction import CalendarTrade, CalendarTradeConstructor, OptionQuote, TradeValidator
@@ -58,6 +101,22 @@ except ImportError as e:
     logger = logging.getLogger(__name__)
     logger.warning(f"P&L engine module unavailable due to missing dependencies: {e}")
 
+try:
+    from .pricing import black_scholes, black_scholes_price, chain_greeks, BSResult
+    __all__.extend(["black_scholes", "black_scholes_price", "chain_greeks", "BSResult"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Pricing kernel unavailable due to missing dependencies: {e}")
+
+try:
+    from .vol_surface import VolSurface, SmileFit, fit_smile
+    __all__.extend(["VolSurface", "SmileFit", "fit_smile"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Volatility surface unavailable due to missing dependencies: {e}")
+
 try:
     from .greeks import Greeks, CalendarGreeks, GreeksCalculator, SensitivityAnalyzer
     __all__.extend(["Greeks", "CalendarGreeks", "GreeksCalculator", "SensitivityAnalyzer"])
@@ -83,6 +142,22 @@ except ImportError as e:
     logger = logging.getLogger(__name__)
     logger.warning(f"Risk management module unavailable due to missing dependencies: {e}")
 
+try:
+    from .position_store import PositionStore, PortfolioAggregate
+    __all__.extend(["PositionStore", "PortfolioAggregate"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Position store unavailable due to missing dependencies: {e}")
+
+try:
+    from .stress import PortfolioStressEngine, StressResult, calendar_legs, straddle_legs
+    __all__.extend(["PortfolioStressEngine", "StressResult", "calendar_legs", "straddle_legs"])
+except ImportError as e:
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Portfolio stress engine unavailable due to missing dependencies: {e}")
+
 try:
     from .account import AccountManager, AccountSettings, MarginValidation, CapitalAllocation
     __all__.extend(["AccountManager", "AccountSettings", "MarginValidation", "CapitalAllocation"])
@@ -12,16 +12,82 @@ Features:
 - Entry timing assessment for optimal trade execution
 - Configurable alert preferences and delivery methods
 - Integration with Modules 1-3 for complete trade analysis
+
+Scans run analyze_symbol (calendar metrics, earnings, trade construction,
+sizing and decision) concurrently across the watchlist on a shared
+DataService. Each symbol keeps a fingerprint of its last inputs: price
+bucket, ATM IV term structure bucket, next earnings date and the scan date.
+A rescan first recomputes the fingerprint from cached quotes and chains and
+re-runs the full pipeline only for symbols whose fingerprint changed; the
+others reuse their previous opportunities.
+
+Configuration (environment):
+- ALERT_PRICE_BUCKET_PCT: Price move that counts as changed input (default 0.01)
+- ALERT_IV_BUCKET: ATM IV change that counts as changed input (default 0.01)
+- ALERT_EARNINGS_TTL_SEC: Seconds an earnings lookup is reused (default 21600)
 """
 
+import os
+import math
+import time
 import logging
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 logger = logging.getLogger("options_trader.alerts")
 
+PRICE_BUCKET_PCT = float(os.getenv("ALERT_PRICE_BUCKET_PCT", "0.01"))
+IV_BUCKET = float(os.getenv("ALERT_IV_BUCKET", "0.01"))
+EARNINGS_TTL_SEC = float(os.getenv("ALERT_EARNINGS_TTL_SEC", str(6 * 3600)))
+DEFAULT_ALERT_WORKERS = 8
+
+# analyze_symbol options used by scans (all four modules)
+DEFAULT_ANALYSIS_OPTIONS = {
+    "expirations_to_check": 2,
+    "include_earnings": True,
+    "include_trade_construction": True,
+    "include_position_sizing": True,
+    "include_trading_decision": True
+}
+
+DECISION_ACTIONS = {"RECOMMENDED": "EXECUTE", "CONSIDER": "CONSIDER"}
+
+
+def input_fingerprint(price: float, atm_ivs: List[Tuple[str, Optional[float]]],
+                      earnings_key: Optional[str], as_of: date) -> Tuple:
+    """
+    Bucketed summary of the inputs a symbol's analysis depends on.
+
+    Args:
+        price: Underlying price
+        atm_ivs: (expiration, ATM IV) pairs in expiration order
+        earnings_key: Next earnings date and timing (None if unknown)
+        as_of: Scan date (days to expiration and earnings change daily)
+
+    Returns:
+        Hashable fingerprint; equal fingerprints mean the analysis can be reused
+    """
+    price_bucket = round(math.log(price) / math.log1p(PRICE_BUCKET_PCT)) if price and price > 0 else None
+    iv_buckets = tuple(
+        (expiration, round(iv / IV_BUCKET) if iv is not None and math.isfinite(iv) else None)
+        for expiration, iv in atm_ivs
+    )
+    return (as_of.isoformat(), price_bucket, iv_buckets, earnings_key)
+
+
+@dataclass
+class _SymbolState:
+    """Last scan inputs and results for one symbol."""
+    fingerprint: Optional[Tuple] = None
+    opportunities: List["TradingOpportunity"] = field(default_factory=list)
+    analysis: Optional[Dict[str, Any]] = None
+    earnings_key: Optional[str] = None
+    earnings_checked: float = 0.0
+
 
 @dataclass
 class TradingOpportunity:
@@ -84,43 +150,79 @@ class TradingAlertSystem:
     timely alerts with entry timing recommendations.
     """
     
-    def __init__(self, preferences: AlertPreferences = None):
-        """Initialize the trading alert system."""
+    def __init__(self, preferences: AlertPreferences = None, data_service=None,
+                 max_workers: Optional[int] = None, analysis_options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the trading alert system.
+        
+        Args:
+            preferences: Alert preferences (defaults if None)
+            data_service: DataService shared by every scan (created on first scan if None)
+            max_workers: Symbols analyzed concurrently (default: WATCHLIST_MAX_WORKERS env or 8)
+            analysis_options: analyze_symbol() keyword arguments (default: all modules, 2 expirations)
+        """
         self.logger = logging.getLogger(f"{__name__}.TradingAlertSystem")
         self.preferences = preferences or AlertPreferences()
         self.alert_history = []
         self.last_scan_time = None
+        self.last_scan_stats: Dict[str, Any] = {}
+        self.data_service = data_service
+        self.max_workers = max(1, int(max_workers or os.getenv("WATCHLIST_MAX_WORKERS", DEFAULT_ALERT_WORKERS)))
+        self.analysis_options = dict(analysis_options or DEFAULT_ANALYSIS_OPTIONS)
+        self._states: Dict[str, _SymbolState] = {}
+        self._lock = threading.Lock()
+        self._earnings_calendar = None
         
-    def scan_for_opportunities(self, watchlist: List[str] = None) -> List[TradingOpportunity]:
+    def scan_for_opportunities(self, watchlist: List[str] = None, force: bool = False) -> List[TradingOpportunity]:
         """
         Scan watchlist for trading opportunities.
         
+        Symbols are scanned concurrently. Only symbols whose input fingerprint
+        changed since the previous scan are re-analyzed (all of them when
+        force is True); the rest reuse their previous opportunities.
+        
         Args:
             watchlist: Optional list of symbols to scan. Uses preferences if None.
+            force: Re-analyze every symbol regardless of fingerprints
         
         Returns:
             List of TradingOpportunity objects found
         """
         try:
-            symbols_to_scan = watchlist or self.preferences.watchlist_symbols
+            symbols_to_scan = []
+            for raw_symbol in watchlist or self.preferences.watchlist_symbols:
+                symbol = (raw_symbol or "").strip().upper()
+                if symbol and symbol not in symbols_to_scan:
+                    symbols_to_scan.append(symbol)
             
             if not symbols_to_scan:
                 self.logger.warning("No symbols to scan - watchlist is empty")
                 return []
             
             self.logger.info(f"Scanning {len(symbols_to_scan)} symbols for trading opportunities")
+            start_time = time.perf_counter()
             
-            opportunities = []
+            if self.data_service is None:
+                from .data_service import DataService
+                self.data_service = DataService()
             
-            for symbol in symbols_to_scan:
-                try:
-                    # Scan for different types of opportunities
-                    symbol_opportunities = self._scan_symbol_opportunities(symbol)
+            opportunities = []
+            reevaluated = errors = 0
+            workers = min(self.max_workers, len(symbols_to_scan))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alerts") as executor:
+                scans = executor.map(lambda s: self._scan_symbol(s, force), symbols_to_scan)
+                for symbol, (symbol_opportunities, changed, failed) in zip(symbols_to_scan, scans):
                     opportunities.extend(symbol_opportunities)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to scan {symbol}: {e}")
-                    continue
+                    reevaluated += changed
+                    errors += failed
+            
+            self.last_scan_stats = {
+                "symbols": len(symbols_to_scan),
+                "reevaluated": reevaluated,
+                "reused": len(symbols_to_scan) - reevaluated,  # Failed symbols count as re-analyzed
+                "errors": errors,
+                "elapsed_sec": round(time.perf_counter() - start_time, 3)
+            }
             
             # Filter opportunities based on preferences
             filtered_opportunities = self._filter_opportunities(opportunities)
@@ -138,7 +240,9 @@ class TradingAlertSystem:
             self.last_scan_time = datetime.now().isoformat()
             
             self.logger.info(f"Scan complete: {len(filtered_opportunities)} opportunities found "
-                           f"from {len(opportunities)} total candidates")
+                           f"from {len(opportunities)} total candidates "
+                           f"({self.last_scan_stats['reevaluated']} re-analyzed, "
+                           f"{self.last_scan_stats['reused']} unchanged)")
             
             return filtered_opportunities
             
@@ -185,7 +289,7 @@ class TradingAlertSystem:
                 timing_factors.append("Weak signals - avoid entry")
                 timing_score -= 0.3
             
-            # Market conditions (simplified analysis)
+            # Market conditions from the symbol's latest analysis
             market_conditions = self._assess_market_conditions(opportunity.symbol)
             if market_conditions == "FAVORABLE":
                 timing_factors.append("Favorable market conditions")
@@ -306,73 +410,170 @@ class TradingAlertSystem:
             self.logger.error(f"Alert preference management failed: {e}")
             return self.preferences
     
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Forget stored fingerprints so the next scan re-analyzes (one symbol or all)."""
+        with self._lock:
+            if symbol is None:
+                self._states.clear()
+            else:
+                self._states.pop(symbol.strip().upper(), None)
+    
+    def _state(self, symbol: str) -> _SymbolState:
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is None:
+                state = self._states[symbol] = _SymbolState()
+            return state
+    
+    def _earnings_key(self, symbol: str, state: _SymbolState) -> Optional[str]:
+        """Next earnings date/timing, looked up at most every EARNINGS_TTL_SEC."""
+        if state.earnings_checked and time.monotonic() - state.earnings_checked < EARNINGS_TTL_SEC:
+            return state.earnings_key
+        if self._earnings_calendar is None:
+            from .earnings import EarningsCalendar
+            self._earnings_calendar = EarningsCalendar(self.data_service.get_earnings_providers())
+        event = self._earnings_calendar.get_next_earnings(symbol)
+        state.earnings_key = f"{event.date.date().isoformat()} {event.timing}" if event else None
+        state.earnings_checked = time.monotonic()
+        return state.earnings_key
+    
+    def _fingerprint(self, symbol: str, state: _SymbolState) -> Optional[Tuple]:
+        """Fingerprint a symbol's current inputs from (mostly cached) quotes and chains."""
+        from .analysis import summarize_chain_for_atm
+        
+        price, _, _ = self.data_service.get_price(symbol)
+        if price is None:
+            return None
+        expirations, _ = self.data_service.get_expirations(symbol, self.analysis_options.get("expirations_to_check", 1))
+        atm_ivs = []
+        for expiration in expirations:
+            chain, _ = self.data_service.get_chain(symbol, expiration)
+            atm_ivs.append((expiration, summarize_chain_for_atm(chain, price).get("atm_iv")))
+        return input_fingerprint(price, atm_ivs, self._earnings_key(symbol, state), date.today())
+    
+    def _scan_symbol(self, symbol: str, force: bool = False) -> Tuple[List[TradingOpportunity], bool, bool]:
+        """
+        Scan one symbol, re-analyzing only when its inputs changed.
+        
+        Returns:
+            (opportunities, re-analyzed, failed)
+        """
+        state = self._state(symbol)
+        try:
+            fingerprint = self._fingerprint(symbol, state)
+        except Exception as e:
+            self.logger.debug(f"Fingerprint unavailable for {symbol}, re-analyzing: {e}")
+            fingerprint = None
+        
+        if not force and fingerprint is not None and fingerprint == state.fingerprint:
+            return state.opportunities, False, False
+        
+        opportunities = self._scan_symbol_opportunities(symbol)
+        if state.analysis is None or "error" in state.analysis:
+            state.fingerprint = None  # Retry failed symbols on the next scan
+            return [], True, True
+        state.fingerprint = fingerprint
+        return opportunities, True, False
+    
     def _scan_symbol_opportunities(self, symbol: str) -> List[TradingOpportunity]:
-        """Scan a single symbol for trading opportunities."""
+        """Run the analysis pipeline for a symbol and derive its opportunities."""
+        from .analyzer import analyze_symbol
+        
         opportunities = []
+        state = self._state(symbol)
+        state.analysis = None
         
         try:
-            # In production, this would perform full Module 1-3 analysis
-            # For now, simulate opportunity detection
-            
-            # Simulate different opportunity types
-            opportunity_types = ["earnings_calendar", "high_signals", "time_decay"]
+            analysis = analyze_symbol(symbol, data_service=self.data_service, **self.analysis_options)
+            state.analysis = analysis
+            if "error" in analysis:
+                self.logger.warning(f"Analysis failed for {symbol}: {analysis['error']}")
+                state.opportunities = []
+                return []
             
-            for opp_type in opportunity_types:
-                # Simulate opportunity detection logic
-                if self._should_generate_opportunity(symbol, opp_type):
-                    opportunity = self._create_opportunity(symbol, opp_type)
-                    opportunities.append(opportunity)
+            for opp_type in ("earnings_calendar", "high_signals", "time_decay"):
+                if self._should_generate_opportunity(analysis, opp_type):
+                    opportunities.append(self._create_opportunity(symbol, opp_type, analysis))
             
         except Exception as e:
             self.logger.error(f"Symbol scanning failed for {symbol}: {e}")
         
+        state.opportunities = opportunities
         return opportunities
     
-    def _should_generate_opportunity(self, symbol: str, opportunity_type: str) -> bool:
-        """Determine if an opportunity should be generated for a symbol/type."""
-        # Simplified logic - in production would analyze real market data
-        symbol_hash = hash(symbol + opportunity_type)
-        probability = 0.15 + (abs(symbol_hash) % 10) / 100  # 15-25% chance
+    @staticmethod
+    def _entry_window_start(analysis: Dict[str, Any]) -> Optional[datetime]:
+        windows = analysis.get("earnings_analysis", {}).get("trading_windows")
+        if not windows:
+            return None
+        return datetime.fromisoformat(windows["entry_start"])
+    
+    def _should_generate_opportunity(self, analysis: Dict[str, Any], opportunity_type: str) -> bool:
+        """Determine if an analysis result qualifies as an opportunity of a type."""
+        calendar = analysis.get("calendar_spread_analysis", {})
+        signal_count = int(calendar.get("signal_count") or 0)
         
-        import random
-        return random.random() < probability
+        if opportunity_type == "earnings_calendar":
+            # Upcoming earnings entry window and at least one supporting signal
+            entry_start = self._entry_window_start(analysis)
+            if entry_start is None or signal_count < 1:
+                return False
+            return entry_start >= datetime.now(entry_start.tzinfo) - timedelta(minutes=15)
+        if opportunity_type == "high_signals":
+            return signal_count >= 2
+        if opportunity_type == "time_decay":
+            # Front month premium elevated (backwardated term structure)
+            return bool(calendar.get("ts_slope_signal"))
+        return False
     
-    def _create_opportunity(self, symbol: str, opportunity_type: str) -> TradingOpportunity:
-        """Create a trading opportunity for a symbol."""
-        # Generate realistic opportunity parameters
-        symbol_hash = abs(hash(symbol + opportunity_type))
+    def _create_opportunity(self, symbol: str, opportunity_type: str, analysis: Dict[str, Any]) -> TradingOpportunity:
+        """Create a trading opportunity from an analysis result."""
+        calendar = analysis.get("calendar_spread_analysis", {})
+        decision = analysis.get("trading_decision", {})
+        construction = analysis.get("trade_construction", {})
+        sizing = analysis.get("position_sizing", {})
+        windows = analysis.get("earnings_analysis", {}).get("trading_windows", {})
+        calendar_trade = construction.get("calendar_trade", {})
+        
+        signal_strength = int(calendar.get("signal_count") or 0)
+        confidence = float(decision.get("original_confidence", decision.get("enhanced_confidence", 0.0)) or 0.0)
         
-        signal_strength = 1 + (symbol_hash % 3)  # 1-3 signals
-        confidence = 0.4 + (symbol_hash % 50) / 100  # 40-90% confidence
-        days_to_exp = 3 + (symbol_hash % 15)  # 3-18 days
+        # Front expiration of the constructed trade, else the nearest analyzed one
+        expiration = calendar_trade.get("front_expiration")
+        if not expiration:
+            expiration = next((e["expiration"] for e in analysis.get("expirations", []) if "error" not in e), "")
+        days_to_exp = (date.fromisoformat(expiration) - date.today()).days if expiration else 0
         
-        # Determine urgency based on days to expiration and signal strength
-        if days_to_exp <= 5 and signal_strength >= 2:
+        # Urgency follows the earnings entry window, else the signals
+        entry_start = self._entry_window_start(analysis)
+        if entry_start is not None:
+            days_to_entry = (entry_start - datetime.now(entry_start.tzinfo)).total_seconds() / 86400
+        else:
+            days_to_entry = None
+        if days_to_entry is not None and days_to_entry <= 1 and signal_strength >= 2:
             urgency = "HIGH"
-        elif days_to_exp <= 10 or signal_strength >= 2:
-            urgency = "MEDIUM" 
+        elif (days_to_entry is not None and days_to_entry <= 5) or signal_strength >= 2:
+            urgency = "MEDIUM"
         else:
             urgency = "LOW"
         
-        # Generate reasoning based on opportunity type
         reasoning = []
         if opportunity_type == "earnings_calendar":
-            reasoning.append("Upcoming earnings event detected")
-            reasoning.append("Calendar spread setup identified")
+            earnings = analysis.get("earnings_analysis", {}).get("earnings_event", {})
+            reasoning.append(f"Earnings {earnings.get('date', '')[:10]} {earnings.get('timing', '')}".strip())
         elif opportunity_type == "high_signals":
-            reasoning.append(f"{signal_strength}/3 technical signals active")
-            reasoning.append("High-probability setup detected")
+            reasoning.append(f"{signal_strength}/3 strategy signals active")
         elif opportunity_type == "time_decay":
-            reasoning.append("Optimal time decay window for calendar spreads")
-            reasoning.append("Front month premium elevated")
+            slope = calendar.get("term_structure_slope")
+            reasoning.append(f"Front month premium elevated (term structure slope {slope:.5f})"
+                             if slope is not None else "Front month premium elevated")
+        if calendar.get("recommendation"):
+            reasoning.append(calendar["recommendation"])
+        reasoning.extend((decision.get("original_reasoning") or [])[:2])
         
-        # Generate action recommendation
-        if signal_strength >= 3 and confidence >= 0.7:
-            recommended_action = "EXECUTE"
-        elif signal_strength >= 2 and confidence >= 0.5:
-            recommended_action = "CONSIDER"
-        else:
-            recommended_action = "MONITOR"
+        recommended_action = DECISION_ACTIONS.get(decision.get("decision"), "MONITOR")
+        quality_score = construction.get("quality_assessment", {}).get("overall_score", decision.get("quality_score", 0.0))
+        position = sizing.get("recommended_position", {})
         
         return TradingOpportunity(
             symbol=symbol,
@@ -380,18 +581,18 @@ class TradingAlertSystem:
             signal_strength=signal_strength,
             confidence=confidence,
             urgency=urgency,
-            expiration_date=(datetime.now() + timedelta(days=days_to_exp)).strftime("%Y-%m-%d"),
+            expiration_date=expiration,
             days_to_expiration=days_to_exp,
-            expected_move=8.0 + (symbol_hash % 10),  # 8-18% expected move
-            risk_reward_ratio=1.5 + (symbol_hash % 15) / 10,  # 1.5-3.0 ratio
-            quality_score=60.0 + (symbol_hash % 30),  # 60-90 quality score
+            expected_move=float(calendar.get("expected_move_pct") or 0.0),
+            risk_reward_ratio=float(decision.get("risk_reward_ratio") or 0.0),
+            quality_score=float(quality_score or 0.0),
             alert_generated=datetime.now().isoformat(),
-            entry_window_start=datetime.now().strftime("%Y-%m-%d 15:45:00"),
-            entry_window_end=datetime.now().strftime("%Y-%m-%d 16:00:00"),
+            entry_window_start=windows.get("entry_start", ""),
+            entry_window_end=windows.get("entry_end", ""),
             reasoning=reasoning,
             recommended_action=recommended_action,
-            estimated_capital=500 + (symbol_hash % 1500),  # $500-$2000
-            max_position_size=50 + (symbol_hash % 150)  # 50-200 contracts
+            estimated_capital=float(position.get("capital_required") or 0.0),
+            max_position_size=int(position.get("contracts") or 0)
         )
     
     def _filter_opportunities(self, opportunities: List[TradingOpportunity]) -> List[TradingOpportunity]:
@@ -425,13 +626,14 @@ class TradingAlertSystem:
         return filtered
     
     def _assess_market_conditions(self, symbol: str) -> str:
-        """Assess current market conditions for timing purposes."""
-        # Simplified market conditions assessment
-        # In production, this would analyze VIX, market trends, etc.
+        """Assess volatility conditions from the symbol's latest scan analysis."""
+        state = self._states.get(symbol.strip().upper())
+        if state is None or not state.analysis or "error" in state.analysis:
+            return "NEUTRAL"
         
-        conditions = ["FAVORABLE", "NEUTRAL", "UNFAVORABLE"]
-        symbol_hash = abs(hash(symbol + datetime.now().strftime("%Y-%m-%d")))
-        return conditions[symbol_hash % 3]
+        calendar = state.analysis.get("calendar_spread_analysis", {})
+        elevated = bool(calendar.get("ts_slope_signal")) + bool(calendar.get("iv_rv_signal"))
+        return ("UNFAVORABLE", "NEUTRAL", "FAVORABLE")[elevated]
     
     def _send_console_alerts(self, opportunities: List[TradingOpportunity]) -> None:
         """Send alerts to console output."""
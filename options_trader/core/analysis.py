@@ -32,12 +32,8 @@ except ImportError:
     HAS_PANDAS = False
     pd = None
 
-try:
-    from scipy.interpolate import interp1d
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
-    interp1d = None
+from .volatility import rolling_yang_zhang
+from ..providers.chain import OptionChain
 
 logger = logging.getLogger("options_trader.analysis")
 
@@ -53,8 +49,8 @@ def build_term_structure(days: List[float], ivs: List[float]):
     Returns:
         Interpolation function or None if insufficient data
     """
-    if not HAS_NUMPY or not HAS_SCIPY:
-        logger.warning("Missing dependencies (numpy, scipy) for term structure analysis")
+    if not HAS_NUMPY:
+        logger.warning("Missing dependency (numpy) for term structure analysis")
         return None
         
     if len(days) < 2 or len(ivs) < 2:
@@ -70,17 +66,9 @@ def build_term_structure(days: List[float], ivs: List[float]):
     ivs = ivs[sort_idx]
     
     try:
-        # Create interpolation spline
-        spline = interp1d(days, ivs, kind='linear', fill_value="extrapolate")
-        
         def term_spline(dte: float) -> float:
-            """Get implied volatility for given days to expiry."""
-            if dte < days[0]:  
-                return float(ivs[0])
-            elif dte > days[-1]:
-                return float(ivs[-1])
-            else:  
-                return float(spline(dte))
+            """Get implied volatility for given days to expiry (flat beyond the end points)."""
+            return float(np.interp(dte, days, ivs))
         
         logger.debug(f"Built term structure with {len(days)} points from {days[0]:.1f} to {days[-1]:.1f} days")
         return term_spline
@@ -125,36 +113,12 @@ def yang_zhang_volatility(price_history) -> float:
             logger.warning("Insufficient clean data for Yang-Zhang calculation")
             return 0.0
             
-        # Yang-Zhang volatility calculation
-        o = np.log(df['Open'])
-        h = np.log(df['High'])
-        l = np.log(df['Low'])
-        c = np.log(df['Close'])
-        
-        # Overnight returns (close to next open)
-        overnight = o[1:].values - c[:-1].values
-        
-        # Close-to-open returns
-        co = o - c.shift(1)
-        co = co.dropna()
-        
-        # High-low variance
-        hl = h - l
-        
-        # Close-to-open variance
-        cc = c - o
-        
-        # Yang-Zhang estimator components
-        overnight_var = np.var(overnight, ddof=1) if len(overnight) > 1 else 0
-        co_var = np.var(co, ddof=1) if len(co) > 1 else 0
-        hl_var = np.mean(hl ** 2) if len(hl) > 0 else 0
-        cc_var = np.var(cc, ddof=1) if len(cc) > 1 else 0
-        
-        # Yang-Zhang volatility (annualized)
-        k = 0.34 / (1.34 + (len(df) + 1) / (len(df) - 1))
-        yz_var = overnight_var + k * co_var + (1 - k) * (hl_var + cc_var)
-        
-        volatility = np.sqrt(yz_var * 252)  # Annualized
+        # Single full-length window of the vectorized engine
+        window = len(df)
+        volatility = float(rolling_yang_zhang(
+            df['Open'].values, df['High'].values, df['Low'].values, df['Close'].values,
+            windows=(window,)
+        )[window][-1])
         logger.debug(f"Yang-Zhang volatility calculated: {volatility:.4f}")
         
         return volatility
@@ -306,51 +270,49 @@ def summarize_chain_for_atm(chain, price: float) -> Dict[str, Any]:
     Summarize option chain for at-the-money analysis.
     
     Args:
-        chain: Option chain object with .calls and .puts DataFrames
+        chain: OptionChain, or any object with .calls and .puts DataFrames
         price: Current underlying price
         
     Returns:
         Dictionary with ATM option summary
     """
     try:
-        from .utils import ensure_numeric_cols, nearest_strike_row
-        
-        calls = ensure_numeric_cols(chain.calls.copy())
-        puts = ensure_numeric_cols(chain.puts.copy())
+        chain = OptionChain.from_any(chain)
+        call_side, put_side = chain.call_side, chain.put_side
         
-        call_atm = nearest_strike_row(calls, price)
-        put_atm = nearest_strike_row(puts, price)
+        call_idx = call_side.nearest_index(price)
+        put_idx = put_side.nearest_index(price)
         
-        if call_atm is None or put_atm is None:
+        if call_idx is None or put_idx is None:
             return {"error": "Unable to locate ATM rows (calls/puts)."}
         
-        def _calculate_mid_price(row):
+        def _calculate_mid_price(side, idx):
             """Calculate mid price from bid/ask or use last price."""
-            bid = float(row.get("bid", np.nan))
-            ask = float(row.get("ask", np.nan))
+            bid = float(side.columns["bid"][idx])
+            ask = float(side.columns["ask"][idx])
             
             if np.isfinite(bid) and np.isfinite(ask) and ask >= bid:
                 return (bid + ask) / 2.0
             
-            last_price = row.get("lastPrice", np.nan)
-            return float(last_price) if np.isfinite(last_price) else np.nan
+            last_price = float(side.columns["lastPrice"][idx])
+            return last_price if np.isfinite(last_price) else np.nan
         
-        call_mid = _calculate_mid_price(call_atm)
-        put_mid = _calculate_mid_price(put_atm)
+        call_mid = _calculate_mid_price(call_side, call_idx)
+        put_mid = _calculate_mid_price(put_side, put_idx)
         
         straddle_mid = call_mid + put_mid if np.isfinite(call_mid) and np.isfinite(put_mid) else np.nan
         
         # Calculate average ATM IV
         ivs = [
-            float(call_atm.get("impliedVolatility", np.nan)), 
-            float(put_atm.get("impliedVolatility", np.nan))
+            float(call_side.columns["impliedVolatility"][call_idx]),
+            float(put_side.columns["impliedVolatility"][put_idx])
         ]
         ivs = [v for v in ivs if np.isfinite(v)]
         atm_iv = float(np.mean(ivs)) if ivs else np.nan
         
         result = {
-            "atm_strike_call": float(call_atm["strike"]),
-            "atm_strike_put": float(put_atm["strike"]),
+            "atm_strike_call": float(call_side.strikes[call_idx]),
+            "atm_strike_put": float(put_side.strikes[put_idx]),
             "call_mid": float(call_mid) if np.isfinite(call_mid) else None,
             "put_mid": float(put_mid) if np.isfinite(put_mid) else None,
             "straddle_mid": float(straddle_mid) if np.isfinite(straddle_mid) else None,
@@ -9,7 +9,7 @@ for strategy robustness testing and performance metrics calculation.
 
 Features:
 - Historical trade simulation with realistic execution assumptions
-- Monte Carlo analysis for strategy robustness
+- Monte Carlo analysis for strategy robustness (vectorized, seeded, optionally multi-process)
 - Performance metrics calculation (Sharpe ratio, max drawdown, etc.)
 - Strategy validation against performance thresholds
 """
@@ -21,6 +21,15 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import statistics
 import random
+from concurrent.futures import ProcessPoolExecutor
+
+# Conditional imports for optional dependencies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
 
 logger = logging.getLogger("options_trader.backtesting")
 
@@ -42,6 +51,21 @@ BACKTEST_PARAMETERS = {
     "volatility_regimes": ["low", "medium", "high"]  # Different VIX levels
 }
 
+# Monte Carlo configuration
+MC_MIN_TRADES = 50           # Trades per simulated path (inclusive range)
+MC_MAX_TRADES = 100
+MC_CHUNK_PATHS = 20_000      # Paths drawn per vectorized batch (bounds memory use)
+MC_POSITION_SIZE = 100       # Standardized contracts per simulated trade
+MC_RISK_FREE_RETURN = 0.02   # Per-trade hurdle used in the simplified Sharpe ratio
+
+# Per-path metrics summed across batches and averaged into the final result
+_MC_METRICS = (
+    "win_rate", "average_return", "total_return", "max_drawdown", "sharpe_ratio",
+    "calmar_ratio", "profit_factor", "gross_profit", "gross_loss",
+    "max_consecutive_wins", "max_consecutive_losses", "average_win", "average_loss",
+    "consistency_score", "trades", "winning_trades"
+)
+
 
 @dataclass
 class BacktestResult:
@@ -96,6 +120,112 @@ class TradeSimulation:
     hold_days: int
 
 
+def _max_run_length(flags):
+    """Longest run of True values along axis 1 of a boolean matrix."""
+    counts = np.cumsum(flags, axis=1)
+    resets = np.maximum.accumulate(np.where(flags, 0, counts), axis=1)
+    runs = counts - resets
+    return runs.max(axis=1) if runs.shape[1] else np.zeros(runs.shape[0], dtype=int)
+
+
+def monte_carlo_path_metrics(wins, returns, pnls, mask) -> Dict[str, Any]:
+    """
+    Vectorized per-path performance metrics for padded trade matrices.
+    
+    Mirrors BacktestingEngine._calculate_performance_metrics row by row.
+    
+    Args:
+        wins: Boolean matrix (paths x max_trades) of winning trades
+        returns: Matrix of per-trade returns (pnl_pct)
+        pnls: Matrix of per-trade dollar P&L
+        mask: Boolean matrix marking real trades (rows are left-aligned, padded with False)
+        
+    Returns:
+        Dict of metric name -> array with one value per path
+    """
+    n = mask.sum(axis=1)
+    n_safe = np.maximum(n, 1)
+    wins = wins & mask
+    losses = ~wins & mask
+    returns = np.where(mask, returns, 0.0)
+    pnls = np.where(mask, pnls, 0.0)
+    
+    win_count = wins.sum(axis=1)
+    loss_count = losses.sum(axis=1)
+    win_rate = win_count / n_safe
+    
+    gross_profit = np.where(wins, pnls, 0.0).sum(axis=1)
+    gross_loss = np.where(losses, pnls, 0.0).sum(axis=1)
+    abs_loss = np.abs(gross_loss)
+    profit_factor = np.divide(gross_profit, abs_loss, out=np.zeros_like(gross_profit), where=gross_loss != 0)
+    
+    total_return = returns.sum(axis=1)
+    average_return = total_return / n_safe
+    
+    # Drawdown on cumulative returns relative to the running peak
+    cumulative = np.cumsum(returns, axis=1)
+    peak = np.maximum.accumulate(cumulative, axis=1)
+    denom = 1.0 + peak
+    drawdown = np.divide(peak - cumulative, denom, out=np.zeros_like(cumulative), where=(peak != -1) & mask)
+    max_drawdown = np.maximum(drawdown.max(axis=1), 0.0)
+    
+    # Sharpe ratio (sample standard deviation)
+    deviations = np.where(mask, returns - average_return[:, None], 0.0)
+    variance = (deviations ** 2).sum(axis=1) / np.maximum(n - 1, 1)
+    stdev = np.where(n > 1, np.sqrt(variance), 0.0)
+    sharpe_ratio = np.divide(average_return - MC_RISK_FREE_RETURN, stdev,
+                             out=np.zeros_like(stdev), where=stdev > 0)
+    
+    calmar_ratio = np.divide(total_return, max_drawdown, out=np.zeros_like(total_return), where=max_drawdown > 0)
+    
+    average_win = np.divide(gross_profit, win_count, out=np.zeros_like(gross_profit), where=win_count > 0)
+    average_loss = np.divide(gross_loss, loss_count, out=np.zeros_like(gross_loss), where=loss_count > 0)
+    
+    consistency_score = np.minimum(np.minimum(win_rate, profit_factor / 2.0), 1.0 - max_drawdown)
+    
+    return {
+        "win_rate": win_rate,
+        "average_return": average_return,
+        "total_return": total_return,
+        "max_drawdown": max_drawdown,
+        "sharpe_ratio": sharpe_ratio,
+        "calmar_ratio": calmar_ratio,
+        "profit_factor": profit_factor,
+        "gross_profit": gross_profit,
+        "gross_loss": gross_loss,
+        "max_consecutive_wins": _max_run_length(wins),
+        "max_consecutive_losses": _max_run_length(losses),
+        "average_win": average_win,
+        "average_loss": average_loss,
+        "consistency_score": consistency_score,
+        "trades": n,
+        "winning_trades": win_count
+    }
+
+
+def _monte_carlo_batch(rng, n_paths: int, win_rate: float, avg_profit: float, avg_loss: float) -> Dict[str, Any]:
+    """Draw n_paths trade sequences as matrices and return per-path metrics."""
+    counts = rng.integers(MC_MIN_TRADES, MC_MAX_TRADES + 1, size=n_paths)
+    mask = np.arange(MC_MAX_TRADES)[None, :] < counts[:, None]
+    
+    wins = rng.random((n_paths, MC_MAX_TRADES)) < win_rate
+    variation = rng.random((n_paths, MC_MAX_TRADES))
+    returns = np.where(wins, avg_profit * (0.5 + variation), -avg_loss * (0.8 + variation * 0.4))
+    pnls = returns * MC_POSITION_SIZE * 100  # Assume $1 base price
+    
+    return monte_carlo_path_metrics(wins, returns, pnls, mask)
+
+
+def _monte_carlo_chunk(seed_sequence, n_paths: int, win_rate: float,
+                       avg_profit: float, avg_loss: float) -> Dict[str, float]:
+    """Simulate one chunk of paths and return metric sums (process-pool entry point)."""
+    rng = np.random.default_rng(seed_sequence)
+    metrics = _monte_carlo_batch(rng, n_paths, win_rate, avg_profit, avg_loss)
+    sums = {name: float(np.sum(values)) for name, values in metrics.items()}
+    sums["paths"] = float(n_paths)
+    return sums
+
+
 class BacktestingEngine:
     """
     Backtesting engine for historical strategy validation.
@@ -176,13 +306,23 @@ class BacktestingEngine:
             )
     
     def simulate_monte_carlo(self, trade_parameters: Dict[str, Any], 
-                           iterations: int = 1000) -> BacktestResult:
+                           iterations: int = 1000, seed: Optional[int] = None,
+                           workers: Optional[int] = None,
+                           chunk_paths: int = MC_CHUNK_PATHS) -> BacktestResult:
         """
         Run Monte Carlo simulation for strategy robustness testing.
         
+        Each iteration is a path of 50-100 simulated trades. Paths are drawn in
+        chunks as (paths x trades) matrices and scored with array operations.
+        Every chunk gets its own child of one numpy SeedSequence, so results for a
+        given seed are identical regardless of the worker count.
+        
         Args:
             trade_parameters: Trade parameters for simulation
-            iterations: Number of simulation iterations
+            iterations: Number of simulation iterations (paths)
+            seed: Optional seed for reproducible results
+            workers: Process count for splitting chunks (None or 1 runs in-process)
+            chunk_paths: Paths per vectorized chunk
         
         Returns:
             BacktestResult with Monte Carlo simulation results
@@ -190,18 +330,30 @@ class BacktestingEngine:
         try:
             self.logger.info(f"Starting Monte Carlo simulation: {iterations} iterations")
             
-            all_results = []
+            if not HAS_NUMPY:
+                return self._simulate_monte_carlo_python(trade_parameters, iterations, seed)
             
-            for i in range(iterations):
-                # Generate random trade sequence
-                trades = self._generate_monte_carlo_trades(trade_parameters)
-                
-                # Calculate metrics for this iteration
-                metrics = self._calculate_performance_metrics(trades)
-                all_results.append(metrics)
+            win_rate = trade_parameters.get("expected_win_rate", 0.60)
+            avg_profit = trade_parameters.get("avg_profit", 0.15)
+            avg_loss = trade_parameters.get("avg_loss", 0.07)
+            
+            chunk_paths = max(1, int(chunk_paths))
+            sizes = [chunk_paths] * (iterations // chunk_paths)
+            if iterations % chunk_paths:
+                sizes.append(iterations % chunk_paths)
+            seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+            
+            if workers and workers > 1 and len(sizes) > 1:
+                with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as pool:
+                    chunk_sums = list(pool.map(
+                        _monte_carlo_chunk, seeds, sizes,
+                        [win_rate] * len(sizes), [avg_profit] * len(sizes), [avg_loss] * len(sizes)
+                    ))
+            else:
+                chunk_sums = [_monte_carlo_chunk(child, size, win_rate, avg_profit, avg_loss)
+                              for child, size in zip(seeds, sizes)]
             
-            # Aggregate results across all iterations
-            aggregated_result = self._aggregate_monte_carlo_results(all_results)
+            aggregated_result = self._aggregate_monte_carlo_sums(chunk_sums)
             
             self.logger.info(f"Monte Carlo complete: {iterations} iterations, "
                            f"avg win rate: {aggregated_result.win_rate:.1%}")
@@ -215,6 +367,30 @@ class BacktestingEngine:
                 validation_errors=[f"Monte Carlo failed: {str(e)}"]
             )
     
+    def _simulate_monte_carlo_python(self, trade_parameters: Dict[str, Any],
+                                     iterations: int, seed: Optional[int] = None) -> BacktestResult:
+        """Pure-Python Monte Carlo used when numpy is unavailable."""
+        # Local generator so seeding never disturbs the interpreter-wide RNG
+        rng = random.Random(seed)
+        
+        all_results = []
+        
+        for i in range(iterations):
+            # Generate random trade sequence
+            trades = self._generate_monte_carlo_trades(trade_parameters, rng)
+            
+            # Calculate metrics for this iteration
+            metrics = self._calculate_performance_metrics(trades)
+            all_results.append(metrics)
+        
+        # Aggregate results across all iterations
+        aggregated_result = self._aggregate_monte_carlo_results(all_results)
+        
+        self.logger.info(f"Monte Carlo complete: {iterations} iterations, "
+                       f"avg win rate: {aggregated_result.win_rate:.1%}")
+        
+        return aggregated_result
+    
     def validate_strategy_robustness(self, backtest_result: BacktestResult) -> ValidationReport:
         """
         Validate strategy against performance thresholds.
@@ -368,10 +544,12 @@ class BacktestingEngine:
         
         return trades
     
-    def _generate_monte_carlo_trades(self, trade_parameters: Dict[str, Any]) -> List[TradeSimulation]:
-        """Generate trades for Monte Carlo simulation."""
+    def _generate_monte_carlo_trades(self, trade_parameters: Dict[str, Any],
+                                     rng: Optional[random.Random] = None) -> List[TradeSimulation]:
+        """Generate trades for Monte Carlo simulation (rng defaults to the module RNG)."""
+        rng = rng or random
         trades = []
-        num_trades = 50 + random.randint(0, 50)  # 50-100 trades per simulation
+        num_trades = rng.randint(MC_MIN_TRADES, MC_MAX_TRADES)  # 50-100 trades per simulation
         
         for i in range(num_trades):
             # Use trade parameters to generate realistic trades
@@ -379,14 +557,14 @@ class BacktestingEngine:
             avg_profit = trade_parameters.get("avg_profit", 0.15)
             avg_loss = trade_parameters.get("avg_loss", 0.07)
             
-            win = random.random() < win_rate
-            position_size = 100  # Standardized for Monte Carlo
+            win = rng.random() < win_rate
+            position_size = MC_POSITION_SIZE  # Standardized for Monte Carlo
             
             if win:
-                return_pct = avg_profit * (0.5 + random.random())  # Vary profits
+                return_pct = avg_profit * (0.5 + rng.random())  # Vary profits
                 pnl = return_pct * position_size * 100  # Assume $1 base price
             else:
-                return_pct = -avg_loss * (0.8 + random.random() * 0.4)  # Vary losses
+                return_pct = -avg_loss * (0.8 + rng.random() * 0.4)  # Vary losses
                 pnl = return_pct * position_size * 100
             
             trades.append(TradeSimulation(
@@ -449,7 +627,7 @@ class BacktestingEngine:
         
         # Sharpe ratio (simplified - assumes 2% risk-free rate)
         if returns and statistics.stdev(returns) > 0:
-            sharpe_ratio = (average_return - 0.02) / statistics.stdev(returns)
+            sharpe_ratio = (average_return - MC_RISK_FREE_RETURN) / statistics.stdev(returns)
         else:
             sharpe_ratio = 0.0
         
@@ -517,6 +695,38 @@ class BacktestingEngine:
             is_valid=True
         )
     
+    def _aggregate_monte_carlo_sums(self, chunk_sums: List[Dict[str, float]]) -> BacktestResult:
+        """Aggregate per-chunk metric sums from the vectorized Monte Carlo."""
+        paths = sum(chunk["paths"] for chunk in chunk_sums)
+        if not paths:
+            return BacktestResult(is_valid=False)
+        
+        totals = {name: sum(chunk[name] for chunk in chunk_sums) for name in _MC_METRICS}
+        means = {name: value / paths for name, value in totals.items()}
+        total_trades = int(totals["trades"])
+        winning_trades = int(totals["winning_trades"])
+        
+        return BacktestResult(
+            total_trades=total_trades,
+            winning_trades=winning_trades,
+            losing_trades=total_trades - winning_trades,
+            win_rate=means["win_rate"],
+            average_return=means["average_return"],
+            total_return=means["total_return"],
+            max_drawdown=means["max_drawdown"],
+            sharpe_ratio=means["sharpe_ratio"],
+            calmar_ratio=means["calmar_ratio"],
+            profit_factor=means["profit_factor"],
+            gross_profit=means["gross_profit"],
+            gross_loss=abs(means["gross_loss"]),
+            max_consecutive_wins=int(round(means["max_consecutive_wins"])),
+            max_consecutive_losses=int(round(means["max_consecutive_losses"])),
+            average_win=means["average_win"],
+            average_loss=abs(means["average_loss"]),
+            consistency_score=means["consistency_score"],
+            is_valid=True
+        )
+    
     def _random_date_between(self, start_date: str, end_date: str) -> str:
         """Generate random date between start and end dates."""
         # Simplified - would use proper date parsing in production
@@ -5,7 +5,7 @@ Data Service - Multi-Provider Orchestration
 ===========================================
 
 Orchestrates data retrieval from multiple providers with intelligent fallback logic.
-Handles price caching, rate limiting, and provider health monitoring.
+Handles price caching, per-provider rate limiting, and provider health monitoring.
 
 Provider priority order:
 1. Demo (if enabled)
@@ -19,15 +19,47 @@ Provider priority order:
 import os
 import json
 import time
+import atexit
 import logging
+import tempfile
 import threading
+import weakref
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from ..providers.base import PriceProvider, OptionsProvider, EarningsProvider
 from ..providers.demo import DemoProvider
 
+try:
+    from ..providers.synthetic import SyntheticMarketProvider, synthetic_provider_from_env
+except ImportError:
+    SyntheticMarketProvider = None
+
+try:
+    from ..providers.chain import OptionChain
+except ImportError:
+    OptionChain = None
+from ..providers.rate_limit import get_limiter, limiter_stats
+from ..providers.metrics import instrument_provider, record_cache
+from ..providers.replay import ReplayProvider, record_provider, recording_path, replay_options_from_env
+
 # Import other providers conditionally
+try:
+    from .history_store import HistoryStore
+except ImportError:
+    HistoryStore = None
+
+try:
+    from .vol_surface import VolSurface
+except ImportError:
+    VolSurface = None
+
+try:
+    from .pricing import fill_missing_iv, missing_iv_mask, days_to_expiry
+except ImportError:
+    fill_missing_iv = None
+
 try:
     from ..providers.yahoo import YahooProvider
 except ImportError:
@@ -52,105 +84,354 @@ logger = logging.getLogger("options_trader.data_service")
 
 # Cache configuration
 PRICE_CACHE_TTL_SEC = 300  # 5 minutes
-MIN_INTERVAL_BETWEEN_REQUESTS = 0.7
+PRICE_CACHE_STALE_TTL_SEC = 86400  # 24 hours, last-resort lookups
+PRICE_CACHE_MAX_AGE_SEC = PRICE_CACHE_STALE_TTL_SEC
+PRICE_CACHE_MAX_ENTRIES = int(os.getenv("PRICE_CACHE_MAX_ENTRIES", "5000"))
+PRICE_CACHE_FLUSH_INTERVAL_SEC = float(os.getenv("PRICE_CACHE_FLUSH_INTERVAL_SEC", "30"))
+CHAIN_CACHE_TTL_SEC = float(os.getenv("CHAIN_CACHE_TTL_SEC", "120"))
+CHAIN_CACHE_MAX_ENTRIES = int(os.getenv("CHAIN_CACHE_MAX_ENTRIES", "512"))
+VOL_SURFACE_TTL_SEC = float(os.getenv("VOL_SURFACE_TTL_SEC", str(CHAIN_CACHE_TTL_SEC)))
+# Live providers that can be recorded and replayed (see providers/replay.py)
+REPLAYABLE_PROVIDERS = ("yahoo", "alpha_vantage", "finnhub", "tradier")
 MAX_RETRIES = 3
 BASE_DELAY = 0.9
 
 
 class PriceCache:
-    """Thread-safe price caching with TTL."""
+    """
+    Thread-safe in-memory price cache with TTL, LRU eviction and write-behind persistence.
+    
+    The JSON file is read once when the cache is created. Lookups and updates only
+    touch memory; dirty state is flushed to disk by a background timer and at
+    interpreter exit, using an atomic temp-file rename so readers never see a
+    partially written file. Writes are serialized, so a slower flush can never
+    leave an older snapshot on disk after a newer one.
+    """
     
-    def __init__(self, cache_file: str = ".price_cache.json"):
-        """Initialize price cache with file persistence."""
+    _instances: Dict[str, "PriceCache"] = {}
+    _instances_lock = threading.Lock()
+    _live: "weakref.WeakSet[PriceCache]" = weakref.WeakSet()  # Flushed once at exit, not kept alive
+    
+    def __init__(self, cache_file: str = ".price_cache.json",
+                 max_entries: int = PRICE_CACHE_MAX_ENTRIES,
+                 max_age_sec: int = PRICE_CACHE_MAX_AGE_SEC,
+                 flush_interval_sec: float = PRICE_CACHE_FLUSH_INTERVAL_SEC):
+        """
+        Initialize price cache with file persistence.
+        
+        Args:
+            cache_file: JSON file used for persistence
+            max_entries: Maximum symbols kept before least-recently-used eviction
+            max_age_sec: Entries older than this are dropped (must cover stale lookups)
+            flush_interval_sec: Delay before dirty entries are written to disk
+        """
         self.cache_file = Path(cache_file)
+        self.max_entries = max(1, int(max_entries))
+        self.max_age_sec = max_age_sec
+        self.flush_interval_sec = flush_interval_sec
         self.lock = threading.Lock()
-        logger.debug(f"Price cache initialized: {self.cache_file}")
+        self._write_lock = threading.Lock()  # Serializes snapshot + disk write (taken before self.lock)
+        
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        
+        self._load_cache()
+        PriceCache._live.add(self)
+        logger.debug(f"Price cache initialized: {self.cache_file} ({len(self._entries)} entries)")
     
-    def _load_cache(self) -> Dict[str, Any]:
-        """Load cache from disk."""
+    @classmethod
+    def shared(cls, cache_file: str = ".price_cache.json") -> "PriceCache":
+        """Return the process-wide cache for a file so all DataService instances share it."""
+        key = str(Path(cache_file).resolve())
+        with cls._instances_lock:
+            cache = cls._instances.get(key)
+            if cache is None:
+                cache = cls(cache_file)
+                cls._instances[key] = cache
+            return cache
+    
+    @classmethod
+    def _flush_all(cls) -> None:
+        """Flush every cache still alive (registered once with atexit)."""
+        for cache in list(cls._live):
+            cache.flush()
+    
+    def _load_cache(self) -> None:
+        """Load cache from disk into memory (called once at startup)."""
         try:
             if not self.cache_file.exists():
-                return {}
+                return
             
             with open(self.cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+                data = json.load(f)
+            
+            now = time.time()
+            entries = []
+            for symbol, entry in data.items():
+                if not isinstance(entry, dict):
+                    continue
+                timestamp = entry.get("ts")
+                price = entry.get("price")
+                if isinstance(timestamp, (int, float)) and isinstance(price, (int, float)):
+                    if now - timestamp <= self.max_age_sec:
+                        entries.append((float(timestamp), symbol.upper(), float(price)))
+            
+            # Oldest first so the most recent quotes are the last to be evicted
+            for timestamp, symbol, price in sorted(entries)[-self.max_entries:]:
+                self._entries[symbol] = (price, timestamp)
                 
         except Exception as e:
             logger.warning(f"Failed to load price cache: {e}")
-            return {}
     
-    def _save_cache(self, cache: Dict[str, Any]) -> None:
-        """Save cache to disk."""
+    def _save_cache(self, snapshot: Dict[str, Any]) -> None:
+        """Atomically write a snapshot to disk."""
+        tmp_path = None
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache, f)
-                
+            directory = self.cache_file.parent
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{self.cache_file.name}.", suffix=".tmp",
+                                            dir=str(directory) if str(directory) else ".")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.cache_file)
+            tmp_path = None
+            
         except Exception as e:
             logger.warning(f"Failed to save price cache: {e}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def _schedule_flush(self) -> None:
+        """Arm the write-behind timer if it is not already pending (lock held)."""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval_sec, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self) -> None:
+        """Write dirty entries to disk now."""
+        # Snapshot and write under one write lock: concurrent flushes land in
+        # snapshot order, and lookups only wait on self.lock for the copy
+        with self._write_lock:
+            with self.lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                snapshot = {symbol: {"price": price, "ts": timestamp}
+                            for symbol, (price, timestamp) in self._entries.items()}
+                self._dirty = False
+            
+            self._save_cache(snapshot)
+        logger.debug(f"Flushed {len(snapshot)} cached prices to {self.cache_file}")
     
     def get_price(self, symbol: str, ttl_sec: int = PRICE_CACHE_TTL_SEC) -> Optional[float]:
         """Get cached price if still valid."""
+        key = symbol.upper()
         with self.lock:
-            try:
-                cache = self._load_cache()
-                entry = cache.get(symbol.upper())
-                
-                if not entry:
-                    return None
-                
-                timestamp = entry.get("ts")
-                price = entry.get("price")
-                
-                if isinstance(timestamp, (int, float)) and isinstance(price, (int, float)):
-                    age = time.time() - timestamp
-                    if age <= ttl_sec:
-                        logger.debug(f"Using cached price for {symbol}: ${price:.2f} (age={age:.1f}s)")
-                        return float(price)
-                
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                record_cache("price", "miss")
                 return None
-                
-            except Exception as e:
-                logger.warning(f"Cache lookup failed for {symbol}: {e}")
+            
+            price, timestamp = entry
+            age = time.time() - timestamp
+            
+            if age > self.max_age_sec:
+                del self._entries[key]
+                self._evictions += 1
+                self._schedule_flush()
+                self._misses += 1
+                record_cache("price", "miss")
                 return None
+            
+            if age > ttl_sec:
+                self._misses += 1
+                record_cache("price", "miss")
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            record_cache("price", "hit")
+        
+        logger.debug(f"Using cached price for {symbol}: ${price:.2f} (age={age:.1f}s)")
+        return price
     
     def set_price(self, symbol: str, price: float) -> None:
         """Cache a price with current timestamp."""
+        key = symbol.upper()
+        try:
+            value = float(price)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cache storage failed for {symbol}: {e}")
+            return
+        
         with self.lock:
-            try:
-                cache = self._load_cache()
-                cache[symbol.upper()] = {
-                    "price": float(price), 
-                    "ts": time.time()
-                }
-                self._save_cache(cache)
-                
-                logger.debug(f"Cached price for {symbol}: ${price:.2f}")
-                
-            except Exception as e:
-                logger.warning(f"Cache storage failed for {symbol}: {e}")
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            self._schedule_flush()
+        
+        logger.debug(f"Cached price for {symbol}: ${value:.2f}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return cache effectiveness counters."""
+        with self.lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "dirty": self._dirty
+            }
+
 
+atexit.register(PriceCache._flush_all)
 
-class RequestThrottler:
-    """Rate limiting for API requests."""
+
+class _InFlightFetch:
+    """A chain fetch in progress that concurrent callers can wait on."""
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ChainCache:
+    """
+    Thread-safe option chain cache keyed by (symbol, expiration).
+    
+    Entries expire after a TTL and the least recently used chain is evicted once
+    max_entries is reached. Concurrent requests for a key that is already being
+    fetched wait for that fetch instead of issuing their own, so each chain hits
+    the providers at most once per TTL window. Failed fetches are not cached.
+    """
     
-    def __init__(self, min_interval: float = MIN_INTERVAL_BETWEEN_REQUESTS):
-        """Initialize throttler with minimum interval."""
-        self.min_interval = min_interval
-        self.last_request_time = 0.0
+    def __init__(self, ttl_sec: float = CHAIN_CACHE_TTL_SEC, max_entries: int = CHAIN_CACHE_MAX_ENTRIES,
+                 name: str = "chain"):
+        """
+        Initialize chain cache.
+        
+        Args:
+            ttl_sec: Seconds a fetched chain stays valid (0 disables caching)
+            max_entries: Maximum chains kept before least-recently-used eviction
+            name: Cache name used in metrics
+        """
+        self.name = name
+        self.ttl_sec = ttl_sec
+        self.max_entries = max(1, int(max_entries))
         self.lock = threading.Lock()
+        
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, str, float]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], _InFlightFetch] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
     
-    def throttle(self) -> None:
-        """Enforce minimum interval between requests."""
+    def get_or_fetch(self, symbol: str, expiration: str, fetcher) -> Tuple[Any, str]:
+        """
+        Return a cached chain or fetch it once, sharing the result with concurrent callers.
+        
+        Args:
+            symbol: Stock symbol
+            expiration: Expiration date in 'YYYY-MM-DD' format
+            fetcher: Callable returning (chain, source) on a cache miss
+            
+        Returns:
+            Tuple of (chain_object, source_description)
+        """
+        key = (symbol.upper(), expiration)
+        
         with self.lock:
-            now = time.time()
-            elapsed = now - self.last_request_time
+            entry = self._entries.get(key)
+            if entry is not None:
+                chain, source, fetched_at = entry
+                if time.time() - fetched_at <= self.ttl_sec:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    record_cache(self.name, "hit")
+                    return chain, source
+                del self._entries[key]
+            
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = _InFlightFetch()
+                self._inflight[key] = pending
+                owner = True
+                self._misses += 1
+            else:
+                owner = False
+                self._coalesced += 1
+        record_cache(self.name, "miss" if owner else "coalesced")
+        
+        if not owner:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+        
+        try:
+            chain, source = fetcher()
+            pending.value = (chain, source)
             
-            if elapsed < self.min_interval:
-                sleep_time = self.min_interval - elapsed
-                logger.debug(f"Throttling: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+            if self.ttl_sec > 0:
+                with self.lock:
+                    self._entries[key] = (chain, source, time.time())
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                        self._evictions += 1
             
-            self.last_request_time = time.time()
+            return chain, source
+            
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self.lock:
+                self._inflight.pop(key, None)
+            pending.event.set()
+    
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop cached chains for one symbol, or all chains when symbol is None."""
+        with self.lock:
+            if symbol is None:
+                self._entries.clear()
+                return
+            symbol = symbol.upper()
+            for key in [k for k in self._entries if k[0] == symbol]:
+                del self._entries[key]
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return cache effectiveness counters."""
+        with self.lock:
+            lookups = self._hits + self._misses + self._coalesced
+            return {
+                "entries": len(self._entries),
+                "ttl_sec": self.ttl_sec,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "evictions": self._evictions,
+                "hit_rate": (self._hits + self._coalesced) / lookups if lookups else 0.0
+            }
 
 
 class DataService:
@@ -165,28 +446,73 @@ class DataService:
     Handles provider failures gracefully and implements retry logic.
     """
     
-    def __init__(self, use_demo: bool = False):
+    def __init__(self, use_demo: bool = False, chain_cache_ttl_sec: Optional[float] = None,
+                 record_dir: Optional[str] = None, replay_dir: Optional[str] = None,
+                 synthetic: Optional["SyntheticMarketProvider"] = None):
         """
         Initialize data service with all available providers.
         
         Args:
             use_demo: If True, use demo provider for all data (no API calls)
+            chain_cache_ttl_sec: Option chain cache TTL (defaults to CHAIN_CACHE_TTL_SEC, 0 disables)
+            record_dir: Record live provider responses here (default: PROVIDER_RECORD_DIR env)
+            replay_dir: Serve recorded responses from here instead of live providers
+                (default: PROVIDER_REPLAY_DIR env; REPLAY_* env vars set latency and errors)
+            synthetic: Serve all data from this synthetic market instead of demo/live
+                providers (default: built from SYNTHETIC_MARKET_SEED env when set)
         """
         # Initialize cache and throttling
-        self.price_cache = PriceCache()
-        self.throttler = RequestThrottler()
+        self.price_cache = PriceCache.shared()
+        self.chain_cache = ChainCache(
+            ttl_sec=CHAIN_CACHE_TTL_SEC if chain_cache_ttl_sec is None else chain_cache_ttl_sec
+        )
+        # Surfaces reuse the chain cache machinery, keyed by (symbol, expiration set)
+        self.surface_cache = ChainCache(ttl_sec=VOL_SURFACE_TTL_SEC, max_entries=CHAIN_CACHE_MAX_ENTRIES,
+                                        name="surface")
+        self.yahoo_limiter = get_limiter("yahoo")  # Other providers limit inside _make_request
         self.use_demo = use_demo
-        
-        # Initialize providers (with fallbacks for missing dependencies)
-        self.yahoo = YahooProvider() if YahooProvider else None
-        self.alpha_vantage = AlphaVantageProvider() if AlphaVantageProvider else None
-        self.finnhub = FinnhubProvider() if FinnhubProvider else None
-        self.tradier = TradierProvider() if TradierProvider else None
+        self.record_dir = record_dir if record_dir is not None else os.getenv("PROVIDER_RECORD_DIR") or None
+        self.replay_dir = replay_dir if replay_dir is not None else os.getenv("PROVIDER_REPLAY_DIR") or None
+        
+        if self.replay_dir and not use_demo:
+            self._init_replay_providers(self.replay_dir)
+        else:
+            # Initialize providers (with fallbacks for missing dependencies)
+            self.yahoo = YahooProvider() if YahooProvider else None
+            self.alpha_vantage = AlphaVantageProvider() if AlphaVantageProvider else None
+            self.finnhub = FinnhubProvider() if FinnhubProvider else None
+            self.tradier = TradierProvider() if TradierProvider else None
+            if self.record_dir and not use_demo:
+                for name in REPLAYABLE_PROVIDERS:
+                    record_provider(getattr(self, name), name, self.record_dir)
         self.demo = DemoProvider() if use_demo else None
         
-        logger.info(f"DataService initialized (demo_mode={use_demo})")
+        # A synthetic market takes the demo provider's place (no API calls)
+        if synthetic is None and SyntheticMarketProvider is not None:
+            synthetic = synthetic_provider_from_env()
+        if synthetic is not None:
+            self.demo = synthetic
+            self.use_demo = True
+        
+        # Time every provider call (per-run timings and cumulative histograms)
+        for name in ("yahoo", "alpha_vantage", "finnhub", "tradier", "demo"):
+            instrument_provider(getattr(self, name), name)
+        
+        logger.info(f"DataService initialized (demo_mode={self.use_demo}, synthetic={synthetic is not None})")
         self._log_provider_status()
     
+    def _init_replay_providers(self, directory: str) -> None:
+        """Replace every live provider with its recording (None when not recorded)."""
+        options = replay_options_from_env()
+        for name in REPLAYABLE_PROVIDERS:
+            provider = None
+            if os.path.exists(recording_path(directory, name)):
+                provider = ReplayProvider(name, directory, **options)
+            setattr(self, name, provider)
+        logger.info(f"Replaying recorded provider responses from {directory} "
+                    f"(latency={options['latency_sec']}s+{options['latency_scale']}x, "
+                    f"error_rate={options['error_rate']})")
+    
     def _log_provider_status(self) -> None:
         """Log which providers are available."""
         providers = []
@@ -235,7 +561,7 @@ class DataService:
         
         # 3. Yahoo Finance (primary free provider)
         if self.yahoo:
-            self.throttler.throttle()
+            self.yahoo_limiter.acquire()
             price, source = self.yahoo.get_price(symbol)
             if price is not None:
                 self.price_cache.set_price(symbol, price)
@@ -262,7 +588,7 @@ class DataService:
                 logger.warning(f"Finnhub price failed for {symbol}: {e}")
         
         # 6. Last resort: stale cache
-        stale_price = self.price_cache.get_price(symbol, ttl_sec=86400)  # 24 hours
+        stale_price = self.price_cache.get_price(symbol, ttl_sec=PRICE_CACHE_STALE_TTL_SEC)
         if stale_price is not None:
             logger.warning(f"Using stale cached price for {symbol}: ${stale_price:.2f}")
             return stale_price, "cache.stale", True
@@ -295,7 +621,7 @@ class DataService:
         
         # Try Yahoo first
         if self.yahoo:
-            self.throttler.throttle()
+            self.yahoo_limiter.acquire()
             expirations = self.yahoo.get_expirations(symbol, max_count)
             if expirations:
                 logger.debug(f"Yahoo expirations for {symbol}: {len(expirations)} found")
@@ -328,6 +654,13 @@ class DataService:
         """
         Get option chain with provider fallback.
         
+        Chains are cached per (symbol, expiration) for the chain cache TTL and
+        concurrent requests for the same chain share a single provider fetch.
+        Every provider's result is normalized to a columnar OptionChain, and
+        implied volatilities the provider left null or zero are solved from
+        quote mids before caching. Callers must treat the returned chain as
+        read-only.
+        
         Provider priority:
         1. Demo (if enabled)
         2. Yahoo Finance
@@ -346,6 +679,43 @@ class DataService:
         """
         symbol = symbol.upper().strip()
         
+        def fetch():
+            chain, source = self._fetch_chain(symbol, expiration)
+            if OptionChain is not None:
+                chain = OptionChain.from_any(chain, symbol, expiration)
+            return self._fill_missing_ivs(symbol, expiration, chain, source)
+        
+        return self.chain_cache.get_or_fetch(symbol, expiration, fetch)
+    
+    def _fill_missing_ivs(self, symbol: str, expiration: str, chain: Any, source: str) -> Tuple[Any, str]:
+        """Solve IVs the provider left null or zero from quote mids (before the chain is cached)."""
+        if fill_missing_iv is None or not isinstance(chain, OptionChain):
+            return chain, source
+        
+        try:
+            sides = [(name, chain.side(name)) for name in ("call", "put")]
+            sides = [(name, side) for name, side in sides
+                     if len(side) and missing_iv_mask(side.column("impliedVolatility")).any()]
+            if not sides:
+                return chain, source
+            
+            spot, _, _ = self.get_price(symbol)
+            if not spot:
+                return chain, source
+            
+            days = days_to_expiry(expiration)
+            for name, side in sides:
+                side.set_column("impliedVolatility", fill_missing_iv(
+                    side.column("impliedVolatility"), side.mid_prices(), spot, side.strikes, days, name
+                ))
+            logger.debug(f"Filled missing IVs for {symbol} {expiration} ({source})")
+        except Exception as e:
+            logger.warning(f"IV fill failed for {symbol} {expiration}: {e}")
+        
+        return chain, source
+    
+    def _fetch_chain(self, symbol: str, expiration: str) -> Tuple[Any, str]:
+        """Fetch an option chain from the first provider that returns one."""
         if self.demo:
             chain = self.demo.get_chain(symbol, expiration)
             return chain, "demo"
@@ -353,7 +723,7 @@ class DataService:
         # Try Yahoo first
         if self.yahoo:
             try:
-                self.throttler.throttle()
+                self.yahoo_limiter.acquire()
                 chain = self.yahoo.get_chain(symbol, expiration)
                 logger.debug(f"Yahoo chain for {symbol} {expiration} retrieved successfully")
                 return chain, "yahoo"
@@ -380,6 +750,101 @@ class DataService:
         
         raise RuntimeError(f"No provider could return option chain for {symbol} {expiration}")
     
+    def _yahoo_history(self, symbol: str, start):
+        """History store fetcher: Yahoo bars from start onward, within the Yahoo rate limit."""
+        self.yahoo_limiter.acquire()
+        return self.yahoo.get_history(symbol, start)
+    
+    def get_price_history(self, symbol: str, lookback_bars: int = 63):
+        """
+        Get recent daily OHLCV bars from the local history store.
+        
+        Only sessions missing from the store are requested from Yahoo, so repeat
+        calls on the same day make no network requests.
+        
+        Args:
+            symbol: Stock symbol
+            lookback_bars: Number of most recent daily bars to return (63 ~ 3 months)
+            
+        Returns:
+            DataFrame indexed by date with Open/High/Low/Close/Volume columns, or None
+        """
+        if self.demo:
+            # Synthetic markets generate their own history; plain demo data has none
+            if hasattr(self.demo, "get_history"):
+                return self.demo.get_history(symbol).iloc[-lookback_bars:]
+            return None
+        if not HistoryStore:
+            return None
+        
+        fetcher = self._yahoo_history if self.yahoo else None
+        try:
+            history = HistoryStore.shared().get_history(symbol, lookback_bars, fetcher=fetcher)
+        except Exception as e:
+            logger.warning(f"Price history unavailable for {symbol}: {e}")
+            return None
+        
+        if history is not None:
+            logger.debug(f"Retrieved {len(history)} days of price history for {symbol}")
+        return history
+    
+    def get_vol_surface(self, symbol: str, expirations: List[str], spot: Optional[float] = None):
+        """
+        Get the implied volatility surface fitted to all strikes of the given expirations.
+        
+        Surfaces are cached per (symbol, expiration set) for VOL_SURFACE_TTL_SEC, so
+        trade construction, Greeks and P&L all read the same IVs for one snapshot.
+        Chains come from get_chain and are therefore shared with the chain cache.
+        
+        Args:
+            symbol: Stock symbol
+            expirations: Expiration dates in 'YYYY-MM-DD' format
+            spot: Underlying price (looked up when None)
+            
+        Returns:
+            VolSurface, or None if the surface cannot be built
+        """
+        if VolSurface is None or not expirations:
+            return None
+        
+        symbol = symbol.upper().strip()
+        expirations = sorted(set(expirations))
+        
+        def build():
+            price = spot if spot else self.get_price(symbol)[0]
+            if not price:
+                raise RuntimeError(f"No price available for {symbol} volatility surface")
+            
+            chains = {}
+            for expiration in expirations:
+                try:
+                    chains[expiration] = self.get_chain(symbol, expiration)[0]
+                except Exception as e:
+                    logger.warning(f"Volatility surface skipping {symbol} {expiration}: {e}")
+            return VolSurface.from_chains(symbol, price, chains), "surface"
+        
+        try:
+            surface, _ = self.surface_cache.get_or_fetch(symbol, "|".join(expirations), build)
+        except Exception as e:
+            logger.warning(f"Volatility surface unavailable for {symbol}: {e}")
+            return None
+        return surface if surface else None
+    
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return price, option chain, surface and history store counters."""
+        stats = {
+            "price": self.price_cache.stats(),
+            "chain": self.chain_cache.stats(),
+            "surface": self.surface_cache.stats()
+        }
+        if HistoryStore:
+            stats["history"] = HistoryStore.shared().stats()
+        return stats
+    
+    def rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-provider rate limiter configuration and queue wait times."""
+        return limiter_stats()
+    
     def get_earnings_providers(self) -> List[EarningsProvider]:
         """
         Get list of available earnings providers for the EarningsCalendar.
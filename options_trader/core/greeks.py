@@ -17,7 +17,6 @@ Integrates with trade construction and P&L engines for comprehensive risk analys
 """
 
 import logging
-import math
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Tuple, Union
 
@@ -30,6 +29,7 @@ except ImportError:
     np = None
 
 from .trade_construction import CalendarTrade, OptionQuote
+from .pricing import black_scholes, chain_greeks
 
 logger = logging.getLogger("options_trader.greeks")
 
@@ -254,52 +254,46 @@ class GreeksCalculator:
             if t <= 0:
                 return self._expiration_greeks_bs(s, k, option_type)
             
-            # Black-Scholes d1 and d2
-            d1 = (math.log(s / k) + (r + 0.5 * vol * vol) * t) / (vol * math.sqrt(t))
-            d2 = d1 - vol * math.sqrt(t)
-            
-            # Normal PDF and CDF
-            nd1 = self._normal_cdf(d1)
-            nd2 = self._normal_cdf(d2)
-            npdf_d1 = self._normal_pdf(d1)
-            
-            if option_type.lower() == "call":
-                # Call Greeks
-                delta = nd1
-                gamma = npdf_d1 / (s * vol * math.sqrt(t))
-                theta = (-s * npdf_d1 * vol / (2 * math.sqrt(t)) - 
-                        r * k * math.exp(-r * t) * nd2) / 365  # Per day
-                vega = s * npdf_d1 * math.sqrt(t) / 100  # Per 1% IV change
-                rho = k * t * math.exp(-r * t) * nd2 / 100
-            else:
-                # Put Greeks
-                delta = nd1 - 1
-                gamma = npdf_d1 / (s * vol * math.sqrt(t))
-                theta = (-s * npdf_d1 * vol / (2 * math.sqrt(t)) + 
-                        r * k * math.exp(-r * t) * self._normal_cdf(-d2)) / 365  # Per day
-                vega = s * npdf_d1 * math.sqrt(t) / 100  # Per 1% IV change
-                rho = -k * t * math.exp(-r * t) * self._normal_cdf(-d2) / 100
-            
-            # Dollar exposures
-            delta_dollars = delta * s
-            theta_dollars = theta
-            vega_dollars = vega
+            bs = black_scholes(s, k, vol, t, r, option_type)
             
             return Greeks(
-                delta=delta,
-                gamma=gamma,
-                theta=theta,
-                vega=vega,
-                rho=rho,
-                delta_dollars=delta_dollars,
-                theta_dollars=theta_dollars,
-                vega_dollars=vega_dollars
+                delta=bs.delta,
+                gamma=bs.gamma,
+                theta=bs.theta,
+                vega=bs.vega,
+                rho=bs.rho,
+                delta_dollars=bs.delta * s,
+                theta_dollars=bs.theta,
+                vega_dollars=bs.vega
             )
             
         except Exception as e:
             self.logger.error(f"Black-Scholes Greeks calculation failed: {e}")
             return Greeks()
     
+    def calculate_chain_greeks(self, options_df, underlying_price: float,
+                               days_to_expiry: float, option_type: str = "call",
+                               overwrite: bool = False):
+        """
+        Calculate Greeks for a whole option chain in one vectorized call.
+        
+        Args:
+            options_df: Chain DataFrame with 'strike' and 'impliedVolatility' columns
+            underlying_price: Current underlying price
+            days_to_expiry: Days to expiration
+            option_type: 'call' or 'put' (or a per-row array)
+            overwrite: Replace provider-supplied Greeks instead of only filling gaps
+            
+        Returns:
+            Copy of the chain with theoPrice, delta, gamma, theta, vega and rho columns
+        """
+        try:
+            return chain_greeks(options_df, underlying_price, days_to_expiry,
+                                option_type, self.risk_free_rate, overwrite=overwrite)
+        except Exception as e:
+            self.logger.error(f"Chain Greeks calculation failed: {e}")
+            return options_df
+    
     def _calculate_approximate_greeks(self, option_quote: OptionQuote, 
                                     underlying_price: float, days_to_expiry: float) -> Greeks:
         """Calculate approximate Greeks using finite differences."""
@@ -389,37 +383,6 @@ class GreeksCalculator:
             theta_dollars=0.0,
             vega_dollars=0.0
         )
-    
-    def _normal_cdf(self, x: float) -> float:
-        """Approximation of normal cumulative distribution function."""
-        try:
-            # Abramowitz and Stegun approximation
-            sign = 1 if x >= 0 else -1
-            x = abs(x)
-            
-            # Constants
-            a1 =  0.254829592
-            a2 = -0.284496736
-            a3 =  1.421413741
-            a4 = -1.453152027
-            a5 =  1.061405429
-            p  =  0.3275911
-            
-            # A&S formula 7.1.26
-            t = 1.0 / (1.0 + p * x)
-            y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x)
-            
-            return 0.5 * (1.0 + sign * y)
-            
-        except Exception:
-            return 0.5
-    
-    def _normal_pdf(self, x: float) -> float:
-        """Normal probability density function."""
-        try:
-            return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
-        except Exception:
-            return 0.0
 
 
 class SensitivityAnalyzer:
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Historical Bar Store
+====================
+
+Local, incrementally updated store of daily OHLCV bars used for realized
+volatility and volume signals.
+
+Each symbol is kept as a NumPy structured array (<SYMBOL>.npy, loaded memory-
+mapped) plus a small JSON sidecar recording when the store was last checked
+against the provider. Only completed sessions are stored. A read makes zero
+network calls when the store already holds the most recent completed weekday
+session or was already checked today; otherwise only the missing days are
+requested and appended.
+
+Providers return bars back-adjusted for splits and dividends, so every append
+re-requests the last stored session as well. If the provider's value for that
+overlapping bar no longer matches the stored one, the history was re-adjusted
+since it was stored, and the symbol is rebuilt from a fresh download instead of
+mixing two adjustment bases in one series.
+
+Session dates are taken in exchange time (America/New_York), so a machine in
+another timezone does not treat an unfinished session as completed.
+
+Configuration (environment):
+- HISTORY_STORE_DIR: Directory for bar files (default .history_store)
+- HISTORY_MAX_BARS: Bars retained per symbol (default 504, ~2 years)
+"""
+
+import os
+import re
+import json
+import logging
+import tempfile
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from ..providers.metrics import record_cache
+
+try:
+    from zoneinfo import ZoneInfo
+    EXCHANGE_TZ = ZoneInfo("America/New_York")
+except Exception:
+    EXCHANGE_TZ = None  # No tz database: fall back to local dates
+
+# Conditional imports for optional dependencies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+    pd = None
+
+logger = logging.getLogger("options_trader.history_store")
+
+HISTORY_STORE_DIR = os.getenv("HISTORY_STORE_DIR", ".history_store")
+HISTORY_MAX_BARS = int(os.getenv("HISTORY_MAX_BARS", "504"))
+HISTORY_INITIAL_DAYS = 180  # Calendar days requested when a symbol is first seen
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9.^=-]{1,15}$")  # Ticker characters only: no path separators
+HISTORY_ADJUSTMENT_RTOL = 1e-4  # Overlap close change that marks a split/dividend re-adjustment
+
+BAR_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+BAR_DTYPE = [("date", "datetime64[D]"), ("open", "f8"), ("high", "f8"),
+             ("low", "f8"), ("close", "f8"), ("volume", "f8")] if HAS_NUMPY else None
+
+# fetcher(symbol, start_date) -> DataFrame indexed by date with BAR_COLUMNS
+HistoryFetcher = Callable[[str, date], Any]
+
+
+def validate_symbol(symbol: str) -> str:
+    """
+    Normalize a ticker symbol and check it is safe to use as a file name.
+
+    Args:
+        symbol: Stock symbol (case-insensitive, surrounding whitespace ignored)
+
+    Returns:
+        Upper-cased symbol
+
+    Raises:
+        ValueError: If the symbol has characters other than A-Z, 0-9 and . ^ = -
+            or is longer than 15 characters
+    """
+    normalized = str(symbol or "").strip().upper()
+    if not SYMBOL_PATTERN.match(normalized):
+        raise ValueError(f"Invalid symbol: {symbol!r}")
+    return normalized
+
+
+def exchange_today() -> date:
+    """Current date at the exchange (America/New_York)."""
+    return datetime.now(EXCHANGE_TZ).date() if EXCHANGE_TZ is not None else date.today()
+
+
+def last_completed_session(today: Optional[date] = None) -> date:
+    """Most recent weekday strictly before today (holidays are covered by checked_at)."""
+    day = (today or exchange_today()) - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+class HistoryStore:
+    """Per-symbol memory-mapped daily bar store with incremental updates."""
+
+    _instances: Dict[str, "HistoryStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: str = HISTORY_STORE_DIR, max_bars: int = HISTORY_MAX_BARS):
+        """
+        Initialize history store.
+
+        Args:
+            root: Directory holding <SYMBOL>.npy and <SYMBOL>.json files
+            max_bars: Bars retained per symbol (oldest are dropped)
+        """
+        if not HAS_NUMPY or not HAS_PANDAS:
+            raise ImportError("numpy and pandas are required for the history store")
+
+        self.root = Path(root)
+        self.max_bars = max(1, int(max_bars))
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self._fetches = 0
+        self._local_reads = 0
+        self._rebuilds = 0
+
+    @classmethod
+    def shared(cls, root: str = HISTORY_STORE_DIR) -> "HistoryStore":
+        """Return the process-wide store for a directory so per-symbol locks are shared."""
+        key = str(Path(root).resolve())
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls(root)
+                cls._instances[key] = store
+            return store
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._locks_lock:
+            lock = self._locks.get(symbol)
+            if lock is None:
+                lock = self._locks[symbol] = threading.Lock()
+            return lock
+
+    def _bars_path(self, symbol: str) -> Path:
+        return self.root / f"{validate_symbol(symbol)}.npy"
+
+    def _meta_path(self, symbol: str) -> Path:
+        return self.root / f"{validate_symbol(symbol)}.json"
+
+    def load_bars(self, symbol: str):
+        """Return the stored structured array for a symbol (memory-mapped), or an empty array."""
+        path = self._bars_path(symbol)
+        if not path.exists():
+            return np.empty(0, dtype=BAR_DTYPE)
+        try:
+            return np.load(path, mmap_mode="r")
+        except Exception as e:
+            logger.warning(f"Corrupt history file for {symbol}, ignoring: {e}")
+            return np.empty(0, dtype=BAR_DTYPE)
+
+    def _load_meta(self, symbol: str) -> Dict[str, Any]:
+        try:
+            with open(self._meta_path(symbol), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _atomic_write(self, path: Path, writer: Callable[[Any], None], binary: bool) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(self.root))
+        try:
+            with os.fdopen(fd, "wb" if binary else "w", **({} if binary else {"encoding": "utf-8"})) as f:
+                writer(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _save(self, symbol: str, bars, meta: Dict[str, Any]) -> None:
+        if bars is not None:
+            self._atomic_write(self._bars_path(symbol), lambda f: np.save(f, bars), binary=True)
+        self._atomic_write(self._meta_path(symbol), lambda f: json.dump(meta, f), binary=False)
+
+    @staticmethod
+    def _frame_to_bars(frame, after: Optional[date], before: date):
+        """Convert a provider DataFrame to structured bars dated within (after, before)."""
+        if frame is None or len(frame) == 0 or not all(col in frame.columns for col in BAR_COLUMNS):
+            return np.empty(0, dtype=BAR_DTYPE)
+
+        frame = frame[list(BAR_COLUMNS)].copy()
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        frame.index = index.normalize()
+
+        # Providers occasionally repeat a day; keep the last occurrence
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        frame = frame.dropna(subset=["Open", "High", "Low", "Close"])
+
+        days = frame.index.values.astype("datetime64[D]")
+        keep = days < np.datetime64(before)
+        if after is not None:
+            keep &= days > np.datetime64(after)
+
+        data = frame.to_numpy(dtype=float)[keep]
+        bars = np.empty(len(data), dtype=BAR_DTYPE)
+        bars["date"] = days[keep]
+        for i, name in enumerate(("open", "high", "low", "close", "volume")):
+            bars[name] = data[:, i]
+        return bars
+
+    def update(self, symbol: str, fetcher: HistoryFetcher, today: Optional[date] = None) -> int:
+        """
+        Append any missing completed sessions for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            fetcher: Callable returning bars from a start date onward
+            today: Override for the current exchange date (testing)
+
+        Returns:
+            Number of bars appended (0 when already current)
+
+        Raises:
+            ValueError: If the symbol is invalid (see validate_symbol), or it needs a
+                rebuild but the provider returned no bars
+        """
+        symbol = validate_symbol(symbol)
+        today = today or exchange_today()
+
+        with self._lock_for(symbol):
+            meta = self._load_meta(symbol)
+            bars = self.load_bars(symbol)
+            last_date = bars["date"][-1].astype(date) if len(bars) else None
+
+            if last_date is not None and last_date >= last_completed_session(today):
+                record_cache("history", "hit")
+                return 0
+            if meta.get("checked_date") == today.isoformat():
+                record_cache("history", "hit")
+                return 0
+
+            record_cache("history", "miss")
+            # Start at the last stored session so its bar can be compared
+            start = last_date if last_date else today - timedelta(days=HISTORY_INITIAL_DAYS)
+            self._fetches += 1
+            frame = fetcher(symbol, start)
+            new_bars = self._frame_to_bars(frame, last_date, today)
+
+            combined = None
+            if last_date is not None and self._readjusted(bars, frame, last_date):
+                logger.info(f"History store: {symbol} was re-adjusted for a split or dividend, rebuilding")
+                self._rebuilds += 1
+                self._fetches += 1
+                rebuilt = self._frame_to_bars(fetcher(symbol, bars["date"][0].astype(date)), None, today)
+                if not len(rebuilt):
+                    raise ValueError(f"Provider returned no bars to rebuild {symbol}")
+                combined = rebuilt[-self.max_bars:]
+                new_bars = rebuilt[rebuilt["date"] > np.datetime64(last_date)]
+            elif len(new_bars):
+                combined = np.concatenate([np.asarray(bars), new_bars])[-self.max_bars:]
+            del bars  # Release the memory map before replacing the file
+
+            meta.update({
+                "checked_date": today.isoformat(),
+                "checked_at": datetime.now().isoformat(timespec="seconds"),
+                "last_date": str(combined["date"][-1]) if combined is not None else meta.get("last_date")
+            })
+            self._save(symbol, combined, meta)
+
+            logger.debug(f"History store: appended {len(new_bars)} bars for {symbol}")
+            return len(new_bars)
+
+    def _readjusted(self, bars, frame, last_date: date) -> bool:
+        """Whether the provider's bar for the last stored session differs from the stored one."""
+        overlap = self._frame_to_bars(frame, last_date - timedelta(days=1), last_date + timedelta(days=1))
+        if not len(overlap):
+            return False  # Nothing to compare against (e.g. empty response)
+        return not np.isclose(overlap["close"][0], bars["close"][-1], rtol=HISTORY_ADJUSTMENT_RTOL, atol=0.0)
+
+    def get_history(self, symbol: str, lookback_bars: int = 63,
+                    fetcher: Optional[HistoryFetcher] = None, today: Optional[date] = None):
+        """
+        Return the most recent daily bars as a DataFrame, refreshing the store if stale.
+
+        Args:
+            symbol: Stock symbol
+            lookback_bars: Number of most recent bars to return
+            fetcher: Provider callback for missing days (None reads the store only)
+            today: Override for the current exchange date (testing)
+
+        Returns:
+            DataFrame indexed by date with Open/High/Low/Close/Volume columns, or None if empty
+
+        Raises:
+            ValueError: If the symbol is invalid (see validate_symbol)
+        """
+        symbol = validate_symbol(symbol)
+        if fetcher is not None:
+            try:
+                self.update(symbol, fetcher, today)
+            except Exception as e:
+                logger.warning(f"History update failed for {symbol}, using stored bars: {e}")
+
+        with self._lock_for(symbol):
+            self._local_reads += 1
+            bars = np.array(self.load_bars(symbol)[-lookback_bars:])
+
+        if not len(bars):
+            return None
+
+        return pd.DataFrame(
+            {column: bars[name] for column, name in zip(BAR_COLUMNS, ("open", "high", "low", "close", "volume"))},
+            index=pd.DatetimeIndex(bars["date"].astype("datetime64[ns]"), name="Date")
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return read, provider fetch and adjustment rebuild counters."""
+        return {"reads": self._local_reads, "provider_fetches": self._fetches, "rebuilds": self._rebuilds}
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stage-Graph Pipeline
+====================
+
+Small dependency-driven executor for multi-stage analyses.
+
+A pipeline is a set of named stages, each declaring the values it consumes
+(inputs, optional_inputs) and the values it may produce (outputs). The graph
+is validated once at construction (unique producers, no cycles). A run then:
+
+- starts every stage whose inputs are available, concurrently on a bounded
+  thread pool, as soon as they become available
+- skips stages that were not enabled for the run, and stages whose required
+  inputs can no longer be produced (producer skipped, failed or emitted
+  nothing)
+- waits for optional inputs to settle, so a stage sees them when their
+  producer runs and gets None when it does not
+- times every stage individually and reports each result to listeners
+
+A stage may raise PipelineAbort to stop the run early with a final result
+(e.g. no price available); stages already running are allowed to finish and
+the earliest-declared aborting stage wins. Other exceptions fail only that
+stage and its dependents.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..providers.metrics import record_stage
+
+logger = logging.getLogger("options_trader.pipeline")
+
+# Stage statuses
+STAGE_OK = "ok"
+STAGE_FAILED = "failed"
+STAGE_SKIPPED = "skipped"
+STAGE_ABORTED = "aborted"
+
+DEFAULT_PIPELINE_WORKERS = 4
+
+
+class PipelineAbort(Exception):
+    """Raised by a stage to end the run early with a final result."""
+
+    def __init__(self, result: Any):
+        super().__init__("pipeline aborted")
+        self.result = result
+
+
+@dataclass
+class Stage:
+    """
+    One node of the stage graph.
+
+    func is called as func(context, **inputs) and returns a dict of outputs
+    (a subset of the declared outputs) or None. Missing optional inputs are
+    passed as None.
+    """
+    name: str
+    func: Callable[..., Optional[Dict[str, Any]]]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    optional_inputs: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageResult:
+    """Outcome and timing of one stage in one run."""
+    name: str
+    status: str
+    seconds: float = 0.0
+    error: Optional[BaseException] = None
+    reason: str = ""
+
+
+@dataclass
+class PipelineRun:
+    """Values and per-stage results of one pipeline run."""
+    values: Dict[str, Any]
+    results: Dict[str, StageResult] = field(default_factory=dict)
+    aborted: Optional[PipelineAbort] = None
+    aborted_by: str = ""
+    total_seconds: float = 0.0
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Stage name -> wall seconds, for stages that ran."""
+        return {name: r.seconds for name, r in self.results.items() if r.status != STAGE_SKIPPED}
+
+    def failed(self, *names: str) -> Optional[StageResult]:
+        """First failed result among the named stages (any stage if none named)."""
+        for name, result in self.results.items():
+            if result.status == STAGE_FAILED and (not names or name in names):
+                return result
+        return None
+
+
+class Pipeline:
+    """Dependency-driven stage scheduler."""
+
+    def __init__(self, stages: Iterable[Stage], name: str = "pipeline",
+                 max_workers: int = DEFAULT_PIPELINE_WORKERS):
+        """
+        Validate the stage graph.
+
+        Args:
+            stages: Stages in declaration order (used to break ties deterministically)
+            name: Pipeline name used in logs and listener callbacks
+            max_workers: Maximum stages running at once
+
+        Raises:
+            ValueError: Duplicate stage names or outputs, or a dependency cycle
+        """
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.stages: List[Stage] = list(stages)
+        self._order = {stage.name: i for i, stage in enumerate(self.stages)}
+        if len(self._order) != len(self.stages):
+            raise ValueError(f"Duplicate stage names in {name}")
+
+        self.producers: Dict[str, Stage] = {}
+        for stage in self.stages:
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(f"Output '{output}' produced by both {self.producers[output].name} and {stage.name}")
+                self.producers[output] = stage
+
+        self._check_acyclic()
+        self._listeners: List[Callable[[str, StageResult], None]] = []
+        self._listeners_lock = threading.Lock()
+
+    def _dependencies(self, stage: Stage) -> List[Stage]:
+        return [self.producers[v] for v in stage.inputs + stage.optional_inputs if v in self.producers]
+
+    def _check_acyclic(self) -> None:
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(stage: Stage, path: List[str]) -> None:
+            if state.get(stage.name) == 2:
+                return
+            if state.get(stage.name) == 1:
+                raise ValueError(f"Dependency cycle in {self.name}: {' -> '.join(path + [stage.name])}")
+            state[stage.name] = 1
+            for dependency in self._dependencies(stage):
+                visit(dependency, path + [stage.name])
+            state[stage.name] = 2
+
+        for stage in self.stages:
+            visit(stage, [])
+
+    def add_listener(self, listener: Callable[[str, StageResult], None]) -> None:
+        """Register a callback invoked as listener(pipeline_name, stage_result) after every stage."""
+        with self._listeners_lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, StageResult], None]) -> None:
+        """Unregister a listener added with add_listener."""
+        with self._listeners_lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, result: StageResult) -> None:
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(self.name, result)
+            except Exception as e:
+                logger.warning(f"Pipeline listener failed for {self.name}.{result.name}: {e}")
+
+    def run(self, context: Any = None, initial: Optional[Dict[str, Any]] = None,
+            enabled: Optional[Iterable[str]] = None) -> PipelineRun:
+        """
+        Execute the graph.
+
+        Args:
+            context: Object passed as the first argument to every stage
+            initial: Values available before any stage runs
+            enabled: Names of stages to run (None runs every stage)
+
+        Returns:
+            PipelineRun with all produced values and per-stage results
+        """
+        run = PipelineRun(values=dict(initial or {}))
+        enabled_names = set(self._order) if enabled is None else set(enabled)
+        pending = [s for s in self.stages if s.name in enabled_names]
+        for stage in self.stages:
+            if stage.name not in enabled_names:
+                self._finish(run, StageResult(stage.name, STAGE_SKIPPED, reason="not requested"))
+
+        started = time.perf_counter()
+        running: Dict[Any, Stage] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        try:
+            while pending or running:
+                if run.aborted is None:
+                    pending = self._schedule(run, pending, running, executor, context)
+                else:
+                    for stage in pending:
+                        self._finish(run, StageResult(stage.name, STAGE_SKIPPED, reason="run aborted"))
+                    pending = []
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: self._order[running[f].name]):
+                    stage = running.pop(future)
+                    self._collect(run, stage, future.result())
+        finally:
+            executor.shutdown(wait=True)
+
+        run.total_seconds = time.perf_counter() - started
+        if logger.isEnabledFor(logging.DEBUG):
+            timing = ", ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in run.timings.items())
+            logger.debug(f"{self.name} finished in {run.total_seconds * 1000:.1f}ms ({timing})")
+        return run
+
+    def _available(self, run: PipelineRun, value: str) -> Optional[bool]:
+        """True if value exists, False if it can no longer be produced, None if still pending."""
+        if value in run.values:
+            return True
+        producer = self.producers.get(value)
+        if producer is None or producer.name in run.results:
+            return False
+        return None
+
+    def _schedule(self, run: PipelineRun, pending: List[Stage], running: Dict[Any, Stage],
+                  executor: ThreadPoolExecutor, context: Any) -> List[Stage]:
+        """Start ready stages, skip unreachable ones; returns stages still waiting."""
+        progressed = True
+        while progressed:
+            progressed = False
+            waiting = []
+            for stage in pending:
+                required = [self._available(run, v) for v in stage.inputs]
+                if False in required:
+                    missing = [v for v, ok in zip(stage.inputs, required) if ok is False]
+                    self._finish(run, StageResult(stage.name, STAGE_SKIPPED, reason=f"missing {', '.join(missing)}"))
+                    progressed = True  # Skipping can settle other stages' inputs
+                elif None in required or None in (self._available(run, v) for v in stage.optional_inputs):
+                    waiting.append(stage)
+                else:
+                    kwargs = {v: run.values[v] for v in stage.inputs}
+                    kwargs.update({v: run.values.get(v) for v in stage.optional_inputs})
+                    # Each stage runs in a copy of the caller's context so per-run metrics follow it
+                    ctx = contextvars.copy_context()
+                    running[executor.submit(ctx.run, self._execute, stage, context, kwargs)] = stage
+            pending = waiting
+        return pending
+
+    @staticmethod
+    def _execute(stage: Stage, context: Any, kwargs: Dict[str, Any]):
+        start = time.perf_counter()
+        try:
+            outputs = stage.func(context, **kwargs)
+            return outputs, None, time.perf_counter() - start
+        except Exception as e:
+            return None, e, time.perf_counter() - start
+
+    def _collect(self, run: PipelineRun, stage: Stage, outcome) -> None:
+        outputs, error, seconds = outcome
+        if isinstance(error, PipelineAbort):
+            # Stages already running finish first; the earliest-declared abort wins
+            if run.aborted is None or self._order[stage.name] < self._order[run.aborted_by]:
+                run.aborted, run.aborted_by = error, stage.name
+            self._finish(run, StageResult(stage.name, STAGE_ABORTED, seconds))
+            return
+        if error is not None:
+            logger.warning(f"{self.name} stage {stage.name} failed: {error}")
+            self._finish(run, StageResult(stage.name, STAGE_FAILED, seconds, error=error))
+            return
+
+        outputs = outputs or {}
+        unexpected = set(outputs) - set(stage.outputs)
+        if unexpected:
+            error = ValueError(f"Stage {stage.name} produced undeclared outputs: {sorted(unexpected)}")
+            self._finish(run, StageResult(stage.name, STAGE_FAILED, seconds, error=error))
+            return
+        run.values.update(outputs)
+        self._finish(run, StageResult(stage.name, STAGE_OK, seconds))
+
+    def _finish(self, run: PipelineRun, result: StageResult) -> None:
+        run.results[result.name] = result
+        record_stage(self.name, result.name, result.seconds, result.status)
+        self._notify(result)
@@ -11,7 +11,7 @@ Core Components:
 - PnLEngine: Main simulation engine with IV crush modeling
 - IVCrushModel: Configurable IV crush parameter management
 - ScenarioGenerator: Price and volatility scenario creation
-- PnLGrid: Results visualization and analysis
+- PnLGrid: Array-backed results grid (price x IV crush x time decay)
 
 Integrates seamlessly with existing Module 1 architecture.
 """
@@ -38,6 +38,7 @@ except ImportError:
     pd = None
 
 from .trade_construction import CalendarTrade, OptionQuote
+from .pricing import black_scholes_price, DAYS_PER_YEAR
 
 logger = logging.getLogger("options_trader.pnl_engine")
 
@@ -74,45 +75,114 @@ class PnLScenario:
     spread_value: float
     pnl: float
     pnl_pct: float
-    
-    
+    days_elapsed: float = 1.0  # Time decay applied before revaluation
+
+
+# PnLScenario field -> grid array name
+_SCENARIO_FIELDS = {
+    "price_change_pct": "price_change_pct",
+    "new_underlying_price": "new_price",
+    "iv_crush_scenario": "iv_scenario",
+    "front_iv_after": "front_iv_after",
+    "back_iv_after": "back_iv_after",
+    "front_option_value": "front_option_value",
+    "back_option_value": "back_option_value",
+    "spread_value": "spread_value",
+    "pnl": "pnl",
+    "pnl_pct": "pnl_pct",
+    "days_elapsed": "days_elapsed",
+}
+
+
 class PnLGrid:
-    """P&L simulation results grid with analysis methods."""
+    """
+    P&L simulation results grid with analysis methods.
+    
+    Results are held as flat, equally sized NumPy arrays (one element per
+    scenario). PnLScenario objects are only built when `scenarios` is accessed,
+    so large grids can be summarized and exported without per-cell objects.
+    A grid can also be built from a list of PnLScenario objects.
+    """
     
-    def __init__(self, scenarios: List[PnLScenario], trade: CalendarTrade):
-        self.scenarios = scenarios
+    def __init__(self, scenarios: Optional[List[PnLScenario]], trade: CalendarTrade,
+                 arrays: Optional[Dict[str, Any]] = None,
+                 grid_shape: Optional[Tuple[int, int, int]] = None):
         self.trade = trade
+        self.grid_shape = grid_shape  # (price steps, IV levels, decay days) for cube views
         self.logger = logging.getLogger("options_trader.pnl_grid")
+        self._scenarios = list(scenarios) if scenarios is not None else None
+        self._arrays = arrays
+        
+        if self._scenarios is None and self._arrays is None:
+            self._scenarios = []
+    
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, Any], trade: CalendarTrade,
+                    grid_shape: Optional[Tuple[int, int, int]] = None) -> 'PnLGrid':
+        """Build a grid from flat result arrays keyed by grid array name."""
+        return cls(None, trade, arrays=arrays, grid_shape=grid_shape)
+    
+    @property
+    def arrays(self) -> Dict[str, Any]:
+        """Flat result arrays (built from scenarios on first access if needed)."""
+        if self._arrays is None:
+            scenarios = self._scenarios or []
+            if HAS_NUMPY:
+                self._arrays = {
+                    name: np.array([getattr(sc, field) for sc in scenarios],
+                                   dtype=object if name == "iv_scenario" else float)
+                    for field, name in _SCENARIO_FIELDS.items()
+                }
+            else:
+                self._arrays = {name: [getattr(sc, field) for sc in scenarios]
+                                for field, name in _SCENARIO_FIELDS.items()}
+        return self._arrays
+    
+    @property
+    def scenarios(self) -> List[PnLScenario]:
+        """Scenario dataclass views, materialized on demand."""
+        if self._scenarios is None:
+            arrays = self._arrays
+            columns = {field: arrays[name] for field, name in _SCENARIO_FIELDS.items()}
+            self._scenarios = [
+                PnLScenario(**{
+                    field: (values[i] if field == "iv_crush_scenario" else float(values[i]))
+                    for field, values in columns.items()
+                })
+                for i in range(len(self))
+            ]
+        return self._scenarios
+    
+    def __len__(self) -> int:
+        if self._arrays is not None:
+            return len(self._arrays["pnl"])
+        return len(self._scenarios or [])
     
     def to_dataframe(self) -> Optional[pd.DataFrame]:
         """Convert scenarios to pandas DataFrame."""
-        if not HAS_PANDAS or not self.scenarios:
+        if not HAS_PANDAS or len(self) == 0:
             return None
-            
-        data = []
-        for scenario in self.scenarios:
-            data.append({
-                'price_change_pct': scenario.price_change_pct,
-                'new_price': scenario.new_underlying_price,
-                'iv_scenario': scenario.iv_crush_scenario,
-                'front_iv_after': scenario.front_iv_after,
-                'back_iv_after': scenario.back_iv_after,
-                'spread_value': scenario.spread_value,
-                'pnl': scenario.pnl,
-                'pnl_pct': scenario.pnl_pct
-            })
-        
-        return pd.DataFrame(data)
+        
+        arrays = self.arrays
+        return pd.DataFrame({
+            'price_change_pct': arrays['price_change_pct'],
+            'new_price': arrays['new_price'],
+            'iv_scenario': arrays['iv_scenario'],
+            'front_iv_after': arrays['front_iv_after'],
+            'back_iv_after': arrays['back_iv_after'],
+            'days_elapsed': arrays['days_elapsed'],
+            'spread_value': arrays['spread_value'],
+            'pnl': arrays['pnl'],
+            'pnl_pct': arrays['pnl_pct']
+        })
     
     def get_summary_stats(self) -> Dict[str, float]:
         """Calculate summary statistics from scenarios."""
-        if not self.scenarios:
+        if len(self) == 0:
             return {}
         
-        pnls = [s.pnl for s in self.scenarios]
-        pnl_pcts = [s.pnl_pct for s in self.scenarios]
-        
         if not HAS_NUMPY:
+            pnls = list(self.arrays["pnl"])
             # Basic statistics without numpy
             return {
                 'max_profit': max(pnls),
@@ -122,8 +192,7 @@ class PnLGrid:
                 'total_scenarios': len(pnls)
             }
         
-        pnls_array = np.array(pnls)
-        pnl_pcts_array = np.array(pnl_pcts)
+        pnls_array = np.asarray(self.arrays["pnl"], dtype=float)
         
         return {
             'max_profit': float(np.max(pnls_array)),
@@ -134,14 +203,32 @@ class PnLGrid:
             'percentile_25': float(np.percentile(pnls_array, 25)),
             'percentile_75': float(np.percentile(pnls_array, 75)),
             'profit_scenarios': int(np.sum(pnls_array > 0)),
-            'total_scenarios': len(pnls),
-            'win_rate': float(np.sum(pnls_array > 0) / len(pnls))
+            'total_scenarios': len(pnls_array),
+            'win_rate': float(np.sum(pnls_array > 0) / len(pnls_array))
         }
     
+    def pnl_cube(self) -> Optional[Any]:
+        """P&L reshaped to (price, iv, days) when the grid came from simulate_scenario_grid."""
+        if not HAS_NUMPY or self.grid_shape is None:
+            return None
+        return np.asarray(self.arrays["pnl"], dtype=float).reshape(self.grid_shape)
+    
     def get_expected_move_pnl(self, expected_move_pct: float) -> Dict[str, float]:
         """Get P&L at expected move boundaries."""
         results = {}
         
+        if HAS_NUMPY:
+            price_changes = np.asarray(self.arrays["price_change_pct"], dtype=float)
+            pnls = np.asarray(self.arrays["pnl"], dtype=float)
+            near = np.abs(np.abs(price_changes) - expected_move_pct) < 0.5  # Within 0.5%
+            
+            # First matching scenario on each side, in grid order
+            for side, mask in (("up", near & (price_changes > 0)), ("down", near & (price_changes <= 0))):
+                hits = np.flatnonzero(mask)
+                if hits.size:
+                    results[f"{side}_{expected_move_pct:.1f}pct"] = float(pnls[hits[0]])
+            return results
+        
         for scenario in self.scenarios:
             price_change = abs(scenario.price_change_pct)
             
@@ -173,6 +260,11 @@ class PnLEngine:
             "price_move_range": (-10.0, 10.0),  # -10% to +10%
             "price_move_step": 1.0,             # 1% increments
             "iv_scenarios": ["conservative", "expected", "optimistic"],
+            "iv_crush_multipliers": {           # Scale applied to IVCrushParameters drops
+                "conservative": 0.7,
+                "expected": 1.0,
+                "optimistic": 1.3
+            },
             "time_decay_days": 1,               # 1 day time decay
             "risk_free_rate": 0.05,            # 5% risk-free rate
             "use_simplified_pricing": True     # Use simplified Black-Scholes
@@ -200,6 +292,15 @@ class PnLEngine:
                 # Use default medium liquidity parameters
                 crush_params = IVCrushParameters()
             
+            if HAS_NUMPY:
+                multipliers = self.config["iv_crush_multipliers"]
+                result_grid = self.simulate_scenario_grid(
+                    trade, crush_params,
+                    crush_multipliers={name: multipliers[name] for name in self.config["iv_scenarios"]}
+                )
+                self.logger.info(f"Completed P&L simulation for {trade.symbol}: {len(result_grid)} scenarios")
+                return result_grid
+            
             # Generate price movement scenarios
             price_scenarios = self._generate_price_scenarios()
             
@@ -227,6 +328,121 @@ class PnLEngine:
             self.logger.error(f"P&L simulation failed for {trade.symbol}: {e}")
             return PnLGrid([], trade)
     
+    def simulate_scenario_grid(self, trade: CalendarTrade,
+                               crush_params: Optional[IVCrushParameters] = None,
+                               price_moves_pct: Optional[Any] = None,
+                               crush_multipliers: Optional[Any] = None,
+                               decay_days: Optional[Any] = None) -> PnLGrid:
+        """
+        Simulate a full price x IV crush x time decay grid in one vectorized pass.
+        
+        Args:
+            trade: CalendarTrade object
+            crush_params: IV crush parameters (defaults to medium liquidity)
+            price_moves_pct: Underlying moves in percent (defaults to config range/step),
+                e.g. build_price_moves(-20, 20, 401)
+            crush_multipliers: Scales applied to the crush drops, either a dict of
+                {label: multiplier} or a sequence (e.g. np.linspace(0, 1.5, 50))
+            decay_days: Days elapsed before revaluation (defaults to config time_decay_days)
+            
+        Returns:
+            Array-backed PnLGrid ordered price-major, then IV level, then decay day
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("numpy is required for grid simulation")
+        
+        if crush_params is None:
+            crush_params = IVCrushParameters()
+        
+        moves = np.asarray(
+            self._generate_price_scenarios() if price_moves_pct is None else price_moves_pct, dtype=float
+        ).ravel()
+        
+        if crush_multipliers is None:
+            crush_multipliers = self.config["iv_crush_multipliers"]
+        if isinstance(crush_multipliers, dict):
+            labels = np.array(list(crush_multipliers.keys()), dtype=object)
+            multipliers = np.asarray(list(crush_multipliers.values()), dtype=float)
+        else:
+            multipliers = np.asarray(crush_multipliers, dtype=float).ravel()
+            labels = np.array([f"crush_{m:.2f}x" for m in multipliers], dtype=object)
+        
+        days = np.asarray(
+            [self.config["time_decay_days"]] if decay_days is None else decay_days, dtype=float
+        ).ravel()
+        
+        shape = (moves.size, multipliers.size, days.size)
+        
+        # Broadcast axes: price (i, 1, 1), IV (1, j, 1), days (1, 1, k)
+        move_axis = moves[:, None, None]
+        new_price = trade.underlying_price * (1 + move_axis / 100)
+        front_iv = np.maximum(
+            trade.front_option.implied_volatility * (1 - crush_params.front_iv_drop * multipliers), 0.0
+        )[None, :, None]
+        back_iv = np.maximum(
+            trade.back_option.implied_volatility * (1 - crush_params.back_iv_drop * multipliers), 0.0
+        )[None, :, None]
+        day_axis = days[None, None, :]
+        
+        front_value = self._calculate_option_values(
+            new_price, trade.front_option.strike, front_iv,
+            trade.days_to_expiration_front - day_axis, trade.front_option.option_type
+        )
+        back_value = self._calculate_option_values(
+            new_price, trade.back_option.strike, back_iv,
+            trade.days_to_expiration_back - day_axis, trade.back_option.option_type
+        )
+        
+        # Calendar spread value (long back, short front)
+        spread_value = back_value - front_value
+        pnl = spread_value - trade.net_debit
+        pnl_pct = (pnl / trade.net_debit) * 100 if trade.net_debit > 0 else np.zeros_like(pnl)
+        
+        def flat(values):
+            return np.ascontiguousarray(np.broadcast_to(values, shape)).ravel()
+        
+        arrays = {
+            "price_change_pct": flat(move_axis),
+            "new_price": flat(new_price),
+            "iv_scenario": flat(labels[None, :, None]),
+            "front_iv_after": flat(front_iv),
+            "back_iv_after": flat(back_iv),
+            "front_option_value": flat(front_value),
+            "back_option_value": flat(back_value),
+            "spread_value": flat(spread_value),
+            "pnl": flat(pnl),
+            "pnl_pct": flat(pnl_pct),
+            "days_elapsed": flat(day_axis),
+        }
+        
+        self.logger.debug(f"Simulated {moves.size}x{multipliers.size}x{days.size} P&L grid for {trade.symbol}")
+        return PnLGrid.from_arrays(arrays, trade, grid_shape=shape)
+    
+    @staticmethod
+    def build_price_moves(min_pct: float, max_pct: float, steps: int) -> List[float]:
+        """Evenly spaced price moves in percent, inclusive of both ends."""
+        if steps <= 1:
+            return [float(min_pct)]
+        width = (max_pct - min_pct) / (steps - 1)
+        return [min_pct + i * width for i in range(steps)]
+    
+    def _calculate_option_values(self, spot_price, strike: float, iv, days_to_expiry, option_type: str):
+        """Vectorized counterpart of _calculate_option_value (expired legs at intrinsic)."""
+        if self.config["use_simplified_pricing"]:
+            return black_scholes_price(
+                spot_price, strike, iv, days_to_expiry / DAYS_PER_YEAR,
+                self.config["risk_free_rate"], option_type
+            )
+        
+        if option_type.lower() == "call":
+            intrinsic = np.maximum(spot_price - strike, 0.0)
+        else:
+            intrinsic = np.maximum(strike - spot_price, 0.0)
+        
+        # Add time value approximation for unexpired legs
+        time_value = iv * spot_price * np.sqrt(np.maximum(days_to_expiry, 0.0) / DAYS_PER_YEAR) * 0.4
+        return intrinsic + time_value
+    
     def _generate_price_scenarios(self) -> List[float]:
         """Generate price movement scenarios."""
         min_move, max_move = self.config["price_move_range"]
@@ -307,7 +523,8 @@ class PnLEngine:
                 back_option_value=back_value_after,
                 spread_value=spread_value_after,
                 pnl=pnl,
-                pnl_pct=pnl_pct
+                pnl_pct=pnl_pct,
+                days_elapsed=self.config["time_decay_days"]
             )
             
         except Exception as e:
@@ -322,7 +539,8 @@ class PnLEngine:
                 back_option_value=0.0,
                 spread_value=0.0,
                 pnl=0.0,
-                pnl_pct=0.0
+                pnl_pct=0.0,
+                days_elapsed=self.config["time_decay_days"]
             )
     
     def _calculate_option_value(self, spot_price: float, strike: float, 
@@ -361,52 +579,10 @@ class PnLEngine:
                                 t: float, r: float, option_type: str) -> float:
         """Simplified Black-Scholes implementation."""
         try:
-            if t <= 0:
-                if option_type.lower() == "call":
-                    return max(0, s - k)
-                else:
-                    return max(0, k - s)
-            
-            # Black-Scholes formula
-            d1 = (math.log(s / k) + (r + 0.5 * vol * vol) * t) / (vol * math.sqrt(t))
-            d2 = d1 - vol * math.sqrt(t)
-            
-            # Normal CDF approximation
-            nd1 = self._normal_cdf(d1)
-            nd2 = self._normal_cdf(d2)
-            
-            if option_type.lower() == "call":
-                return s * nd1 - k * math.exp(-r * t) * nd2
-            else:
-                return k * math.exp(-r * t) * self._normal_cdf(-d2) - s * self._normal_cdf(-d1)
-                
+            return black_scholes_price(s, k, vol, t, r, option_type)
         except Exception as e:
             self.logger.error(f"Black-Scholes calculation failed: {e}")
             return 0.0
-    
-    def _normal_cdf(self, x: float) -> float:
-        """Approximation of normal cumulative distribution function."""
-        try:
-            # Abramowitz and Stegun approximation
-            sign = 1 if x >= 0 else -1
-            x = abs(x)
-            
-            # Constants
-            a1 =  0.254829592
-            a2 = -0.284496736
-            a3 =  1.421413741
-            a4 = -1.453152027
-            a5 =  1.061405429
-            p  =  0.3275911
-            
-            # A&S formula 7.1.26
-            t = 1.0 / (1.0 + p * x)
-            y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x)
-            
-            return 0.5 * (1.0 + sign * y)
-            
-        except Exception:
-            return 0.5  # Fallback to 50%
 
 
 class IVCrushModel:
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Position Store
+==============
+
+Transactional SQLite store for live and historical portfolio positions.
+
+Positions are rows in a WAL-mode database indexed by symbol, sector, strategy
+and status, so writers append or update a single row instead of rewriting the
+whole portfolio. Open-position aggregates (capital at risk, P&L and Greeks in
+total, per sector and per strategy) are maintained by triggers inside the same
+transaction as each write and cached in memory, so compliance checks read them
+in O(1) regardless of how many positions have been recorded. Writes from other
+processes are picked up through PRAGMA data_version before each read.
+
+The database file is only created on the first write; reads against a missing
+file see an empty portfolio.
+
+Configuration (environment):
+- POSITIONS_DB: SQLite database path (default .portfolio_positions.db)
+- POSITIONS_BUSY_TIMEOUT_SEC: Wait for another writer's lock (default 5)
+"""
+
+import os
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger("options_trader.position_store")
+
+POSITIONS_DB = os.getenv("POSITIONS_DB", ".portfolio_positions.db")
+POSITIONS_BUSY_TIMEOUT_SEC = float(os.getenv("POSITIONS_BUSY_TIMEOUT_SEC", "5"))
+
+STATUS_OPEN = "open"
+STATUS_CLOSED = "closed"
+
+# Columns accepted from callers (id and status bookkeeping are managed here)
+POSITION_COLUMNS = ("symbol", "contracts", "entry_date", "strategy_type", "net_debit", "max_loss",
+                    "unrealized_pnl", "net_delta", "net_vega", "net_theta", "sector",
+                    "underlying_price", "legs")
+UPDATABLE_COLUMNS = ("contracts", "net_debit", "max_loss", "unrealized_pnl",
+                     "net_delta", "net_vega", "net_theta", "sector", "strategy_type",
+                     "underlying_price", "legs")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    contracts INTEGER NOT NULL,
+    entry_date TEXT NOT NULL,
+    strategy_type TEXT NOT NULL DEFAULT 'calendar_spread',
+    net_debit REAL NOT NULL DEFAULT 0,
+    max_loss REAL NOT NULL DEFAULT 0,
+    unrealized_pnl REAL NOT NULL DEFAULT 0,
+    net_delta REAL NOT NULL DEFAULT 0,
+    net_vega REAL NOT NULL DEFAULT 0,
+    net_theta REAL NOT NULL DEFAULT 0,
+    sector TEXT NOT NULL DEFAULT 'unknown',
+    status TEXT NOT NULL DEFAULT 'open',
+    closed_date TEXT,
+    underlying_price REAL NOT NULL DEFAULT 0,
+    legs TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_positions_symbol ON positions(symbol);
+CREATE INDEX IF NOT EXISTS idx_positions_sector ON positions(sector);
+CREATE INDEX IF NOT EXISTS idx_positions_strategy ON positions(strategy_type);
+CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status);
+
+CREATE TABLE IF NOT EXISTS portfolio_aggregates (
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    contracts INTEGER NOT NULL DEFAULT 0,
+    capital_at_risk REAL NOT NULL DEFAULT 0,
+    unrealized_pnl REAL NOT NULL DEFAULT 0,
+    net_delta REAL NOT NULL DEFAULT 0,
+    net_vega REAL NOT NULL DEFAULT 0,
+    net_theta REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, key)
+);
+
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Columns added after the first schema version: (name, declaration) applied with ALTER TABLE
+ADDED_COLUMNS = (("underlying_price", "REAL NOT NULL DEFAULT 0"), ("legs", "TEXT"))
+
+# (dimension, SQL expression for the key) maintained for every open position
+AGGREGATE_DIMENSIONS = (("total", "''"), ("sector", "{row}.sector"), ("strategy", "{row}.strategy_type"))
+
+
+def _apply_sql(row: str, sign: str) -> str:
+    """UPSERT statements adding (sign '+') or removing (sign '-') one row's contribution."""
+    statements = []
+    for dimension, key in AGGREGATE_DIMENSIONS:
+        key_sql = key.format(row=row)
+        values = (f"{sign}1, {sign}{row}.contracts, {sign}{row}.max_loss * {row}.contracts, "
+                  f"{sign}{row}.unrealized_pnl * {row}.contracts, {sign}{row}.net_delta * {row}.contracts, "
+                  f"{sign}{row}.net_vega * {row}.contracts, {sign}{row}.net_theta * {row}.contracts")
+        statements.append(
+            f"INSERT INTO portfolio_aggregates VALUES ('{dimension}', {key_sql}, {values}) "
+            f"ON CONFLICT(dimension, key) DO UPDATE SET "
+            f"count = count + excluded.count, contracts = contracts + excluded.contracts, "
+            f"capital_at_risk = capital_at_risk + excluded.capital_at_risk, "
+            f"unrealized_pnl = unrealized_pnl + excluded.unrealized_pnl, "
+            f"net_delta = net_delta + excluded.net_delta, net_vega = net_vega + excluded.net_vega, "
+            f"net_theta = net_theta + excluded.net_theta;"
+        )
+    if sign == "-":
+        # Drop emptied groups so float residue never outlives the last position
+        statements.append("DELETE FROM portfolio_aggregates WHERE count <= 0;")
+    return "\n    ".join(statements)
+
+
+TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS positions_agg_insert AFTER INSERT ON positions
+WHEN NEW.status = 'open' BEGIN
+    {_apply_sql("NEW", "+")}
+END;
+CREATE TRIGGER IF NOT EXISTS positions_agg_delete AFTER DELETE ON positions
+WHEN OLD.status = 'open' BEGIN
+    {_apply_sql("OLD", "-")}
+END;
+CREATE TRIGGER IF NOT EXISTS positions_agg_update_old AFTER UPDATE ON positions
+WHEN OLD.status = 'open' BEGIN
+    {_apply_sql("OLD", "-")}
+END;
+CREATE TRIGGER IF NOT EXISTS positions_agg_update_new AFTER UPDATE ON positions
+WHEN NEW.status = 'open' BEGIN
+    {_apply_sql("NEW", "+")}
+END;
+"""
+
+
+@dataclass(frozen=True)
+class PortfolioAggregate:
+    """Summed exposure of a group of open positions (per-contract values times contracts)."""
+    count: int = 0
+    contracts: int = 0
+    capital_at_risk: float = 0.0
+    unrealized_pnl: float = 0.0
+    net_delta: float = 0.0
+    net_vega: float = 0.0
+    net_theta: float = 0.0
+
+
+EMPTY_AGGREGATE = PortfolioAggregate()
+
+
+class PositionStore:
+    """SQLite-backed position store with trigger-maintained portfolio aggregates."""
+
+    _instances: Dict[str, "PositionStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str = POSITIONS_DB, busy_timeout_sec: float = POSITIONS_BUSY_TIMEOUT_SEC):
+        """
+        Initialize position store.
+
+        Args:
+            path: SQLite database file (created on first write)
+            busy_timeout_sec: How long a write waits for another process's lock
+        """
+        self.path = Path(path)
+        self.busy_timeout_sec = busy_timeout_sec
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._aggregates: Dict[Tuple[str, str], PortfolioAggregate] = {}
+        self._data_version: Optional[int] = None
+        self._reloads = 0
+        self._writes = 0
+
+    @classmethod
+    def shared(cls, path: str = POSITIONS_DB) -> "PositionStore":
+        """Return the process-wide store for a database file so connection and aggregates are reused."""
+        key = str(Path(path).resolve())
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls(path)
+                cls._instances[key] = store
+            return store
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _connection(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Open the database on demand; without create, a missing file yields None."""
+        if self._conn is not None:
+            return self._conn
+        if not create and not self.path.exists():
+            return None
+
+        if self.path.parent and not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=self.busy_timeout_sec,
+                               isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA + TRIGGERS)
+        self._upgrade_schema(conn)
+        self._conn = conn
+        logger.debug(f"Opened position store {self.path}")
+        return conn
+
+    @staticmethod
+    def _upgrade_schema(conn: sqlite3.Connection) -> None:
+        """Add columns missing from databases created by an older schema."""
+        existing = {row["name"] for row in conn.execute("PRAGMA table_info(positions)")}
+        for name, declaration in ADDED_COLUMNS:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE positions ADD COLUMN {name} {declaration}")
+                logger.info(f"Added positions.{name} column")
+
+    def _write(self, statements: Iterable[Tuple[str, Tuple]]) -> List[sqlite3.Cursor]:
+        """Run statements in one IMMEDIATE transaction and refresh the aggregate cache."""
+        with self._lock:
+            conn = self._connection(create=True)
+            cursors = []
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    cursors.append(conn.execute(sql, params))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._writes += 1
+            self._reload_aggregates(conn)
+            return cursors
+
+    def _reload_aggregates(self, conn: sqlite3.Connection) -> None:
+        rows = conn.execute("SELECT * FROM portfolio_aggregates").fetchall()
+        self._aggregates = {
+            (row["dimension"], row["key"]): PortfolioAggregate(
+                count=row["count"], contracts=row["contracts"], capital_at_risk=row["capital_at_risk"],
+                unrealized_pnl=row["unrealized_pnl"], net_delta=row["net_delta"],
+                net_vega=row["net_vega"], net_theta=row["net_theta"])
+            for row in rows
+        }
+        self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        self._reloads += 1
+
+    def _current_aggregates(self) -> Dict[Tuple[str, str], PortfolioAggregate]:
+        """Aggregate cache, reloaded only when another connection has committed since the last read."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return {}
+            if conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version:
+                self._reload_aggregates(conn)
+            return self._aggregates
+
+    def close(self) -> None:
+        """Close the database connection (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._data_version = None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _insert_statement(position: Mapping[str, Any]) -> Tuple[str, Tuple]:
+        values = {column: position[column] for column in POSITION_COLUMNS if column in position}
+        if "legs" in values:
+            values["legs"] = json.dumps(values["legs"] or [])
+        if "symbol" not in values or "contracts" not in values:
+            raise ValueError("Position requires symbol and contracts")
+        values.setdefault("entry_date", date.today().isoformat())
+        values["status"] = position.get("status") or STATUS_OPEN
+        values["closed_date"] = position.get("closed_date")
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        return f"INSERT INTO positions ({columns}) VALUES ({placeholders})", tuple(values.values())
+
+    def add(self, position: Mapping[str, Any]) -> int:
+        """
+        Record a new open position.
+
+        Args:
+            position: Column values (see POSITION_COLUMNS); symbol and contracts are required
+
+        Returns:
+            Row id of the new position
+        """
+        cursor = self._write([self._insert_statement(position)])[0]
+        return cursor.lastrowid
+
+    def update(self, position_id: int, **fields: Any) -> bool:
+        """Update marks or attributes of one position; aggregates follow automatically."""
+        unknown = set(fields) - set(UPDATABLE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot update position columns: {sorted(unknown)}")
+        if not fields:
+            return False
+        if "legs" in fields:
+            fields["legs"] = json.dumps(fields["legs"] or [])
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        cursor = self._write([(f"UPDATE positions SET {assignments} WHERE id = ?",
+                               tuple(fields.values()) + (position_id,))])[0]
+        return cursor.rowcount > 0
+
+    def close_positions(self, symbol: str, closed_date: Optional[str] = None) -> int:
+        """Mark every open position in a symbol closed, keeping it as history. Returns rows closed."""
+        cursor = self._write([(
+            "UPDATE positions SET status = ?, closed_date = ? WHERE symbol = ? AND status = ?",
+            (STATUS_CLOSED, closed_date or date.today().isoformat(), symbol, STATUS_OPEN)
+        )])[0]
+        return cursor.rowcount
+
+    def migrate_json(self, json_path: str, sector_for=None) -> int:
+        """
+        Import positions from the legacy JSON file once.
+
+        The import runs in a single transaction together with a marker row, so
+        neither a crash nor a second process can import the same file twice. The
+        file is then renamed to '<name>.migrated'.
+
+        Args:
+            json_path: Legacy positions file ({"positions": [...]})
+            sector_for: Optional callable mapping symbol to sector for imported rows
+
+        Returns:
+            Number of positions imported
+        """
+        source = Path(json_path)
+        if not source.exists():
+            return 0
+
+        marker = f"migrated:{source.resolve()}"
+        with self._lock:
+            conn = self._connection(create=True)
+            if conn.execute("SELECT 1 FROM store_meta WHERE key = ?", (marker,)).fetchone():
+                return 0
+            try:
+                with open(source, "r") as f:
+                    positions = json.load(f).get("positions", [])
+            except Exception as e:
+                logger.warning(f"Failed to read legacy positions from {source}: {e}")
+                return 0
+
+            # The marker goes first: a concurrent migration fails on its primary key and rolls back
+            statements = [("INSERT INTO store_meta VALUES (?, ?)", (marker, datetime.now().isoformat()))]
+            for position in positions:
+                row = dict(position)
+                if sector_for is not None:
+                    row["sector"] = sector_for(row.get("symbol", ""))
+                statements.append(self._insert_statement(row))
+            try:
+                self._write(statements)
+            except sqlite3.IntegrityError:
+                return 0
+
+        try:
+            source.rename(source.with_name(source.name + ".migrated"))
+        except OSError as e:
+            logger.warning(f"Imported {source} but could not rename it: {e}")
+        logger.info(f"Migrated {len(positions)} positions from {source} to {self.path}")
+        return len(positions)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def positions(self, status: Optional[str] = STATUS_OPEN, symbol: Optional[str] = None,
+                  sector: Optional[str] = None, strategy_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return position rows matching the filters (status=None includes history), oldest first."""
+        clauses, params = [], []
+        for column, value in (("status", status), ("symbol", symbol),
+                              ("sector", sector), ("strategy_type", strategy_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(f"SELECT * FROM positions{where} ORDER BY id", params).fetchall()
+        return [self._decode(row) for row in rows]
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+        data = dict(row)
+        data["legs"] = json.loads(data["legs"]) if data.get("legs") else []
+        return data
+
+    def totals(self) -> PortfolioAggregate:
+        """Aggregate exposure of all open positions."""
+        return self._current_aggregates().get(("total", ""), EMPTY_AGGREGATE)
+
+    def aggregate(self, dimension: str, key: str) -> PortfolioAggregate:
+        """Aggregate exposure for one sector or strategy ('sector' / 'strategy' dimension)."""
+        return self._current_aggregates().get((dimension, key), EMPTY_AGGREGATE)
+
+    def breakdown(self, dimension: str) -> Dict[str, PortfolioAggregate]:
+        """All groups of one dimension ('sector' or 'strategy')."""
+        return {key: agg for (dim, key), agg in self._current_aggregates().items() if dim == dimension}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return store counters."""
+        totals = self.totals()
+        return {
+            "path": str(self.path),
+            "open_positions": totals.count,
+            "capital_at_risk": totals.capital_at_risk,
+            "writes": self._writes,
+            "aggregate_reloads": self._reloads,
+        }
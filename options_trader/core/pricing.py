@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Black-Scholes Pricing Kernel
+============================
+
+Vectorized Black-Scholes pricing and Greeks shared by the Greeks calculator,
+P&L engine and straddle constructor.
+
+All inputs broadcast against each other, so a whole option chain (or a whole
+price x IV scenario grid) is priced in a single call. Greeks follow the
+conventions used throughout the package:
+- theta: per calendar day
+- vega: per 1 volatility point (1% IV change)
+- rho: per 1% rate change
+
+Expired contracts (t <= 0) return intrinsic value with zero gamma/theta/vega/rho.
+Zero-volatility contracts are valued at their discounted forward intrinsic value.
+
+implied_volatility inverts the same kernel for whole arrays at once using
+Newton steps safeguarded by a per-contract bisection bracket, and
+fill_chain_iv uses it to fill IVs that providers leave null or zero.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+# Conditional imports for optional dependencies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+try:
+    from scipy.special import ndtr as _ndtr
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    _ndtr = None
+
+from ..providers.chain import quote_mids
+
+logger = logging.getLogger("options_trader.pricing")
+
+DAYS_PER_YEAR = 365.0
+SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+# Abramowitz and Stegun 7.1.26 coefficients (fallback when scipy is unavailable)
+_AS_A1 = 0.254829592
+_AS_A2 = -0.284496736
+_AS_A3 = 1.421413741
+_AS_A4 = -1.453152027
+_AS_A5 = 1.061405429
+_AS_P = 0.3275911
+
+# Implied volatility solver
+IV_MIN_VOL = 1e-4
+IV_MAX_VOL = 5.0
+IV_PRICE_TOL = 1e-8
+IV_MAX_ITER = 100
+IV_MIN_VALID = 1e-3   # Provider IVs below this are placeholders, not quotes
+IV_MIN_DAYS = 1.0 / 24.0  # Floor on time to expiry when inverting same-day contracts
+EXPIRY_HOUR = 16  # Options stop trading at the 4pm close on expiration day
+
+
+@dataclass
+class BSResult:
+    """Black-Scholes price and Greeks (arrays, or floats for scalar inputs)."""
+    price: Any
+    delta: Any
+    gamma: Any
+    theta: Any    # Per calendar day
+    vega: Any     # Per 1% IV change
+    rho: Any      # Per 1% rate change
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return results as a plain dictionary."""
+        return {
+            "price": self.price,
+            "delta": self.delta,
+            "gamma": self.gamma,
+            "theta": self.theta,
+            "vega": self.vega,
+            "rho": self.rho
+        }
+
+
+def days_to_expiry(expiration: str, now: Optional[datetime] = None) -> float:
+    """
+    Fractional calendar days until the close on an expiration date.
+
+    Args:
+        expiration: Expiration date in 'YYYY-MM-DD' format
+        now: Override for the current time (testing)
+
+    Returns:
+        Days to expiry (negative once the contract has expired)
+    """
+    expiry = datetime.strptime(expiration, "%Y-%m-%d").replace(hour=EXPIRY_HOUR)
+    return (expiry - (now or datetime.now())).total_seconds() / 86400.0
+
+
+def norm_cdf(x):
+    """Standard normal CDF, vectorized (scipy ndtr, else Abramowitz-Stegun)."""
+    if not HAS_NUMPY:
+        return _norm_cdf_scalar(x)
+
+    x = np.asarray(x, dtype=float)
+    if HAS_SCIPY:
+        return _ndtr(x)
+
+    sign = np.where(x >= 0, 1.0, -1.0)
+    ax = np.abs(x) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + _AS_P * ax)
+    y = 1.0 - (((((_AS_A5 * t + _AS_A4) * t) + _AS_A3) * t + _AS_A2) * t + _AS_A1) * t * np.exp(-ax * ax)
+    return 0.5 * (1.0 + sign * y)
+
+
+def norm_pdf(x):
+    """Standard normal PDF, vectorized."""
+    if not HAS_NUMPY:
+        return math.exp(-0.5 * x * x) / SQRT_2PI
+
+    x = np.asarray(x, dtype=float)
+    return np.exp(-0.5 * x * x) / SQRT_2PI
+
+
+def call_flags(option_type) -> Any:
+    """
+    Convert option type input to a boolean "is call" array.
+
+    Accepts booleans, 'call'/'put' strings (case-insensitive, 'c'/'p' prefixes),
+    or arrays/lists of either.
+    """
+    if isinstance(option_type, str):
+        return option_type.strip().lower().startswith("c")
+    if isinstance(option_type, (bool, int)) or (HAS_NUMPY and isinstance(option_type, np.bool_)):
+        return bool(option_type)
+
+    values = np.asarray(option_type)
+    if values.dtype.kind in ("U", "S", "O"):
+        return np.char.startswith(np.char.lower(values.astype(str)), "c")
+    return values.astype(bool)
+
+
+def black_scholes(spot, strike, vol, t, rate: Union[float, Any] = 0.05,
+                  option_type: Union[str, bool, Any] = "call") -> BSResult:
+    """
+    Price options and compute Greeks in one vectorized pass.
+
+    Args:
+        spot: Underlying price(s)
+        strike: Strike price(s)
+        vol: Implied volatility(ies) as decimals (0.30 = 30%)
+        t: Time(s) to expiry in years
+        rate: Risk-free rate(s) as decimals
+        option_type: 'call'/'put', boolean is-call flag, or an array of either
+
+    Returns:
+        BSResult with price, delta, gamma, theta (per day), vega (per 1%), rho (per 1%).
+        Fields are floats when every input is scalar, otherwise broadcast arrays.
+    """
+    if not HAS_NUMPY:
+        return _black_scholes_scalar(float(spot), float(strike), float(vol), float(t),
+                                     float(rate), call_flags(option_type))
+
+    is_call = call_flags(option_type)
+    s, k, v, tt, r, c = np.broadcast_arrays(
+        np.asarray(spot, dtype=float), np.asarray(strike, dtype=float),
+        np.asarray(vol, dtype=float), np.asarray(t, dtype=float),
+        np.asarray(rate, dtype=float), np.asarray(is_call, dtype=bool)
+    )
+    scalar = s.ndim == 0
+
+    live = (tt > 0) & (v > 0) & (s > 0) & (k > 0)
+    t_pos = np.where(tt > 0, tt, 1.0)
+    v_pos = np.where(live, v, 1.0)
+    sqrt_t = np.sqrt(t_pos)
+    discount = np.exp(-r * np.where(tt > 0, tt, 0.0))
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        d1 = (np.log(np.where(live, s / k, 1.0)) + (r + 0.5 * v_pos * v_pos) * t_pos) / (v_pos * sqrt_t)
+        d2 = d1 - v_pos * sqrt_t
+
+        nd1 = norm_cdf(d1)
+        nd2 = norm_cdf(d2)
+        pdf_d1 = norm_pdf(d1)
+
+        call_price = s * nd1 - k * discount * nd2
+        put_price = k * discount * (1.0 - nd2) - s * (1.0 - nd1)
+        price = np.where(c, call_price, put_price)
+        delta = np.where(c, nd1, nd1 - 1.0)
+        gamma = pdf_d1 / (s * v_pos * sqrt_t)
+        decay = -s * pdf_d1 * v_pos / (2.0 * sqrt_t)
+        theta = np.where(c, decay - r * k * discount * nd2, decay + r * k * discount * (1.0 - nd2)) / DAYS_PER_YEAR
+        vega = s * pdf_d1 * sqrt_t / 100.0
+        rho = np.where(c, k * t_pos * discount * nd2, -k * t_pos * discount * (1.0 - nd2)) / 100.0
+
+    if not live.all():
+        # Expired: intrinsic value, step delta (0.5 magnitude at the money)
+        expired = tt <= 0
+        intrinsic = np.where(c, np.maximum(s - k, 0.0), np.maximum(k - s, 0.0))
+        at_money = np.abs(s - k) < 0.01
+        expired_delta = np.where(
+            c,
+            np.where(s > k, 1.0, np.where(at_money, 0.5, 0.0)),
+            np.where(s < k, -1.0, np.where(at_money, -0.5, 0.0))
+        )
+
+        # Zero volatility before expiry: deterministic discounted forward payoff
+        forward_itm = np.where(c, s > k * discount, s < k * discount)
+        flat_price = np.where(c, np.maximum(s - k * discount, 0.0), np.maximum(k * discount - s, 0.0))
+        flat_delta = np.where(forward_itm, np.where(c, 1.0, -1.0), 0.0)
+
+        dead = ~live
+        price = np.where(dead, np.where(expired, intrinsic, flat_price), price)
+        delta = np.where(dead, np.where(expired, expired_delta, flat_delta), delta)
+        gamma = np.where(dead, 0.0, gamma)
+        theta = np.where(dead, 0.0, theta)
+        vega = np.where(dead, 0.0, vega)
+        rho = np.where(dead, 0.0, rho)
+
+    if scalar:
+        return BSResult(float(price), float(delta), float(gamma), float(theta), float(vega), float(rho))
+    return BSResult(price, delta, gamma, theta, vega, rho)
+
+
+def black_scholes_price(spot, strike, vol, t, rate: Union[float, Any] = 0.05,
+                        option_type: Union[str, bool, Any] = "call"):
+    """Vectorized Black-Scholes price only (see black_scholes for conventions)."""
+    return black_scholes(spot, strike, vol, t, rate, option_type).price
+
+
+def chain_greeks(options_df, spot: float, days_to_expiry: float,
+                 option_type: Union[str, Any] = "call", rate: float = 0.05,
+                 iv_column: str = "impliedVolatility", overwrite: bool = False):
+    """
+    Compute Greeks for every row of an option chain DataFrame in one call.
+
+    Args:
+        options_df: DataFrame with 'strike' and implied volatility columns
+        spot: Current underlying price
+        days_to_expiry: Calendar days to expiration
+        option_type: 'call'/'put' for the whole frame, or a per-row array
+        rate: Risk-free rate
+        iv_column: Column holding implied volatility
+        overwrite: Replace existing Greek columns instead of only filling missing values
+
+    Returns:
+        Copy of the DataFrame with theoPrice, delta, gamma, theta, vega and rho columns
+    """
+    result_df = options_df.copy()
+    if result_df.empty or "strike" not in result_df.columns or iv_column not in result_df.columns:
+        return result_df
+
+    strikes = result_df["strike"].to_numpy(dtype=float)
+    ivs = np.nan_to_num(result_df[iv_column].to_numpy(dtype=float), nan=0.0)
+    if not isinstance(option_type, str):
+        option_type = np.asarray(option_type)
+
+    bs = black_scholes(spot, strikes, ivs, max(days_to_expiry, 0.0) / DAYS_PER_YEAR, rate, option_type)
+
+    columns = {"theoPrice": bs.price, "delta": bs.delta, "gamma": bs.gamma,
+               "theta": bs.theta, "vega": bs.vega, "rho": bs.rho}
+    for name, values in columns.items():
+        if overwrite or name not in result_df.columns:
+            result_df[name] = values
+        else:
+            existing = result_df[name].to_numpy(dtype=float)
+            missing = ~np.isfinite(existing) | (existing == 0.0)
+            result_df[name] = np.where(missing, values, existing)
+
+    return result_df
+
+
+def implied_volatility(price, spot, strike, t, rate: Union[float, Any] = 0.05,
+                       option_type: Union[str, bool, Any] = "call",
+                       tol: float = IV_PRICE_TOL, max_iter: int = IV_MAX_ITER):
+    """
+    Invert Black-Scholes for implied volatility, vectorized over all inputs.
+
+    Every contract keeps a [low, high] volatility bracket that tightens after
+    each pricing pass. Newton steps are taken when they land inside the
+    bracket; otherwise the contract bisects, so convergence is guaranteed even
+    for deep ITM/OTM quotes where vega vanishes. Only unconverged contracts are
+    re-priced on each iteration.
+
+    Args:
+        price: Option market price(s)
+        spot: Underlying price(s)
+        strike: Strike price(s)
+        t: Time(s) to expiry in years
+        rate: Risk-free rate(s) as decimals
+        option_type: 'call'/'put', boolean is-call flag, or an array of either
+        tol: Absolute price tolerance
+        max_iter: Maximum pricing passes
+
+    Returns:
+        Implied volatility as decimals; NaN where the price violates no-arbitrage
+        bounds or needs a volatility outside [IV_MIN_VOL, IV_MAX_VOL]. A float
+        when every input is scalar.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for the implied volatility solver")
+
+    arrays = np.broadcast_arrays(
+        np.asarray(price, dtype=float), np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float), np.asarray(t, dtype=float),
+        np.asarray(rate, dtype=float), np.asarray(call_flags(option_type), dtype=bool)
+    )
+    shape = arrays[0].shape
+    target, s, k, tt, r, c = (a.ravel() for a in arrays)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        discount = np.exp(-r * tt)
+        lower = np.where(c, np.maximum(s - k * discount, 0.0), np.maximum(k * discount - s, 0.0))
+        upper = np.where(c, s, k * discount)
+        valid = (np.isfinite(target) & (tt > 0) & (s > 0) & (k > 0)
+                 & (target > lower) & (target < upper))
+
+        # Manaster-Koehler start, Brenner-Subrahmanyam near the money
+        moneyness = np.abs(np.log(np.where(valid, s / k, 1.0)) + r * tt)
+        guess = np.where(moneyness > 1e-3,
+                         np.sqrt(2.0 * moneyness / np.where(tt > 0, tt, 1.0)),
+                         np.sqrt(2.0 * math.pi / np.where(tt > 0, tt, 1.0)) * target / np.where(s > 0, s, 1.0))
+
+    sigma = np.where(valid, np.clip(np.nan_to_num(guess, nan=0.2), IV_MIN_VOL, IV_MAX_VOL), np.nan)
+    lo = np.full_like(sigma, IV_MIN_VOL)
+    hi = np.full_like(sigma, IV_MAX_VOL)
+
+    # Quotes richer than the widest bracket have no solution
+    active = np.flatnonzero(valid)
+    if active.size:
+        ceiling = black_scholes_price(s[active], k[active], IV_MAX_VOL, tt[active], r[active], c[active])
+        too_rich = ceiling < target[active] - tol
+        sigma[active[too_rich]] = np.nan
+        active = active[~too_rich]
+
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        bs = black_scholes(s[active], k[active], sigma[active], tt[active], r[active], c[active])
+        sig = sigma[active]
+        diff = bs.price - target[active]
+
+        lo[active] = np.where(diff < 0, sig, lo[active])
+        hi[active] = np.where(diff > 0, sig, hi[active])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = sig - diff / (bs.vega * 100.0)
+        in_bracket = np.isfinite(newton) & (newton > lo[active]) & (newton < hi[active])
+        step = np.where(in_bracket, newton, 0.5 * (lo[active] + hi[active]))
+
+        done = (np.abs(diff) < tol) | (hi[active] - lo[active] < 1e-12)
+        sigma[active] = np.where(done, sig, step)
+        active = active[~done]
+
+    if active.size:
+        logger.debug(f"Implied volatility: {active.size} contracts hit max_iter={max_iter}")
+
+    if not shape:
+        return float(sigma[0])
+    return sigma.reshape(shape)
+
+
+def quote_mid_prices(options_df):
+    """
+    Per-row mid price of a DataFrame chain (same rule as OptionSide.mid_prices).
+
+    Returns:
+        Float array (NaN where the row has no usable price)
+    """
+    n = len(options_df)
+
+    def column(name):
+        if name not in options_df.columns:
+            return np.full(n, np.nan)
+        return options_df[name].to_numpy(dtype=float, na_value=np.nan)
+
+    return quote_mids(column("bid"), column("ask"), column("lastPrice"))
+
+
+def missing_iv_mask(ivs):
+    """True where an IV is null, non-finite or a placeholder below IV_MIN_VALID."""
+    ivs = np.asarray(ivs, dtype=float)
+    return ~(np.isfinite(ivs) & (ivs >= IV_MIN_VALID))
+
+
+def fill_missing_iv(ivs, prices, spot: float, strikes, days_to_expiry: float,
+                    option_type: Union[str, Any] = "call", rate: float = 0.05, overwrite: bool = False):
+    """
+    Array core of fill_chain_iv: solve missing IVs from option prices.
+
+    Args:
+        ivs: Provider implied volatilities (NaN/None/0 treated as missing)
+        prices: Option prices to invert (e.g. quote mids)
+        spot: Current underlying price
+        strikes: Strike prices
+        days_to_expiry: Calendar days to expiration (floored at IV_MIN_DAYS)
+        option_type: 'call'/'put' for all rows, or a per-row array
+        rate: Risk-free rate
+        overwrite: Re-solve every row instead of only missing ones
+
+    Returns:
+        New IV array (solved rows that have no solution are NaN)
+    """
+    ivs = np.array(ivs, dtype=float)
+    missing = np.ones(len(ivs), dtype=bool) if overwrite else missing_iv_mask(ivs)
+    if not missing.any():
+        return ivs
+
+    if not isinstance(option_type, str):
+        option_type = np.asarray(option_type)[missing]
+
+    solved = implied_volatility(
+        np.asarray(prices, dtype=float)[missing],
+        spot,
+        np.asarray(strikes, dtype=float)[missing],
+        max(days_to_expiry, IV_MIN_DAYS) / DAYS_PER_YEAR,
+        rate,
+        option_type
+    )
+    ivs[missing] = solved
+
+    logger.debug(f"Filled {int(np.isfinite(solved).sum())}/{int(missing.sum())} missing IVs")
+    return ivs
+
+
+def fill_chain_iv(options_df, spot: float, days_to_expiry: float,
+                  option_type: Union[str, Any] = "call", rate: float = 0.05,
+                  iv_column: str = "impliedVolatility", overwrite: bool = False):
+    """
+    Fill missing implied volatilities for an option chain in one solver call.
+
+    Rows whose IV is null, non-finite or below IV_MIN_VALID are solved from the
+    quote mid (bid/ask, falling back to lastPrice). Rows without a usable price
+    or outside no-arbitrage bounds are left NaN.
+
+    Args:
+        options_df: DataFrame with 'strike' and bid/ask/lastPrice columns
+        spot: Current underlying price
+        days_to_expiry: Calendar days to expiration (floored at IV_MIN_DAYS)
+        option_type: 'call'/'put' for the whole frame, or a per-row array
+        rate: Risk-free rate
+        iv_column: Column holding implied volatility
+        overwrite: Re-solve every row instead of only missing ones
+
+    Returns:
+        Copy of the DataFrame with the IV column filled
+    """
+    result_df = options_df.copy()
+    if result_df.empty or "strike" not in result_df.columns:
+        return result_df
+
+    if iv_column in result_df.columns:
+        ivs = result_df[iv_column].to_numpy(dtype=float, na_value=np.nan)
+    else:
+        ivs = np.full(len(result_df), np.nan)
+
+    result_df[iv_column] = fill_missing_iv(
+        ivs, quote_mid_prices(result_df), spot, result_df["strike"].to_numpy(dtype=float),
+        days_to_expiry, option_type, rate, overwrite
+    )
+    return result_df
+
+
+def _norm_cdf_scalar(x: float) -> float:
+    """Scalar Abramowitz-Stegun normal CDF used when numpy is unavailable."""
+    sign = 1.0 if x >= 0 else -1.0
+    ax = abs(x) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + _AS_P * ax)
+    y = 1.0 - (((((_AS_A5 * t + _AS_A4) * t) + _AS_A3) * t + _AS_A2) * t + _AS_A1) * t * math.exp(-ax * ax)
+    return 0.5 * (1.0 + sign * y)
+
+
+def _black_scholes_scalar(s: float, k: float, vol: float, t: float, r: float, is_call: bool) -> BSResult:
+    """Pure-Python single-option path used when numpy is unavailable."""
+    if t <= 0:
+        intrinsic = max(0.0, s - k) if is_call else max(0.0, k - s)
+        if is_call:
+            delta = 1.0 if s > k else (0.5 if abs(s - k) < 0.01 else 0.0)
+        else:
+            delta = -1.0 if s < k else (-0.5 if abs(s - k) < 0.01 else 0.0)
+        return BSResult(intrinsic, delta, 0.0, 0.0, 0.0, 0.0)
+
+    discount = math.exp(-r * t)
+    if vol <= 0 or s <= 0 or k <= 0:
+        forward_value = (s - k * discount) if is_call else (k * discount - s)
+        delta = (1.0 if is_call else -1.0) if forward_value > 0 else 0.0
+        return BSResult(max(0.0, forward_value), delta, 0.0, 0.0, 0.0, 0.0)
+
+    sqrt_t = math.sqrt(t)
+    d1 = (math.log(s / k) + (r + 0.5 * vol * vol) * t) / (vol * sqrt_t)
+    d2 = d1 - vol * sqrt_t
+    nd1 = _norm_cdf_scalar(d1)
+    nd2 = _norm_cdf_scalar(d2)
+    pdf_d1 = math.exp(-0.5 * d1 * d1) / SQRT_2PI
+
+    gamma = pdf_d1 / (s * vol * sqrt_t)
+    decay = -s * pdf_d1 * vol / (2 * sqrt_t)
+    vega = s * pdf_d1 * sqrt_t / 100
+
+    if is_call:
+        price = s * nd1 - k * discount * nd2
+        delta = nd1
+        theta = (decay - r * k * discount * nd2) / DAYS_PER_YEAR
+        rho = k * t * discount * nd2 / 100
+    else:
+        price = k * discount * (1 - nd2) - s * (1 - nd1)
+        delta = nd1 - 1
+        theta = (decay + r * k * discount * (1 - nd2)) / DAYS_PER_YEAR
+        rho = -k * t * discount * (1 - nd2) / 100
+
+    return BSResult(price, delta, gamma, theta, vega, rho)
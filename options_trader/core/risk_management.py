@@ -9,22 +9,24 @@ Enforces concentration limits, portfolio Greeks constraints, and compliance rule
 
 Key Features:
 - Portfolio concentration limits (max 20% per sector/strategy)
-- Greeks-based portfolio risk calculation
+- Greeks-based portfolio risk calculation and full-revaluation stress grids (see stress)
 - Daily loss limits and drawdown protection
-- Position tracking with JSON persistence
+- Position tracking in a transactional SQLite store (see position_store)
 """
 
 import os
-import json
 import logging
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, date
+from datetime import date
 from pathlib import Path
 
+from .position_store import POSITIONS_DB, PositionStore, STATUS_OPEN
+from .stress import PortfolioStressEngine, StressResult
+
 logger = logging.getLogger("options_trader.risk_management")
 
-# Default portfolio position tracking file
+# Legacy JSON positions file, migrated into the position store on first use
 POSITIONS_FILE = ".portfolio_positions.json"
 
 
@@ -63,6 +65,11 @@ class Position:
     net_vega: float = 0.0
     net_theta: float = 0.0
     sector: str = "unknown"
+    position_id: Optional[int] = None
+    status: str = STATUS_OPEN
+    closed_date: Optional[str] = None
+    underlying_price: float = 0.0
+    legs: List[Dict[str, Any]] = field(default_factory=list)  # Option legs for stress revaluation
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert position to dictionary for JSON serialization."""
@@ -77,12 +84,20 @@ class Position:
             "net_delta": self.net_delta,
             "net_vega": self.net_vega,
             "net_theta": self.net_theta,
-            "sector": self.sector
+            "sector": self.sector,
+            "position_id": self.position_id,
+            "status": self.status,
+            "closed_date": self.closed_date,
+            "underlying_price": self.underlying_price,
+            "legs": self.legs
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Position':
-        """Create position from dictionary."""
+        """Create position from dictionary (store rows carry the row id as 'id')."""
+        data = dict(data)
+        if "id" in data:
+            data["position_id"] = data.pop("id")
         return cls(**data)
 
 
@@ -138,49 +153,30 @@ class RiskManagementEngine:
     and provides comprehensive risk assessment for new positions.
     """
     
-    def __init__(self, positions_file: str = POSITIONS_FILE):
-        """Initialize risk management engine with position tracking."""
+    def __init__(self, positions_file: str = POSITIONS_FILE, positions_db: str = POSITIONS_DB,
+                 store: Optional[PositionStore] = None):
+        """
+        Initialize risk management engine with position tracking.
+        
+        Args:
+            positions_file: Legacy JSON positions file, imported once if present
+            positions_db: SQLite position store path (ignored when store is given)
+            store: Explicit position store (defaults to the shared store for positions_db)
+        """
         self.positions_file = Path(positions_file)
         self.risk_limits = RiskLimits.load_from_env()
-        self.current_positions = self._load_positions()
+        self.store = store or PositionStore.shared(positions_db)
+        self.store.migrate_json(str(self.positions_file), sector_for=self._get_symbol_sector)
         
-        logger.debug(f"RiskManagementEngine initialized with {len(self.current_positions)} positions")
+        logger.debug(f"RiskManagementEngine initialized with {self.store.totals().count} positions")
         logger.debug(f"Risk limits: position={self.risk_limits.max_position_pct*100:.1f}%, "
                     f"concentration={self.risk_limits.max_concentration_pct*100:.1f}%, "
                     f"daily_loss={self.risk_limits.max_daily_loss_pct*100:.1f}%")
     
-    def _load_positions(self) -> List[Position]:
-        """Load current positions from JSON file."""
-        if not self.positions_file.exists():
-            logger.debug("No positions file found, starting with empty portfolio")
-            return []
-            
-        try:
-            with open(self.positions_file, 'r') as f:
-                data = json.load(f)
-                positions = [Position.from_dict(pos) for pos in data.get("positions", [])]
-                logger.debug(f"Loaded {len(positions)} positions from {self.positions_file}")
-                return positions
-                
-        except Exception as e:
-            logger.warning(f"Failed to load positions from {self.positions_file}: {e}")
-            return []
-    
-    def _save_positions(self) -> None:
-        """Save current positions to JSON file."""
-        try:
-            data = {
-                "last_updated": datetime.now().isoformat(),
-                "positions": [pos.to_dict() for pos in self.current_positions]
-            }
-            
-            with open(self.positions_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
-            logger.debug(f"Saved {len(self.current_positions)} positions to {self.positions_file}")
-            
-        except Exception as e:
-            logger.error(f"Failed to save positions to {self.positions_file}: {e}")
+    @property
+    def current_positions(self) -> List[Position]:
+        """Open positions, read from the store (aggregate checks do not need this list)."""
+        return [Position.from_dict(row) for row in self.store.positions()]
     
     def enforce_position_limits(self, proposed_contracts: int, max_loss_per_contract: float,
                                account_size: float, symbol: str) -> AdjustedPosition:
@@ -214,7 +210,7 @@ class RiskManagementEngine:
             )
         
         # Check portfolio utilization
-        current_risk = sum(pos.max_loss * pos.contracts for pos in self.current_positions)
+        current_risk = self.store.totals().capital_at_risk
         total_risk_after = current_risk + proposed_risk
         
         # Conservative limit: don't use more than 75% of account
@@ -265,11 +261,8 @@ class RiskManagementEngine:
         # Get current sector (simplified - in practice would use sector mapping)
         sector = self._get_symbol_sector(symbol)
         
-        # Calculate current concentrations
-        metrics = self.calculate_portfolio_metrics(account_size)
-        
         # Check sector concentration
-        current_sector_risk = metrics.concentration_by_sector.get(sector, 0.0)
+        current_sector_risk = self.store.aggregate("sector", sector).capital_at_risk
         new_sector_risk = current_sector_risk + position_risk
         sector_pct = (new_sector_risk / account_size) * 100 if account_size > 0 else 0
         
@@ -279,7 +272,7 @@ class RiskManagementEngine:
             return False
         
         # Check strategy concentration
-        current_strategy_risk = metrics.concentration_by_strategy.get(strategy_type, 0.0)
+        current_strategy_risk = self.store.aggregate("strategy", strategy_type).capital_at_risk
         new_strategy_risk = current_strategy_risk + position_risk
         strategy_pct = (new_strategy_risk / account_size) * 100 if account_size > 0 else 0
         
@@ -292,9 +285,10 @@ class RiskManagementEngine:
     
     def calculate_portfolio_greeks(self, account_size: float = 100000) -> PortfolioGreeks:
         """Calculate aggregate portfolio Greeks."""
-        net_delta = sum(pos.net_delta * pos.contracts for pos in self.current_positions)
-        net_theta = sum(pos.net_theta * pos.contracts for pos in self.current_positions)
-        net_vega = sum(pos.net_vega * pos.contracts for pos in self.current_positions)
+        totals = self.store.totals()
+        net_delta = totals.net_delta
+        net_theta = totals.net_theta
+        net_vega = totals.net_vega
         
         # Estimate dollar Greeks (simplified calculation)
         delta_dollars = net_delta * account_size * 0.01  # 1% move impact
@@ -308,31 +302,20 @@ class RiskManagementEngine:
             delta_dollars=delta_dollars,
             theta_dollars=theta_dollars,
             vega_dollars=vega_dollars,
-            position_count=len(self.current_positions)
+            position_count=totals.count
         )
     
     def calculate_portfolio_metrics(self, account_size: float = 100000) -> PortfolioMetrics:
         """Calculate comprehensive portfolio metrics."""
-        # Calculate capital at risk
-        total_risk = sum(pos.max_loss * pos.contracts for pos in self.current_positions)
+        # Capital at risk, concentrations and P&L come from the store's running aggregates
+        totals = self.store.totals()
+        total_risk = totals.capital_at_risk
         utilization_pct = (total_risk / account_size) * 100 if account_size > 0 else 0
         
-        # Calculate concentrations by sector
-        sector_risk = {}
-        strategy_risk = {}
-        
-        for pos in self.current_positions:
-            pos_risk = pos.max_loss * pos.contracts
-            
-            # Sector concentration
-            sector = self._get_symbol_sector(pos.symbol)
-            sector_risk[sector] = sector_risk.get(sector, 0) + pos_risk
-            
-            # Strategy concentration
-            strategy_risk[pos.strategy_type] = strategy_risk.get(pos.strategy_type, 0) + pos_risk
-        
-        # Calculate P&L
-        unrealized_pnl = sum(pos.unrealized_pnl * pos.contracts for pos in self.current_positions)
+        sector_risk = {sector: agg.capital_at_risk for sector, agg in self.store.breakdown("sector").items()}
+        strategy_risk = {strategy: agg.capital_at_risk
+                         for strategy, agg in self.store.breakdown("strategy").items()}
+        unrealized_pnl = totals.unrealized_pnl
         
         # Get portfolio Greeks
         greeks = self.calculate_portfolio_greeks(account_size)
@@ -346,6 +329,25 @@ class RiskManagementEngine:
             greeks=greeks
         )
     
+    def stress_portfolio(self, spots: Optional[Dict[str, float]] = None,
+                         price_moves_pct: Optional[List[float]] = None,
+                         iv_shifts: Optional[List[float]] = None,
+                         day_rolls: Optional[List[float]] = None) -> StressResult:
+        """
+        Reprice all open positions under a price x IV x time scenario grid.
+        
+        Args:
+            spots: Current underlying prices by symbol (defaults to entry prices)
+            price_moves_pct: Underlying moves in percent
+            iv_shifts: Absolute IV shifts as decimals
+            day_rolls: Calendar days elapsed
+            
+        Returns:
+            StressResult with the (positions, moves, shifts, days) P&L cube
+        """
+        return PortfolioStressEngine().stress(self.current_positions, spots, price_moves_pct,
+                                              iv_shifts, day_rolls)
+    
     def validate_risk_compliance(self, symbol: str, contracts: int, max_loss: float,
                                account_size: float, net_delta: float = 0.0) -> RiskAssessment:
         """
@@ -377,7 +379,7 @@ class RiskManagementEngine:
             violations.append("Position would exceed concentration limits")
         
         # Check portfolio utilization
-        current_risk = sum(pos.max_loss * pos.contracts for pos in self.current_positions)
+        current_risk = self.store.totals().capital_at_risk
         total_utilization = ((current_risk + position_risk) / account_size) * 100 if account_size > 0 else 0
         
         if total_utilization > 75:
@@ -399,7 +401,7 @@ class RiskManagementEngine:
         if risk_pct > 2:
             recommendations.append("Consider reducing position size for better risk management")
         
-        if len(self.current_positions) >= 10:
+        if self.store.totals().count >= 10:
             recommendations.append("Portfolio has many positions - consider closing some before adding new ones")
         
         # Calculate risk score (0-100)
@@ -424,10 +426,15 @@ class RiskManagementEngine:
     
     def add_position(self, symbol: str, contracts: int, net_debit: float, max_loss: float,
                     strategy_type: str = "calendar_spread", net_delta: float = 0.0,
-                    net_vega: float = 0.0, net_theta: float = 0.0) -> bool:
+                    net_vega: float = 0.0, net_theta: float = 0.0,
+                    underlying_price: float = 0.0, legs: Optional[List[Dict[str, Any]]] = None) -> bool:
         """
         Add new position to portfolio tracking.
         
+        Args:
+            underlying_price: Underlying price at entry (stress fallback when no spot is supplied)
+            legs: Option legs for full-revaluation stress tests (see stress.calendar_legs)
+        
         Returns:
             True if position was added successfully
         """
@@ -442,11 +449,12 @@ class RiskManagementEngine:
                 net_delta=net_delta,
                 net_vega=net_vega,
                 net_theta=net_theta,
-                sector=self._get_symbol_sector(symbol)
+                sector=self._get_symbol_sector(symbol),
+                underlying_price=underlying_price,
+                legs=list(legs or [])
             )
             
-            self.current_positions.append(position)
-            self._save_positions()
+            self.store.add(position.to_dict())
             
             logger.info(f"Added position: {symbol} {contracts} contracts, ${net_debit * contracts:.0f} debit")
             return True
@@ -456,13 +464,9 @@ class RiskManagementEngine:
             return False
     
     def remove_position(self, symbol: str) -> bool:
-        """Remove position from portfolio tracking."""
+        """Close all open positions in a symbol (closed rows are kept as history)."""
         try:
-            original_count = len(self.current_positions)
-            self.current_positions = [pos for pos in self.current_positions if pos.symbol != symbol]
-            
-            if len(self.current_positions) < original_count:
-                self._save_positions()
+            if self.store.close_positions(symbol) > 0:
                 logger.info(f"Removed position: {symbol}")
                 return True
             else:
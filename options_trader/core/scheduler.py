@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Earnings Window Scheduler
+=========================
+
+Event-driven replacement for periodic full rescans: tracks a watchlist and
+acts on each symbol only when its earnings trading windows open.
+
+One timer heap holds every pending event across the watchlist, ordered by
+wall-clock time:
+- refresh:  look up the next earnings event and (re)compute its windows
+            (every REFRESH_INTERVAL while the event is far away)
+- prefetch: warm the chain cache shortly before the entry window
+- entry:    run analyze_symbol with the decision pipeline as the entry
+            window opens (TradingWindows.entry_start)
+- exit:     notify when the exit window opens (TradingWindows.exit_start)
+
+The run loop sleeps until the earliest event is due, so thousands of tracked
+names cost one sleeping thread and a heap entry or two each while idle. Events
+that are due run on a small worker pool. Rescheduled or untracked symbols
+leave stale heap entries behind that are skipped when popped (lazy deletion,
+no heap rebuilds).
+
+Windows that fall on a weekend are skipped with a warning, like
+EarningsCalendar.validate_earnings_event reports them.
+
+Configuration (environment):
+- SCHEDULER_PREFETCH_LEAD_SEC: Seconds before entry to prefetch chains (default 60;
+  keep below CHAIN_CACHE_TTL_SEC so the prefetched chains are still cached)
+- SCHEDULER_REFRESH_INTERVAL_SEC: Seconds between earnings lookups per symbol (default 43200)
+"""
+
+import os
+import heapq
+import logging
+import itertools
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .data_service import DataService
+from .earnings import EarningsCalendar, TradingWindows, ZoneInfo
+from .analyzer import analyze_symbol
+from ..providers.base import EarningsEvent
+from ..providers.metrics import MetricsRegistry
+
+logger = logging.getLogger("options_trader.scheduler")
+
+PREFETCH_LEAD_SEC = float(os.getenv("SCHEDULER_PREFETCH_LEAD_SEC", "60"))
+REFRESH_INTERVAL_SEC = float(os.getenv("SCHEDULER_REFRESH_INTERVAL_SEC", str(12 * 3600)))
+MAX_SLEEP_SEC = 60.0  # Re-check the clock at least this often (suspend, clock changes)
+DEFAULT_SCHEDULER_WORKERS = 4
+
+EVENT_KINDS = ("refresh", "prefetch", "entry", "exit")
+
+_registry = MetricsRegistry.shared()
+_registry.describe("scheduler_events_total", "Scheduler events fired, by kind and status")
+
+# Heap entry: (due timestamp, sequence, kind, symbol, generation)
+_HeapEntry = Tuple[float, int, str, str, int]
+
+
+@dataclass
+class TrackedSymbol:
+    """Scheduling state of one watchlist symbol."""
+    symbol: str
+    generation: int
+    earnings: Optional[EarningsEvent] = None
+    windows: Optional[TradingWindows] = None
+    last_refresh: Optional[datetime] = None
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _on_weekend(moment: datetime, market_timezone: str) -> bool:
+    try:
+        return moment.astimezone(ZoneInfo(market_timezone)).weekday() >= 5
+    except Exception:
+        return moment.weekday() >= 5
+
+
+class EarningsWindowScheduler:
+    """Timer-heap scheduler that runs analysis just in time for each symbol's entry window."""
+
+    def __init__(self, data_service: DataService, symbols: Iterable[str] = (),
+                 analysis_options: Optional[Dict[str, Any]] = None,
+                 on_entry: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 on_exit: Optional[Callable[[str, TradingWindows], None]] = None,
+                 prefetch_lead_sec: float = PREFETCH_LEAD_SEC,
+                 refresh_interval_sec: float = REFRESH_INTERVAL_SEC,
+                 max_workers: Optional[int] = None,
+                 calendar: Optional[EarningsCalendar] = None,
+                 clock: Callable[[], datetime] = _utc_now):
+        """
+        Initialize the scheduler.
+
+        Args:
+            data_service: DataService used for earnings lookups, prefetches and analysis
+            symbols: Initial watchlist
+            analysis_options: analyze_symbol() keyword arguments for entry analyses
+                (default: 2 expirations with earnings and trading decision)
+            on_entry: Called with (symbol, analysis result) when an entry window opens
+            on_exit: Called with (symbol, windows) when an exit window opens
+            prefetch_lead_sec: Seconds before entry_start to prefetch chains (0 disables)
+            refresh_interval_sec: Seconds between earnings lookups for a symbol
+            max_workers: Worker threads for due events
+            calendar: EarningsCalendar to use (built from data_service if None)
+            clock: Returns the current time as an aware datetime
+        """
+        self.data_service = data_service
+        self.analysis_options = dict(analysis_options or {"expirations_to_check": 2, "include_earnings": True,
+                                                          "include_trading_decision": True})
+        self.on_entry = on_entry
+        self.on_exit = on_exit
+        self.prefetch_lead = timedelta(seconds=max(0.0, prefetch_lead_sec))
+        self.refresh_interval = timedelta(seconds=max(1.0, refresh_interval_sec))
+        self.max_workers = max(1, int(max_workers or DEFAULT_SCHEDULER_WORKERS))
+        self.calendar = calendar or EarningsCalendar(data_service.get_earnings_providers())
+        self.clock = clock
+
+        self._heap: List[_HeapEntry] = []
+        self._sequence = itertools.count()
+        self._tracked: Dict[str, TrackedSymbol] = {}
+        self._fired: Counter = Counter()
+        self._wakeup = threading.Condition()
+        self._stop = threading.Event()
+
+        self.track(symbols)
+
+    # Watchlist -------------------------------------------------------------
+
+    def track(self, symbols: Iterable[str]) -> int:
+        """
+        Start tracking symbols (an earnings lookup is scheduled immediately).
+
+        Returns:
+            Number of newly tracked symbols
+        """
+        added = 0
+        now = self.clock()
+        with self._wakeup:
+            for raw_symbol in symbols:
+                symbol = (raw_symbol or "").strip().upper()
+                if not symbol or symbol in self._tracked:
+                    continue
+                self._tracked[symbol] = TrackedSymbol(symbol, next(self._sequence))
+                self._push(now, "refresh", symbol)
+                added += 1
+        return added
+
+    def untrack(self, symbol: str) -> bool:
+        """Stop tracking a symbol; its pending events are dropped when they come due."""
+        with self._wakeup:
+            return self._tracked.pop(symbol.strip().upper(), None) is not None
+
+    def tracked(self, symbol: str) -> Optional[TrackedSymbol]:
+        """Scheduling state of a tracked symbol."""
+        return self._tracked.get(symbol.strip().upper())
+
+    def _push(self, when: datetime, kind: str, symbol: str) -> None:
+        """Schedule an event for the symbol's current generation (caller holds _wakeup)."""
+        heapq.heappush(self._heap, (when.timestamp(), next(self._sequence), kind, symbol,
+                                    self._tracked[symbol].generation))
+        self._wakeup.notify()
+
+    def _pop_due(self, now: datetime) -> List[_HeapEntry]:
+        """Pop every current event due at now, skipping stale ones (caller holds _wakeup)."""
+        due = []
+        cutoff = now.timestamp()
+        while self._heap and self._heap[0][0] <= cutoff:
+            entry = heapq.heappop(self._heap)
+            state = self._tracked.get(entry[3])
+            if state is not None and state.generation == entry[4]:
+                due.append(entry)
+        return due
+
+    def next_event_time(self) -> Optional[datetime]:
+        """Due time of the earliest pending event (may be a stale entry)."""
+        with self._wakeup:
+            if not self._heap:
+                return None
+            return datetime.fromtimestamp(self._heap[0][0], timezone.utc)
+
+    # Event handlers --------------------------------------------------------
+
+    def _refresh(self, symbol: str, generation: int) -> None:
+        event = self.calendar.get_next_earnings(symbol)
+        now = self.clock()
+        windows = self.calendar.calculate_trading_windows(event) if event else None
+
+        with self._wakeup:
+            state = self._tracked.get(symbol)
+            if state is None or state.generation != generation:
+                return
+            state.last_refresh = now
+            if windows is None or now > windows.exit_end:
+                # Nothing upcoming (or only a past event): look again later
+                state.earnings, state.windows = event, windows
+                self._push(now + self.refresh_interval, "refresh", symbol)
+                return
+
+            if state.windows != windows:
+                # New or moved event: drop the old window events
+                state.generation = next(self._sequence)
+                state.earnings, state.windows = event, windows
+                self._schedule_windows(state, now)
+
+            prefetch_at = windows.entry_start - self.prefetch_lead
+            next_refresh = now + self.refresh_interval
+            if next_refresh >= prefetch_at:
+                next_refresh = windows.exit_end + timedelta(minutes=1)  # Next quarter's event
+            self._push(next_refresh, "refresh", symbol)
+
+    def _schedule_windows(self, state: TrackedSymbol, now: datetime) -> None:
+        """Push prefetch/entry/exit events for windows that have not closed (caller holds _wakeup)."""
+        windows = state.windows
+        if now <= windows.entry_end:
+            if _on_weekend(windows.entry_start, windows.market_timezone):
+                logger.warning(f"{state.symbol} entry window falls on a weekend, skipping entry")
+            else:
+                prefetch_at = windows.entry_start - self.prefetch_lead
+                if self.prefetch_lead and prefetch_at > now:
+                    self._push(prefetch_at, "prefetch", state.symbol)
+                self._push(max(windows.entry_start, now), "entry", state.symbol)
+        if now <= windows.exit_end:
+            if _on_weekend(windows.exit_start, windows.market_timezone):
+                logger.warning(f"{state.symbol} exit window falls on a weekend, skipping exit")
+            else:
+                self._push(max(windows.exit_start, now), "exit", state.symbol)
+        logger.info(f"Scheduled {state.symbol}: entry {windows.entry_start.isoformat()}, "
+                    f"exit {windows.exit_start.isoformat()}")
+
+    def _prefetch(self, symbol: str, generation: int) -> None:
+        count = int(self.analysis_options.get("expirations_to_check", 1))
+        expirations, _ = self.data_service.get_expirations(symbol, max_count=count)
+        for expiration in expirations:
+            self.data_service.get_chain(symbol, expiration)
+
+    def _entry(self, symbol: str, generation: int) -> None:
+        result = analyze_symbol(symbol, data_service=self.data_service, **self.analysis_options)
+        if self.on_entry:
+            self.on_entry(symbol, result)
+        else:
+            decision = result.get("trading_decision", {}).get("decision", result.get("error"))
+            logger.info(f"Entry window open for {symbol}: {decision}")
+
+    def _exit(self, symbol: str, generation: int) -> None:
+        state = self._tracked.get(symbol)
+        if state is None:
+            return
+        if self.on_exit:
+            self.on_exit(symbol, state.windows)
+        else:
+            logger.info(f"Exit window open for {symbol} until {state.windows.exit_end.isoformat()}")
+
+    def _fire(self, entry: _HeapEntry) -> None:
+        _, _, kind, symbol, generation = entry
+        handler = getattr(self, f"_{kind}")
+        status = "ok"
+        try:
+            handler(symbol, generation)
+        except Exception as e:
+            status = "error"
+            logger.error(f"Scheduler {kind} failed for {symbol}: {e}")
+            if kind == "refresh":
+                with self._wakeup:
+                    state = self._tracked.get(symbol)
+                    if state is not None and state.generation == generation:
+                        self._push(self.clock() + self.refresh_interval, "refresh", symbol)
+        with self._wakeup:
+            self._fired[kind] += 1
+        _registry.inc("scheduler_events_total", kind=kind, status=status)
+
+    # Running ---------------------------------------------------------------
+
+    def run_pending(self) -> List[Tuple[str, str]]:
+        """
+        Run every event that is due in the calling thread (including due events they schedule).
+
+        Returns:
+            (kind, symbol) of each event run, in order
+        """
+        ran = []
+        while True:
+            with self._wakeup:
+                due = self._pop_due(self.clock())
+            if not due:
+                return ran
+            for entry in due:
+                self._fire(entry)
+                ran.append((entry[2], entry[3]))
+
+    def run(self) -> None:
+        """Sleep until events come due and run them on the worker pool, until stop() is called."""
+        self._stop.clear()
+        logger.info(f"Earnings scheduler running: {len(self._tracked)} symbols, {self.max_workers} workers")
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scheduler") as executor:
+            while not self._stop.is_set():
+                with self._wakeup:
+                    now = self.clock()
+                    due = self._pop_due(now)
+                    if not due:
+                        delay = MAX_SLEEP_SEC
+                        if self._heap:
+                            delay = min(delay, self._heap[0][0] - now.timestamp())
+                        self._wakeup.wait(max(delay, 0.0))
+                        continue
+                for entry in due:
+                    executor.submit(self._fire, entry)
+        logger.info("Earnings scheduler stopped")
+
+    def stop(self) -> None:
+        """Stop run() after the events already submitted finish."""
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Tracked symbols, pending heap entries and fired event counts."""
+        next_event = self.next_event_time()
+        with self._wakeup:
+            return {
+                "tracked": len(self._tracked),
+                "pending": len(self._heap),
+                "scheduled_entries": sum(1 for s in self._tracked.values()
+                                         if s.windows is not None and s.windows.entry_end >= self.clock()),
+                "fired": {kind: self._fired.get(kind, 0) for kind in EVENT_KINDS},
+                "next_event": next_event.isoformat() if next_event else None
+            }
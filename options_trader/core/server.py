@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analysis Server
+===============
+
+Long-running analysis daemon exposing analyze_symbol and watchlist scans over
+a local HTTP/JSON API (TCP or Unix socket).
+
+A one-shot CLI run pays for interpreter start-up, imports, logging setup,
+provider construction and cold caches on every call. The server keeps one
+process resident instead:
+- One DataService per data mode, so provider sessions, the chain/surface
+  caches, the price cache and the history store stay warm across requests
+- A persistent worker pool for scans (single-symbol requests run on their
+  connection thread, so they never queue behind a large scan)
+- HTTP/1.1 keep-alive, so clients can reuse one connection
+
+Endpoints:
+- GET  /health             Liveness, version, uptime and request count
+- GET  /stats              Cache and rate limiter counters plus metrics snapshot
+- GET  /metrics            Prometheus text exposition of the metrics registry
+- GET  /analyze/<SYMBOL>   analyze_symbol with options from the query string
+- POST /analyze            analyze_symbol with options from a JSON body
+- POST /scan               Watchlist scan; streams one JSON line per symbol
+
+Request options: symbol, expirations, demo, earnings, trade_construction,
+position_sizing, trading_decision, structure, account_size, risk_per_trade
+(scans take symbols instead of symbol). Options not given fall back to the
+server defaults set on the command line.
+
+The server binds to localhost by default and has no authentication; do not
+expose it on a public interface.
+
+Configuration (environment):
+- SERVE_ADDRESS: Default listen address (host:port, port, or unix:/path)
+- SERVE_MAX_SCAN_SYMBOLS: Largest accepted scan (default 5000)
+"""
+
+import os
+import json
+import time
+import signal
+import logging
+import threading
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .analyzer import DEFAULT_WATCHLIST_WORKERS, analyze_symbol, analyze_watchlist
+from .data_service import DataService
+from .history_store import validate_symbol
+from ..providers.metrics import MetricsRegistry
+
+logger = logging.getLogger("options_trader.server")
+
+DEFAULT_SERVE_ADDRESS = "127.0.0.1:8765"
+MAX_REQUEST_BYTES = 1 << 20
+MAX_SCAN_SYMBOLS = int(os.getenv("SERVE_MAX_SCAN_SYMBOLS", "5000"))
+ROUTES = ("/health", "/stats", "/metrics", "/analyze", "/scan")
+
+_registry = MetricsRegistry.shared()
+_registry.describe("server_requests_total", "API requests served, by route and HTTP status")
+_registry.describe("server_request_seconds", "API request wall time in seconds, by route")
+
+
+class RequestError(ValueError):
+    """Invalid API request (reported to the client as HTTP 400)."""
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def _checked_symbol(value: Any) -> str:
+    """Upper-cased ticker symbol, or RequestError for anything else (symbols become file names)."""
+    try:
+        return validate_symbol(str(value))
+    except ValueError as e:
+        raise RequestError(str(e))
+
+
+# Request field -> (analyze_symbol keyword, converter)
+ANALYSIS_OPTIONS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "expirations": ("expirations_to_check", int),
+    "earnings": ("include_earnings", _parse_bool),
+    "trade_construction": ("include_trade_construction", _parse_bool),
+    "position_sizing": ("include_position_sizing", _parse_bool),
+    "trading_decision": ("include_trading_decision", _parse_bool),
+    "structure": ("trade_structure", str),
+    "account_size": ("account_size", float),
+    "risk_per_trade": ("risk_per_trade", float)
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars/arrays and dates found in analysis results."""
+    if hasattr(value, "item") and getattr(value, "ndim", 0) == 0:
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def to_json(value: Any) -> bytes:
+    """Encode a response body."""
+    return json.dumps(value, default=_json_default).encode("utf-8")
+
+
+def parse_address(spec: str) -> Tuple[str, Any]:
+    """
+    Parse a listen address.
+
+    Args:
+        spec: 'host:port', 'port' (localhost) or 'unix:/path/to/socket'
+
+    Returns:
+        ('unix', path) or ('tcp', (host, port))
+
+    Raises:
+        ValueError if the address cannot be parsed
+    """
+    spec = spec.strip()
+    if spec.startswith("unix:"):
+        path = spec[len("unix:"):]
+        if not path:
+            raise ValueError("Unix socket address needs a path (unix:/path/to/socket)")
+        return "unix", path
+    host, _, port = spec.rpartition(":")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Threaded HTTP server on a Unix domain socket (owner-only permissions)."""
+
+        daemon_threads = True
+
+        def server_bind(self):
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)  # Stale socket from an earlier run
+            super().server_bind()
+            os.chmod(self.server_address, 0o600)
+else:
+    _UnixHTTPServer = None
+
+
+class AnalysisServer:
+    """Resident analysis process serving the JSON API."""
+
+    def __init__(self, address: str = DEFAULT_SERVE_ADDRESS, max_workers: Optional[int] = None,
+                 defaults: Optional[Dict[str, Any]] = None, data_service: Optional[DataService] = None):
+        """
+        Bind the server (requests are served once serve_forever() runs).
+
+        Args:
+            address: Listen address ('host:port', 'port' or 'unix:/path')
+            max_workers: Scan worker pool size (default: WATCHLIST_MAX_WORKERS env or 8)
+            defaults: Default request options (demo, expirations, earnings, ...)
+            data_service: DataService to serve the default data mode from (created lazily if None)
+        """
+        self.defaults = dict(defaults or {})
+        self.max_workers = max(1, int(max_workers or os.getenv("WATCHLIST_MAX_WORKERS", DEFAULT_WATCHLIST_WORKERS)))
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="serve")
+        self.started_at = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._services: Dict[bool, DataService] = {}
+        if data_service is not None:
+            self._services[_parse_bool(self.defaults.get("demo", False))] = data_service
+
+        kind, bind_to = parse_address(address)
+        handler = type("Handler", (_RequestHandler,), {"api": self})
+        if kind == "unix":
+            if _UnixHTTPServer is None:
+                raise ValueError("Unix sockets are not supported on this platform")
+            self.httpd = _UnixHTTPServer(bind_to, handler)
+            self.address = f"unix:{bind_to}"
+        else:
+            self.httpd = ThreadingHTTPServer(bind_to, handler)
+            host, port = self.httpd.server_address[:2]
+            self.address = f"http://{host}:{port}"
+
+    # Data services ---------------------------------------------------------
+
+    def service(self, demo: bool) -> DataService:
+        """Return the warm DataService for a data mode, creating it on first use."""
+        with self._lock:
+            service = self._services.get(demo)
+            if service is None:
+                service = self._services[demo] = DataService(use_demo=demo)
+            return service
+
+    def warm_up(self) -> None:
+        """Construct the default DataService before the first request arrives."""
+        self.service(_parse_bool(self.defaults.get("demo", False)))
+
+    def _options(self, payload: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        merged = {**self.defaults, **{k: v for k, v in payload.items() if v is not None}}
+        options = {}
+        try:
+            for field, (keyword, convert) in ANALYSIS_OPTIONS.items():
+                if merged.get(field) is not None:
+                    options[keyword] = convert(merged[field])
+        except (TypeError, ValueError) as e:
+            raise RequestError(f"Invalid option value: {e}")
+        return _parse_bool(merged.get("demo", False)), options
+
+    # API operations --------------------------------------------------------
+
+    def analyze(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Run analyze_symbol for payload['symbol'] on the warm DataService."""
+        symbol = str(payload.get("symbol") or "").strip()
+        if not symbol:
+            raise RequestError("Missing 'symbol'")
+        symbol = _checked_symbol(symbol)
+        demo, options = self._options(payload)
+        return analyze_symbol(symbol, use_demo=demo, data_service=self.service(demo), **options)
+
+    def scan(self, payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Scan payload['symbols'] on the worker pool, yielding results as they finish."""
+        symbols = payload.get("symbols")
+        if isinstance(symbols, str):
+            symbols = symbols.replace(",", " ").split()
+        if not isinstance(symbols, list) or not symbols:
+            raise RequestError("'symbols' must be a non-empty list")
+        if len(symbols) > MAX_SCAN_SYMBOLS:
+            raise RequestError(f"At most {MAX_SCAN_SYMBOLS} symbols per scan")
+        symbols = [_checked_symbol(s) for s in symbols]
+        demo, options = self._options({k: v for k, v in payload.items() if k not in ("symbols", "workers")})
+        service = self.service(demo)
+        for symbol, result in analyze_watchlist(symbols, use_demo=demo, data_service=service,
+                                                executor=self.executor, **options):
+            yield {"symbol": symbol, "result": result}
+
+    def health(self) -> Dict[str, Any]:
+        """Liveness summary."""
+        from .. import __version__
+        return {"status": "ok", "version": __version__, "uptime_sec": round(time.time() - self.started_at, 1),
+                "requests": self.requests, "workers": self.max_workers,
+                "data_modes": ["demo" if demo else "live" for demo in sorted(self._services)]}
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache, rate limiter and metrics counters of the warm services."""
+        with self._lock:
+            services = dict(self._services)
+        stats = {"caches": {("demo" if demo else "live"): service.cache_stats() for demo, service in services.items()},
+                 "metrics": _registry.snapshot()}
+        if services:
+            stats["rate_limits"] = next(iter(services.values())).rate_limit_stats()
+        return stats
+
+    # Lifecycle -------------------------------------------------------------
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown() is called or the process is interrupted."""
+        logger.info(f"Analysis server listening on {self.address} ({self.max_workers} scan workers)")
+        self.httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() (call from another thread)."""
+        self.httpd.shutdown()
+
+    def close(self) -> None:
+        """Release the socket, stop the worker pool and persist the price cache."""
+        self.httpd.server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for service in self._services.values():
+            service.price_cache.flush()
+        if self.address.startswith("unix:") and os.path.exists(self.address[len("unix:"):]):
+            os.unlink(self.address[len("unix:"):])
+        logger.info("Analysis server stopped")
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes API requests to the owning AnalysisServer."""
+
+    api: AnalysisServer = None
+    protocol_version = "HTTP/1.1"
+    server_version = "OptionsTraderServer"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        route = "/" + (parts[0] if parts else "")
+        if route not in ROUTES:
+            route = "other"  # Keep metric labels bounded
+        status = 500
+        with self.api._lock:
+            self.api.requests += 1
+        try:
+            if method == "GET" and route == "/health" and len(parts) == 1:
+                status = self._send_json(200, self.api.health())
+            elif method == "GET" and route == "/stats" and len(parts) == 1:
+                status = self._send_json(200, self.api.stats())
+            elif method == "GET" and route == "/metrics" and len(parts) == 1:
+                status = self._send(200, _registry.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+            elif method == "GET" and route == "/analyze" and len(parts) == 2:
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                status = self._send_json(200, self.api.analyze({**query, "symbol": parts[1]}))
+            elif method == "POST" and route == "/analyze" and len(parts) == 1:
+                status = self._send_json(200, self.api.analyze(self._read_json()))
+            elif method == "POST" and route == "/scan" and len(parts) == 1:
+                status = self._stream_lines(self.api.scan(self._read_json()))
+            else:
+                status = self._send_json(404, {"error": f"No route for {method} {url.path}"})
+        except RequestError as e:
+            status = self._send_json(400, {"error": str(e)})
+        except (BrokenPipeError, ConnectionResetError):
+            status = 499  # Client went away
+            self.close_connection = True
+        except Exception as e:
+            logger.error(f"{method} {url.path} failed: {e}", exc_info=True)
+            status = self._send_json(500, {"error": f"Internal server error: {e}"})
+        finally:
+            _registry.inc("server_requests_total", route=route, status=str(status))
+            _registry.observe("server_request_seconds", time.perf_counter() - start, route=route)
+
+    def _read_json(self) -> Dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            raise RequestError("Invalid Content-Length")
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            raise RequestError(f"Request body larger than {MAX_REQUEST_BYTES} bytes")
+        body = self.rfile.read(length) if length else b"{}"
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise RequestError(f"Request body is not valid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise RequestError("Request body must be a JSON object")
+        return payload
+
+    def _send(self, status: int, body: bytes, content_type: str) -> int:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return status
+
+    def _send_json(self, status: int, value: Any) -> int:
+        return self._send(status, to_json(value), "application/json")
+
+    def _stream_lines(self, lines: Iterator[Dict[str, Any]]) -> int:
+        """Send one JSON object per line with chunked encoding as each becomes available."""
+        first = next(lines, None)  # Validation errors surface here, before headers are sent
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            line = first
+            while line is not None:
+                chunk = to_json(line) + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.flush()
+                line = next(lines, None)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception as e:
+            # Headers are already sent; end the stream without the terminating chunk
+            logger.error(f"Streaming response failed: {e}", exc_info=True)
+            self.close_connection = True
+            return 500
+        finally:
+            if hasattr(lines, "close"):
+                lines.close()  # Cancels queued symbols if the client disconnected
+        return 200
+
+
+def run_server(address: Optional[str] = None, max_workers: Optional[int] = None,
+               defaults: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Run the analysis server in the foreground until interrupted.
+
+    Args:
+        address: Listen address (default: SERVE_ADDRESS env or 127.0.0.1:8765)
+        max_workers: Scan worker pool size
+        defaults: Default request options
+    """
+    server = AnalysisServer(address or os.getenv("SERVE_ADDRESS") or DEFAULT_SERVE_ADDRESS,
+                            max_workers=max_workers, defaults=defaults)
+    server.warm_up()
+    if threading.current_thread() is threading.main_thread():
+        # Stop cleanly (flushing caches) on SIGTERM as well as Ctrl+C
+        signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+    print(f"📡 Analysis server listening on {server.address} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Analysis server interrupted")
+    finally:
+        server.close()
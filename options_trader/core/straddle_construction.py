@@ -26,8 +26,14 @@ except ImportError:
     HAS_NUMPY = False
     np = None
 
+from .pricing import black_scholes, norm_cdf
+from ..providers.chain import OptionChain, StrikeIndex
+
 logger = logging.getLogger("options_trader.straddle_construction")
 
+# Risk-free rate used when leg Greeks have to be computed locally
+STRADDLE_RISK_FREE_RATE = 0.05
+
 
 @dataclass
 class OptionQuote:
@@ -164,6 +170,9 @@ class StraddleConstructor:
                 self.logger.warning(f"Could not find both call and put options at strike {atm_strike}")
                 return None
             
+            # Chains without provider Greeks get them from the pricing kernel
+            self._fill_missing_greeks([call_option, put_option], current_price, expiration)
+            
             # Calculate straddle metrics
             net_credit = call_option.mid_price() + put_option.mid_price()
             max_profit = net_credit  # Maximum profit if stock stays at strike
@@ -200,21 +209,14 @@ class StraddleConstructor:
     def _find_atm_strike(self, current_price: float, options_chain, expiration: str) -> Optional[float]:
         """Find the strike closest to current price"""
         try:
-            # Handle yfinance Options object
+            # Handle OptionChain / yfinance-style object with calls DataFrame
             if hasattr(options_chain, 'calls'):
-                # yfinance Options object - extract strikes from calls DataFrame
-                calls_df = options_chain.calls
-                if calls_df.empty:
+                call_side = OptionChain.from_any(options_chain, expiration=expiration).call_side
+                if not len(call_side):
                     self.logger.warning(f"No calls found in options chain")
                     return None
+                strike_index = call_side.index
                 
-                # Extract strikes from the 'strike' column
-                if 'strike' in calls_df.columns:
-                    strikes = calls_df['strike'].tolist()
-                else:
-                    self.logger.warning(f"No 'strike' column found in calls DataFrame")
-                    return None
-                    
             # Handle dictionary structure (legacy format)
             elif isinstance(options_chain, dict):
                 # Look for calls in the options chain for this expiration
@@ -230,17 +232,16 @@ class StraddleConstructor:
                     return None
                 
                 calls = exp_data["calls"]
-                strikes = [float(strike) for strike in calls.keys()]
+                strike_index = StrikeIndex.from_values(list(calls.keys()))
                 
             else:
                 self.logger.warning(f"Unsupported options chain format: {type(options_chain)}")
                 return None
             
-            if not strikes:
-                return None
-            
             # Find closest strike to current price
-            closest_strike = min(strikes, key=lambda x: abs(x - current_price))
+            closest_strike = strike_index.nearest_strike(current_price)
+            if closest_strike is None:
+                return None
             
             self.logger.debug(f"ATM strike selected: ${closest_strike} (current: ${current_price:.2f})")
             return closest_strike
@@ -253,22 +254,19 @@ class StraddleConstructor:
                          option_type: str, options_chain) -> Optional[OptionQuote]:
         """Get option quote for specific strike/expiration/type"""
         try:
-            # Handle yfinance Options object
+            # Handle OptionChain / yfinance-style object with calls/puts DataFrames
             if hasattr(options_chain, 'calls') and hasattr(options_chain, 'puts'):
-                if option_type == "call":
-                    df = options_chain.calls
-                else:
-                    df = options_chain.puts
+                side = OptionChain.from_any(options_chain, expiration=expiration).side(option_type)
                 
                 # Find row with matching strike
-                matching_rows = df[df['strike'] == strike]
-                if matching_rows.empty:
+                index = side.index.exact(strike)
+                if index is None:
                     self.logger.warning(f"No {option_type} found for strike ${strike}")
                     return None
                     
-                option_row = matching_rows.iloc[0]  # Take first match
+                option_row = side.row(index)
                 
-                # Extract option data from DataFrame row
+                # Extract option data from chain row
                 quote = OptionQuote(
                     symbol=option_row.get('contractSymbol', f"{symbol}{expiration.replace('-', '')}{option_type[0].upper()}{int(strike)}"),
                     strike=strike,
@@ -321,6 +319,48 @@ class StraddleConstructor:
             self.logger.error(f"Error getting {option_type} option quote: {e}")
             return None
     
+    def _days_to_expiration(self, expiration: str) -> Optional[int]:
+        """Calendar days until expiration, or None if the date cannot be parsed."""
+        try:
+            exp_date = datetime.strptime(expiration, "%Y-%m-%d")
+            return (exp_date - datetime.now()).days
+        except (TypeError, ValueError):
+            return None
+    
+    def _fill_missing_greeks(self, quotes: List[OptionQuote], current_price: float, expiration: str) -> None:
+        """Compute Greeks for legs whose chain rows carried none (all legs in one call)."""
+        missing = [q for q in quotes
+                   if q.implied_volatility > 0 and not any((q.delta, q.gamma, q.theta, q.vega))]
+        if not missing:
+            return
+        
+        days_to_exp = self._days_to_expiration(expiration)
+        if days_to_exp is None:
+            return
+        
+        try:
+            if HAS_NUMPY:
+                bs = black_scholes(
+                    current_price,
+                    np.array([q.strike for q in missing]),
+                    np.array([q.implied_volatility for q in missing]),
+                    max(days_to_exp, 0) / 365.0,
+                    STRADDLE_RISK_FREE_RATE,
+                    np.array([q.option_type for q in missing])
+                )
+                for i, quote in enumerate(missing):
+                    quote.delta = float(bs.delta[i])
+                    quote.gamma = float(bs.gamma[i])
+                    quote.theta = float(bs.theta[i])
+                    quote.vega = float(bs.vega[i])
+            else:
+                for quote in missing:
+                    bs = black_scholes(current_price, quote.strike, quote.implied_volatility,
+                                       max(days_to_exp, 0) / 365.0, STRADDLE_RISK_FREE_RATE, quote.option_type)
+                    quote.delta, quote.gamma, quote.theta, quote.vega = bs.delta, bs.gamma, bs.theta, bs.vega
+        except Exception as e:
+            self.logger.warning(f"Could not compute leg Greeks: {e}")
+    
     def _calculate_pop(self, current_price: float, straddle: StraddleTrade) -> float:
         """Calculate probability of profit (simplified)"""
         try:
@@ -331,17 +371,15 @@ class StraddleConstructor:
             avg_iv = (straddle.call_option.implied_volatility + 
                      straddle.put_option.implied_volatility) / 2.0
             
-            if not HAS_NUMPY or avg_iv <= 0:
+            if avg_iv <= 0:
                 return 0.5  # Default estimate
             
             # Calculate days to expiration
-            try:
-                exp_date = datetime.strptime(straddle.expiration, "%Y-%m-%d")
-                days_to_exp = (exp_date - datetime.now()).days
-                if days_to_exp <= 0:
-                    return 0.0
-            except:
+            days_to_exp = self._days_to_expiration(straddle.expiration)
+            if days_to_exp is None:
                 days_to_exp = 30  # Default
+            elif days_to_exp <= 0:
+                return 0.0
             
             # Standard deviation of price movement
             time_factor = (days_to_exp / 365.0) ** 0.5
@@ -353,8 +391,7 @@ class StraddleConstructor:
             
             # Probability of being outside breakeven range
             # P(X < lower) + P(X > upper) = P(X < lower) + (1 - P(X < upper))
-            from scipy.stats import norm
-            prob_profit = norm.cdf(z_lower) + (1 - norm.cdf(z_upper))
+            prob_profit = float(norm_cdf(z_lower) + (1 - norm_cdf(z_upper)))
             
             return max(0.0, min(1.0, prob_profit))
             
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Portfolio Stress Engine
+=======================
+
+Full-revaluation stress testing of every open position under a grid of
+underlying moves, implied volatility shifts and day rolls.
+
+Each position's option legs (recorded with the position, see calendar_legs
+and straddle_legs) are repriced with Black-Scholes for every scenario in one
+batched NumPy evaluation, processed in leg chunks that keep temporaries
+cache-sized. Leg values are netted per position into a P&L cube ordered
+position, price move, IV shift, day roll. Positions recorded without legs
+fall back to a first-order Taylor estimate from their stored spread Greeks.
+
+P&L is in dollars relative to the current model value of each leg, using the
+standard 100-share contract multiplier.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+# Conditional imports for optional dependencies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+from .pricing import DAYS_PER_YEAR, IV_MIN_VOL, days_to_expiry, norm_cdf
+
+logger = logging.getLogger("options_trader.stress")
+
+CONTRACT_MULTIPLIER = 100
+STRESS_CHUNK_ELEMENTS = 250_000  # Leg x scenario values evaluated per batch
+MIN_YEARS = 1e-8  # Time floor: legs rolled past expiry price at intrinsic value
+
+DEFAULT_PRICE_MOVES_PCT = tuple(float(m) for m in range(-20, 21, 2))
+DEFAULT_IV_SHIFTS = (-0.10, -0.05, 0.0, 0.05, 0.10)
+DEFAULT_DAY_ROLLS = (0.0, 1.0, 5.0)
+
+
+def calendar_legs(trade) -> List[Dict[str, Any]]:
+    """Legs of a CalendarTrade: short the front option, long the back option."""
+    return [
+        {"option_type": trade.front_option.option_type, "strike": trade.front_option.strike,
+         "expiration": trade.front_expiration, "quantity": -1,
+         "iv": trade.front_option.implied_volatility},
+        {"option_type": trade.back_option.option_type, "strike": trade.back_option.strike,
+         "expiration": trade.back_expiration, "quantity": 1,
+         "iv": trade.back_option.implied_volatility},
+    ]
+
+
+def straddle_legs(trade) -> List[Dict[str, Any]]:
+    """Legs of a short StraddleTrade: short the call and the put."""
+    return [
+        {"option_type": option.option_type, "strike": option.strike, "expiration": trade.expiration,
+         "quantity": -1, "iv": option.implied_volatility}
+        for option in (trade.call_option, trade.put_option)
+    ]
+
+
+@dataclass
+class StressResult:
+    """Portfolio P&L cube with its scenario axes."""
+    pnl: Any                      # (positions, price moves, IV shifts, day rolls)
+    position_ids: List[Optional[int]]
+    symbols: List[str]
+    methods: List[str]            # "full" (leg revaluation) or "taylor" (stored Greeks)
+    price_moves_pct: Any
+    iv_shifts: Any
+    day_rolls: Any
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def scenario_count(self) -> int:
+        return int(self.price_moves_pct.size * self.iv_shifts.size * self.day_rolls.size)
+
+    def portfolio_pnl(self):
+        """Total P&L per scenario, shaped (price moves, IV shifts, day rolls)."""
+        return self.pnl.sum(axis=0)
+
+    def by_symbol(self) -> Dict[str, Any]:
+        """P&L cube summed per underlying symbol."""
+        totals: Dict[str, Any] = {}
+        for index, symbol in enumerate(self.symbols):
+            totals[symbol] = totals[symbol] + self.pnl[index] if symbol in totals else self.pnl[index].copy()
+        return totals
+
+    def worst_case(self) -> Dict[str, float]:
+        """Scenario with the largest portfolio loss."""
+        total = self.portfolio_pnl()
+        i, j, k = np.unravel_index(int(np.argmin(total)), total.shape)
+        return {
+            "pnl": float(total[i, j, k]),
+            "price_change_pct": float(self.price_moves_pct[i]),
+            "iv_shift": float(self.iv_shifts[j]),
+            "days_elapsed": float(self.day_rolls[k]),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for reports (the cube itself is left out)."""
+        total = self.portfolio_pnl()
+        return {
+            "positions": len(self.symbols),
+            "scenarios": self.scenario_count,
+            "full_revaluation": self.methods.count("full"),
+            "taylor_fallback": self.methods.count("taylor"),
+            "skipped": list(self.skipped),
+            "worst_case": self.worst_case(),
+            "best_pnl": float(total.max()) if total.size else 0.0,
+        }
+
+
+class PortfolioStressEngine:
+    """Batched full-revaluation stress engine for open positions."""
+
+    def __init__(self, risk_free_rate: float = 0.05, multiplier: float = CONTRACT_MULTIPLIER,
+                 chunk_elements: int = STRESS_CHUNK_ELEMENTS):
+        """
+        Initialize stress engine.
+
+        Args:
+            risk_free_rate: Rate used for all revaluations
+            multiplier: Shares per contract
+            chunk_elements: Leg x scenario values evaluated per batch (bounds memory)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for portfolio stress testing")
+        self.risk_free_rate = risk_free_rate
+        self.multiplier = multiplier
+        self.chunk_elements = max(1, int(chunk_elements))
+
+    def stress(self, positions: Sequence[Any], spots: Optional[Mapping[str, float]] = None,
+               price_moves_pct: Optional[Sequence[float]] = None,
+               iv_shifts: Optional[Sequence[float]] = None,
+               day_rolls: Optional[Sequence[float]] = None,
+               now: Optional[datetime] = None) -> StressResult:
+        """
+        Build the P&L cube for a set of positions.
+
+        Args:
+            positions: Position objects (symbol, contracts, legs, underlying_price, net_* Greeks)
+            spots: Current underlying prices by symbol (defaults to each position's underlying_price)
+            price_moves_pct: Underlying moves in percent, applied to every symbol
+            iv_shifts: Absolute IV shifts as decimals (0.05 = +5 vol points), applied to every leg
+            day_rolls: Calendar days elapsed before revaluation
+            now: Valuation time for leg days to expiry (testing)
+
+        Returns:
+            StressResult whose cube is (positions, price moves, IV shifts, day rolls)
+        """
+        moves = np.asarray(DEFAULT_PRICE_MOVES_PCT if price_moves_pct is None else price_moves_pct,
+                           dtype=float).ravel()
+        shifts = np.asarray(DEFAULT_IV_SHIFTS if iv_shifts is None else iv_shifts, dtype=float).ravel()
+        days = np.asarray(DEFAULT_DAY_ROLLS if day_rolls is None else day_rolls, dtype=float).ravel()
+        spots = {symbol.upper(): price for symbol, price in (spots or {}).items()}
+        now = now or datetime.now()
+
+        priced, skipped = [], []
+        for position in positions:
+            spot = spots.get(position.symbol.upper()) or getattr(position, "underlying_price", 0.0)
+            if not spot or spot <= 0:
+                skipped.append(position.symbol)
+            else:
+                priced.append((position, float(spot)))
+        if skipped:
+            logger.warning(f"No underlying price for {len(skipped)} positions, excluded from stress: {skipped}")
+
+        methods = ["full" if getattr(position, "legs", None) else "taylor" for position, _ in priced]
+        full = [i for i, method in enumerate(methods) if method == "full"]
+        taylor = [i for i, method in enumerate(methods) if method == "taylor"]
+        cube = np.zeros((len(priced), moves.size, shifts.size, days.size))
+        if full:
+            cube[full] = self._revalue_legs([priced[i] for i in full], moves, shifts, days, now)
+        if taylor:
+            cube[taylor] = self._taylor([priced[i] for i in taylor], moves, shifts, days)
+
+        logger.debug(f"Stressed {len(priced)} positions ({len(full)} full, {len(taylor)} Taylor) "
+                     f"across {moves.size}x{shifts.size}x{days.size} scenarios")
+        return StressResult(
+            pnl=cube,
+            position_ids=[getattr(position, "position_id", None) for position, _ in priced],
+            symbols=[position.symbol for position, _ in priced],
+            methods=methods,
+            price_moves_pct=moves, iv_shifts=shifts, day_rolls=days, skipped=skipped,
+        )
+
+    def _revalue_legs(self, entries, moves, shifts, days, now: datetime):
+        """Reprice every leg across the grid and net legs into per-position P&L."""
+        rows = [(index, position, spot, leg) for index, (position, spot) in enumerate(entries)
+                for leg in position.legs]
+        owner = np.array([row[0] for row in rows])
+        spot = np.array([row[2] for row in rows])
+        strike = np.array([float(row[3]["strike"]) for row in rows])
+        iv = np.array([float(row[3]["iv"]) for row in rows])
+        is_call = np.array([str(row[3]["option_type"]).lower().startswith("c") for row in rows])
+        dte = np.array([days_to_expiry(row[3]["expiration"], now) for row in rows])
+        weight = np.array([float(row[3]["quantity"]) * row[1].contracts for row in rows]) * self.multiplier
+
+        base = self._leg_values(spot, strike, iv, dte, is_call, np.zeros(1), np.zeros(1), np.zeros(1))
+        base = base.reshape(len(rows))
+
+        scenario_shape = (moves.size, shifts.size, days.size)
+        cube = np.zeros((len(entries),) + scenario_shape)
+        chunk = max(1, self.chunk_elements // int(np.prod(scenario_shape)))
+        for start in range(0, len(rows), chunk):
+            stop = min(len(rows), start + chunk)
+            values = self._leg_values(spot[start:stop], strike[start:stop], iv[start:stop], dte[start:stop],
+                                      is_call[start:stop], moves, shifts, days)
+            values -= base[start:stop, None, None, None]
+            values *= weight[start:stop, None, None, None]
+
+            # Legs are grouped by position, so each position's legs are contiguous
+            owners = owner[start:stop]
+            starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+            cube[owners[starts]] += np.add.reduceat(values, starts, axis=0)
+        return cube
+
+    def _leg_values(self, spot, strike, iv, dte, is_call, moves, shifts, days):
+        """Black-Scholes values for legs x (moves, shifts, days); calls priced directly, puts by parity."""
+        n = spot.size
+        r = self.risk_free_rate
+        scenario_spot = spot[:, None] * (1.0 + moves[None, :] / 100.0)                      # (n, P)
+        vol = np.maximum(iv[:, None] + shifts[None, :], IV_MIN_VOL)[:, :, None]              # (n, V, 1)
+        remaining = np.maximum((dte[:, None] - days[None, :]) / DAYS_PER_YEAR, 0.0)[:, None, :]  # (n, 1, D)
+        t = np.maximum(remaining, MIN_YEARS)
+
+        vol_sqrt_t = (vol * np.sqrt(t)).reshape(n, 1, -1)                                    # (n, 1, V*D)
+        drift = ((r + 0.5 * vol * vol) * t).reshape(n, 1, -1)
+        strike_pv = np.broadcast_to(strike[:, None, None] * np.exp(-r * remaining), vol.shape[:2] + t.shape[2:])
+        strike_pv = strike_pv.reshape(n, 1, -1)
+
+        with np.errstate(divide="ignore"):
+            log_moneyness = np.log(np.maximum(scenario_spot, 0.0) / strike[:, None])[:, :, None]
+        d1 = log_moneyness + drift
+        d1 /= vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+
+        s = scenario_spot[:, :, None]
+        value = s * norm_cdf(d1)
+        value -= strike_pv * norm_cdf(d2)
+        puts = ~is_call
+        if puts.any():
+            value[puts] += strike_pv[puts] - s[puts]
+        return value.reshape(n, moves.size, shifts.size, days.size)
+
+    def _taylor(self, entries, moves, shifts, days):
+        """First-order P&L from stored per-share spread Greeks (delta, vega per vol point, theta per day)."""
+        spot = np.array([s for _, s in entries])
+        scale = np.array([p.contracts for p, _ in entries], dtype=float) * self.multiplier
+        delta = np.array([p.net_delta for p, _ in entries]) * scale
+        vega = np.array([p.net_vega for p, _ in entries]) * scale
+        theta = np.array([p.net_theta for p, _ in entries]) * scale
+
+        return ((delta * spot)[:, None, None, None] * (moves / 100.0)[None, :, None, None]
+                + vega[:, None, None, None] * (shifts * 100.0)[None, None, :, None]
+                + theta[:, None, None, None] * days[None, None, None, :])
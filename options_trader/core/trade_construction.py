@@ -17,7 +17,7 @@ Preserves all existing functionality while adding trade construction capabilitie
 """
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple, Union
 
@@ -36,7 +36,7 @@ except ImportError:
     HAS_PANDAS = False
     pd = None
 
-from .utils import ensure_numeric_cols, nearest_strike_row
+from ..providers.chain import OptionChain
 
 logger = logging.getLogger("options_trader.trade_construction")
 
@@ -332,6 +332,10 @@ class CalendarTradeConstructor:
                 self.logger.warning(f"Could not find options at strike {strike} for {symbol}")
                 return None
             
+            front_option.expiration = front_exp
+            back_option.expiration = back_exp
+            self._fill_iv_from_surface(symbol, underlying_price, [front_option, back_option])
+            
             # Create calendar trade
             calendar_trade = CalendarTrade(
                 symbol=symbol,
@@ -350,26 +354,66 @@ class CalendarTradeConstructor:
             self.logger.error(f"Failed to construct calendar spread for {symbol}: {e}")
             return None
     
+    def _surface_ivs(self, symbol: str, underlying_price: float,
+                     quotes: List[OptionQuote]) -> Optional[List[Optional[float]]]:
+        """Surface IV per quote from the cached volatility surface (None where unusable)."""
+        if not hasattr(self.data_service, "get_vol_surface"):
+            return None
+        
+        surface = self.data_service.get_vol_surface(symbol, [q.expiration for q in quotes], underlying_price)
+        if surface is None or not len(surface):
+            return None
+        
+        ivs = [float(surface.iv_for_expiration(q.strike, q.expiration)) for q in quotes]
+        return [iv if iv > 0 and iv == iv else None for iv in ivs]  # Drops NaN and non-positive fits
+    
+    def _fill_iv_from_surface(self, symbol: str, underlying_price: float, quotes: List[OptionQuote]) -> None:
+        """Replace missing quote IVs with the cached volatility surface for the same snapshot."""
+        if all(q.implied_volatility > 0 for q in quotes):
+            return
+        
+        for quote, iv in zip(quotes, self._surface_ivs(symbol, underlying_price, quotes) or []):
+            if not (quote.implied_volatility > 0) and iv is not None:
+                quote.implied_volatility = iv
+                self.logger.debug(f"IV for {symbol} {quote.strike} {quote.expiration} taken from surface: {iv:.4f}")
+    
+    def with_surface_ivs(self, trade: CalendarTrade) -> CalendarTrade:
+        """
+        Copy of a calendar trade whose leg IVs come from the cached volatility surface.
+        
+        Greeks and P&L model both legs on this copy, so they price off the same
+        smoothed surface that filled missing IVs during construction rather than
+        two independently noisy quotes. The trade itself keeps the quoted IVs.
+        
+        Args:
+            trade: Constructed calendar trade
+            
+        Returns:
+            Trade copy with surface IVs, or the trade unchanged when no surface is available
+        """
+        legs = [trade.front_option, trade.back_option]
+        ivs = self._surface_ivs(trade.symbol, trade.underlying_price, legs)
+        if not ivs or None in ivs:
+            return trade
+        
+        front, back = (replace(quote, implied_volatility=iv) for quote, iv in zip(legs, ivs))
+        return replace(trade, front_option=front, back_option=back)
+    
     def _find_option_at_strike(self, chain, target_strike: float, option_type: str) -> Optional[OptionQuote]:
         """Find option at specific strike in option chain."""
         try:
-            # Select calls or puts
-            if option_type.lower() == "call":
-                options_df = ensure_numeric_cols(chain.calls.copy()) if hasattr(chain, 'calls') else None
-            else:
-                options_df = ensure_numeric_cols(chain.puts.copy()) if hasattr(chain, 'puts') else None
-            
-            if options_df is None or options_df.empty:
-                return None
+            chain = OptionChain.from_any(chain)
+            side = chain.side(option_type)
             
             # Find nearest strike
-            option_row = nearest_strike_row(options_df, target_strike)
-            if option_row is None:
+            index = side.index.nearest(target_strike)
+            if index is None:
                 return None
+            option_row = side.row(index)
             
             # Create OptionQuote object
             option_quote = OptionQuote(
-                symbol=f"{chain.symbol if hasattr(chain, 'symbol') else 'UNKNOWN'}",
+                symbol=chain.symbol or "UNKNOWN",
                 strike=float(option_row.get("strike", target_strike)),
                 expiration="",  # Will be set by caller
                 option_type=option_type,
@@ -12,6 +12,8 @@ import numpy as np
 import pandas as pd
 from typing import Optional
 
+from ..providers.chain import StrikeIndex
+
 logger = logging.getLogger("options_trader.utils")
 
 
@@ -53,21 +55,20 @@ def nearest_strike_row(df: pd.DataFrame, price: float) -> Optional[pd.Series]:
             logger.warning("Empty DataFrame passed to nearest_strike_row")
             return None
         
-        df = ensure_numeric_cols(df)
-        
         if "strike" not in df.columns:
             logger.error("No 'strike' column found in DataFrame")
             return None
         
-        # Find the row with strike closest to price
-        strike_diff = (df["strike"] - price).abs()
-        nearest_idx = strike_diff.idxmin()
+        # Binary search over a sorted view of the strikes; the frame itself is not copied
+        position = StrikeIndex.from_values(df["strike"].to_numpy()).nearest(price)
+        if position is None:
+            return None
         
-        result = df.loc[nearest_idx]
-        logger.debug(f"Found nearest strike {result['strike']:.2f} for price ${price:.2f}")
+        result = df.iloc[position]
+        logger.debug(f"Found nearest strike {float(result['strike']):.2f} for price ${price:.2f}")
         
         return result
         
     except Exception as e:
         logger.error(f"nearest_strike_row failed: {e}")
-        return None
\ No newline at end of file
+        return None
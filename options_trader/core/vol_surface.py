@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Volatility Surface
+==================
+
+Implied volatility surface built once per (symbol, snapshot) from every strike
+of every fetched option chain.
+
+Each expiration gets a parametric smile: a weighted quadratic in standardized
+log-moneyness x = ln(K / F) / sqrt(T), fitted to out-of-the-money quotes (puts
+below the forward, calls above). Near-the-money quotes carry the most weight,
+and the smile is held flat beyond the outermost fitted strikes so the wings
+cannot blow up.
+
+Between expirations the surface interpolates total variance (iv^2 * T)
+linearly in time at fixed strike, and holds IV flat outside the fitted
+tenors. Lookups use a binary search over the sorted expirations, so querying
+any (strike, DTE) costs O(log n) and never touches the chain DataFrames.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# Conditional imports for optional dependencies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+from .pricing import DAYS_PER_YEAR, IV_MAX_VOL, IV_MIN_VALID, days_to_expiry
+from ..providers.chain import OptionChain
+
+logger = logging.getLogger("options_trader.vol_surface")
+
+SURFACE_RISK_FREE_RATE = 0.05
+SURFACE_MIN_DAYS = 0.5  # Expirations closer than this are excluded from the surface
+SMILE_WEIGHT_SCALE = 0.5  # Standardized moneyness at which a quote's weight halves
+
+
+@dataclass
+class SmileFit:
+    """Quadratic smile for one expiration: iv(x) = a + b*x + c*x^2."""
+    expiration: str
+    dte: float
+    forward: float
+    a: float
+    b: float
+    c: float
+    x_min: float
+    x_max: float
+    n_points: int
+    rmse: float
+
+    @property
+    def t(self) -> float:
+        """Time to expiry in years."""
+        return self.dte / DAYS_PER_YEAR
+
+    @property
+    def atm_iv(self) -> float:
+        """Implied volatility at the forward."""
+        return float(self.iv(self.forward))
+
+    def iv(self, strike):
+        """Implied volatility at one or more strikes (flat beyond the fitted range)."""
+        x = np.log(np.asarray(strike, dtype=float) / self.forward) / math.sqrt(self.t)
+        x = np.clip(x, self.x_min, self.x_max)
+        return np.clip(self.a + self.b * x + self.c * x * x, IV_MIN_VALID, IV_MAX_VOL)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return fit parameters as a plain dictionary."""
+        return {
+            "expiration": self.expiration,
+            "dte": round(self.dte, 3),
+            "forward": self.forward,
+            "atm_iv": self.atm_iv,
+            "skew": self.b,
+            "curvature": self.c,
+            "n_points": self.n_points,
+            "rmse": self.rmse
+        }
+
+
+def fit_smile(strikes, ivs, forward: float, dte: float, expiration: str = "") -> Optional[SmileFit]:
+    """
+    Fit a quadratic smile to (strike, IV) quotes of one expiration.
+
+    Args:
+        strikes: Strike prices
+        ivs: Implied volatilities (decimals); non-finite or implausible values are dropped
+        forward: Forward price for the expiration
+        dte: Days to expiry
+        expiration: Expiration label stored on the fit
+
+    Returns:
+        SmileFit, or None if no usable quotes remain. Fewer than three quotes
+        reduce the fit to a line or a constant.
+    """
+    strikes = np.asarray(strikes, dtype=float)
+    ivs = np.asarray(ivs, dtype=float)
+    usable = np.isfinite(strikes) & (strikes > 0) & np.isfinite(ivs) & (ivs >= IV_MIN_VALID) & (ivs <= IV_MAX_VOL)
+    if not usable.any() or forward <= 0 or dte <= 0:
+        return None
+
+    x = np.log(strikes[usable] / forward) / math.sqrt(dte / DAYS_PER_YEAR)
+    y = ivs[usable]
+    weights = 1.0 / (1.0 + (x / SMILE_WEIGHT_SCALE) ** 2)
+
+    degree = min(2, len(np.unique(x)) - 1)
+    design = np.vander(x, degree + 1, increasing=True)
+    sqrt_w = np.sqrt(weights)
+    coeffs, *_ = np.linalg.lstsq(design * sqrt_w[:, None], y * sqrt_w, rcond=None)
+    coeffs = np.concatenate([coeffs, np.zeros(3 - len(coeffs))])
+
+    residuals = design @ coeffs[:degree + 1] - y
+    return SmileFit(
+        expiration=expiration,
+        dte=float(dte),
+        forward=float(forward),
+        a=float(coeffs[0]),
+        b=float(coeffs[1]),
+        c=float(coeffs[2]),
+        x_min=float(x.min()),
+        x_max=float(x.max()),
+        n_points=int(len(y)),
+        rmse=float(np.sqrt(np.mean(residuals ** 2)))
+    )
+
+
+def _otm_quotes(chain, forward: float) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Strikes and IVs of out-of-the-money quotes (puts below the forward, calls at or above)."""
+    chain = OptionChain.from_any(chain)
+    strikes, ivs = [], []
+    for side, otm in ((chain.put_side, lambda k: k < forward), (chain.call_side, lambda k: k >= forward)):
+        if not len(side):
+            continue
+        k = side.strikes
+        mask = otm(k)
+        bid = side.column("bid")
+        if np.any(bid > 0):
+            mask &= bid > 0  # Zero-bid strikes carry stale or placeholder IVs
+        strikes.append(k[mask])
+        ivs.append(side.column("impliedVolatility")[mask])
+
+    if not strikes:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(strikes), np.concatenate(ivs)
+
+
+@dataclass
+class VolSurface:
+    """Implied volatility surface: per-expiration smiles interpolated in time."""
+    symbol: str
+    spot: float
+    smiles: List[SmileFit]
+    built_at: datetime = field(default_factory=datetime.now)
+
+    def __post_init__(self):
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for the volatility surface")
+        self.smiles = sorted(self.smiles, key=lambda s: s.dte)
+        self._dtes = np.array([s.dte for s in self.smiles])
+        self._t = self._dtes / DAYS_PER_YEAR
+        self._params = np.array([[s.forward, s.a, s.b, s.c, s.x_min, s.x_max] for s in self.smiles]).reshape(-1, 6)
+
+    @classmethod
+    def from_chains(cls, symbol: str, spot: float, chains: Mapping[str, Any],
+                    rate: float = SURFACE_RISK_FREE_RATE, now: Optional[datetime] = None) -> "VolSurface":
+        """
+        Build a surface from option chains keyed by expiration ('YYYY-MM-DD').
+
+        Args:
+            symbol: Underlying symbol
+            spot: Current underlying price
+            chains: Expiration -> OptionChain (or object with .calls/.puts DataFrames)
+            rate: Risk-free rate used for forwards
+            now: Override for the current time (testing)
+        """
+        smiles = []
+        for expiration, chain in chains.items():
+            try:
+                dte = days_to_expiry(expiration, now)
+                if dte < SURFACE_MIN_DAYS or chain is None:
+                    continue
+                forward = spot * math.exp(rate * dte / DAYS_PER_YEAR)
+                strikes, ivs = _otm_quotes(chain, forward)
+                smile = fit_smile(strikes, ivs, forward, dte, expiration)
+                if smile is not None:
+                    smiles.append(smile)
+            except Exception as e:
+                logger.warning(f"Skipping {symbol} {expiration} in volatility surface: {e}")
+
+        logger.debug(f"Built volatility surface for {symbol} with {len(smiles)} expirations")
+        return cls(symbol=symbol, spot=float(spot), smiles=smiles)
+
+    @property
+    def expirations(self) -> List[str]:
+        """Fitted expirations in DTE order."""
+        return [s.expiration for s in self.smiles]
+
+    def __len__(self) -> int:
+        return len(self.smiles)
+
+    def _smile_iv(self, index, strike):
+        """Vectorized smile evaluation with per-element smile index."""
+        forward, a, b, c, x_min, x_max = (self._params[index, i] for i in range(6))
+        x = np.clip(np.log(strike / forward) / np.sqrt(self._t[index]), x_min, x_max)
+        return np.clip(a + b * x + c * x * x, IV_MIN_VALID, IV_MAX_VOL)
+
+    def iv(self, strike, dte):
+        """
+        Implied volatility at any strike and days to expiry.
+
+        Args:
+            strike: Strike price(s)
+            dte: Calendar days to expiry (broadcasts against strike)
+
+        Returns:
+            IV as decimals (float for scalar inputs, else array); NaN if the surface is empty
+        """
+        strike, dte = np.broadcast_arrays(np.asarray(strike, dtype=float), np.asarray(dte, dtype=float))
+        scalar = strike.ndim == 0
+        if not self.smiles:
+            result = np.full(strike.shape, np.nan)
+            return float(result) if scalar else result
+
+        n = len(self.smiles)
+        upper = np.clip(np.searchsorted(self._dtes, dte), 0, n - 1)
+        lower = np.clip(upper - 1, 0, n - 1)
+        iv_lo = self._smile_iv(lower, strike)
+        iv_hi = self._smile_iv(upper, strike)
+
+        t = np.clip(dte, self._dtes[0], self._dtes[-1]) / DAYS_PER_YEAR
+        t_lo, t_hi = self._t[lower], self._t[upper]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(t_hi > t_lo, (t - t_lo) / (t_hi - t_lo), 1.0)
+            total_var = (1 - weight) * iv_lo ** 2 * t_lo + weight * iv_hi ** 2 * t_hi
+            result = np.sqrt(total_var / t)
+
+        return float(result) if scalar else result
+
+    def iv_for_expiration(self, strike, expiration: str, now: Optional[datetime] = None):
+        """Implied volatility at strike(s) for an expiration date."""
+        return self.iv(strike, max(days_to_expiry(expiration, now), SURFACE_MIN_DAYS))
+
+    def atm_iv(self, dte):
+        """At-the-money (spot strike) implied volatility at the given DTE."""
+        return self.iv(self.spot, dte)
+
+    def term_structure(self) -> Tuple[List[float], List[float]]:
+        """(DTEs, ATM IVs) of the fitted expirations."""
+        return [s.dte for s in self.smiles], [s.atm_iv for s in self.smiles]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-friendly summary of the surface."""
+        return {
+            "symbol": self.symbol,
+            "spot": self.spot,
+            "built_at": self.built_at.isoformat(timespec="seconds"),
+            "expirations": [s.to_dict() for s in self.smiles]
+        }
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Realized Volatility Engine
+==========================
+
+Vectorized Yang-Zhang realized volatility over many symbols and windows.
+
+All estimators work on 2-D (symbols x days) OHLC arrays. Each bar is reduced
+once to its Yang-Zhang components (overnight return, squared high-low range,
+open-to-close return); every window is then evaluated from cumulative sums of
+those components, so RV10/RV20/RV30/RV60 cost one pass over the data rather
+than one pandas recomputation per symbol and window.
+
+RollingYangZhang keeps the same sums as running totals, so appending a new bar
+for every symbol is O(windows) regardless of history length.
+
+The estimator matches analysis.yang_zhang_volatility exactly:
+    var = (1 + k) * var(overnight) + (1 - k) * (mean(hl^2) + var(close - open))
+    k = 0.34 / (1.34 + (n + 1) / (n - 1))
+where a window of n bars holds n - 1 overnight returns.
+"""
+
+import logging
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+# Conditional imports for optional dependencies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+    pd = None
+
+logger = logging.getLogger("options_trader.volatility")
+
+TRADING_DAYS_PER_YEAR = 252
+DEFAULT_RV_WINDOWS = (10, 20, 30, 60)
+OHLC_COLUMNS = ("Open", "High", "Low", "Close")
+
+# Running sums are rebuilt from the ring buffer this often to cancel float drift
+RESYNC_INTERVAL = 4096
+
+# Component sums tracked per window, in order
+_SUM_FIELDS = ("on", "on2", "hl2", "cc", "cc2", "bad_on", "bad_bar")
+
+
+def _validate_windows(windows: Iterable[int]) -> Tuple[int, ...]:
+    windows = tuple(sorted(set(int(w) for w in windows)))
+    if not windows or windows[0] < 2:
+        raise ValueError("Yang-Zhang windows must be at least 2 bars")
+    return windows
+
+
+def yang_zhang_components(open_, high, low, close):
+    """
+    Reduce OHLC bars to Yang-Zhang components.
+
+    Args:
+        open_, high, low, close: Price arrays of shape (..., days)
+
+    Returns:
+        (overnight, hl2, cc, bad_on, bad_bar): overnight log return (first bar is
+        0 and flagged bad), squared log high-low range, log close-open return, and
+        float flags marking missing overnight returns and missing bars. Values
+        under a flag are zeroed so they can be summed safely.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        o = np.log(np.asarray(open_, dtype=float))
+        h = np.log(np.asarray(high, dtype=float))
+        l = np.log(np.asarray(low, dtype=float))
+        c = np.log(np.asarray(close, dtype=float))
+
+    hl = h - l
+    cc = c - o
+    bad_bar = ~(np.isfinite(hl) & np.isfinite(cc))
+
+    overnight = np.zeros_like(o)
+    overnight[..., 1:] = o[..., 1:] - c[..., :-1]
+    bad_on = np.ones_like(bad_bar)
+    bad_on[..., 1:] = ~np.isfinite(overnight[..., 1:]) | bad_bar[..., 1:] | bad_bar[..., :-1]
+
+    overnight[bad_on] = 0.0
+    hl2 = np.where(bad_bar, 0.0, hl * hl)
+    cc = np.where(bad_bar, 0.0, cc)
+    return overnight, hl2, cc, bad_on.astype(float), bad_bar.astype(float)
+
+
+def _combine(window: int, on, on2, hl2, cc, cc2, bad, annualize: bool):
+    """Turn window sums into Yang-Zhang volatility (NaN where the window has gaps)."""
+    m = window - 1  # Overnight returns per window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if m > 1:
+            on_var = (on2 - on * on / m) / (m - 1)
+        else:
+            on_var = np.zeros_like(on)
+        cc_var = (cc2 - cc * cc / window) / (window - 1)
+        hl_var = hl2 / window
+
+        k = 0.34 / (1.34 + (window + 1) / (window - 1))
+        yz_var = (1 + k) * on_var + (1 - k) * (hl_var + cc_var)
+        yz_var = np.maximum(yz_var, 0.0)  # Clip tiny negatives from cancellation
+        vol = np.sqrt(yz_var * TRADING_DAYS_PER_YEAR) if annualize else np.sqrt(yz_var)
+
+    return np.where(bad > 0.5, np.nan, vol)
+
+
+def rolling_yang_zhang(open_, high, low, close,
+                       windows: Sequence[int] = DEFAULT_RV_WINDOWS,
+                       annualize: bool = True) -> Dict[int, "np.ndarray"]:
+    """
+    Rolling Yang-Zhang volatility for several windows in one pass.
+
+    Args:
+        open_, high, low, close: Arrays of shape (days,) or (symbols, days)
+        windows: Window lengths in bars
+        annualize: Scale by sqrt(252)
+
+    Returns:
+        Dict mapping window -> array shaped like the inputs. Entry [..., t] uses
+        bars t-window+1..t and is NaN until a full window of valid bars exists.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for the rolling Yang-Zhang engine")
+
+    windows = _validate_windows(windows)
+    on, hl2, cc, bad_on, bad_bar = yang_zhang_components(open_, high, low, close)
+    days = on.shape[-1]
+
+    def csum(x):
+        # Leading zero so window sums are csum[t + 1] - csum[start]
+        out = np.zeros(x.shape[:-1] + (days + 1,))
+        np.cumsum(x, axis=-1, out=out[..., 1:])
+        return out
+
+    sums = {
+        "on": csum(on), "on2": csum(on * on), "hl2": csum(hl2),
+        "cc": csum(cc), "cc2": csum(cc * cc), "bad_on": csum(bad_on), "bad_bar": csum(bad_bar)
+    }
+
+    results = {}
+    for window in windows:
+        out = np.full(on.shape, np.nan)
+        if days >= window:
+            end = slice(window, days + 1)
+            bar_start = slice(0, days + 1 - window)
+            on_start = slice(1, days + 2 - window)  # Overnight returns start one bar later
+
+            def bar_sum(name):
+                return sums[name][..., end] - sums[name][..., bar_start]
+
+            def on_sum(name):
+                return sums[name][..., end] - sums[name][..., on_start]
+
+            bad = bar_sum("bad_bar") + on_sum("bad_on")
+            out[..., window - 1:] = _combine(
+                window, on_sum("on"), on_sum("on2"), bar_sum("hl2"),
+                bar_sum("cc"), bar_sum("cc2"), bad, annualize
+            )
+        results[window] = out
+
+    return results
+
+
+def stack_ohlc(histories: Mapping[str, "pd.DataFrame"], max_days: Optional[int] = None):
+    """
+    Right-align per-symbol OHLC DataFrames into (symbols x days) arrays.
+
+    Each symbol's own most recent bar lands in the last column, so symbols with
+    shorter histories are NaN-padded on the left instead of being dropped.
+
+    Args:
+        histories: Symbol -> DataFrame with Open/High/Low/Close columns
+        max_days: Keep at most this many trailing bars per symbol
+
+    Returns:
+        (symbols, open, high, low, close)
+    """
+    symbols = [s for s, df in histories.items()
+               if df is not None and len(df) and all(col in df.columns for col in OHLC_COLUMNS)]
+    lengths = [len(histories[s]) if max_days is None else min(len(histories[s]), max_days) for s in symbols]
+    days = max(lengths, default=0)
+
+    arrays = np.full((4, len(symbols), days), np.nan)
+    for row, (symbol, length) in enumerate(zip(symbols, lengths)):
+        values = histories[symbol][list(OHLC_COLUMNS)].to_numpy(dtype=float)[-length:]
+        arrays[:, row, days - length:] = values.T
+
+    return symbols, arrays[0], arrays[1], arrays[2], arrays[3]
+
+
+def realized_vol_term_structure(histories: Mapping[str, "pd.DataFrame"],
+                                windows: Sequence[int] = DEFAULT_RV_WINDOWS) -> "pd.DataFrame":
+    """
+    Latest Yang-Zhang RV for every symbol and window.
+
+    Args:
+        histories: Symbol -> daily OHLC DataFrame (e.g. from DataService.get_price_history)
+        windows: Window lengths in bars
+
+    Returns:
+        DataFrame indexed by symbol with one 'rv<window>' column per window (NaN
+        when a symbol has fewer bars than the window)
+    """
+    if not HAS_PANDAS:
+        raise ImportError("pandas is required for realized_vol_term_structure")
+
+    windows = _validate_windows(windows)
+    symbols, o, h, l, c = stack_ohlc(histories, max_days=windows[-1])
+    if not symbols:
+        return pd.DataFrame(columns=[f"rv{w}" for w in windows])
+
+    series = rolling_yang_zhang(o, h, l, c, windows)
+    return pd.DataFrame({f"rv{w}": series[w][:, -1] for w in windows}, index=pd.Index(symbols, name="symbol"))
+
+
+class RollingYangZhang:
+    """
+    Streaming Yang-Zhang volatility for a fixed set of symbols and windows.
+
+    Keeps a ring buffer of the last max(windows) bars' components plus running
+    sums per window, so each update() is O(windows) per symbol no matter how
+    much history has been seen.
+
+    Example:
+        rv = RollingYangZhang(["AAPL", "MSFT"], windows=(10, 20))
+        rv.extend(open_hist, high_hist, low_hist, close_hist)  # (symbols, days) arrays
+        latest = rv.update(open_today, high_today, low_today, close_today)
+    """
+
+    def __init__(self, symbols: Sequence[str], windows: Sequence[int] = DEFAULT_RV_WINDOWS,
+                 annualize: bool = True):
+        """
+        Initialize streaming estimator.
+
+        Args:
+            symbols: Symbols in row order of every update
+            windows: Window lengths in bars
+            annualize: Scale by sqrt(252)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for the rolling Yang-Zhang engine")
+
+        self.symbols = list(symbols)
+        self.windows = _validate_windows(windows)
+        self.annualize = annualize
+        self.capacity = self.windows[-1]
+
+        n = len(self.symbols)
+        self._buffer = {name: np.zeros((n, self.capacity)) for name in _SUM_FIELDS}
+        self._sums = {name: np.zeros((len(self.windows), n)) for name in _SUM_FIELDS}
+        self._prev_close = np.full(n, np.nan)
+        self._count = 0
+
+    @property
+    def bars_seen(self) -> int:
+        """Number of bars processed."""
+        return self._count
+
+    def _components(self, open_, high, low, close) -> Dict[str, "np.ndarray"]:
+        """Components for one new bar per symbol, using the stored previous close."""
+        n = len(self.symbols)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            o, h, l, c = (np.log(np.asarray(x, dtype=float).reshape(n)) for x in (open_, high, low, close))
+            overnight = o - self._prev_close
+
+        hl = h - l
+        cc = c - o
+        bad_bar = ~(np.isfinite(hl) & np.isfinite(cc))
+        bad_on = bad_bar | ~np.isfinite(overnight)  # Also covers a missing previous bar
+
+        # Store log close; a missing bar invalidates the next overnight return
+        self._prev_close = np.where(bad_bar, np.nan, c)
+
+        overnight = np.where(bad_on, 0.0, overnight)
+        cc = np.where(bad_bar, 0.0, cc)
+        return {
+            "on": overnight, "on2": overnight * overnight, "hl2": np.where(bad_bar, 0.0, hl * hl),
+            "cc": cc, "cc2": cc * cc,
+            "bad_on": bad_on.astype(float), "bad_bar": bad_bar.astype(float)
+        }
+
+    def _resync(self) -> None:
+        """Rebuild running sums from the ring buffer."""
+        latest = (self._count - 1) % self.capacity
+        for i, window in enumerate(self.windows):
+            for name in _SUM_FIELDS:
+                span = window - 1 if name in ("on", "on2", "bad_on") else window
+                slots = (latest - np.arange(min(span, self._count))) % self.capacity
+                self._sums[name][i] = self._buffer[name][:, slots].sum(axis=1)
+
+    def update(self, open_, high, low, close) -> Dict[int, "np.ndarray"]:
+        """
+        Append one bar for every symbol.
+
+        Args:
+            open_, high, low, close: Arrays of shape (symbols,), NaN for a missing bar
+
+        Returns:
+            Dict mapping window -> latest volatility per symbol (NaN until a full window)
+        """
+        new = self._components(open_, high, low, close)
+        slot = self._count % self.capacity
+
+        for i, window in enumerate(self.windows):
+            for name in _SUM_FIELDS:
+                span = window - 1 if name in ("on", "on2", "bad_on") else window
+                self._sums[name][i] += new[name]
+                if self._count >= span:
+                    leaving = (self._count - span) % self.capacity
+                    self._sums[name][i] -= self._buffer[name][:, leaving]
+
+        for name in _SUM_FIELDS:
+            self._buffer[name][:, slot] = new[name]
+        self._count += 1
+
+        if self._count % RESYNC_INTERVAL == 0:
+            self._resync()
+
+        return self.current()
+
+    def extend(self, open_, high, low, close) -> Dict[int, "np.ndarray"]:
+        """
+        Append a block of bars given as (symbols, days) arrays.
+
+        Returns:
+            Latest volatility per window after the final bar
+        """
+        o, h, l, c = (np.asarray(x, dtype=float).reshape(len(self.symbols), -1) for x in (open_, high, low, close))
+        for t in range(o.shape[1]):
+            self.update(o[:, t], h[:, t], l[:, t], c[:, t])
+        return self.current()
+
+    def current(self) -> Dict[int, "np.ndarray"]:
+        """Latest volatility per window and symbol."""
+        results = {}
+        for i, window in enumerate(self.windows):
+            if self._count < window:
+                results[window] = np.full(len(self.symbols), np.nan)
+                continue
+            sums = {name: self._sums[name][i] for name in _SUM_FIELDS}
+            results[window] = _combine(
+                window, sums["on"], sums["on2"], sums["hl2"], sums["cc"], sums["cc2"],
+                sums["bad_on"] + sums["bad_bar"], self.annualize
+            )
+        return results
+
+    def to_frame(self) -> "pd.DataFrame":
+        """Latest volatilities as a DataFrame indexed by symbol with 'rv<window>' columns."""
+        latest = self.current()
+        return pd.DataFrame({f"rv{w}": latest[w] for w in self.windows},
+                            index=pd.Index(self.symbols, name="symbol"))
@@ -10,22 +10,61 @@ Multi-provider data sourcing with fallbacks for:
 - Earnings calendar: Alpha Vantage, Finnhub, Tradier
 
 All providers implement standard interfaces for seamless fallback handling.
+REST providers share pooled keep-alive sessions (see http.py), and any provider
+can be driven from asyncio through AsyncProviderAdapter. Option chains are
+returned as the columnar OptionChain type (see chain.py). Provider calls, rate
+limit waits and cache lookups are timed through metrics.py. Live responses can
+be recorded and replayed offline with ReplayProvider (see replay.py), and
+SyntheticMarketProvider generates deterministic market data for load tests.
 """
 
 # Import base interfaces (always available)
 from .base import PriceProvider, OptionsProvider, EarningsProvider
+from .base import AsyncPriceProvider, AsyncOptionsProvider, AsyncEarningsProvider
+from .async_adapter import AsyncProviderAdapter
 
 # Import demo provider (no external dependencies)
 from .demo import DemoProvider
 
+# Instrumentation (standard library only)
+from .metrics import MetricsRegistry, RunTimings, collect_timings
+
 # Import other providers conditionally
 __all__ = [
     "PriceProvider",
     "OptionsProvider", 
     "EarningsProvider",
-    "DemoProvider"
+    "AsyncPriceProvider",
+    "AsyncOptionsProvider",
+    "AsyncEarningsProvider",
+    "AsyncProviderAdapter",
+    "DemoProvider",
+    "MetricsRegistry",
+    "RunTimings",
+    "collect_timings"
 ]
 
+# Columnar option chain (requires numpy)
+try:
+    from .chain import OptionChain, OptionSide, StrikeIndex
+    __all__.extend(["OptionChain", "OptionSide", "StrikeIndex"])
+except ImportError:
+    OptionChain = OptionSide = StrikeIndex = None
+
+# Recorded-response replay
+try:
+    from .replay import ReplayProvider, ReplayError, record_provider
+    __all__.extend(["ReplayProvider", "ReplayError", "record_provider"])
+except ImportError:
+    ReplayProvider = ReplayError = record_provider = None
+
+# Deterministic synthetic market (requires numpy)
+try:
+    from .synthetic import SyntheticMarketProvider, synthetic_universe
+    __all__.extend(["SyntheticMarketProvider", "synthetic_universe"])
+except ImportError:
+    SyntheticMarketProvider = synthetic_universe = None
+
 # Yahoo provider (requires yfinance)
 try:
     from .yahoo import YahooProvider
@@ -15,8 +15,9 @@ import logging
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
-import time
 
+from .http import get_session
+from .rate_limit import get_limiter
 from .base import PriceProvider, EarningsProvider, EarningsEvent
 
 logger = logging.getLogger("options_trader.providers.alpha_vantage")
@@ -38,8 +39,8 @@ class AlphaVantageProvider(PriceProvider, EarningsProvider):
         if not self.api_key:
             logger.warning("Alpha Vantage API key not found in environment")
         
-        self._last_request_time = 0
-        self._min_interval = 12  # Alpha Vantage free tier: 5 requests per minute
+        self.session = get_session("alpha_vantage")  # Pooled keep-alive connections
+        self.rate_limiter = get_limiter("alpha_vantage")  # Free tier: 5 requests per minute
         
         logger.debug("Alpha Vantage provider initialized")
     
@@ -47,30 +48,17 @@ class AlphaVantageProvider(PriceProvider, EarningsProvider):
         """Check if provider is properly configured."""
         return bool(self.api_key)
     
-    def _throttle(self):
-        """Implement rate limiting for Alpha Vantage free tier."""
-        if not self._is_enabled():
-            return
-            
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_interval:
-            sleep_time = self._min_interval - elapsed
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.1f}s")
-            time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
-    
     def _make_request(self, **params) -> dict:
         """Make API request with rate limiting and error handling."""
         if not self._is_enabled():
             raise RuntimeError("Alpha Vantage API key not configured")
         
-        self._throttle()
+        self.rate_limiter.acquire()
         
         params['apikey'] = self.api_key
         
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
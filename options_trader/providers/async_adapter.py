@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Async Provider Adapter
+======================
+
+Exposes any synchronous provider through the async provider interfaces.
+
+Blocking provider calls run on worker threads via asyncio.to_thread, bounded by
+a per-adapter semaphore. Combined with the pooled sessions in providers.http,
+many symbols can be requested concurrently from one event loop while sharing a
+small set of keep-alive connections.
+
+Example:
+    finnhub = AsyncProviderAdapter(FinnhubProvider(), max_concurrency=8)
+    prices = await finnhub.get_prices(["AAPL", "MSFT", "NVDA"])
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base import (
+    AsyncPriceProvider, AsyncOptionsProvider, AsyncEarningsProvider,
+    PriceProvider, OptionsProvider, EarningsProvider, EarningsEvent
+)
+
+logger = logging.getLogger("options_trader.providers.async_adapter")
+
+ASYNC_PROVIDER_CONCURRENCY = int(os.getenv("ASYNC_PROVIDER_CONCURRENCY", "8"))
+
+
+class AsyncProviderAdapter(AsyncPriceProvider, AsyncOptionsProvider, AsyncEarningsProvider):
+    """Async wrapper around a synchronous price/options/earnings provider."""
+
+    def __init__(self, provider: Any, max_concurrency: Optional[int] = None):
+        """
+        Initialize adapter.
+
+        Args:
+            provider: Synchronous provider instance
+            max_concurrency: Maximum in-flight calls (defaults to ASYNC_PROVIDER_CONCURRENCY)
+        """
+        self.provider = provider
+        self.max_concurrency = max(1, max_concurrency or ASYNC_PROVIDER_CONCURRENCY)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _call(self, interface: type, method: str, *args, **kwargs):
+        """Run a provider method on a worker thread under the concurrency limit."""
+        if not isinstance(self.provider, interface):
+            raise NotImplementedError(
+                f"{type(self.provider).__name__} does not implement {interface.__name__}"
+            )
+        async with self._get_semaphore():
+            return await asyncio.to_thread(getattr(self.provider, method), *args, **kwargs)
+
+    async def get_price(self, symbol: str) -> Tuple[Optional[float], str]:
+        """Get current price for a symbol."""
+        return await self._call(PriceProvider, "get_price", symbol)
+
+    async def get_expirations(self, symbol: str, max_count: int = 3) -> List[str]:
+        """Get available option expiration dates."""
+        return await self._call(OptionsProvider, "get_expirations", symbol, max_count)
+
+    async def get_chain(self, symbol: str, expiration: str):
+        """Get option chain for specific expiration."""
+        return await self._call(OptionsProvider, "get_chain", symbol, expiration)
+
+    async def get_next_earnings(self, symbol: str) -> Optional[EarningsEvent]:
+        """Get the next earnings announcement for a symbol."""
+        return await self._call(EarningsProvider, "get_next_earnings", symbol)
+
+    async def get_earnings_calendar(self, symbol: str, days_ahead: int = 30) -> List[EarningsEvent]:
+        """Get earnings calendar for a symbol within specified days."""
+        return await self._call(EarningsProvider, "get_earnings_calendar", symbol, days_ahead)
+
+    async def get_prices(self, symbols: Iterable[str]) -> Dict[str, Tuple[Optional[float], str]]:
+        """
+        Fetch prices for many symbols concurrently.
+
+        Failed lookups are reported as (None, "error: ...") rather than raised.
+        """
+        symbols = list(dict.fromkeys(s.upper().strip() for s in symbols if s and s.strip()))
+        results = await asyncio.gather(*(self.get_price(s) for s in symbols), return_exceptions=True)
+
+        prices = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Async price lookup failed for {symbol}: {result}")
+                prices[symbol] = (None, f"error: {result}")
+            else:
+                prices[symbol] = result
+        return prices
@@ -68,7 +68,7 @@ class OptionsProvider(ABC):
         Get option chain for specific expiration.
         
         Returns:
-            Object with .calls and .puts DataFrame attributes (yfinance-like)
+            OptionChain (see chain.py), or any object with .calls and .puts DataFrames
         """
         pass
 
@@ -94,4 +94,67 @@ class EarningsProvider(ABC):
         Returns:
             List of EarningsEvent objects
         """
-        pass
\ No newline at end of file
+        pass
+
+
+class AsyncPriceProvider(ABC):
+    """Async interface for price data providers."""
+    
+    @abstractmethod
+    async def get_price(self, symbol: str) -> Tuple[Optional[float], str]:
+        """
+        Get current price for a symbol.
+        
+        Returns:
+            Tuple of (price, source_description)
+            price is None if unavailable
+        """
+        pass
+
+
+class AsyncOptionsProvider(ABC):
+    """Async interface for options data providers."""
+    
+    @abstractmethod
+    async def get_expirations(self, symbol: str, max_count: int = 3) -> List[str]:
+        """
+        Get available option expiration dates.
+        
+        Returns:
+            List of expiration dates in 'YYYY-MM-DD' format
+        """
+        pass
+    
+    @abstractmethod
+    async def get_chain(self, symbol: str, expiration: str):
+        """
+        Get option chain for specific expiration.
+        
+        Returns:
+            OptionChain (see chain.py), or any object with .calls and .puts DataFrames
+        """
+        pass
+
+
+class AsyncEarningsProvider(ABC):
+    """Async interface for earnings calendar providers."""
+    
+    @abstractmethod
+    async def get_next_earnings(self, symbol: str) -> Optional[EarningsEvent]:
+        """
+        Get the next earnings announcement for a symbol.
+        
+        Returns:
+            EarningsEvent if found, None otherwise
+        """
+        pass
+    
+    @abstractmethod
+    async def get_earnings_calendar(self, symbol: str, days_ahead: int = 30) -> List[EarningsEvent]:
+        """
+        Get earnings calendar for a symbol within specified days.
+        
+        Returns:
+            List of EarningsEvent objects
+        """
+        pass
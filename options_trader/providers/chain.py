@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar Option Chain
+=====================
+
+One normalized option chain type shared by every provider.
+
+Each side (calls, puts) is a struct of typed NumPy arrays sorted by strike:
+float64 prices, IVs and Greeks, int32 volume and open interest. Providers
+build the arrays straight from their JSON payloads without per-row dicts, and
+downstream code reads columns directly instead of copying and re-coercing
+DataFrames.
+
+Strike lookups go through a StrikeIndex built once per side: nearest,
+bracketing, exact, range and +/-N-strike queries are binary searches over the
+sorted strikes and return row positions, so no frame is copied or scanned.
+
+For code that still expects the yfinance shape, OptionChain.calls / .puts
+return a DataFrame view built lazily once per side. These views share the
+chain's arrays and must be treated as read-only; use OptionSide.set_column to
+change a column.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+# Conditional imports for optional dependencies
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+    pd = None
+
+logger = logging.getLogger("options_trader.providers.chain")
+
+# Always present on every side (NaN / 0 when the provider has no value)
+FLOAT_COLUMNS = ("strike", "bid", "ask", "lastPrice", "impliedVolatility")
+INT_COLUMNS = ("volume", "openInterest")
+# Present only when the provider supplies them
+GREEK_COLUMNS = ("delta", "gamma", "theta", "vega")
+SYMBOL_COLUMN = "contractSymbol"
+
+# Record field -> key name or getter, used by OptionSide.from_records
+FieldSpec = Union[str, Callable[[Mapping[str, Any]], Any]]
+
+
+def quote_mids(bid, ask, last) -> "np.ndarray":
+    """Bid/ask mid for two-sided quotes, else last price; NaN when neither is usable."""
+    two_sided = np.isfinite(bid) & np.isfinite(ask) & (bid > 0) & (ask >= bid)
+    mid = np.where(two_sided, 0.5 * (bid + ask), last)
+    return np.where(np.isfinite(mid) & (mid > 0), mid, np.nan)
+
+
+def _float_array(values) -> "np.ndarray":
+    """Coerce a column to float64, mapping None and unparseable values to NaN."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        if HAS_PANDAS:
+            return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+        return np.array([_to_float(v) for v in values], dtype=np.float64)
+
+
+def _int_array(values) -> "np.ndarray":
+    """Coerce a column to int32, mapping missing values to 0."""
+    floats = _float_array(values)
+    return np.where(np.isfinite(floats), floats, 0.0).astype(np.int32)
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class StrikeIndex:
+    """
+    Sorted strike index answering strike queries in O(log n).
+
+    Every query returns row positions in the data the index was built from
+    (for an OptionSide these are simply side indices; for a DataFrame, use
+    them with .iloc). Rows without a finite strike are never returned.
+    """
+
+    def __init__(self, sorted_strikes: "np.ndarray", positions: Optional["np.ndarray"] = None):
+        """
+        Wrap already-sorted strikes. Use from_values for unsorted input.
+
+        Args:
+            sorted_strikes: Ascending, finite float strikes
+            positions: Row position of each sorted strike (None if identical to its index)
+        """
+        self.strikes = sorted_strikes
+        self._positions = positions
+
+    @classmethod
+    def from_values(cls, strikes) -> "StrikeIndex":
+        """Index arbitrary strike values (any order, NaN and unparseable values skipped)."""
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for the strike index")
+        values = _float_array(strikes)
+        valid = np.isfinite(values)
+        if valid.all() and not np.any(values[1:] < values[:-1]):
+            return cls(values)
+        rows = np.flatnonzero(valid)
+        order = np.argsort(values[rows], kind="stable")
+        return cls(values[rows][order], rows[order])
+
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    def _position(self, i: int) -> int:
+        return int(self._positions[i]) if self._positions is not None else int(i)
+
+    def _positions_of(self, sorted_slice: slice) -> "np.ndarray":
+        if self._positions is not None:
+            return self._positions[sorted_slice]
+        return np.arange(len(self.strikes))[sorted_slice]
+
+    def _nearest_sorted(self, price: float) -> Optional[int]:
+        strikes = self.strikes
+        if not len(strikes):
+            return None
+        i = int(np.searchsorted(strikes, price))
+        if i == 0:
+            return 0
+        if i == len(strikes):
+            return i - 1
+        return i if strikes[i] - price < price - strikes[i - 1] else i - 1
+
+    def nearest(self, price: float) -> Optional[int]:
+        """Row of the strike closest to price (lower strike on ties), or None if empty."""
+        i = self._nearest_sorted(price)
+        return None if i is None else self._position(i)
+
+    def nearest_strike(self, price: float) -> Optional[float]:
+        """Strike closest to price, or None if empty."""
+        i = self._nearest_sorted(price)
+        return None if i is None else float(self.strikes[i])
+
+    def exact(self, strike: float, tol: float = 1e-9) -> Optional[int]:
+        """Row whose strike equals strike within tol, or None."""
+        i = self._nearest_sorted(strike)
+        if i is None or abs(self.strikes[i] - strike) > tol:
+            return None
+        return self._position(i)
+
+    def bracket(self, price: float) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Rows of the strikes bracketing price.
+
+        Returns:
+            (row of highest strike <= price, row of lowest strike >= price); either
+            is None beyond the listed strikes. Both are the same row on an exact hit.
+        """
+        lo = int(np.searchsorted(self.strikes, price, side="right")) - 1
+        hi = int(np.searchsorted(self.strikes, price, side="left"))
+        below = self._position(lo) if lo >= 0 else None
+        above = self._position(hi) if hi < len(self.strikes) else None
+        return below, above
+
+    def around(self, price: float, n: int) -> "np.ndarray":
+        """Rows of the nearest strike and up to n listed strikes on each side, in strike order."""
+        i = self._nearest_sorted(price)
+        if i is None:
+            return np.empty(0, dtype=np.intp)
+        return self._positions_of(slice(max(i - n, 0), i + n + 1))
+
+    def between(self, low: float, high: float) -> "np.ndarray":
+        """Rows with low <= strike <= high, in strike order."""
+        start = int(np.searchsorted(self.strikes, low, side="left"))
+        stop = int(np.searchsorted(self.strikes, high, side="right"))
+        return self._positions_of(slice(start, max(start, stop)))
+
+
+class OptionSide:
+    """Calls or puts of one expiration as typed, strike-sorted column arrays."""
+
+    def __init__(self, columns: Dict[str, "np.ndarray"], contract_symbols: Optional["np.ndarray"] = None):
+        """
+        Wrap already-typed columns. Use from_columns / from_records / from_frame
+        to build a side from raw data.
+
+        Args:
+            columns: Column name -> array, all the same length and sorted by strike
+            contract_symbols: Optional object array of OCC contract symbols
+        """
+        self.columns = columns
+        self.contract_symbols = contract_symbols
+        self._frame = None
+        self._index = None
+
+    @classmethod
+    def from_columns(cls, contract_symbols: Optional[Iterable[str]] = None, **columns) -> "OptionSide":
+        """
+        Build a side from column sequences, coercing dtypes and sorting by strike.
+
+        Missing standard columns are filled with NaN (floats) or 0 (ints).
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for the columnar option chain")
+
+        strikes = _float_array(columns.get("strike", []))
+        n = len(strikes)
+        typed = {"strike": strikes}
+        for name in FLOAT_COLUMNS[1:] + GREEK_COLUMNS:
+            if name in columns and columns[name] is not None:
+                typed[name] = _float_array(columns[name])
+            elif name in FLOAT_COLUMNS:
+                typed[name] = np.full(n, np.nan)
+        for name in INT_COLUMNS:
+            typed[name] = _int_array(columns[name]) if columns.get(name) is not None else np.zeros(n, dtype=np.int32)
+
+        symbols = np.asarray(list(contract_symbols), dtype=object) if contract_symbols is not None else None
+
+        # Drop rows without a strike, then sort (skipped when already sorted)
+        valid = np.isfinite(strikes)
+        if not valid.all():
+            typed = {name: values[valid] for name, values in typed.items()}
+            symbols = symbols[valid] if symbols is not None else None
+        strikes = typed["strike"]
+        if len(strikes) > 1 and np.any(strikes[1:] < strikes[:-1]):
+            order = np.argsort(strikes, kind="stable")
+            typed = {name: values[order] for name, values in typed.items()}
+            symbols = symbols[order] if symbols is not None else None
+
+        return cls(typed, symbols)
+
+    @classmethod
+    def from_records(cls, records: List[Mapping[str, Any]], fields: Mapping[str, FieldSpec],
+                     symbol_field: Optional[FieldSpec] = None) -> "OptionSide":
+        """
+        Build a side from provider JSON records, one column at a time.
+
+        Args:
+            records: Contract dictionaries as returned by the provider
+            fields: Column name -> record key (or getter for nested values)
+            symbol_field: Record key (or getter) holding the contract symbol
+        """
+        def extract(spec: FieldSpec) -> List[Any]:
+            if callable(spec):
+                return [spec(r) for r in records]
+            return [r.get(spec) for r in records]
+
+        columns = {name: extract(spec) for name, spec in fields.items()}
+        symbols = extract(symbol_field) if symbol_field is not None else None
+        return cls.from_columns(contract_symbols=symbols, **columns)
+
+    @classmethod
+    def from_frame(cls, df) -> "OptionSide":
+        """Build a side from a yfinance-style DataFrame."""
+        if df is None or len(df) == 0 or not hasattr(df, "columns"):
+            return cls.from_columns()
+        columns = {name: df[name].to_numpy() for name in FLOAT_COLUMNS + GREEK_COLUMNS + INT_COLUMNS
+                   if name in df.columns}
+        symbols = df[SYMBOL_COLUMN].to_numpy() if SYMBOL_COLUMN in df.columns else None
+        return cls.from_columns(contract_symbols=symbols, **columns)
+
+    def __len__(self) -> int:
+        return len(self.columns["strike"])
+
+    @property
+    def strikes(self) -> "np.ndarray":
+        """Sorted strike array."""
+        return self.columns["strike"]
+
+    def column(self, name: str) -> Optional["np.ndarray"]:
+        """Return a column array (no copy), or None if this side lacks it."""
+        return self.columns.get(name)
+
+    def set_column(self, name: str, values) -> None:
+        """Replace or add a float column (invalidates the DataFrame view)."""
+        values = _float_array(values)
+        if values.shape != self.strikes.shape:
+            raise ValueError(f"Column {name} has {values.shape[0]} rows, expected {len(self)}")
+        self.columns[name] = values
+        self._frame = None
+
+    def mid_prices(self) -> "np.ndarray":
+        """Bid/ask mid for two-sided quotes, else last price; NaN when neither is usable."""
+        return quote_mids(self.columns["bid"], self.columns["ask"], self.columns["lastPrice"])
+
+    @property
+    def index(self) -> StrikeIndex:
+        """Strike index over this side (built once; strikes are already sorted)."""
+        if self._index is None:
+            self._index = StrikeIndex(self.strikes)
+        return self._index
+
+    def nearest_index(self, price: float) -> Optional[int]:
+        """Index of the strike closest to price (lower strike on ties), or None if empty."""
+        return self.index.nearest(price)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """One contract as a dict of Python scalars."""
+        row = {name: values[index].item() for name, values in self.columns.items()}
+        if self.contract_symbols is not None:
+            row[SYMBOL_COLUMN] = self.contract_symbols[index]
+        return row
+
+    def to_frame(self):
+        """DataFrame view of this side (built once, shares the column arrays)."""
+        if self._frame is None:
+            if not HAS_PANDAS:
+                raise ImportError("pandas is required for DataFrame chain views")
+            data = dict(self.columns)
+            if self.contract_symbols is not None:
+                data = {SYMBOL_COLUMN: self.contract_symbols, **data}
+            self._frame = pd.DataFrame(data, copy=False)
+        return self._frame
+
+
+class OptionChain:
+    """Normalized option chain for one symbol and expiration."""
+
+    def __init__(self, calls: OptionSide, puts: OptionSide, symbol: str = "", expiration: str = ""):
+        """
+        Initialize chain.
+
+        Args:
+            calls: Call side
+            puts: Put side
+            symbol: Underlying symbol
+            expiration: Expiration date in 'YYYY-MM-DD' format
+        """
+        self.call_side = calls
+        self.put_side = puts
+        self.symbol = symbol
+        self.expiration = expiration
+
+    @classmethod
+    def from_frames(cls, calls_df, puts_df, symbol: str = "", expiration: str = "") -> "OptionChain":
+        """Build a chain from yfinance-style calls/puts DataFrames."""
+        return cls(OptionSide.from_frame(calls_df), OptionSide.from_frame(puts_df), symbol, expiration)
+
+    @classmethod
+    def from_any(cls, chain, symbol: str = "", expiration: str = "") -> "OptionChain":
+        """Return chain unchanged if already normalized, else convert an object with .calls/.puts."""
+        if isinstance(chain, cls):
+            return chain
+        return cls.from_frames(getattr(chain, "calls", None), getattr(chain, "puts", None),
+                               symbol or getattr(chain, "symbol", ""), expiration)
+
+    def side(self, option_type: str) -> OptionSide:
+        """Return the call or put side ('call'/'put', case-insensitive)."""
+        return self.call_side if option_type.strip().lower().startswith("c") else self.put_side
+
+    @property
+    def calls(self):
+        """Calls as a read-only DataFrame view (yfinance compatibility)."""
+        return self.call_side.to_frame()
+
+    @property
+    def puts(self):
+        """Puts as a read-only DataFrame view (yfinance compatibility)."""
+        return self.put_side.to_frame()
+
+    @property
+    def n_contracts(self) -> int:
+        """Total contracts on both sides."""
+        return len(self.call_side) + len(self.put_side)
+
+    def __repr__(self) -> str:
+        return (f"OptionChain({self.symbol or '?'} {self.expiration or '?'}: "
+                f"{len(self.call_side)} calls, {len(self.put_side)} puts)")
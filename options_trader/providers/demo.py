@@ -6,8 +6,14 @@ Demo Data Provider
 
 Provides synthetic demo data for testing and development.
 No API keys or network access required.
+
+Values are drawn from per-call random.Random instances seeded with a CRC32 of
+the symbol (and expiration), so they are identical across processes and
+threads. For realistic chain sizes and whole synthetic universes see
+synthetic.py.
 """
 
+import zlib
 import logging
 import random
 from datetime import datetime, timedelta
@@ -27,11 +33,21 @@ try:
 except ImportError:
     DataFrame = SimpleDataFrame
 
+try:
+    from .chain import OptionChain, OptionSide, HAS_NUMPY as HAS_COLUMNAR_CHAIN
+except ImportError:
+    HAS_COLUMNAR_CHAIN = False
+
 from .base import PriceProvider, OptionsProvider, EarningsProvider, EarningsEvent
 
 logger = logging.getLogger("options_trader.providers.demo")
 
 
+def _rng(*parts: str) -> random.Random:
+    """Independent generator seeded from a process-stable hash of parts."""
+    return random.Random(zlib.crc32(":".join(parts).encode("utf-8")))
+
+
 class DemoProvider(PriceProvider, OptionsProvider, EarningsProvider):
     """Demo provider with synthetic data for testing."""
     
@@ -50,8 +66,7 @@ class DemoProvider(PriceProvider, OptionsProvider, EarningsProvider):
             Tuple of (price, source_description)
         """
         # Use symbol as seed for consistent prices
-        random.seed(hash(symbol))
-        price = round(100 + random.random() * 50, 2)
+        price = round(100 + _rng(symbol).random() * 50, 2)
         
         logger.debug(f"Demo price for {symbol}: ${price:.2f}")
         return price, "demo.price"
@@ -90,22 +105,22 @@ class DemoProvider(PriceProvider, OptionsProvider, EarningsProvider):
             expiration: Expiration date in 'YYYY-MM-DD' format
             
         Returns:
-            Object with .calls and .puts DataFrame attributes
+            OptionChain (or a .calls/.puts object of SimpleDataFrames without numpy)
         """
         # Use consistent seed for this symbol/expiration combo
-        random.seed(hash(symbol + expiration))
+        rng = _rng(symbol, expiration)
         
         price, _ = self.get_price(symbol)
         strikes = [round(price + offset, 2) for offset in (-5, 0, 5)]
         
-        def create_option_side(is_call: bool) -> DataFrame:
+        def create_option_side(is_call: bool):
             """Create synthetic options for calls or puts."""
             rows = []
             for strike in strikes:
-                bid = max(0.1, round(random.random() * 2.0, 2))
-                ask = bid + round(random.random(), 2)
+                bid = max(0.1, round(rng.random() * 2.0, 2))
+                ask = bid + round(rng.random(), 2)
                 last_price = (bid + ask) / 2
-                iv = round(0.2 + random.random() * 0.2, 4)  # 20-40% IV range
+                iv = round(0.2 + rng.random() * 0.2, 4)  # 20-40% IV range
                 
                 rows.append({
                     "strike": strike,
@@ -115,15 +130,23 @@ class DemoProvider(PriceProvider, OptionsProvider, EarningsProvider):
                     "impliedVolatility": iv
                 })
             
+            if HAS_COLUMNAR_CHAIN:
+                return OptionSide.from_records(rows, {name: name for name in rows[0]})
             return DataFrame(rows)
         
-        # Create yfinance-like object
-        class OptionChain:
-            pass
+        calls = create_option_side(True)
+        puts = create_option_side(False)
         
-        chain = OptionChain()
-        chain.calls = create_option_side(True)
-        chain.puts = create_option_side(False)
+        if HAS_COLUMNAR_CHAIN:
+            chain = OptionChain(calls, puts, symbol=symbol, expiration=expiration)
+        else:
+            # Create yfinance-like object
+            class LegacyOptionChain:
+                pass
+            
+            chain = LegacyOptionChain()
+            chain.calls = calls
+            chain.puts = puts
         
         logger.debug(f"Demo chain for {symbol} {expiration}: {len(strikes)} strikes each side")
         return chain
@@ -139,14 +162,14 @@ class DemoProvider(PriceProvider, OptionsProvider, EarningsProvider):
             EarningsEvent with synthetic data
         """
         # Use symbol to generate consistent fake earnings
-        random.seed(hash(symbol + "earnings"))
+        rng = _rng(symbol, "earnings")
         
         # Generate earnings 1-4 weeks ahead
-        days_ahead = random.randint(7, 28)
+        days_ahead = rng.randint(7, 28)
         earnings_date = datetime.now() + timedelta(days=days_ahead)
         
         # Random BMO/AMC timing
-        timing = random.choice(["BMO", "AMC"])
+        timing = rng.choice(["BMO", "AMC"])
         
         event = EarningsEvent(
             symbol=symbol.upper(),
@@ -15,8 +15,10 @@ import logging
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
-import pandas as pd
 
+from .http import get_session
+from .rate_limit import get_limiter
+from .chain import OptionChain, OptionSide
 from .base import PriceProvider, OptionsProvider, EarningsProvider, EarningsEvent
 
 logger = logging.getLogger("options_trader.providers.finnhub")
@@ -38,6 +40,9 @@ class FinnhubProvider(PriceProvider, OptionsProvider, EarningsProvider):
         if not self.api_key:
             logger.warning("Finnhub API key not found in environment")
         
+        self.session = get_session("finnhub")  # Pooled keep-alive connections
+        self.rate_limiter = get_limiter("finnhub")
+        
         logger.debug("Finnhub provider initialized")
     
     def _is_enabled(self) -> bool:
@@ -45,15 +50,17 @@ class FinnhubProvider(PriceProvider, OptionsProvider, EarningsProvider):
         return bool(self.api_key)
     
     def _make_request(self, endpoint: str, **params) -> dict:
-        """Make API request with error handling."""
+        """Make API request with rate limiting and error handling."""
         if not self._is_enabled():
             raise RuntimeError("Finnhub API key not configured")
         
+        self.rate_limiter.acquire()
+        
         params['token'] = self.api_key
         url = f"{self.BASE_URL}{endpoint}"
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
             
@@ -127,7 +134,7 @@ class FinnhubProvider(PriceProvider, OptionsProvider, EarningsProvider):
             expiration: Expiration date in 'YYYY-MM-DD' format
             
         Returns:
-            Object with .calls and .puts DataFrame attributes
+            OptionChain with columnar call/put sides
             
         Raises:
             Exception if chain cannot be retrieved
@@ -142,33 +149,22 @@ class FinnhubProvider(PriceProvider, OptionsProvider, EarningsProvider):
             if not contracts:
                 raise RuntimeError("Empty option chain from Finnhub")
             
-            # Separate calls and puts
-            calls = []
-            puts = []
-            
-            for contract in contracts:
-                row = {
-                    "strike": contract.get("strike"),
-                    "bid": contract.get("bid"),
-                    "ask": contract.get("ask"),
-                    "lastPrice": contract.get("lastPrice"),
-                    "impliedVolatility": contract.get("impliedVolatility"),
-                }
-                
-                if contract.get("type") == "call":
-                    calls.append(row)
-                elif contract.get("type") == "put":
-                    puts.append(row)
-            
-            # Create yfinance-like object
-            class OptionChain:
-                pass
-            
-            chain = OptionChain()
-            chain.calls = pd.DataFrame(calls)
-            chain.puts = pd.DataFrame(puts)
+            # Columns are built straight from the JSON records
+            fields = {
+                "strike": "strike",
+                "bid": "bid",
+                "ask": "ask",
+                "lastPrice": "lastPrice",
+                "impliedVolatility": "impliedVolatility",
+            }
+            chain = OptionChain(
+                OptionSide.from_records([c for c in contracts if c.get("type") == "call"], fields),
+                OptionSide.from_records([c for c in contracts if c.get("type") == "put"], fields),
+                symbol=symbol,
+                expiration=expiration
+            )
             
-            logger.debug(f"Finnhub chain for {symbol} {expiration}: {len(calls)} calls, {len(puts)} puts")
+            logger.debug(f"Finnhub chain for {symbol} {expiration}: {len(chain.call_side)} calls, {len(chain.put_side)} puts")
             return chain
             
         except Exception as e:
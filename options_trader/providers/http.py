@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pooled HTTP Sessions
+====================
+
+Shared requests.Session objects for the REST providers (Alpha Vantage, Finnhub,
+Tradier). Each provider gets one session per process with a tuned connection
+pool, so repeated calls reuse keep-alive connections instead of paying a new
+TCP + TLS handshake per request.
+
+Configuration (environment):
+- HTTP_POOL_CONNECTIONS: Host pools kept per session (default 4)
+- HTTP_POOL_MAXSIZE: Connections kept per host (default 16, match watchlist workers)
+- HTTP_MAX_RETRIES: Retries for connection errors and 502/503/504 (default 2)
+"""
+
+import os
+import logging
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import response_size_hook
+
+try:
+    from urllib3.util.retry import Retry
+except ImportError:
+    Retry = None
+
+logger = logging.getLogger("options_trader.providers.http")
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+USER_AGENT = "options-trader/2.0"
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_session(name: str = "http") -> requests.Session:
+    """Create a session with a pooled, retrying adapter that records response sizes under name."""
+    session = requests.Session()
+    session.hooks["response"].append(response_size_hook(name))
+
+    if Retry is not None and HTTP_MAX_RETRIES > 0:
+        retries = Retry(
+            total=HTTP_MAX_RETRIES,
+            connect=HTTP_MAX_RETRIES,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False
+        )
+    else:
+        retries = 0
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retries,
+        pool_block=False
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, "Accept": "application/json"})
+    return session
+
+
+def get_session(name: str) -> requests.Session:
+    """
+    Return the shared pooled session for a provider, creating it on first use.
+
+    Args:
+        name: Provider name (e.g. 'finnhub')
+
+    Returns:
+        requests.Session reused by every instance of that provider
+    """
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = _build_session(name)
+            _sessions[name] = session
+            logger.debug(f"Created pooled HTTP session for {name} (maxsize={HTTP_POOL_MAXSIZE})")
+        return session
+
+
+def close_sessions() -> None:
+    """Close every pooled session (connections are re-opened on next use)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instrumentation
+===============
+
+Timing and counter instrumentation for the data and analysis layers.
+
+Two views of the same measurements are kept:
+
+- MetricsRegistry.shared(): process-wide cumulative counters and latency
+  histograms (pipeline stages, provider calls, rate-limit waits, cache
+  lookups, bytes fetched), exportable as JSON or Prometheus text format for
+  batch runs.
+- RunTimings: the measurements of a single analysis, collected through a
+  context variable while collect_timings() is active. Worker threads started
+  with contextvars.copy_context() record into the same run.
+
+This module lives beside rate_limit.py and http.py so both the providers and
+the core modules can import it without import cycles. It has no third-party
+dependencies and recording never raises.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("options_trader.providers.metrics")
+
+# Latency histogram bucket upper bounds in seconds (+Inf is implicit)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PROMETHEUS_PREFIX = "options_trader_"
+
+# Provider methods timed by instrument_provider
+PROVIDER_METHODS = ("get_price", "get_expirations", "get_chain", "get_history",
+                    "get_next_earnings", "get_earnings_calendar")
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(upper bound, cumulative count) pairs including +Inf."""
+        total, result = 0, []
+        for bound, count in zip([str(b) for b in self.buckets] + ["+Inf"], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "buckets": dict(self.cumulative())
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe registry of labelled counters and histograms."""
+
+    _shared: Optional["MetricsRegistry"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._help: Dict[str, str] = {}
+
+    @classmethod
+    def shared(cls) -> "MetricsRegistry":
+        """Return the process-wide registry."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def describe(self, name: str, help_text: str) -> None:
+        """Set the HELP text used for a metric in Prometheus output."""
+        self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        """Add to a counter."""
+        key = (name, _labels(labels))
+        with self.lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record one histogram observation."""
+        key = (name, _labels(labels))
+        with self.lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        """Drop every recorded value."""
+        with self.lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly copy of all counters and histograms."""
+        with self.lock:
+            counters: Dict[str, List[Dict[str, Any]]] = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, []).append({"labels": dict(labels), "value": value})
+            histograms: Dict[str, List[Dict[str, Any]]] = {}
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                histograms.setdefault(name, []).append({"labels": dict(labels), **histogram.to_dict()})
+        return {"counters": counters, "histograms": histograms}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Registry snapshot as a JSON document."""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """Registry contents in the Prometheus text exposition format."""
+        def fmt(labels: Dict[str, str], extra: Optional[Tuple[str, str]] = None) -> str:
+            items = list(labels.items()) + ([extra] if extra else [])
+            if not items:
+                return ""
+            escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in items)
+            return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(items, escaped)) + "}"
+
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        for name, series in snapshot["counters"].items():
+            metric = prefix + name
+            lines.append(f"# HELP {metric} {self._help.get(name, name.replace('_', ' '))}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.extend(f"{metric}{fmt(s['labels'])} {s['value']:g}" for s in series)
+        for name, series in snapshot["histograms"].items():
+            metric = prefix + name
+            lines.append(f"# HELP {metric} {self._help.get(name, name.replace('_', ' '))}")
+            lines.append(f"# TYPE {metric} histogram")
+            for s in series:
+                for bound, count in s["buckets"].items():
+                    lines.append(f"{metric}_bucket{fmt(s['labels'], ('le', bound))} {count}")
+                lines.append(f"{metric}_sum{fmt(s['labels'])} {s['sum']:.6f}")
+                lines.append(f"{metric}_count{fmt(s['labels'])} {s['count']}")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry.shared()
+_registry.describe("stage_seconds", "Wall time per analysis pipeline stage")
+_registry.describe("stages_total", "Pipeline stages by final status")
+_registry.describe("provider_call_seconds", "Wall time per provider call")
+_registry.describe("provider_errors_total", "Provider calls that raised")
+_registry.describe("throttle_wait_seconds", "Time spent waiting on provider rate limits")
+_registry.describe("cache_lookups_total", "Cache lookups by result")
+_registry.describe("fetched_bytes_total", "Response bytes received per provider")
+
+
+class RunTimings:
+    """Measurements of one analysis run (thread-safe)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.provider_calls: Dict[str, Dict[str, float]] = {}
+        self.throttle: Dict[str, Dict[str, float]] = {}
+        self.cache: Dict[str, Dict[str, int]] = {}
+        self.bytes_fetched: Dict[str, int] = {}
+
+    @staticmethod
+    def _add(table: Dict[str, Dict[str, float]], key: str, seconds: float) -> None:
+        entry = table.setdefault(key, {"count": 0, "seconds": 0.0})
+        entry["count"] += 1
+        entry["seconds"] += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly timings block (seconds rounded to microseconds)."""
+        def rounded(table):
+            return {k: {"count": int(v["count"]), "seconds": round(v["seconds"], 6)} for k, v in table.items()}
+
+        with self.lock:
+            return {
+                "total_sec": round(time.perf_counter() - self.started, 6),
+                "stages": {k: round(v, 6) for k, v in self.stages.items()},
+                "provider_calls": rounded(self.provider_calls),
+                "throttle_wait": rounded(self.throttle),
+                "cache": {k: dict(v) for k, v in self.cache.items()},
+                "bytes_fetched": dict(self.bytes_fetched)
+            }
+
+
+_current_run: ContextVar[Optional[RunTimings]] = ContextVar("options_trader_run_timings", default=None)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RunTimings]:
+    """Collect measurements recorded in this context (and contexts copied from it) into a RunTimings."""
+    timings = RunTimings()
+    token = _current_run.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_run.reset(token)
+
+
+def current_timings() -> Optional[RunTimings]:
+    """RunTimings being collected in this context, if any."""
+    return _current_run.get()
+
+
+def record_stage(pipeline: str, stage: str, seconds: float, status: str) -> None:
+    """Record a finished (or skipped) pipeline stage."""
+    try:
+        _registry.inc("stages_total", pipeline=pipeline, stage=stage, status=status)
+        if status == "skipped":
+            return
+        _registry.observe("stage_seconds", seconds, pipeline=pipeline, stage=stage)
+        run = _current_run.get()
+        if run is not None:
+            with run.lock:
+                run.stages[stage] = seconds
+    except Exception as e:
+        logger.debug(f"Stage metric dropped: {e}")
+
+
+def record_provider_call(provider: str, method: str, seconds: float, ok: bool = True) -> None:
+    """Record one provider call."""
+    try:
+        _registry.observe("provider_call_seconds", seconds, provider=provider, method=method)
+        if not ok:
+            _registry.inc("provider_errors_total", provider=provider, method=method)
+        run = _current_run.get()
+        if run is not None:
+            with run.lock:
+                RunTimings._add(run.provider_calls, f"{provider}.{method}", seconds)
+    except Exception as e:
+        logger.debug(f"Provider metric dropped: {e}")
+
+
+def record_throttle_wait(provider: str, seconds: float) -> None:
+    """Record one rate-limiter acquisition and how long it waited."""
+    try:
+        _registry.observe("throttle_wait_seconds", seconds, provider=provider)
+        run = _current_run.get()
+        if run is not None:
+            with run.lock:
+                RunTimings._add(run.throttle, provider, seconds)
+    except Exception as e:
+        logger.debug(f"Throttle metric dropped: {e}")
+
+
+def record_cache(cache: str, result: str) -> None:
+    """Record a cache lookup ('hit', 'miss' or 'coalesced')."""
+    try:
+        _registry.inc("cache_lookups_total", cache=cache, result=result)
+        run = _current_run.get()
+        if run is not None:
+            with run.lock:
+                counts = run.cache.setdefault(cache, {})
+                counts[result] = counts.get(result, 0) + 1
+    except Exception as e:
+        logger.debug(f"Cache metric dropped: {e}")
+
+
+def record_bytes(provider: str, n: int) -> None:
+    """Record response bytes received from a provider."""
+    try:
+        _registry.inc("fetched_bytes_total", n, provider=provider)
+        run = _current_run.get()
+        if run is not None:
+            with run.lock:
+                run.bytes_fetched[provider] = run.bytes_fetched.get(provider, 0) + int(n)
+    except Exception as e:
+        logger.debug(f"Bytes metric dropped: {e}")
+
+
+@contextmanager
+def timed_call(provider: str, method: str) -> Iterator[None]:
+    """Time a block as one provider call (exceptions are counted and re-raised)."""
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        record_provider_call(provider, method, time.perf_counter() - start, ok)
+
+
+def instrument_provider(provider: Any, name: str, methods: Tuple[str, ...] = PROVIDER_METHODS) -> Any:
+    """
+    Time a provider instance's data methods in place.
+
+    Bound methods are wrapped on the instance itself, so isinstance checks and
+    other attributes are unaffected. Calling this twice is a no-op.
+
+    Returns:
+        The same provider object
+    """
+    if provider is None or getattr(provider, "_metrics_instrumented", False):
+        return provider
+
+    def wrap(method_name: str, bound):
+        def timed(*args, **kwargs):
+            with timed_call(name, method_name):
+                return bound(*args, **kwargs)
+        timed.__name__ = method_name
+        timed.__doc__ = bound.__doc__
+        return timed
+
+    for method_name in methods:
+        bound = getattr(provider, method_name, None)
+        if callable(bound):
+            setattr(provider, method_name, wrap(method_name, bound))
+    provider._metrics_instrumented = True
+    return provider
+
+
+def record_response_size(provider: str, response: Any) -> None:
+    """Record the body size of a requests-style response (Content-Length, else the body)."""
+    try:
+        size = response.headers.get("Content-Length")
+        record_bytes(provider, int(size) if size is not None else len(response.content or b""))
+    except Exception as e:
+        logger.debug(f"Response size unavailable for {provider}: {e}")
+
+
+def response_size_hook(provider: str):
+    """requests response hook that records the size of each response body."""
+    def hook(response, *args, **kwargs):
+        record_response_size(provider, response)
+        return response
+    return hook
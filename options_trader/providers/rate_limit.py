@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Provider Rate Limiting
+======================
+
+Per-provider token buckets shared by every thread and event loop in the process.
+
+Each call reserves a token under a short lock and then sleeps *outside* the lock
+for however long its reservation requires, so callers queue fairly in arrival
+order without blocking each other's bookkeeping. Bursts up to the bucket size go
+through immediately; sustained traffic is held to the configured rate.
+
+Default limits (override with <PROVIDER>_RATE_PER_MIN and <PROVIDER>_BURST):
+- yahoo: ~86/min (one request per 0.7s), burst 2
+- finnhub: 60/min, burst 10
+- tradier: 120/min, burst 10
+- alpha_vantage: 5/min, burst 1
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .metrics import record_throttle_wait
+
+logger = logging.getLogger("options_trader.providers.rate_limit")
+
+# (requests per minute, burst size)
+DEFAULT_PROVIDER_LIMITS: Dict[str, Tuple[float, int]] = {
+    "yahoo": (60.0 / 0.7, 2),
+    "finnhub": (60.0, 10),
+    "tradier": (120.0, 10),
+    "alpha_vantage": (5.0, 1),
+}
+DEFAULT_LIMIT = (60.0, 5)
+
+
+class TokenBucket:
+    """Thread- and asyncio-safe token bucket with wait-time statistics."""
+
+    def __init__(self, rate_per_sec: float, burst: int = 1, name: str = "provider",
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Any] = time.sleep,
+                 async_sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_sec: Sustained refill rate in tokens per second (<= 0 disables limiting)
+            burst: Bucket capacity (requests allowed back-to-back)
+            name: Provider name used in logs and stats
+            clock: Monotonic time source in seconds (testing)
+            sleep: Blocking wait used by acquire (testing)
+            async_sleep: Awaitable wait used by acquire_async (testing)
+        """
+        self.name = name
+        self.rate = float(rate_per_sec)
+        self.capacity = max(1.0, float(burst))
+        self.lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+
+        self._tokens = self.capacity
+        self._updated = clock()
+
+        self._acquired = 0
+        self._delayed = 0
+        self._waiting = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens (possibly going into debt) and return how long to wait."""
+        if self.rate <= 0:
+            return 0.0
+
+        with self.lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._waiting += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def _release_waiter(self) -> None:
+        with self.lock:
+            self._waiting -= 1
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block the calling thread until the request may proceed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.debug(f"{self.name} rate limit: waiting {wait:.2f}s")
+            try:
+                self._sleep(wait)
+            finally:
+                self._release_waiter()
+        record_throttle_wait(self.name, wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Wait without blocking the event loop until the request may proceed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.debug(f"{self.name} rate limit: waiting {wait:.2f}s")
+            try:
+                await self._async_sleep(wait)
+            finally:
+                self._release_waiter()
+        record_throttle_wait(self.name, wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Return limiter configuration and queue wait statistics."""
+        with self.lock:
+            return {
+                "rate_per_min": self.rate * 60.0,
+                "burst": int(self.capacity),
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "waiting": self._waiting,
+                "total_wait_sec": self._total_wait,
+                "avg_wait_sec": self._total_wait / self._acquired if self._acquired else 0.0,
+                "max_wait_sec": self._max_wait
+            }
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid {name}, using {default}")
+        return default
+
+
+def get_limiter(provider: str) -> TokenBucket:
+    """
+    Return the process-wide token bucket for a provider.
+
+    Limits come from <PROVIDER>_RATE_PER_MIN / <PROVIDER>_BURST environment
+    variables, falling back to DEFAULT_PROVIDER_LIMITS.
+
+    Args:
+        provider: Provider name (e.g. 'finnhub')
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            default_rate, default_burst = DEFAULT_PROVIDER_LIMITS.get(provider, DEFAULT_LIMIT)
+            prefix = provider.upper()
+            rate_per_min = _env_float(f"{prefix}_RATE_PER_MIN", default_rate)
+            burst = int(_env_float(f"{prefix}_BURST", default_burst))
+            limiter = TokenBucket(rate_per_min / 60.0, burst, name=provider)
+            _limiters[provider] = limiter
+            logger.debug(f"Rate limiter for {provider}: {rate_per_min:.1f}/min, burst {burst}")
+        return limiter
+
+
+def limiter_stats(provider: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Return stats for one provider's limiter, or for every limiter created so far."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    if provider is not None:
+        return {provider: limiters[provider].stats()} if provider in limiters else {}
+    return {name: limiter.stats() for name, limiter in limiters.items()}
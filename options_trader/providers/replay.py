@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Recorded-Response Replay
+========================
+
+Capture real provider responses to compressed files and serve them back
+offline through the standard provider interfaces.
+
+Recording wraps a live provider instance in place (record_provider): every
+call to a data method (get_price, get_expirations, get_chain, get_history,
+get_next_earnings, get_earnings_calendar) is forwarded unchanged and its
+result, or the exception it raised, is appended with the call latency to
+<directory>/<provider>.jsonl.gz (gzip-compressed JSON Lines).
+
+ReplayProvider implements PriceProvider, OptionsProvider and EarningsProvider
+from such a file:
+
+- Calls are matched on method and symbol (plus expiration for chains); the
+  latest recording wins. get_expirations honours max_count and get_history
+  returns bars from start onward, so callers' arguments need not match the
+  recording exactly.
+- Recorded exceptions are raised again as ReplayError.
+- Optional latency injection (fixed seconds and/or a multiple of the recorded
+  latency) and an error rate. Injected errors and unrecorded calls fail the way
+  the live providers do: empty results where the interface returns one, an
+  exception for chains and history.
+- Dates are shifted forward by whole weeks since the recording (shift_dates),
+  so recorded expirations and earnings stay in the future and keep weekdays.
+
+Configuration (environment, read by DataService):
+- PROVIDER_RECORD_DIR: Record live provider responses into this directory
+- PROVIDER_REPLAY_DIR: Replace live providers with recordings from this directory
+- REPLAY_LATENCY_SEC / REPLAY_LATENCY_SCALE / REPLAY_ERROR_RATE / REPLAY_SEED
+"""
+
+import os
+import gzip
+import json
+import time
+import atexit
+import random
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import PriceProvider, OptionsProvider, EarningsProvider, EarningsEvent
+
+# Conditional imports for optional dependencies
+try:
+    from .chain import OptionChain, OptionSide, HAS_NUMPY
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+    pd = None
+
+logger = logging.getLogger("options_trader.providers.replay")
+
+RECORDED_METHODS = ("get_price", "get_expirations", "get_chain", "get_history",
+                    "get_next_earnings", "get_earnings_calendar")
+RECORDING_SUFFIX = ".jsonl.gz"
+
+
+class ReplayError(RuntimeError):
+    """A recorded provider failure, an injected error or a call with no recording."""
+
+
+def recording_path(directory: str, provider: str) -> str:
+    """File holding one provider's recorded responses."""
+    return os.path.join(directory, f"{provider}{RECORDING_SUFFIX}")
+
+
+def _call_key(method: str, args: tuple, kwargs: Dict[str, Any]) -> List[str]:
+    """Recording key: symbol, plus expiration for chains."""
+    symbol = args[0] if args else kwargs.get("symbol", "")
+    key = [str(symbol).upper()]
+    if method == "get_chain":
+        key.append(str(args[1] if len(args) > 1 else kwargs.get("expiration", "")))
+    return key
+
+
+# ---------------------------------------------------------------------------
+# Serialization (tagged JSON)
+# ---------------------------------------------------------------------------
+
+def _encode_side(side: "OptionSide") -> Dict[str, Any]:
+    return {
+        "columns": {name: values.tolist() for name, values in side.columns.items()},
+        "contract_symbols": side.contract_symbols.tolist() if side.contract_symbols is not None else None
+    }
+
+
+def _decode_side(data: Dict[str, Any]) -> "OptionSide":
+    return OptionSide.from_columns(contract_symbols=data.get("contract_symbols"), **data["columns"])
+
+
+def encode_value(value: Any) -> Any:
+    """Convert a provider result into JSON-serializable tagged data."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, tuple):
+        return {"__tuple__": [encode_value(v) for v in value]}
+    if isinstance(value, list):
+        return [encode_value(v) for v in value]
+    if isinstance(value, dict):
+        return {"__dict__": [[encode_value(k), encode_value(v)] for k, v in value.items()]}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, EarningsEvent):
+        return {"__earnings__": {"symbol": value.symbol, "date": encode_value(value.date),
+                                 "timing": value.timing, "confirmed": value.confirmed, "source": value.source}}
+    if HAS_NUMPY and isinstance(value, OptionChain):
+        return {"__chain__": {"symbol": value.symbol, "expiration": value.expiration,
+                              "calls": _encode_side(value.call_side), "puts": _encode_side(value.put_side)}}
+    if HAS_PANDAS and isinstance(value, pd.DataFrame):
+        return {"__frame__": {
+            "index": [str(ts) for ts in value.index],
+            "index_name": value.index.name,
+            "columns": {str(name): value[name].tolist() for name in value.columns}
+        }}
+    if hasattr(value, "calls") and hasattr(value, "puts") and HAS_NUMPY:
+        return encode_value(OptionChain.from_any(value))
+    if hasattr(value, "item"):  # NumPy scalar
+        return value.item()
+    raise TypeError(f"Cannot record value of type {type(value).__name__}")
+
+
+def decode_value(data: Any) -> Any:
+    """Rebuild a provider result from encode_value output (fresh objects every call)."""
+    if isinstance(data, list):
+        return [decode_value(v) for v in data]
+    if not isinstance(data, dict):
+        return data
+    if "__tuple__" in data:
+        return tuple(decode_value(v) for v in data["__tuple__"])
+    if "__dict__" in data:
+        return {decode_value(k): decode_value(v) for k, v in data["__dict__"]}
+    if "__datetime__" in data:
+        return datetime.fromisoformat(data["__datetime__"])
+    if "__date__" in data:
+        return date.fromisoformat(data["__date__"])
+    if "__earnings__" in data:
+        fields = dict(data["__earnings__"])
+        fields["date"] = decode_value(fields["date"])
+        return EarningsEvent(**fields)
+    if "__chain__" in data:
+        chain = data["__chain__"]
+        return OptionChain(_decode_side(chain["calls"]), _decode_side(chain["puts"]),
+                           chain["symbol"], chain["expiration"])
+    if "__frame__" in data:
+        frame = data["__frame__"]
+        index = pd.DatetimeIndex(pd.to_datetime(frame["index"]), name=frame.get("index_name"))
+        return pd.DataFrame(frame["columns"], index=index)
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+class ResponseRecorder:
+    """Appends recorded calls for one provider to a gzip JSON Lines file (thread-safe)."""
+
+    def __init__(self, directory: str, provider: str):
+        os.makedirs(directory, exist_ok=True)
+        self.path = recording_path(directory, provider)
+        self.provider = provider
+        self.lock = threading.Lock()
+        self._file = gzip.open(self.path, "at", encoding="utf-8")
+        self.count = 0
+        atexit.register(self.close)
+
+    def record(self, method: str, key: List[str], latency: float,
+               result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Append one call; values that cannot be encoded are skipped with a warning."""
+        entry = {"method": method, "key": key, "recorded_at": datetime.now().isoformat(timespec="seconds"),
+                 "latency_sec": round(latency, 6)}
+        try:
+            if error is not None:
+                entry["error"] = {"type": type(error).__name__, "message": str(error)}
+            else:
+                entry["result"] = encode_value(result)
+            line = json.dumps(entry)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not recording {self.provider}.{method}{key}: {e}")
+            return
+
+        with self.lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()  # Keep the file readable if the process dies
+            self.count += 1
+
+    def close(self) -> None:
+        """Finish the gzip stream."""
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def record_provider(provider: Any, name: str, directory: str) -> Any:
+    """
+    Record a live provider's responses in place.
+
+    Data methods are wrapped on the instance, so isinstance checks, _is_enabled
+    and other attributes are unaffected. Calling this twice is a no-op.
+
+    Args:
+        provider: Provider instance (None is returned unchanged)
+        name: Provider name used for the recording file
+        directory: Directory receiving <name>.jsonl.gz
+
+    Returns:
+        The same provider object
+    """
+    if provider is None or getattr(provider, "_replay_recorder", None) is not None:
+        return provider
+
+    recorder = ResponseRecorder(directory, name)
+
+    def wrap(method: str, bound):
+        def recorded(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = bound(*args, **kwargs)
+            except Exception as e:
+                recorder.record(method, _call_key(method, args, kwargs), time.perf_counter() - start, error=e)
+                raise
+            recorder.record(method, _call_key(method, args, kwargs), time.perf_counter() - start, result=result)
+            return result
+        recorded.__name__ = method
+        recorded.__doc__ = bound.__doc__
+        return recorded
+
+    for method in RECORDED_METHODS:
+        bound = getattr(provider, method, None)
+        if callable(bound):
+            setattr(provider, method, wrap(method, bound))
+    provider._replay_recorder = recorder
+    logger.info(f"Recording {name} responses to {recorder.path}")
+    return provider
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+def load_recording(path: str) -> List[Dict[str, Any]]:
+    """Read recorded entries, tolerating a stream cut off by a crash."""
+    entries = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line))
+    except (EOFError, json.JSONDecodeError) as e:
+        logger.warning(f"Recording {path} is truncated, using {len(entries)} entries: {e}")
+    return entries
+
+
+class ReplayProvider(PriceProvider, OptionsProvider, EarningsProvider):
+    """Serves recorded provider responses offline."""
+
+    def __init__(self, name: str, directory: str, latency_sec: float = 0.0, latency_scale: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None, shift_dates: bool = True):
+        """
+        Load a provider recording.
+
+        Args:
+            name: Provider name (reads <directory>/<name>.jsonl.gz)
+            directory: Recording directory
+            latency_sec: Fixed delay added to every call
+            latency_scale: Multiple of the recorded latency added to every call
+            error_rate: Probability (0-1) that a call fails as if the provider were down
+            seed: Seed for the injected-error draws
+            shift_dates: Move dates forward by whole weeks elapsed since the recording
+        """
+        self.name = name
+        self.path = recording_path(directory, name)
+        self.latency_sec = max(0.0, float(latency_sec))
+        self.latency_scale = max(0.0, float(latency_scale))
+        self.error_rate = min(1.0, max(0.0, float(error_rate)))
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+        self._entries: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        recorded_dates = []
+        for entry in load_recording(self.path) if os.path.exists(self.path) else []:
+            self._entries[(entry["method"], *entry["key"])] = entry
+            recorded_dates.append(entry.get("recorded_at", "")[:10])
+
+        self.shift = timedelta(0)
+        if shift_dates and recorded_dates:
+            first = date.fromisoformat(min(d for d in recorded_dates if d) or date.today().isoformat())
+            self.shift = timedelta(weeks=max(0, (date.today() - first).days // 7))
+
+        logger.debug(f"Replay provider {name}: {len(self._entries)} recorded calls, date shift {self.shift.days}d")
+
+    def _is_enabled(self) -> bool:
+        """True if the recording holds any calls."""
+        return bool(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Date shifting ---------------------------------------------------------
+
+    def _shift_date_str(self, value: str, sign: int = 1) -> str:
+        try:
+            return (date.fromisoformat(value) + sign * self.shift).isoformat()
+        except (TypeError, ValueError):
+            return value
+
+    def _shift_result(self, method: str, result: Any) -> Any:
+        if not self.shift:
+            return result
+        if method == "get_expirations" and isinstance(result, list):
+            return [self._shift_date_str(e) for e in result]
+        if method == "get_chain" and HAS_NUMPY and isinstance(result, OptionChain):
+            result.expiration = self._shift_date_str(result.expiration)
+        elif method == "get_history" and HAS_PANDAS and isinstance(result, pd.DataFrame):
+            result.index = result.index + self.shift
+        elif isinstance(result, EarningsEvent):
+            result.date = result.date + self.shift
+        elif isinstance(result, list):
+            for event in result:
+                if isinstance(event, EarningsEvent):
+                    event.date = event.date + self.shift
+        return result
+
+    # Replay core -----------------------------------------------------------
+
+    def _replay(self, method: str, key: List[str]) -> Any:
+        """Recorded result for a call, after injected latency; raises ReplayError on failure."""
+        entry = self._entries.get((method, *key))
+        delay = self.latency_sec + self.latency_scale * (entry or {}).get("latency_sec", 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.error_rate > 0:
+            with self._rng_lock:
+                injected = self._rng.random() < self.error_rate
+            if injected:
+                raise ReplayError(f"{self.name} injected error for {method} {' '.join(key)}")
+        if entry is None:
+            raise ReplayError(f"{self.name} has no recording for {method} {' '.join(key)}")
+        if "error" in entry:
+            raise ReplayError(f"{self.name} recorded {entry['error']['type']}: {entry['error']['message']}")
+        return self._shift_result(method, decode_value(entry["result"]))
+
+    def get_price(self, symbol: str) -> Tuple[Optional[float], str]:
+        """Recorded price, or (None, '<name>.replay.none') when unavailable."""
+        try:
+            return self._replay("get_price", _call_key("get_price", (symbol,), {}))
+        except ReplayError as e:
+            logger.debug(f"Replay price unavailable: {e}")
+            return None, f"{self.name}.replay.none"
+
+    def get_expirations(self, symbol: str, max_count: int = 3) -> List[str]:
+        """Recorded expirations (first max_count), or [] when unavailable."""
+        try:
+            return list(self._replay("get_expirations", _call_key("get_expirations", (symbol,), {})))[:max_count]
+        except ReplayError as e:
+            logger.debug(f"Replay expirations unavailable: {e}")
+            return []
+
+    def get_chain(self, symbol: str, expiration: str):
+        """
+        Recorded option chain.
+
+        Raises:
+            ReplayError if the chain was not recorded or the call fails
+        """
+        recorded_expiration = self._shift_date_str(expiration, sign=-1)
+        return self._replay("get_chain", _call_key("get_chain", (symbol, recorded_expiration), {}))
+
+    def get_history(self, symbol: str, start):
+        """
+        Recorded daily bars from start onward.
+
+        Raises:
+            ReplayError if history was not recorded or the call fails
+        """
+        history = self._replay("get_history", _call_key("get_history", (symbol,), {}))
+        if HAS_PANDAS and isinstance(history, pd.DataFrame) and start is not None:
+            history = history[history.index >= pd.Timestamp(str(start))]
+        return history
+
+    def get_next_earnings(self, symbol: str) -> Optional[EarningsEvent]:
+        """Recorded next earnings event, or None when unavailable."""
+        try:
+            return self._replay("get_next_earnings", _call_key("get_next_earnings", (symbol,), {}))
+        except ReplayError as e:
+            logger.debug(f"Replay earnings unavailable: {e}")
+            return None
+
+    def get_earnings_calendar(self, symbol: str, days_ahead: int = 30) -> List[EarningsEvent]:
+        """Recorded earnings events within days_ahead, or [] when unavailable."""
+        try:
+            events = self._replay("get_earnings_calendar", _call_key("get_earnings_calendar", (symbol,), {}))
+        except ReplayError as e:
+            logger.debug(f"Replay earnings calendar unavailable: {e}")
+            return []
+        cutoff = datetime.now() + timedelta(days=days_ahead)
+        return [event for event in events or [] if _naive(event.date) <= cutoff]
+
+
+def _naive(value: datetime) -> datetime:
+    return value.replace(tzinfo=None) if isinstance(value, datetime) and value.tzinfo else value
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid {name}={os.getenv(name)!r}, using {default}")
+        return default
+
+
+def replay_options_from_env() -> Dict[str, Any]:
+    """ReplayProvider keyword arguments from REPLAY_* environment variables."""
+    seed = os.getenv("REPLAY_SEED")
+    return {
+        "latency_sec": _env_float("REPLAY_LATENCY_SEC", 0.0),
+        "latency_scale": _env_float("REPLAY_LATENCY_SCALE", 0.0),
+        "error_rate": _env_float("REPLAY_ERROR_RATE", 0.0),
+        "seed": int(seed) if seed not in (None, "") else None,
+        "shift_dates": os.getenv("REPLAY_SHIFT_DATES", "true").lower() in ("1", "true", "yes")
+    }
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic Market Generator
+==========================
+
+Deterministic, production-scale synthetic market data for load testing the
+full pipeline without network access.
+
+SyntheticMarketProvider implements PriceProvider, OptionsProvider and
+EarningsProvider (plus get_history) for any symbol:
+
+- Per-symbol profile (spot, volatility, smile, liquidity, earnings date and
+  expected earnings move) drawn from the market seed and a CRC32 of the symbol
+- Weekly expirations for the next weeks plus third-Friday monthlies
+- Strike ladders of n_strikes around spot with exchange-style increments
+- Black-Scholes quotes from a skewed smile; term structure carries the
+  earnings event variance in every expiration after the announcement, so
+  front-month IV is elevated before earnings like the real thing
+- Bid/ask spreads, volume and open interest that thin out away from the money
+- Daily OHLCV history ending at the last session before as_of
+
+Every value is a pure function of (seed, as_of, symbol, expiration), so two
+processes with the same seed produce identical data. synthetic_universe()
+generates thousands of distinct ticker symbols for batch scans.
+
+Configuration (environment, read by DataService):
+- SYNTHETIC_MARKET_SEED: Serve synthetic market data with this seed instead of demo/live data
+- SYNTHETIC_STRIKES: Strikes per expiration (default 120)
+"""
+
+import os
+import math
+import zlib
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import PriceProvider, OptionsProvider, EarningsProvider, EarningsEvent
+from .chain import OptionChain, OptionSide
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+    pd = None
+
+logger = logging.getLogger("options_trader.providers.synthetic")
+
+DEFAULT_STRIKES = 120
+DEFAULT_WEEKLY_EXPIRATIONS = 8
+DEFAULT_MONTHLY_EXPIRATIONS = 6
+DEFAULT_HISTORY_BARS = 504
+RISK_FREE_RATE = 0.04
+TRADING_DAYS = 252
+
+_TICKER_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _stable_hash(*parts: Any) -> int:
+    """Process-independent 32-bit hash (unlike hash(), which is salted per process)."""
+    return zlib.crc32(":".join(str(p) for p in parts).encode("utf-8"))
+
+
+def _strike_increment(spot: float) -> float:
+    if spot < 25:
+        return 0.5
+    if spot < 100:
+        return 1.0
+    if spot < 250:
+        return 2.5
+    return 5.0
+
+
+def _third_friday(year: int, month: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(4 - first.weekday()) % 7 + 14)
+
+
+def synthetic_universe(n: int, seed: int = 0) -> List[str]:
+    """
+    Generate n distinct 3-4 letter ticker symbols, deterministic for a seed.
+
+    Args:
+        n: Number of symbols
+        seed: Universe seed
+
+    Returns:
+        List of upper-case symbols in generation order
+    """
+    rng = np.random.default_rng([seed, _stable_hash("universe")])
+    symbols: List[str] = []
+    seen = set()
+    capacity = 26 ** 3 + 26 ** 4
+    if n > capacity:
+        raise ValueError(f"At most {capacity} synthetic symbols are available")
+    while len(symbols) < n:
+        length = 3 if rng.random() < 0.4 else 4
+        symbol = "".join(_TICKER_LETTERS[i] for i in rng.integers(0, 26, length))
+        if symbol not in seen:
+            seen.add(symbol)
+            symbols.append(symbol)
+    return symbols
+
+
+class SyntheticMarketProvider(PriceProvider, OptionsProvider, EarningsProvider):
+    """Deterministic synthetic prices, option chains, history and earnings for any symbol."""
+
+    def __init__(self, seed: int = 0, as_of: Optional[date] = None, n_strikes: int = DEFAULT_STRIKES,
+                 weekly_expirations: int = DEFAULT_WEEKLY_EXPIRATIONS,
+                 monthly_expirations: int = DEFAULT_MONTHLY_EXPIRATIONS,
+                 history_bars: int = DEFAULT_HISTORY_BARS):
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Market seed; every generated value is a function of it
+            as_of: Market date (default today); expirations, history and earnings are relative to it
+            n_strikes: Strikes per expiration and side
+            weekly_expirations: Weekly (Friday) expirations listed ahead of as_of
+            monthly_expirations: Third-Friday monthly expirations listed ahead of as_of
+            history_bars: Daily bars available per symbol
+        """
+        self.seed = int(seed)
+        self.as_of = as_of or date.today()
+        self.n_strikes = max(3, int(n_strikes))
+        self.weekly_expirations = max(0, int(weekly_expirations))
+        self.monthly_expirations = max(0, int(monthly_expirations))
+        self.history_bars = max(2, int(history_bars))
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        logger.debug(f"Synthetic market initialized (seed={self.seed}, as_of={self.as_of}, strikes={self.n_strikes})")
+
+    def _is_enabled(self) -> bool:
+        return True
+
+    def _rng(self, *parts: Any) -> np.random.Generator:
+        return np.random.default_rng([self.seed, _stable_hash(*parts)])
+
+    def profile(self, symbol: str) -> Dict[str, Any]:
+        """Per-symbol market parameters (cached; deterministic for seed and symbol)."""
+        symbol = symbol.upper()
+        profile = self._profiles.get(symbol)
+        if profile is None:
+            rng = self._rng(symbol, "profile")
+            vol = float(np.clip(rng.lognormal(math.log(0.32), 0.35), 0.12, 1.2))
+            profile = {
+                "spot": round(float(np.clip(rng.lognormal(math.log(80), 0.9), 5, 900)), 2),
+                "vol": vol,
+                "realized_ratio": float(rng.uniform(0.6, 1.1)),  # Realized vol as a fraction of IV
+                "skew": float(rng.uniform(-0.35, -0.05)),
+                "smile": float(rng.uniform(0.05, 0.4)),
+                "liquidity": float(rng.lognormal(math.log(2000), 1.0)),
+                "spread_pct": float(rng.uniform(0.01, 0.08)),
+                "earnings_days": int(rng.integers(1, 91)),
+                "earnings_timing": "BMO" if rng.random() < 0.5 else "AMC",
+                "earnings_move": float(rng.uniform(0.02, 0.12)),  # One-day event move (stdev)
+                "avg_volume": float(rng.lognormal(math.log(3_000_000), 1.2))
+            }
+            self._profiles[symbol] = profile  # Benign race: same value from every thread
+        return profile
+
+    # PriceProvider ---------------------------------------------------------
+
+    def get_price(self, symbol: str) -> Tuple[Optional[float], str]:
+        """Synthetic spot price."""
+        return self.profile(symbol)["spot"], "synthetic.price"
+
+    # OptionsProvider -------------------------------------------------------
+
+    def list_expirations(self) -> List[str]:
+        """All listed expirations (weeklies then monthlies, merged and sorted)."""
+        days_to_friday = (4 - self.as_of.weekday()) % 7 or 7
+        first_friday = self.as_of + timedelta(days=days_to_friday)
+        listed = {first_friday + timedelta(weeks=i) for i in range(self.weekly_expirations)}
+
+        monthlies = 0
+        year, month = self.as_of.year, self.as_of.month
+        while monthlies < self.monthly_expirations:
+            friday = _third_friday(year, month)
+            if friday > self.as_of:
+                listed.add(friday)
+                monthlies += 1
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return [d.isoformat() for d in sorted(listed)]
+
+    def get_expirations(self, symbol: str, max_count: int = 3) -> List[str]:
+        """Nearest max_count listed expirations."""
+        return self.list_expirations()[:max_count]
+
+    def _earnings_date(self, symbol: str) -> date:
+        return self.as_of + timedelta(days=self.profile(symbol)["earnings_days"])
+
+    def atm_vol(self, symbol: str, expiration: str) -> float:
+        """ATM implied vol for an expiration, including earnings event variance when it spans the event."""
+        profile = self.profile(symbol)
+        expiry = date.fromisoformat(expiration)
+        t = max((expiry - self.as_of).days, 1) / 365.0
+        variance = profile["vol"] ** 2 * t
+        if expiry >= self._earnings_date(symbol):
+            variance += profile["earnings_move"] ** 2
+        return math.sqrt(variance / t)
+
+    def get_chain(self, symbol: str, expiration: str) -> OptionChain:
+        """
+        Synthetic option chain with n_strikes strikes per side.
+
+        Raises:
+            ValueError if expiration is not a 'YYYY-MM-DD' date after as_of
+        """
+        symbol = symbol.upper()
+        profile = self.profile(symbol)
+        expiry = date.fromisoformat(expiration)
+        if expiry <= self.as_of:
+            raise ValueError(f"Synthetic expiration {expiration} is not after {self.as_of}")
+
+        rng = self._rng(symbol, expiration, "chain")
+        spot = profile["spot"]
+        t = (expiry - self.as_of).days / 365.0
+        increment = _strike_increment(spot)
+        center = round(spot / increment) * increment
+        strikes = center + increment * (np.arange(self.n_strikes) - self.n_strikes // 2)
+        strikes = np.round(strikes[strikes > 0], 2)
+
+        # Skewed smile in standardized moneyness
+        forward = spot * math.exp(RISK_FREE_RATE * t)
+        moneyness = np.log(strikes / forward) / math.sqrt(t)
+        atm = self.atm_vol(symbol, expiration)
+        iv = atm * np.clip(1.0 + profile["skew"] * moneyness + profile["smile"] * moneyness ** 2, 0.5, 3.0)
+
+        # Quotes come from the same kernel the analyzer prices with (imported lazily:
+        # core imports providers, so providers must not import core at module load)
+        from ..core.pricing import black_scholes
+        call = black_scholes(spot, strikes, iv, t, RISK_FREE_RATE, "call")
+        put = black_scholes(spot, strikes, iv, t, RISK_FREE_RATE, "put")
+
+        expiry_code = expiry.strftime("%y%m%d")
+        liquidity = profile["liquidity"] * math.exp(-t * 2.0)  # Back months trade less
+
+        def build_side(values: np.ndarray, delta: np.ndarray, flag: str) -> OptionSide:
+            n = len(strikes)
+            spread = np.maximum(0.01, np.round(values * profile["spread_pct"] * rng.uniform(0.7, 1.3, n), 2))
+            mid = np.maximum(values, 0.01)
+            bid = np.round(np.maximum(mid - spread / 2, 0.0), 2)
+            ask = np.round(np.maximum(mid + spread / 2, bid + 0.01), 2)
+            last = np.round(mid * rng.uniform(0.97, 1.03, n), 2)
+            weight = np.exp(-2.0 * moneyness ** 2)
+            open_interest = np.floor(liquidity * weight * rng.lognormal(0.0, 0.5, n))
+            volume = np.floor(open_interest * rng.uniform(0.02, 0.4, n))
+            symbols = [f"{symbol}{expiry_code}{flag}{int(round(k * 1000)):08d}" for k in strikes]
+            return OptionSide.from_columns(
+                contract_symbols=symbols, strike=strikes, bid=bid, ask=ask, lastPrice=last,
+                impliedVolatility=np.round(iv, 4), volume=volume, openInterest=open_interest, delta=delta
+            )
+
+        calls = build_side(call.price, call.delta, "C")
+        puts = build_side(put.price, put.delta, "P")
+        return OptionChain(calls, puts, symbol=symbol, expiration=expiration)
+
+    # History ---------------------------------------------------------------
+
+    def get_history(self, symbol: str, start=None):
+        """
+        Daily OHLCV bars ending at the last weekday before as_of, with the close pinned to spot.
+
+        Args:
+            symbol: Stock symbol
+            start: First date to include (date or 'YYYY-MM-DD'; None returns all bars)
+
+        Returns:
+            DataFrame indexed by date with Open/High/Low/Close/Volume columns
+        """
+        if not HAS_PANDAS:
+            raise ImportError("pandas is required for synthetic price history")
+
+        symbol = symbol.upper()
+        profile = self.profile(symbol)
+        rng = self._rng(symbol, "history")
+        n = self.history_bars
+        daily_vol = profile["vol"] * profile["realized_ratio"] / math.sqrt(TRADING_DAYS)
+
+        returns = rng.normal(0.0, daily_vol, n)
+        close = profile["spot"] * np.exp(np.cumsum(returns) - returns.sum())  # Last close == spot
+        gap = rng.normal(0.0, daily_vol * 0.3, n)
+        open_ = np.concatenate([[close[0]], close[:-1]]) * np.exp(gap)
+        high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0.0, daily_vol * 0.5, n)))
+        low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0.0, daily_vol * 0.5, n)))
+        volume = np.floor(profile["avg_volume"] * rng.lognormal(0.0, 0.4, n))
+
+        end = self.as_of - timedelta(days=1)
+        index = pd.bdate_range(end=end, periods=n, name="Date")
+        history = pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+                               index=index)
+        if start is not None:
+            history = history[history.index >= pd.Timestamp(str(start))]
+        return history
+
+    # EarningsProvider ------------------------------------------------------
+
+    def get_next_earnings(self, symbol: str) -> Optional[EarningsEvent]:
+        """Next synthetic earnings announcement."""
+        profile = self.profile(symbol)
+        day = self._earnings_date(symbol)
+        hour = 8 if profile["earnings_timing"] == "BMO" else 16
+        return EarningsEvent(symbol=symbol.upper(), date=datetime(day.year, day.month, day.day, hour),
+                             timing=profile["earnings_timing"], confirmed=True, source="synthetic")
+
+    def get_earnings_calendar(self, symbol: str, days_ahead: int = 30) -> List[EarningsEvent]:
+        """Earnings announcements within days_ahead of as_of."""
+        event = self.get_next_earnings(symbol)
+        if event and event.date.date() <= self.as_of + timedelta(days=days_ahead):
+            return [event]
+        return []
+
+
+def synthetic_provider_from_env() -> Optional[SyntheticMarketProvider]:
+    """SyntheticMarketProvider configured from SYNTHETIC_* env vars, or None when unset."""
+    seed = os.getenv("SYNTHETIC_MARKET_SEED", "")
+    if seed == "":
+        return None
+    try:
+        return SyntheticMarketProvider(seed=int(seed),
+                                       n_strikes=int(os.getenv("SYNTHETIC_STRIKES", DEFAULT_STRIKES)))
+    except ValueError as e:
+        logger.warning(f"Invalid synthetic market settings, ignoring: {e}")
+        return None
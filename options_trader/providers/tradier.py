@@ -15,8 +15,10 @@ import logging
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
-import pandas as pd
 
+from .http import get_session
+from .rate_limit import get_limiter
+from .chain import OptionChain, OptionSide
 from .base import OptionsProvider, EarningsProvider, EarningsEvent
 
 logger = logging.getLogger("options_trader.providers.tradier")
@@ -39,6 +41,9 @@ class TradierProvider(OptionsProvider, EarningsProvider):
         if not self.token:
             logger.warning("Tradier token not found in environment")
         
+        self.session = get_session("tradier")  # Pooled keep-alive connections
+        self.rate_limiter = get_limiter("tradier")
+        
         logger.debug(f"Tradier provider initialized with base URL: {self.base_url}")
     
     def _is_enabled(self) -> bool:
@@ -53,14 +58,16 @@ class TradierProvider(OptionsProvider, EarningsProvider):
         }
     
     def _make_request(self, endpoint: str, **params) -> dict:
-        """Make API request with error handling."""
+        """Make API request with rate limiting and error handling."""
         if not self._is_enabled():
             raise RuntimeError("Tradier token not configured")
         
+        self.rate_limiter.acquire()
+        
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = requests.get(url, headers=self._get_headers(), params=params, timeout=10)
+            response = self.session.get(url, headers=self._get_headers(), params=params, timeout=10)
             response.raise_for_status()
             return response.json()
             
@@ -115,7 +122,7 @@ class TradierProvider(OptionsProvider, EarningsProvider):
             expiration: Expiration date in 'YYYY-MM-DD' format
             
         Returns:
-            Object with .calls and .puts DataFrame attributes
+            OptionChain with columnar call/put sides
             
         Raises:
             Exception if chain cannot be retrieved
@@ -132,32 +139,27 @@ class TradierProvider(OptionsProvider, EarningsProvider):
             
             options = data.get("options", {}).get("option", [])
             
-            calls = []
-            puts = []
-            
-            for option in options:
-                row = {
-                    "strike": option.get("strike"),
-                    "bid": option.get("bid"),
-                    "ask": option.get("ask"),
-                    "lastPrice": option.get("last"),
-                    "impliedVolatility": option.get("greeks", {}).get("mid_iv"),
-                }
-                
-                if option.get("option_type") == "call":
-                    calls.append(row)
-                else:
-                    puts.append(row)
-            
-            # Create yfinance-like object
-            class OptionChain:
-                pass
-            
-            chain = OptionChain()
-            chain.calls = pd.DataFrame(calls)
-            chain.puts = pd.DataFrame(puts)
+            if isinstance(options, dict):
+                options = [options]  # Single-contract chains are not wrapped in a list
+            
+            # Columns are built straight from the JSON records
+            fields = {
+                "strike": "strike",
+                "bid": "bid",
+                "ask": "ask",
+                "lastPrice": "last",
+                "impliedVolatility": lambda o: (o.get("greeks") or {}).get("mid_iv"),
+                "volume": "volume",
+                "openInterest": "open_interest",
+            }
+            chain = OptionChain(
+                OptionSide.from_records([o for o in options if o.get("option_type") == "call"], fields, "symbol"),
+                OptionSide.from_records([o for o in options if o.get("option_type") != "call"], fields, "symbol"),
+                symbol=symbol,
+                expiration=expiration
+            )
             
-            logger.debug(f"Tradier chain for {symbol} {expiration}: {len(calls)} calls, {len(puts)} puts")
+            logger.debug(f"Tradier chain for {symbol} {expiration}: {len(chain.call_side)} calls, {len(chain.put_side)} puts")
             return chain
             
         except Exception as e:
@@ -6,16 +6,28 @@ Yahoo Finance Data Provider
 
 Provides price data and options chains from Yahoo Finance via yfinance library.
 Primary provider with good coverage but subject to rate limiting.
+
+yfinance fetches through its own curl_cffi session rather than the pooled
+requests sessions in http.py, so tickers are given a shared MeteredSession
+that records response sizes under the "yahoo" provider label.
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
 import yfinance as yf
 import pandas as pd
 
+from .chain import OptionChain
 from .base import PriceProvider, OptionsProvider, EarningsProvider, EarningsEvent
+from .metrics import record_response_size
+
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:
+    curl_requests = None  # Older yfinance without curl_cffi: its default session is used unmetered
 
 try:
     from yfinance.exceptions import YFRateLimitError
@@ -25,6 +37,32 @@ except Exception:
 
 logger = logging.getLogger("options_trader.providers.yahoo")
 
+_session = None
+_session_lock = threading.Lock()
+
+
+if curl_requests is not None:
+    class MeteredSession(curl_requests.Session):
+        """curl_cffi session (yfinance's transport) that records every response body size."""
+
+        def request(self, *args, **kwargs):
+            response = super().request(*args, **kwargs)
+            record_response_size("yahoo", response)
+            return response
+else:
+    MeteredSession = None
+
+
+def get_yahoo_session():
+    """Return the process-wide metered session for yfinance, or None when curl_cffi is missing."""
+    global _session
+    if MeteredSession is None:
+        return None
+    with _session_lock:
+        if _session is None:
+            _session = MeteredSession(impersonate="chrome")  # Same browser profile yfinance uses
+        return _session
+
 
 class YahooProvider(PriceProvider, OptionsProvider, EarningsProvider):
     """Yahoo Finance data provider using yfinance library."""
@@ -32,12 +70,13 @@ class YahooProvider(PriceProvider, OptionsProvider, EarningsProvider):
     def __init__(self):
         """Initialize Yahoo provider with ticker cache."""
         self._tickers: Dict[str, yf.Ticker] = {}
+        self._session = get_yahoo_session()
         logger.debug("Yahoo provider initialized")
     
     def _get_ticker(self, symbol: str) -> yf.Ticker:
         """Get or create ticker object with caching."""
         if symbol not in self._tickers:
-            self._tickers[symbol] = yf.Ticker(symbol)
+            self._tickers[symbol] = yf.Ticker(symbol, session=self._session)
         return self._tickers[symbol]
     
     def get_price(self, symbol: str) -> Tuple[Optional[float], str]:
@@ -126,7 +165,7 @@ class YahooProvider(PriceProvider, OptionsProvider, EarningsProvider):
             expiration: Expiration date in 'YYYY-MM-DD' format
             
         Returns:
-            Object with .calls and .puts DataFrame attributes
+            OptionChain with columnar call/put sides
             
         Raises:
             Exception if chain cannot be retrieved
@@ -134,14 +173,34 @@ class YahooProvider(PriceProvider, OptionsProvider, EarningsProvider):
         ticker = self._get_ticker(symbol)
         
         try:
-            chain = ticker.option_chain(expiration)
-            logger.debug(f"Yahoo chain for {symbol} {expiration}: {len(chain.calls)} calls, {len(chain.puts)} puts")
+            raw = ticker.option_chain(expiration)
+            chain = OptionChain.from_frames(raw.calls, raw.puts, symbol=symbol, expiration=expiration)
+            logger.debug(f"Yahoo chain for {symbol} {expiration}: {len(chain.call_side)} calls, {len(chain.put_side)} puts")
             return chain
             
         except Exception as e:
             logger.warning(f"Yahoo get_chain failed for {symbol} {expiration}: {e}")
             raise
 
+    def get_history(self, symbol: str, start) -> pd.DataFrame:
+        """
+        Get daily OHLCV bars from a start date through today.
+
+        Bars are back-adjusted for splits and dividends, so earlier bars change
+        after each corporate action (the history store re-checks its last bar).
+
+        Args:
+            symbol: Stock symbol
+            start: First date to request (date or 'YYYY-MM-DD')
+
+        Returns:
+            DataFrame indexed by date with Open/High/Low/Close/Volume columns
+        """
+        start = start.isoformat() if hasattr(start, "isoformat") else str(start)
+        history = self._get_ticker(symbol).history(start=start, interval="1d", auto_adjust=True)
+        logger.debug(f"Yahoo history for {symbol} since {start}: {len(history)} bars")
+        return history
+
     def get_next_earnings(self, symbol: str) -> Optional[EarningsEvent]:
         """
         Get next earnings announcement from Yahoo Finance.
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark Runner
+================
+
+Micro and end-to-end performance benchmarks for the hot paths:
+1. Black-Scholes Greeks (GreeksCalculator._calculate_bs_greeks)
+2. Post-earnings P&L scenario grid (PnLEngine.simulate_post_earnings_scenarios)
+3. Yang-Zhang realized volatility (yang_zhang_volatility)
+4. ATM strike lookup (nearest_strike_row)
+5. Monte Carlo robustness simulation (BacktestingEngine.simulate_monte_carlo)
+6. Full analyze_symbol with all modules on DemoProvider chains and a recorded price tape
+7. Full analyze_symbol on production-sized synthetic chains (SyntheticMarketProvider)
+8. Portfolio stress cube, 500 calendar positions x 10,000 scenarios (PortfolioStressEngine)
+
+Inputs are deterministic fixtures (seeded price paths and chains) so runs are
+comparable. Each benchmark reports the median and best time per call over
+several repeats. Results can be saved as a JSON baseline and later runs are
+compared against it; a benchmark slower than the baseline by more than the
+threshold is reported as a regression and the runner exits with status 1.
+
+Timings are normalized by a pure-Python calibration loop measured in the same
+run, so a baseline recorded on a faster or slower machine still compares
+sensibly (use --no-normalize for raw comparisons).
+
+Usage:
+    python tests/run_benchmarks.py                      # Run and compare with the baseline
+    python tests/run_benchmarks.py --save               # Record a new baseline
+    python tests/run_benchmarks.py --only greeks,pnl    # Subset by name prefix
+    python tests/run_benchmarks.py --quick --threshold 0.5
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.analysis import yang_zhang_volatility
+from options_trader.core.analyzer import analyze_symbol
+from options_trader.core.backtesting import BacktestingEngine
+from options_trader.core.data_service import DataService
+from options_trader.core.greeks import GreeksCalculator
+from options_trader.core.pnl_engine import IVCrushParameters, PnLEngine
+from options_trader.core.pricing import black_scholes
+from options_trader.core.risk_management import Position
+from options_trader.core.stress import PortfolioStressEngine
+from options_trader.core.trade_construction import CalendarTrade, OptionQuote
+from options_trader.core.utils import nearest_strike_row
+from options_trader.providers.demo import DemoProvider
+from options_trader.providers.synthetic import SyntheticMarketProvider
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+DEFAULT_THRESHOLD = 0.25  # 25% slower than baseline counts as a regression
+CALIBRATION_LOOPS = 200_000
+
+
+@dataclass
+class Benchmark:
+    """A named benchmark: setup() builds fixtures and returns the callable to time."""
+    name: str
+    description: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int = 10   # Calls per repeat
+    repeat: int = 5    # Timed repeats (median and min are reported)
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, description: str, number: int = 10, repeat: int = 5):
+    """Register a setup function as a benchmark."""
+    def register(setup: Callable[[], Callable[[], Any]]):
+        BENCHMARKS.append(Benchmark(name, description, setup, number, repeat))
+        return setup
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def make_calendar_trade(symbol: str = "AAPL", spot: float = 100.0) -> CalendarTrade:
+    """ATM call calendar with realistic quotes (front 7 days, back 35 days)."""
+    front_exp = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    back_exp = (datetime.now() + timedelta(days=35)).strftime("%Y-%m-%d")
+    front = OptionQuote(f"{symbol}_F", spot, front_exp, "call", 2.40, 2.60, 2.50, 0.60)
+    back = OptionQuote(f"{symbol}_B", spot, back_exp, "call", 4.40, 4.60, 4.50, 0.40)
+    return CalendarTrade(symbol, spot, spot, front_exp, back_exp, front, back)
+
+
+def make_price_history(days: int = 63, seed: int = 11, daily_vol: float = 0.02) -> pd.DataFrame:
+    """Seeded random-walk OHLCV frame in the provider history format."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, daily_vol, days)))
+    open_ = close * np.exp(rng.normal(0, daily_vol / 2, days))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, daily_vol / 2, days)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, daily_vol / 2, days)))
+    index = pd.bdate_range(end="2030-01-18", periods=days, name="Date")
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close,
+                         "Volume": rng.integers(1_000_000, 5_000_000, days)}, index=index)
+
+
+def make_chain_side(n_strikes: int = 400, seed: int = 5) -> pd.DataFrame:
+    """Unsorted option chain side with n_strikes half-dollar strikes around 100."""
+    rng = np.random.default_rng(seed)
+    strikes = 100 + 0.5 * (np.arange(n_strikes) - n_strikes // 2)
+    rng.shuffle(strikes)
+    return pd.DataFrame({"strike": strikes, "bid": rng.uniform(0.1, 20, n_strikes),
+                         "ask": rng.uniform(0.2, 21, n_strikes), "impliedVolatility": 0.3})
+
+
+class RecordedDemoProvider(DemoProvider):
+    """
+    DemoProvider with a recorded quiet tape and model-consistent quotes.
+
+    Plain demo mode has no price history and quotes random bids and asks without
+    open interest, so analyze_symbol stops before trade construction. This fixture
+    keeps the demo strikes and IVs, prices the quotes with Black-Scholes and serves
+    a low-volatility history, so every module downstream of the signals runs.
+    """
+
+    def get_history(self, symbol: str, start=None) -> pd.DataFrame:
+        return make_price_history(daily_vol=0.008)
+
+    def get_chain(self, symbol: str, expiration: str):
+        chain = super().get_chain(symbol, expiration)
+        spot, _ = self.get_price(symbol)
+        days = max((datetime.strptime(expiration, "%Y-%m-%d") - datetime.now()).days, 1)
+        for option_type in ("call", "put"):
+            side = chain.side(option_type)
+            value = black_scholes(spot, side.strikes, side.column("impliedVolatility"), days / 365.0,
+                                  0.05, option_type).price
+            side.set_column("bid", np.round(value * 0.98, 2))
+            side.set_column("ask", np.round(value * 1.02, 2))
+            side.set_column("lastPrice", np.round(value, 2))
+            side.set_column("openInterest", np.full(len(side), 500.0))
+            side.set_column("volume", np.full(len(side), 120.0))
+        return chain
+
+
+def check_full_pipeline(result: Dict[str, Any]) -> None:
+    """Raise unless analyze_symbol got through trade construction and position sizing."""
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    for stage in ("trade_construction", "position_sizing"):
+        errors = {key: value for key, value in (result.get(stage) or {}).items() if key.endswith("error")}
+        if stage not in result or errors:
+            raise RuntimeError(f"{stage} did not complete: {errors or 'stage missing'}")
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+@benchmark("greeks.bs_single", "GreeksCalculator._calculate_bs_greeks, 100 strikes x call/put", number=20)
+def _bench_bs_greeks():
+    calc = GreeksCalculator()
+    strikes = np.linspace(80, 120, 100).tolist()
+
+    def run():
+        for k in strikes:
+            calc._calculate_bs_greeks(100.0, k, 0.35, 30 / 365, 0.05, "call")
+            calc._calculate_bs_greeks(100.0, k, 0.35, 30 / 365, 0.05, "put")
+    return run
+
+
+@benchmark("pnl.post_earnings_grid", "PnLEngine.simulate_post_earnings_scenarios on an ATM calendar", number=20)
+def _bench_pnl_grid():
+    engine, trade, crush = PnLEngine(), make_calendar_trade(), IVCrushParameters()
+    return lambda: engine.simulate_post_earnings_scenarios(trade, crush, expected_move_pct=5.0)
+
+
+@benchmark("volatility.yang_zhang", "yang_zhang_volatility over 63 daily bars", number=200)
+def _bench_yang_zhang():
+    history = make_price_history()
+    return lambda: yang_zhang_volatility(history)
+
+
+@benchmark("chain.nearest_strike_row", "nearest_strike_row on a 400-strike unsorted chain", number=200)
+def _bench_nearest_strike():
+    side = make_chain_side()
+    return lambda: nearest_strike_row(side, 101.3)
+
+
+@benchmark("backtest.monte_carlo", "BacktestingEngine.simulate_monte_carlo, 1000 paths", number=3)
+def _bench_monte_carlo():
+    engine = BacktestingEngine()
+    params = {"expected_win_rate": 0.62, "avg_profit": 0.15, "avg_loss": 0.07}
+    return lambda: engine.simulate_monte_carlo(params, iterations=1000, seed=42)
+
+
+@benchmark("e2e.analyze_symbol_demo", "analyze_symbol, all modules, 3 expirations, recorded DemoProvider data",
+           number=5)
+def _bench_analyze_symbol():
+    # Chain caching off so every call rebuilds and summarizes the chains
+    service = DataService(chain_cache_ttl_sec=0, synthetic=RecordedDemoProvider())
+    options = dict(expirations_to_check=3, include_earnings=True, include_trade_construction=True,
+                   include_position_sizing=True, include_trading_decision=True, data_service=service)
+
+    def run():
+        check_full_pipeline(analyze_symbol("AAPL", **options))
+    return run
+
+
+@benchmark("e2e.analyze_symbol_synthetic", "analyze_symbol, all modules, 3 expirations, 120-strike synthetic chains",
+           number=5)
+def _bench_analyze_symbol_synthetic():
+    market = SyntheticMarketProvider(seed=7, as_of=date(2030, 1, 7))
+    service = DataService(synthetic=market, chain_cache_ttl_sec=0)
+    options = dict(expirations_to_check=3, include_earnings=True, include_trade_construction=True,
+                   include_position_sizing=True, include_trading_decision=True, data_service=service)
+
+    def run():
+        # SHQQ in this seeded market shows 3/3 signals, so every module runs
+        check_full_pipeline(analyze_symbol("SHQQ", **options))
+    return run
+
+
+@benchmark("risk.portfolio_stress", "PortfolioStressEngine, 500 calendars x (40 moves x 25 IV shifts x 10 days)",
+           number=2, repeat=3)
+def _bench_portfolio_stress():
+    rng = np.random.default_rng(3)
+    positions = []
+    for i in range(500):
+        spot = float(rng.uniform(20, 400))
+        option_type = "call" if i % 2 else "put"
+        legs = [{"option_type": option_type, "strike": round(spot), "expiration": "2030-01-18",
+                 "quantity": -1, "iv": 0.60},
+                {"option_type": option_type, "strike": round(spot), "expiration": "2030-02-15",
+                 "quantity": 1, "iv": 0.40}]
+        positions.append(Position(f"S{i}", 2, "2030-01-07", underlying_price=spot, legs=legs))
+    engine = PortfolioStressEngine()
+    grid = dict(price_moves_pct=np.linspace(-30, 30, 40), iv_shifts=np.linspace(-0.2, 0.2, 25),
+                day_rolls=np.arange(10.0), now=datetime(2030, 1, 7, 10))
+    return lambda: engine.stress(positions, **grid)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def calibrate(loops: int = CALIBRATION_LOOPS) -> float:
+    """Best-of-5 time of a fixed pure-Python loop (machine speed reference)."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        total = 0
+        for i in range(loops):
+            total += i * i
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(bench: Benchmark, quick: bool = False) -> Dict[str, Any]:
+    """
+    Time one benchmark.
+
+    Args:
+        bench: Benchmark to run
+        quick: Single call per repeat and two repeats (smoke runs)
+
+    Returns:
+        Dictionary with per-call median/min seconds and the loop counts used
+    """
+    number = 1 if quick else bench.number
+    repeat = 2 if quick else bench.repeat
+    func = bench.setup()
+    func()  # Warm-up (imports, caches, JIT-free first-call costs)
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "description": bench.description,
+        "median_sec": statistics.median(samples),
+        "min_sec": min(samples),
+        "number": number,
+        "repeat": repeat
+    }
+
+
+def run_suite(only: Optional[List[str]] = None, quick: bool = False, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Run the registered benchmarks.
+
+    Args:
+        only: Name prefixes to include (None runs everything)
+        quick: Smoke mode (see run_benchmark)
+        verbose: Print one line per benchmark
+
+    Returns:
+        {"meta": {...}, "results": {name: timing dict}}
+    """
+    selected = [b for b in BENCHMARKS if not only or any(b.name.startswith(p) for p in only)]
+    results = {}
+    for bench in selected:
+        results[bench.name] = run_benchmark(bench, quick=quick)
+        if verbose:
+            r = results[bench.name]
+            print(f"  {bench.name:<28} median {_format_seconds(r['median_sec']):>10}   "
+                  f"best {_format_seconds(r['min_sec']):>10}")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "calibration_sec": calibrate(),
+            "quick": quick
+        },
+        "results": results
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+            normalize: bool = True) -> List[Dict[str, Any]]:
+    """
+    Compare a run against a baseline.
+
+    Args:
+        current: run_suite() output
+        baseline: Previously saved run_suite() output
+        threshold: Allowed slowdown fraction before flagging (0.25 = 25%)
+        normalize: Scale baseline timings by the calibration ratio of the two runs
+
+    Returns:
+        One entry per benchmark present in both runs, with the slowdown ratio and
+        a 'regression' flag
+    """
+    scale = 1.0
+    if normalize:
+        base_cal = baseline.get("meta", {}).get("calibration_sec")
+        cur_cal = current.get("meta", {}).get("calibration_sec")
+        if base_cal and cur_cal:
+            scale = cur_cal / base_cal
+
+    comparisons = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("median_sec"):
+            continue
+        expected = base["median_sec"] * scale
+        ratio = result["median_sec"] / expected
+        comparisons.append({
+            "name": name,
+            "baseline_sec": expected,
+            "current_sec": result["median_sec"],
+            "ratio": ratio,
+            "regression": ratio > 1.0 + threshold
+        })
+    return comparisons
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1.0:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """Read a saved baseline, or None if missing or unreadable."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main() -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Options trader performance benchmarks")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown before flagging a regression (default: 0.25)")
+    parser.add_argument("--only", type=str, help="Comma-separated benchmark name prefixes")
+    parser.add_argument("--quick", action="store_true", help="One call per repeat (smoke run)")
+    parser.add_argument("--no-normalize", action="store_true", help="Compare raw timings across machines")
+    parser.add_argument("--output", type=str, help="Also write this run's results to a JSON file")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)  # Keep analyzer/provider logs out of timings and output
+    only = [p.strip() for p in args.only.split(",")] if args.only else None
+
+    print("⏱️  OPTIONS TRADER BENCHMARKS")
+    print("=" * 72)
+    run = run_suite(only=only, quick=args.quick)
+    print("=" * 72)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(run, f, indent=2)
+
+    if args.save:
+        with open(args.baseline, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"💾 Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save to record one")
+        return 0
+
+    comparisons = compare(run, baseline, args.threshold, normalize=not args.no_normalize)
+    regressions = [c for c in comparisons if c["regression"]]
+    for c in comparisons:
+        marker = "❌ REGRESSION" if c["regression"] else ("✅ faster" if c["ratio"] < 1.0 - args.threshold else "ok")
+        print(f"  {c['name']:<28} {c['ratio']:>6.2f}x baseline   {marker}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
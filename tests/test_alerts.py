@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trading Alert System Tests
+==========================
+
+Unit tests for the pipeline-backed alert scanner and its incremental rescans.
+"""
+
+import os
+import sys
+from datetime import date
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.alerts import AlertPreferences, TradingAlertSystem, input_fingerprint
+from options_trader.core.data_service import DataService, PriceCache
+from options_trader.providers.synthetic import SyntheticMarketProvider, synthetic_universe
+
+SYMBOLS = synthetic_universe(40, seed=1)
+
+
+@pytest.fixture
+def alert_system(tmp_path):
+    market = SyntheticMarketProvider(seed=1, as_of=date.today())
+    service = DataService(synthetic=market)
+    service.price_cache = PriceCache(cache_file=str(tmp_path / "prices.json"))
+    preferences = AlertPreferences(min_signal_strength=1, min_confidence=0.0, min_quality_score=0.0,
+                                   max_days_to_expiration=60, max_alerts_per_day=1000,
+                                   enabled_alert_types=["earnings_calendar", "high_signals", "time_decay"])
+    yield TradingAlertSystem(preferences, data_service=service, max_workers=4), market, service
+    service.price_cache.flush()  # Stop the write-behind timer thread
+
+
+class TestTradingAlertSystem:
+    """Tests for TradingAlertSystem scanning."""
+
+    def test_fingerprint_buckets(self):
+        base = input_fingerprint(100.0, [("2030-01-18", 0.40)], "2030-01-10 AMC", date(2030, 1, 7))
+
+        assert input_fingerprint(100.2, [("2030-01-18", 0.402)], "2030-01-10 AMC", date(2030, 1, 7)) == base
+        assert input_fingerprint(103.0, [("2030-01-18", 0.40)], "2030-01-10 AMC", date(2030, 1, 7)) != base
+        assert input_fingerprint(100.0, [("2030-01-18", 0.45)], "2030-01-10 AMC", date(2030, 1, 7)) != base
+        assert input_fingerprint(100.0, [("2030-01-18", 0.40)], "2030-01-11 BMO", date(2030, 1, 7)) != base
+        assert input_fingerprint(100.0, [("2030-01-18", 0.40)], "2030-01-10 AMC", date(2030, 1, 8)) != base
+
+    def test_opportunities_come_from_analysis(self, alert_system):
+        alerts, _, _ = alert_system
+
+        opportunities = alerts.scan_for_opportunities(SYMBOLS)
+        assert alerts.last_scan_stats["reevaluated"] == len(SYMBOLS)
+        assert opportunities and alerts.scan_for_opportunities(SYMBOLS) == opportunities
+
+        for opp in opportunities:
+            analysis = alerts._states[opp.symbol].analysis
+            calendar = analysis["calendar_spread_analysis"]
+            assert opp.signal_strength == int(calendar["signal_count"])
+            assert abs(opp.expected_move - calendar["expected_move_pct"]) < 1e-9
+            if opp.opportunity_type == "high_signals":
+                assert opp.signal_strength >= 2
+            if opp.opportunity_type == "time_decay":
+                assert calendar["ts_slope_signal"]
+            if opp.opportunity_type == "earnings_calendar":
+                assert opp.entry_window_start == analysis["earnings_analysis"]["trading_windows"]["entry_start"]
+            expected_action = {"RECOMMENDED": "EXECUTE", "CONSIDER": "CONSIDER"}.get(
+                analysis["trading_decision"]["decision"], "MONITOR")
+            assert opp.recommended_action == expected_action
+
+    def test_rescan_reanalyzes_only_changed_symbols(self, alert_system, tmp_path):
+        alerts, market, service = alert_system
+        alerts.scan_for_opportunities(SYMBOLS)
+
+        alerts.scan_for_opportunities(SYMBOLS)
+        assert alerts.last_scan_stats["reevaluated"] == 0
+        assert alerts.last_scan_stats["reused"] == len(SYMBOLS)
+
+        # Move one symbol's price by 5% and drop its cached quote and chains
+        changed = SYMBOLS[3]
+        market.profile(changed)["spot"] *= 1.05
+        service.price_cache.flush()
+        service.price_cache = PriceCache(cache_file=str(tmp_path / "prices2.json"))
+        service.chain_cache.invalidate(changed)
+        for symbol in SYMBOLS:
+            service.price_cache.set_price(symbol, market.get_price(symbol)[0])
+
+        alerts.scan_for_opportunities(SYMBOLS)
+        assert alerts.last_scan_stats["reevaluated"] == 1
+        assert alerts._states[changed].analysis["price"] == market.get_price(changed)[0]
+
+        alerts.scan_for_opportunities(SYMBOLS, force=True)
+        assert alerts.last_scan_stats["reevaluated"] == len(SYMBOLS)
+
+        alerts.invalidate(SYMBOLS[0])
+        alerts.scan_for_opportunities(SYMBOLS)
+        assert alerts.last_scan_stats["reevaluated"] == 1
+
+    def test_market_conditions_follow_analysis(self, alert_system):
+        alerts, _, _ = alert_system
+        opportunities = alerts.scan_for_opportunities(SYMBOLS)
+
+        for opp in opportunities:
+            calendar = alerts._states[opp.symbol].analysis["calendar_spread_analysis"]
+            elevated = bool(calendar["ts_slope_signal"]) + bool(calendar["iv_rv_signal"])
+            assert alerts.evaluate_entry_timing(opp).market_conditions == \
+                ("UNFAVORABLE", "NEUTRAL", "FAVORABLE")[elevated]
+        assert alerts._assess_market_conditions("UNSCANNED") == "NEUTRAL"
+
+    def test_failing_symbol_is_counted_once(self, alert_system):
+        alerts, _, service = alert_system
+        broken = SYMBOLS[5]
+        get_price = service.get_price
+
+        def failing_get_price(symbol, *args, **kwargs):
+            if symbol.upper() == broken:
+                raise RuntimeError("provider down")
+            return get_price(symbol, *args, **kwargs)
+
+        service.get_price = failing_get_price
+        opportunities = alerts.scan_for_opportunities(SYMBOLS)
+        stats = alerts.last_scan_stats
+        assert stats["errors"] == 1 and stats["reevaluated"] == len(SYMBOLS)
+        assert stats["reused"] == 0
+        assert all(opp.symbol != broken for opp in opportunities)
+
+        # Healthy symbols are reused; the failed one is retried
+        alerts.scan_for_opportunities(SYMBOLS)
+        stats = alerts.last_scan_stats
+        assert (stats["errors"], stats["reevaluated"], stats["reused"]) == (1, 1, len(SYMBOLS) - 1)
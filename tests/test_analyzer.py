@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analyzer Orchestration Tests
+============================
+
+Unit tests for concurrent data fetching inside analyze_symbol and for the
+watchlist scanner.
+"""
+
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core import analyzer
+from options_trader.core.analyzer import _fetch_concurrently, analyze_symbol, analyze_watchlist
+from options_trader.providers.chain import OptionChain
+
+REQUEST_LATENCY = 0.2
+
+
+class SlowDataService:
+    """DataService stand-in whose chain and history requests each take REQUEST_LATENCY."""
+
+    def __init__(self, expirations, failing=()):
+        self.expirations = expirations
+        self.failing = set(failing)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _request(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(REQUEST_LATENCY)
+        with self._lock:
+            self.in_flight -= 1
+
+    def get_price(self, symbol):
+        return 100.0, "test", False
+
+    def get_expirations(self, symbol, max_count=3):
+        return self.expirations[:max_count], "test"
+
+    def get_chain(self, symbol, expiration):
+        self._request()
+        if expiration in self.failing:
+            raise RuntimeError("chain unavailable")
+        iv = 0.3 + 0.01 * self.expirations.index(expiration)
+        side = pd.DataFrame({"strike": [95.0, 100.0, 105.0], "bid": [5.0, 2.0, 0.5],
+                             "ask": [5.2, 2.2, 0.7], "impliedVolatility": iv})
+        return OptionChain.from_frames(side, side, symbol, expiration), "test"
+
+    def get_price_history(self, symbol):
+        self._request()
+        return None
+
+    def get_earnings_providers(self):
+        return []
+
+
+class TestConcurrentFetch:
+    """Tests for per-symbol concurrent chain/history fetching."""
+
+    def test_chains_and_history_overlap(self):
+        expirations = ["2030-01-18", "2030-02-15", "2030-03-15", "2030-04-19"]
+        service = SlowDataService(expirations)
+
+        start = time.perf_counter()
+        result = analyze_symbol("xyz", expirations_to_check=4, include_earnings=True, data_service=service)
+        elapsed = time.perf_counter() - start
+
+        # Five requests of REQUEST_LATENCY each, issued together
+        assert service.max_in_flight == 5
+        assert elapsed < 3 * REQUEST_LATENCY
+        assert [e["expiration"] for e in result["expirations"]] == expirations
+        assert abs(result["expirations"][2]["atm_iv"] - 0.32) < 1e-12
+        assert "signal_count" in result["calendar_spread_analysis"]
+        assert result["earnings_analysis"] == {"error": "No earnings providers available"}
+
+    def test_failed_chain_is_reported_in_place(self):
+        expirations = ["2030-01-18", "2030-02-15", "2030-03-15"]
+        service = SlowDataService(expirations, failing={"2030-02-15"})
+
+        result = analyze_symbol("XYZ", expirations_to_check=3, data_service=service)
+
+        assert [e["expiration"] for e in result["expirations"]] == expirations
+        assert "chain unavailable" in result["expirations"][1]["error"]
+        assert "atm_iv" in result["expirations"][2]
+        assert "earnings_analysis" not in result
+
+    def test_fetch_concurrently_captures_exceptions(self):
+        def fail():
+            raise ValueError("boom")
+
+        results = _fetch_concurrently({"ok": lambda: 1, "bad": fail}, max_workers=2)
+        assert results["ok"] == (1, None)
+        assert results["bad"][0] is None and isinstance(results["bad"][1], ValueError)
+        assert _fetch_concurrently({"ok": lambda: 2}, max_workers=1) == {"ok": (2, None)}
+
+
+class PriceOutageService(SlowDataService):
+    """SlowDataService whose price lookup fails for some symbols."""
+
+    def __init__(self, expirations, down=()):
+        super().__init__(expirations)
+        self.down = set(down)
+
+    def get_price(self, symbol):
+        if symbol in self.down:
+            raise ConnectionError(f"no quote for {symbol}")
+        return super().get_price(symbol)
+
+
+@pytest.fixture
+def main_module(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # main.py creates logs/ in the working directory on import
+    import main
+    return main
+
+
+class TestWatchlist:
+    """Tests for watchlist parsing and the concurrent watchlist scan."""
+
+    def test_load_watchlist_skips_comments_blanks_and_duplicates(self, main_module, tmp_path):
+        watchlist = tmp_path / "watchlist.txt"
+        watchlist.write_text("# Earnings this week\naapl, msft\n\n   \nNVDA  # reports Tuesday\n"
+                             "MSFT\ntsla,,aapl\n#SPY\n", encoding="utf-8")
+
+        assert main_module.load_watchlist(str(watchlist)) == ["AAPL", "MSFT", "NVDA", "TSLA"]
+
+    def test_failing_symbol_does_not_stop_scan(self):
+        service = PriceOutageService(["2030-01-18"], down={"BAD"})
+
+        results = dict(analyze_watchlist(["xyz", "BAD", " abc ", "XYZ", ""], data_service=service, max_workers=2))
+
+        assert sorted(results) == ["ABC", "BAD", "XYZ"]
+        assert "error" in results["BAD"]
+        for symbol in ("ABC", "XYZ"):
+            assert "error" not in results[symbol] and results[symbol]["price"] == 100.0
+
+    def test_worker_exception_is_reported_per_symbol(self):
+        def analyze(symbol, *args, **kwargs):
+            if symbol == "BAD":
+                raise RuntimeError("worker crashed")
+            return {"symbol": symbol}
+
+        with mock.patch.object(analyzer, "analyze_symbol", side_effect=analyze):
+            results = dict(analyze_watchlist(["AAA", "BAD", "CCC"], data_service=object(), max_workers=3))
+
+        assert results["AAA"] == {"symbol": "AAA"} and results["CCC"] == {"symbol": "CCC"}
+        assert "worker crashed" in results["BAD"]["error"]
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark Suite Tests
+=====================
+
+Smoke tests keeping run_benchmarks.py runnable and its regression check honest.
+"""
+
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from run_benchmarks import BASELINE_FILE, BENCHMARKS, compare, load_baseline, run_suite
+
+
+class TestBenchmarkSuite:
+    """Tests for the benchmark runner."""
+
+    def test_every_benchmark_runs(self):
+        run = run_suite(quick=True, verbose=False)
+
+        assert set(run["results"]) == {b.name for b in BENCHMARKS}
+        assert all(r["median_sec"] > 0 for r in run["results"].values())
+        assert run["meta"]["calibration_sec"] > 0
+
+    def test_baseline_covers_every_benchmark(self):
+        baseline = load_baseline(BASELINE_FILE)
+        assert baseline is not None
+        assert set(baseline["results"]) == {b.name for b in BENCHMARKS}
+
+    def test_compare_flags_slowdowns_beyond_threshold(self):
+        baseline = {"meta": {"calibration_sec": 0.01},
+                    "results": {"a": {"median_sec": 1.0}, "b": {"median_sec": 1.0}}}
+        current = {"meta": {"calibration_sec": 0.02},
+                   "results": {"a": {"median_sec": 2.4}, "b": {"median_sec": 2.6}, "new": {"median_sec": 1.0}}}
+
+        # This machine is 2x slower per the calibration loop
+        by_name = {c["name"]: c for c in compare(current, baseline, threshold=0.25)}
+        assert set(by_name) == {"a", "b"}
+        assert not by_name["a"]["regression"] and by_name["b"]["regression"]
+
+        raw = {c["name"]: c for c in compare(current, baseline, threshold=0.25, normalize=False)}
+        assert raw["a"]["regression"] and abs(raw["a"]["ratio"] - 2.4) < 1e-12
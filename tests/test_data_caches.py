@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Data Cache Tests
+================
+
+Unit tests for the in-memory caches used by DataService.
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import tempfile
+import threading
+import weakref
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.data_service import PriceCache, ChainCache, DataService
+from options_trader.core.pricing import black_scholes_price
+
+
+class TestPriceCache:
+    """Tests for the in-memory price cache with write-behind persistence."""
+
+    def setup_method(self):
+        """Create an isolated cache file for each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmp_dir.name, "prices.json")
+        self.caches = []
+
+    def teardown_method(self):
+        """Flush pending writes and remove the temporary cache directory."""
+        for cache in self.caches:
+            cache.flush()
+        self.tmp_dir.cleanup()
+
+    def _cache(self, **kwargs):
+        cache = PriceCache(self.cache_file, **kwargs)
+        self.caches.append(cache)
+        return cache
+
+    def test_hit_and_miss_counters(self):
+        cache = self._cache(flush_interval_sec=60)
+        assert cache.get_price("AAPL") is None
+        cache.set_price("aapl", 123.45)
+        assert cache.get_price("AAPL") == 123.45
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_lru_eviction(self):
+        cache = self._cache(max_entries=2, flush_interval_sec=60)
+        cache.set_price("AAA", 1.0)
+        cache.set_price("BBB", 2.0)
+        cache.get_price("AAA")  # AAA becomes most recently used
+        cache.set_price("CCC", 3.0)
+
+        assert cache.get_price("BBB") is None
+        assert cache.get_price("AAA") == 1.0
+        assert cache.get_price("CCC") == 3.0
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_and_stale_lookup(self):
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump({"MSFT": {"price": 300.0, "ts": time.time() - 3600}}, f)
+
+        cache = self._cache(flush_interval_sec=60)
+        assert cache.get_price("MSFT") is None
+        assert cache.get_price("MSFT", ttl_sec=86400) == 300.0
+
+    def test_flush_writes_atomically_and_reloads(self):
+        cache = self._cache(flush_interval_sec=60)
+        cache.set_price("NVDA", 450.0)
+        assert not os.path.exists(self.cache_file)
+
+        cache.flush()
+        assert os.listdir(self.tmp_dir.name) == ["prices.json"]
+
+        reloaded = self._cache(flush_interval_sec=60)
+        assert reloaded.get_price("NVDA") == 450.0
+
+    def test_write_behind_timer_flushes(self):
+        cache = self._cache(flush_interval_sec=0.05)
+        cache.set_price("AMD", 100.0)
+
+        deadline = time.time() + 2.0
+        while not os.path.exists(self.cache_file) and time.time() < deadline:
+            time.sleep(0.02)
+
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            assert json.load(f)["AMD"]["price"] == 100.0
+
+    def _wait_for_file(self, predicate, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    if predicate(json.load(f)):
+                        return True
+            except (OSError, ValueError):
+                pass
+            time.sleep(0.02)
+        return False
+
+    def test_concurrent_flushes_keep_newest_snapshot(self):
+        cache = self._cache(flush_interval_sec=60)
+        save = cache._save_cache
+        writing = threading.Event()
+
+        def slow_save(snapshot):
+            if snapshot["NVDA"]["price"] == 1.0:
+                writing.set()
+                time.sleep(0.1)  # The older snapshot finishes writing last without serialization
+            save(snapshot)
+
+        cache._save_cache = slow_save
+        cache.set_price("NVDA", 1.0)
+        first = threading.Thread(target=cache.flush)
+        first.start()
+        assert writing.wait(2.0)
+        cache.set_price("NVDA", 2.0)
+        cache.flush()
+        first.join()
+
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            assert json.load(f)["NVDA"]["price"] == 2.0
+
+    def test_expired_entry_eviction_is_flushed(self):
+        cache = self._cache(max_age_sec=3600, flush_interval_sec=0.05)
+        cache.set_price("AMD", 100.0)
+        cache.flush()
+
+        real_time = time.time
+        time.time = lambda: real_time() + 7200
+        try:
+            assert cache.get_price("AMD", ttl_sec=86400) is None
+        finally:
+            time.time = real_time
+
+        assert cache.stats()["evictions"] == 1
+        assert self._wait_for_file(lambda data: "AMD" not in data)
+
+    def test_exit_flush_does_not_keep_caches_alive(self):
+        cache = PriceCache(self.cache_file, flush_interval_sec=60)
+        ref = weakref.ref(cache)
+        assert cache in PriceCache._live
+
+        del cache
+        gc.collect()
+        assert ref() is None
+
+
+class TestChainCache:
+    """Tests for the (symbol, expiration) option chain cache."""
+
+    def test_second_lookup_is_a_hit(self):
+        cache = ChainCache(ttl_sec=60)
+        calls = []
+
+        def fetcher():
+            calls.append(1)
+            return object(), "demo"
+
+        first = cache.get_or_fetch("aapl", "2030-01-18", fetcher)
+        second = cache.get_or_fetch("AAPL", "2030-01-18", fetcher)
+
+        assert first is second or first == second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_ttl_expiry_refetches(self):
+        cache = ChainCache(ttl_sec=0.01)
+        calls = []
+        fetcher = lambda: (calls.append(1), "demo")
+        cache.get_or_fetch("AAPL", "2030-01-18", fetcher)
+        time.sleep(0.03)
+        cache.get_or_fetch("AAPL", "2030-01-18", fetcher)
+        assert len(calls) == 2
+
+    def test_concurrent_requests_share_one_fetch(self):
+        cache = ChainCache(ttl_sec=60)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_fetcher():
+            calls.append(1)
+            started.set()
+            release.wait(2.0)
+            return "chain", "demo"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            cache.get_or_fetch("MSFT", "2030-01-18", slow_fetcher))) for _ in range(4)]
+        threads[0].start()
+        started.wait(2.0)
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(2.0)
+
+        assert len(calls) == 1
+        assert results == [("chain", "demo")] * 4
+        assert cache.stats()["coalesced"] == 3
+
+    def test_failures_are_not_cached(self):
+        cache = ChainCache(ttl_sec=60)
+
+        def failing():
+            raise RuntimeError("provider down")
+
+        for _ in range(2):
+            try:
+                cache.get_or_fetch("TSLA", "2030-01-18", failing)
+                assert False, "expected RuntimeError"
+            except RuntimeError:
+                pass
+
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_missing_ivs_are_solved_before_caching(self):
+        service = DataService(use_demo=False, chain_cache_ttl_sec=60)
+        service.get_price = lambda symbol: (100.0, "test", False)
+        expiration = (date.today() + timedelta(days=30)).isoformat()
+
+        strikes = [95.0, 100.0, 105.0]
+        call_prices = black_scholes_price(100.0, strikes, 0.5, 30.5 / 365, 0.05, "call")
+        calls = pd.DataFrame({"strike": strikes, "lastPrice": call_prices, "impliedVolatility": [None, None, None]})
+        puts = pd.DataFrame({"strike": strikes, "lastPrice": [1.0, 2.0, 3.0], "impliedVolatility": [0.45, 0.5, 0.55]})
+        service._fetch_chain = lambda symbol, exp: (SimpleNamespace(calls=calls, puts=puts), "tradier")
+
+        chain, source = service.get_chain("XYZ", expiration)
+
+        assert source == "tradier"
+        assert chain.calls["impliedVolatility"].between(0.45, 0.55).all()
+        assert list(chain.puts["impliedVolatility"]) == [0.45, 0.5, 0.55]
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+History Store Tests
+===================
+
+Unit tests for the incremental daily bar store.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core import history_store
+from options_trader.core.history_store import HistoryStore, last_completed_session, validate_symbol
+
+
+class FakeFetcher:
+    """Returns synthetic weekday bars from the requested start through 'today' inclusive."""
+
+    def __init__(self, today: date, split_ratio: float = 1.0):
+        self.today = today
+        self.split_ratio = split_ratio  # Back-adjustment applied to every bar (2.0 = after a 2:1 split)
+        self.calls = []
+
+    def __call__(self, symbol, start):
+        self.calls.append((symbol, start))
+        days = pd.bdate_range(start, self.today)
+        # Close depends on the date only, so overlapping requests agree
+        close = (100.0 + 0.1 * (days - pd.Timestamp("2020-01-01")).days.to_numpy(dtype=float)) / self.split_ratio
+        return pd.DataFrame({
+            "Open": close - 0.5, "High": close + 1.0, "Low": close - 1.0,
+            "Close": close, "Volume": np.full(len(days), 1e6)
+        }, index=days.tz_localize("America/New_York"))
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore incremental updates."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = HistoryStore(self.temp_dir, max_bars=100)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_last_completed_session_skips_weekend(self):
+        assert last_completed_session(date(2024, 3, 11)) == date(2024, 3, 8)  # Monday -> Friday
+        assert last_completed_session(date(2024, 3, 13)) == date(2024, 3, 12)
+
+    def test_initial_load_excludes_today_and_respects_max_bars(self):
+        today = date(2024, 3, 13)
+        fetcher = FakeFetcher(today)
+
+        history = self.store.get_history("aapl", lookback_bars=63, fetcher=fetcher, today=today)
+
+        assert len(fetcher.calls) == 1
+        assert list(history.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert len(history) == 63
+        assert history.index[-1].date() == date(2024, 3, 12)
+        assert len(self.store.load_bars("AAPL")) == 100
+
+    def test_current_store_makes_no_fetch(self):
+        today = date(2024, 3, 13)
+        fetcher = FakeFetcher(today)
+        self.store.get_history("AAPL", fetcher=fetcher, today=today)
+
+        # Same day, and also a fresh store instance reading the files from disk
+        self.store.get_history("AAPL", fetcher=fetcher, today=today)
+        HistoryStore(self.temp_dir).get_history("AAPL", fetcher=fetcher, today=today)
+
+        assert len(fetcher.calls) == 1
+        assert self.store.stats()["provider_fetches"] == 1
+
+    def test_incremental_update_fetches_only_missing_days(self):
+        first_day = date(2024, 3, 13)
+        self.store.update("AAPL", FakeFetcher(first_day), today=first_day)
+        before = self.store.load_bars("AAPL")
+        last_close = float(before["close"][-1])
+
+        later = first_day + timedelta(days=7)
+        fetcher = FakeFetcher(later)
+        appended = self.store.update("AAPL", fetcher, today=later)
+
+        assert fetcher.calls == [("AAPL", date(2024, 3, 12))]  # Last stored bar is re-checked
+        assert appended == 5  # Mar 13-19 are the missing weekdays before Mar 20
+        bars = self.store.load_bars("AAPL")
+        assert bars["date"][-1] == np.datetime64("2024-03-19")
+        assert np.all(np.diff(bars["date"].astype(int)) > 0)
+        assert float(bars["close"][-6]) == last_close
+
+    def test_empty_provider_response_is_not_retried_same_day(self):
+        today = date(2024, 3, 13)
+        self.store.update("AAPL", FakeFetcher(today), today=today)
+
+        holiday = date(2024, 3, 20)
+        calls = []
+        empty = lambda symbol, start: calls.append(start) or pd.DataFrame()
+
+        assert self.store.update("AAPL", empty, today=holiday) == 0
+        assert self.store.update("AAPL", empty, today=holiday) == 0
+        assert len(calls) == 1
+
+    def test_fetch_failure_falls_back_to_stored_bars(self):
+        today = date(2024, 3, 13)
+        self.store.update("AAPL", FakeFetcher(today), today=today)
+
+        def failing(symbol, start):
+            raise ConnectionError("offline")
+
+        history = self.store.get_history("AAPL", lookback_bars=10, fetcher=failing, today=date(2024, 3, 20))
+        assert len(history) == 10
+        assert self.store.get_history("MSFT", fetcher=None) is None
+
+    def test_readjusted_history_is_rebuilt(self):
+        first_day = date(2024, 3, 13)
+        self.store.update("AAPL", FakeFetcher(first_day), today=first_day)
+        oldest = self.store.load_bars("AAPL")["date"][0].astype(date)
+
+        # A 2:1 split re-bases the provider's whole history
+        later = first_day + timedelta(days=7)
+        fetcher = FakeFetcher(later, split_ratio=2.0)
+        appended = self.store.update("AAPL", fetcher, today=later)
+
+        assert fetcher.calls == [("AAPL", date(2024, 3, 12)), ("AAPL", oldest)]
+        assert appended == 5
+        bars = self.store.load_bars("AAPL")
+        expected = FakeFetcher(later, split_ratio=2.0)("AAPL", oldest)["Close"].to_numpy()[:-1]  # Mar 20 is today
+        assert len(bars) == 100 and bars["date"][-1] == np.datetime64("2024-03-19")
+        assert np.allclose(bars["close"], expected[-100:])
+        assert self.store.stats()["rebuilds"] == 1
+
+        # Matching overlap appends without another rebuild
+        fetcher = FakeFetcher(later + timedelta(days=1), split_ratio=2.0)
+        assert self.store.update("AAPL", fetcher, today=later + timedelta(days=1)) == 1
+        assert len(fetcher.calls) == 1 and self.store.stats()["rebuilds"] == 1
+
+    def test_sessions_use_exchange_date(self):
+        # 01:00 UTC on Wednesday is still Tuesday evening in New York
+        utc_now = datetime(2024, 3, 13, 1, 0, tzinfo=history_store.ZoneInfo("UTC"))
+        with mock.patch.object(history_store, "datetime", wraps=datetime) as clock:
+            clock.now.side_effect = lambda tz=None: utc_now.astimezone(tz)
+            assert history_store.exchange_today() == date(2024, 3, 12)
+            assert last_completed_session() == date(2024, 3, 11)
+
+    def test_symbols_cannot_escape_store_directory(self):
+        assert validate_symbol(" brk.b ") == "BRK.B" and validate_symbol("^VIX") == "^VIX"
+        today = date(2024, 3, 13)
+        empty = lambda symbol, start: pd.DataFrame()  # No bars, so only the sidecar would be written
+
+        for symbol in ("../../X", "a/b", "..\\X", "", "X" * 16):
+            with pytest.raises(ValueError):
+                self.store.update(symbol, empty, today=today)
+            with pytest.raises(ValueError):
+                self.store.get_history(symbol, fetcher=empty, today=today)
+        assert os.listdir(self.temp_dir) == []
+        assert not os.path.exists(os.path.join(os.path.dirname(self.temp_dir), "X.json"))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instrumentation Tests
+=====================
+
+Unit tests for per-run timings and cumulative metric export.
+"""
+
+import json
+import os
+import sys
+import time
+from unittest import mock
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.analyzer import analyze_symbol
+from options_trader.core.data_service import ChainCache
+from options_trader.core.pipeline import Pipeline, Stage
+from options_trader.providers.metrics import (
+    Histogram, MetricsRegistry, collect_timings, current_timings, instrument_provider
+)
+from options_trader.providers.rate_limit import TokenBucket
+
+from test_analyzer import SlowDataService
+
+
+class TestMetricsRegistry:
+    """Tests for cumulative counters, histograms and their export formats."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [("0.1", 1), ("1.0", 3), ("+Inf", 4)]
+        assert histogram.count == 4 and abs(histogram.sum - 6.25) < 1e-12
+
+    def test_json_and_prometheus_export(self):
+        registry = MetricsRegistry()
+        registry.describe("provider_call_seconds", "Wall time per provider call")
+        registry.observe("provider_call_seconds", 0.02, provider="demo", method="get_chain")
+        registry.observe("provider_call_seconds", 0.2, provider="demo", method="get_chain")
+        registry.inc("cache_lookups_total", cache="chain", result="hit")
+        registry.inc("cache_lookups_total", 2, cache="chain", result="hit")
+
+        snapshot = json.loads(registry.to_json())
+        assert snapshot["counters"]["cache_lookups_total"] == [
+            {"labels": {"cache": "chain", "result": "hit"}, "value": 3.0}
+        ]
+        series = snapshot["histograms"]["provider_call_seconds"][0]
+        assert series["count"] == 2 and series["buckets"]["0.025"] == 1 and series["buckets"]["+Inf"] == 2
+
+        text = registry.to_prometheus()
+        assert "# TYPE options_trader_provider_call_seconds histogram" in text
+        assert 'options_trader_provider_call_seconds_bucket{method="get_chain",provider="demo",le="0.25"} 2' in text
+        assert 'options_trader_provider_call_seconds_count{method="get_chain",provider="demo"} 2' in text
+        assert 'options_trader_cache_lookups_total{cache="chain",result="hit"} 3' in text
+
+        registry.reset()
+        assert registry.snapshot() == {"counters": {}, "histograms": {}}
+
+
+class TestRunTimings:
+    """Tests for per-run collection across threads and layers."""
+
+    def test_pipeline_stages_record_into_callers_run(self):
+        def slow(context):
+            time.sleep(0.01)
+            return {"a": current_timings() is not None}
+
+        pipeline = Pipeline([Stage("slow", slow, outputs=("a",)),
+                             Stage("fast", lambda context, a: {"b": a}, inputs=("a",), outputs=("b",))],
+                            name="test")
+        with collect_timings() as timings:
+            run = pipeline.run()
+
+        assert run.values == {"a": True, "b": True}
+        assert set(timings.stages) == {"slow", "fast"} and timings.stages["slow"] >= 0.01
+        assert current_timings() is None
+
+    def test_throttle_cache_and_provider_calls(self):
+        class Provider:
+            def get_price(self, symbol):
+                return 100.0
+
+        provider = instrument_provider(Provider(), "fake")
+        assert instrument_provider(provider, "fake") is provider
+        bucket = TokenBucket(rate_per_sec=50.0, burst=1, name="fake")
+        cache = ChainCache(ttl_sec=60, name="test_chain")
+
+        with collect_timings() as timings:
+            assert provider.get_price("XYZ") == 100.0
+            bucket.acquire()
+            bucket.acquire()
+            cache.get_or_fetch("XYZ", "2030-01-18", lambda: ("chain", "fake"))
+            cache.get_or_fetch("XYZ", "2030-01-18", lambda: ("chain", "fake"))
+
+        block = timings.to_dict()
+        assert block["provider_calls"]["fake.get_price"]["count"] == 1
+        assert block["throttle_wait"]["fake"]["count"] == 2
+        assert block["throttle_wait"]["fake"]["seconds"] > 0.0
+        assert block["cache"]["test_chain"] == {"miss": 1, "hit": 1}
+
+    def test_yahoo_session_records_response_bytes(self):
+        yahoo = pytest.importorskip("options_trader.providers.yahoo")
+        if yahoo.MeteredSession is None:
+            pytest.skip("curl_cffi not installed")
+
+        class Response:
+            headers = {}
+            content = b"x" * 1234
+
+        session = yahoo.get_yahoo_session()
+        assert yahoo.YahooProvider()._get_ticker("XYZ")._data._session is session
+        base = yahoo.curl_requests.Session
+        with mock.patch.object(base, "request", return_value=Response()), collect_timings() as timings:
+            session.get("https://query2.finance.yahoo.com/v7/finance/options/XYZ")
+
+        assert timings.to_dict()["bytes_fetched"] == {"yahoo": 1234}
+
+    def test_analyze_symbol_attaches_timings(self):
+        expirations = ["2030-01-18", "2030-02-15"]
+        result = analyze_symbol("XYZ", expirations_to_check=2, data_service=SlowDataService(expirations))
+
+        timings = result["timings"]
+        assert {"price", "expirations", "chains", "history", "calendar"} <= set(timings["stages"])
+        assert timings["stages"]["chains"] >= 0.2
+        assert timings["total_sec"] >= timings["stages"]["chains"]
+        json.dumps(timings)
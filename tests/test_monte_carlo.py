@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Monte Carlo Tests
+=================
+
+Unit tests for the vectorized BacktestingEngine Monte Carlo simulation.
+"""
+
+import os
+import sys
+import random
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.backtesting import (
+    BacktestingEngine, TradeSimulation, monte_carlo_path_metrics
+)
+
+PARAMS = {"expected_win_rate": 0.62, "avg_profit": 0.15, "avg_loss": 0.07}
+
+
+class TestMonteCarlo:
+    """Tests for the array-based Monte Carlo engine."""
+
+    def setup_method(self):
+        self.engine = BacktestingEngine()
+
+    def test_path_metrics_match_trade_metrics(self):
+        rng = np.random.default_rng(7)
+        counts = [50, 73, 100]
+        wins = rng.random((3, 100)) < 0.6
+        returns = np.where(wins, 0.15 * (0.5 + rng.random((3, 100))), -0.07 * (0.8 + 0.4 * rng.random((3, 100))))
+        pnls = returns * 10000
+        mask = np.arange(100)[None, :] < np.array(counts)[:, None]
+
+        metrics = monte_carlo_path_metrics(wins, returns, pnls, mask)
+
+        for row, count in enumerate(counts):
+            trades = [
+                TradeSimulation("SIM", "2023-01-01", "2023-01-02", 100, 1.0, 1.0 + r, p, r, bool(w),
+                                100.0, abs(p) if not w else 0.0, 1)
+                for w, r, p in zip(wins[row, :count], returns[row, :count], pnls[row, :count])
+            ]
+            expected = self.engine._calculate_performance_metrics(trades)
+            for name, value in expected.items():
+                assert abs(float(metrics[name][row]) - value) < 1e-9, name
+
+    def test_seed_is_reproducible(self):
+        first = self.engine.simulate_monte_carlo(PARAMS, iterations=2000, seed=42)
+        second = self.engine.simulate_monte_carlo(PARAMS, iterations=2000, seed=42)
+        other = self.engine.simulate_monte_carlo(PARAMS, iterations=2000, seed=43)
+
+        assert first.is_valid
+        assert first == second
+        assert first.sharpe_ratio != other.sharpe_ratio
+        assert abs(first.win_rate - 0.62) < 0.01
+        assert 50 * 2000 <= first.total_trades <= 100 * 2000
+
+    def test_worker_count_does_not_change_results(self):
+        serial = self.engine.simulate_monte_carlo(PARAMS, iterations=3000, seed=11, chunk_paths=1000)
+        parallel = self.engine.simulate_monte_carlo(PARAMS, iterations=3000, seed=11, chunk_paths=1000, workers=2)
+        assert serial == parallel
+
+    def test_python_fallback_leaves_global_rng_alone(self):
+        random.seed(123)
+        expected = [random.random() for _ in range(3)]
+
+        random.seed(123)
+        first = self.engine._simulate_monte_carlo_python(PARAMS, iterations=20, seed=5)
+        assert [random.random() for _ in range(3)] == expected
+        assert self.engine._simulate_monte_carlo_python(PARAMS, iterations=20, seed=5) == first
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Option Chain Tests
+==================
+
+Unit tests for the columnar OptionChain type and provider chain parsing.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.analysis import summarize_chain_for_atm
+from options_trader.core.straddle_construction import StraddleConstructor
+from options_trader.core.trade_construction import CalendarTradeConstructor
+from options_trader.core.utils import nearest_strike_row
+from options_trader.providers.chain import OptionChain, OptionSide, StrikeIndex
+from options_trader.providers.finnhub import FinnhubProvider
+from options_trader.providers.tradier import TradierProvider
+
+
+class TestOptionSide:
+    """Tests for typed, strike-sorted chain sides."""
+
+    def test_columns_are_typed_sorted_and_complete(self):
+        side = OptionSide.from_columns(
+            contract_symbols=["C110", "C100", "CNAN", "C105"],
+            strike=[110, "100", None, 105.0],
+            bid=[1.0, None, 2.0, "n/a"],
+            volume=[5, None, 1, 7.0]
+        )
+
+        assert side.strikes.dtype == np.float64 and side.column("volume").dtype == np.int32
+        assert list(side.strikes) == [100.0, 105.0, 110.0]
+        assert list(side.contract_symbols) == ["C100", "C105", "C110"]
+        assert np.isnan(side.column("bid")[:2]).all() and side.column("bid")[2] == 1.0
+        assert list(side.column("volume")) == [0, 7, 5]
+        assert np.isnan(side.column("impliedVolatility")).all()
+        assert side.column("delta") is None
+
+    def test_nearest_index_matches_nearest_strike_row(self):
+        rng = np.random.default_rng(1)
+        strikes = np.round(rng.uniform(50, 150, 200) * 2) / 2
+        frame = pd.DataFrame({"strike": strikes, "bid": 1.0, "ask": 1.2})
+        side = OptionSide.from_frame(frame)
+
+        for price in np.concatenate([rng.uniform(40, 160, 200), [75.25, 100.0]]):
+            expected = float(nearest_strike_row(frame, price)["strike"])
+            assert side.strikes[side.nearest_index(price)] == expected
+
+        assert OptionSide.from_columns().nearest_index(100.0) is None
+
+    def test_frame_view_is_cached_and_refreshed_on_set_column(self):
+        side = OptionSide.from_columns(strike=[95.0, 100.0], impliedVolatility=[np.nan, 0.3])
+        frame = side.to_frame()
+        assert side.to_frame() is frame
+        assert list(frame.columns[:5]) == ["strike", "bid", "ask", "lastPrice", "impliedVolatility"]
+
+        side.set_column("impliedVolatility", [0.35, 0.3])
+        assert side.to_frame() is not frame
+        assert side.to_frame()["impliedVolatility"].tolist() == [0.35, 0.3]
+
+
+class TestStrikeIndex:
+    """Tests for binary-search strike queries."""
+
+    def test_queries_return_original_row_positions(self):
+        index = StrikeIndex.from_values([110.0, 95.0, None, 100.0, 105.0, 90.0])
+        strikes = [110.0, 95.0, None, 100.0, 105.0, 90.0]
+
+        assert list(index.strikes) == [90.0, 95.0, 100.0, 105.0, 110.0]
+        assert strikes[index.nearest(101.0)] == 100.0
+        assert strikes[index.nearest(102.5)] == 100.0  # Lower strike on ties
+        assert index.nearest_strike(500.0) == 110.0
+        assert index.exact(105.0) == 4 and index.exact(104.0) is None
+        assert index.bracket(102.0) == (3, 4)
+        assert index.bracket(100.0) == (3, 3)
+        assert index.bracket(80.0) == (None, 5) and index.bracket(120.0) == (0, None)
+        assert [strikes[i] for i in index.around(101.0, 1)] == [95.0, 100.0, 105.0]
+        assert [strikes[i] for i in index.around(89.0, 2)] == [90.0, 95.0, 100.0]
+        assert [strikes[i] for i in index.between(95.0, 106.0)] == [95.0, 100.0, 105.0]
+        assert len(index.between(106.0, 95.0)) == 0
+
+    def test_empty_index(self):
+        index = StrikeIndex.from_values([])
+        assert index.nearest(100.0) is None and index.exact(100.0) is None
+        assert index.bracket(100.0) == (None, None)
+        assert len(index.around(100.0, 3)) == 0
+
+    def test_side_index_is_built_once(self):
+        side = OptionSide.from_columns(strike=[105.0, 95.0, 100.0])
+        assert side.index is side.index
+        assert list(side.index.around(100.0, 5)) == [0, 1, 2]
+
+    def test_constructors_select_strikes_through_index(self):
+        calls = pd.DataFrame({"strike": [95.0, 100.0, 105.0], "bid": [6.0, 3.0, 1.0], "ask": [6.4, 3.2, 1.2],
+                              "impliedVolatility": [0.33, 0.32, 0.31], "volume": [1, 2, 3],
+                              "openInterest": [10, 20, 30]})
+        chain = OptionChain.from_frames(calls, calls.copy(), symbol="XYZ", expiration="2030-01-18")
+
+        straddle = StraddleConstructor()
+        assert straddle._find_atm_strike(101.2, chain, "2030-01-18") == 100.0
+        assert straddle._find_atm_strike(101.0, {"2030-01-18": {"calls": {"95": {}, "100": {}}}}, "2030-01-18") == 100.0
+        quote = straddle._get_option_quote("XYZ", 100.0, "2030-01-18", "put", chain)
+        assert quote.bid == 3.0 and quote.open_interest == 20
+        assert straddle._get_option_quote("XYZ", 101.0, "2030-01-18", "put", chain) is None
+
+        calendar = CalendarTradeConstructor(data_service=None)
+        quote = calendar._find_option_at_strike(chain, 104.0, "call")
+        assert quote.strike == 105.0 and quote.symbol == "XYZ" and quote.volume == 3
+
+
+class TestOptionChain:
+    """Tests for chain normalization and provider parsing."""
+
+    def test_from_any_normalizes_legacy_objects(self):
+        calls = pd.DataFrame({"strike": [105.0, 95.0, 100.0], "bid": [1, 6, 3], "ask": [1.2, 6.4, 3.2],
+                              "impliedVolatility": [0.31, 0.33, 0.32], "contractSymbol": ["a", "b", "c"]})
+        legacy = SimpleNamespace(calls=calls, puts=calls.copy())
+
+        chain = OptionChain.from_any(legacy, "XYZ", "2030-01-18")
+        assert OptionChain.from_any(chain) is chain
+        assert list(chain.calls["strike"]) == [95.0, 100.0, 105.0]
+        assert chain.side("PUT") is chain.put_side and chain.n_contracts == 6
+
+        summary = summarize_chain_for_atm(chain, 101.0)
+        assert summary["atm_strike_call"] == 100.0
+        assert summary["call_mid"] == 3.1 and summary["straddle_mid"] == 6.2
+        assert abs(summary["atm_iv"] - 0.32) < 1e-12
+        assert summarize_chain_for_atm(legacy, 101.0) == summary
+
+    def test_tradier_builds_columns_from_json(self):
+        provider = TradierProvider(token="t")
+        provider._make_request = lambda endpoint, **params: {"options": {"option": [
+            {"symbol": "X240119C00105000", "option_type": "call", "strike": 105, "bid": 1.0, "ask": 1.2,
+             "last": None, "volume": 12, "open_interest": 340, "greeks": {"mid_iv": 0.28}},
+            {"symbol": "X240119C00100000", "option_type": "call", "strike": 100, "bid": 3.0, "ask": 3.3,
+             "last": 3.1, "volume": None, "open_interest": 90, "greeks": None},
+            {"symbol": "X240119P00100000", "option_type": "put", "strike": 100, "bid": 2.0, "ask": 2.2,
+             "last": 2.1, "volume": 4, "open_interest": 10, "greeks": {"mid_iv": 0.3}},
+        ]}}
+
+        chain = provider.get_chain("X", "2024-01-19")
+
+        assert isinstance(chain, OptionChain) and chain.expiration == "2024-01-19"
+        calls = chain.call_side
+        assert list(calls.strikes) == [100.0, 105.0]
+        assert np.isnan(calls.column("impliedVolatility")[0]) and calls.column("impliedVolatility")[1] == 0.28
+        assert list(calls.column("volume")) == [0, 12]
+        assert calls.row(1)["contractSymbol"] == "X240119C00105000"
+        assert len(chain.put_side) == 1
+
+    def test_finnhub_builds_columns_from_json(self):
+        provider = FinnhubProvider(api_key="k")
+        provider._make_request = lambda endpoint, **params: {"data": [
+            {"type": "put", "strike": 95.0, "bid": 0.5, "ask": 0.6, "lastPrice": 0.55, "impliedVolatility": 0.4},
+            {"type": "call", "strike": 100.0, "bid": 2.0, "ask": 2.1, "lastPrice": None, "impliedVolatility": None},
+        ]}
+
+        chain = provider.get_chain("X", "2024-01-19")
+
+        assert list(chain.puts["strike"]) == [95.0]
+        assert np.isnan(chain.call_side.column("lastPrice")[0])
+        assert chain.call_side.mid_prices()[0] == 2.05
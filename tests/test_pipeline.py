@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stage Pipeline Tests
+====================
+
+Unit tests for the dependency-driven stage scheduler.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.analyzer import ANALYSIS_PIPELINE
+from options_trader.core.pipeline import (
+    STAGE_FAILED, STAGE_OK, STAGE_SKIPPED, Pipeline, PipelineAbort, Stage
+)
+
+
+def sleeper(seconds, **outputs):
+    """Stage function that sleeps, then returns fixed outputs."""
+    def run(context, **inputs):
+        time.sleep(seconds)
+        return dict(outputs)
+    return run
+
+
+class TestPipeline:
+    """Tests for scheduling, skipping, aborts and timing."""
+
+    def test_independent_stages_run_concurrently(self):
+        pipeline = Pipeline([
+            Stage("a", sleeper(0.2, a=1), outputs=("a",)),
+            Stage("b", sleeper(0.2, b=2), outputs=("b",)),
+            Stage("c", sleeper(0.2, c=3), outputs=("c",)),
+            Stage("sum", lambda ctx, a, b, c: {"total": a + b + c + ctx}, inputs=("a", "b", "c"), outputs=("total",)),
+        ])
+
+        start = time.perf_counter()
+        run = pipeline.run(context=10)
+        elapsed = time.perf_counter() - start
+
+        assert run.values["total"] == 16
+        assert elapsed < 0.5
+        assert set(run.timings) == {"a", "b", "c", "sum"}
+        assert run.timings["a"] >= 0.19
+
+    def test_disabled_and_unreachable_stages_are_skipped(self):
+        calls = []
+        pipeline = Pipeline([
+            Stage("source", lambda ctx: {"x": 1}, outputs=("x",)),
+            Stage("silent", lambda ctx, x: {}, inputs=("x",), outputs=("y",)),
+            Stage("needs_y", lambda ctx, y: calls.append("needs_y"), inputs=("y",)),
+            Stage("extra", lambda ctx: calls.append("extra") or {"z": 1}, outputs=("z",)),
+            Stage("maybe_z", lambda ctx, x, z=None: {"seen": z}, inputs=("x",), optional_inputs=("z",),
+                  outputs=("seen",)),
+        ])
+
+        run = pipeline.run(enabled=["source", "silent", "needs_y", "maybe_z"])
+
+        assert calls == []
+        assert run.values["seen"] is None
+        assert run.results["extra"].reason == "not requested"
+        assert run.results["needs_y"].status == STAGE_SKIPPED and "y" in run.results["needs_y"].reason
+        assert run.results["maybe_z"].status == STAGE_OK
+
+    def test_failure_stops_only_dependents(self):
+        def boom(ctx):
+            raise RuntimeError("provider down")
+
+        pipeline = Pipeline([
+            Stage("bad", boom, outputs=("x",)),
+            Stage("after_bad", lambda ctx, x: {"y": x}, inputs=("x",), outputs=("y",)),
+            Stage("good", lambda ctx: {"z": 1}, outputs=("z",)),
+        ])
+        seen = []
+        pipeline.add_listener(lambda name, result: seen.append((result.name, result.status)))
+
+        run = pipeline.run()
+
+        assert run.results["bad"].status == STAGE_FAILED and "provider down" in str(run.failed().error)
+        assert run.results["after_bad"].status == STAGE_SKIPPED
+        assert run.values == {"z": 1}
+        assert sorted(seen) == [("after_bad", STAGE_SKIPPED), ("bad", STAGE_FAILED), ("good", STAGE_OK)]
+
+    def test_earliest_declared_abort_wins(self):
+        def abort_after(seconds, result):
+            def run(ctx):
+                time.sleep(seconds)
+                raise PipelineAbort(result)
+            return run
+
+        pipeline = Pipeline([
+            Stage("first", abort_after(0.1, "first"), outputs=("a",)),
+            Stage("second", abort_after(0.0, "second"), outputs=("b",)),
+            Stage("later", lambda ctx, a, b: {}, inputs=("a", "b")),
+        ])
+
+        run = pipeline.run()
+        assert run.aborted.result == "first"
+        assert run.results["later"].status == STAGE_SKIPPED
+
+    def test_graph_validation(self):
+        with pytest.raises(ValueError, match="cycle"):
+            Pipeline([
+                Stage("a", lambda ctx, y: {}, inputs=("y",), outputs=("x",)),
+                Stage("b", lambda ctx, x: {}, inputs=("x",), outputs=("y",)),
+            ])
+        with pytest.raises(ValueError, match="produced by both"):
+            Pipeline([Stage("a", lambda ctx: {}, outputs=("x",)), Stage("b", lambda ctx: {}, outputs=("x",))])
+
+    def test_undeclared_outputs_fail_the_stage(self):
+        run = Pipeline([Stage("a", lambda ctx: {"x": 1, "oops": 2}, outputs=("x",))]).run()
+        assert run.results["a"].status == STAGE_FAILED and "x" not in run.values
+
+    def test_analysis_pipeline_declares_every_module(self):
+        names = [stage.name for stage in ANALYSIS_PIPELINE.stages]
+        for name in ("price", "expirations", "chains", "history", "earnings", "calendar", "construction",
+                     "greeks", "pnl", "straddle", "sizing", "decision"):
+            assert name in names
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+P&L Grid Tests
+==============
+
+Unit tests for the array-backed PnLEngine scenario grid.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.trade_construction import CalendarTrade, OptionQuote
+from options_trader.core.pnl_engine import PnLEngine, PnLGrid, IVCrushParameters
+
+
+def _make_trade() -> CalendarTrade:
+    """Build an ATM call calendar with realistic quotes."""
+    front_exp = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    back_exp = (datetime.now() + timedelta(days=35)).strftime("%Y-%m-%d")
+    front = OptionQuote("AAPL_F", 100.0, front_exp, "call", 2.40, 2.60, 2.50, 0.60)
+    back = OptionQuote("AAPL_B", 100.0, back_exp, "call", 4.40, 4.60, 4.50, 0.40)
+    return CalendarTrade("AAPL", 100.0, 100.0, front_exp, back_exp, front, back)
+
+
+class TestPnLGrid:
+    """Tests for vectorized scenario simulation."""
+
+    def setup_method(self):
+        self.trade = _make_trade()
+        self.engine = PnLEngine()
+        self.crush = IVCrushParameters()
+
+    def test_default_grid_matches_scalar_path(self):
+        grid = self.engine.simulate_post_earnings_scenarios(self.trade, self.crush)
+        assert len(grid) == 21 * 3
+
+        iv_scenarios = self.engine._generate_iv_scenarios(self.trade, self.crush)
+        expected = []
+        for move in self.engine._generate_price_scenarios():
+            new_price = self.trade.underlying_price * (1 + move / 100)
+            for name, (front_iv, back_iv) in iv_scenarios.items():
+                expected.append(self.engine._simulate_single_scenario(
+                    self.trade, move, new_price, name, front_iv, back_iv))
+
+        for got, want in zip(grid.scenarios, expected):
+            assert got.iv_crush_scenario == want.iv_crush_scenario
+            assert abs(got.price_change_pct - want.price_change_pct) < 1e-12
+            assert abs(got.pnl - want.pnl) < 1e-9
+
+        legacy = PnLGrid(expected, self.trade)
+        stats, legacy_stats = grid.get_summary_stats(), legacy.get_summary_stats()
+        for key in legacy_stats:
+            assert abs(stats[key] - legacy_stats[key]) < 1e-9
+        assert grid.get_expected_move_pnl(5.0) == legacy.get_expected_move_pnl(5.0)
+
+    def test_large_grid_shape_and_lazy_scenarios(self):
+        grid = self.engine.simulate_scenario_grid(
+            self.trade, self.crush,
+            price_moves_pct=PnLEngine.build_price_moves(-20, 20, 401),
+            crush_multipliers=np.linspace(0.0, 1.5, 50),
+            decay_days=range(1, 11)
+        )
+
+        assert len(grid) == 401 * 50 * 10
+        assert grid._scenarios is None
+        assert grid.pnl_cube().shape == (401, 50, 10)
+        assert grid.get_summary_stats()["total_scenarios"] == 200500
+
+        df = grid.to_dataframe()
+        assert len(df) == 200500
+        assert set(df["days_elapsed"].unique()) == set(range(1, 11))
+        assert grid._scenarios is None
+
+    def test_cube_axes_are_price_iv_days(self):
+        grid = self.engine.simulate_scenario_grid(
+            self.trade, self.crush, price_moves_pct=[-5, 0, 5],
+            crush_multipliers=[0.5, 1.0], decay_days=[1, 3]
+        )
+        cube = grid.pnl_cube()
+        scenario = grid.scenarios[1 * 4 + 1 * 2 + 1]  # price 0%, multiplier 1.0, 3 days
+        assert scenario.price_change_pct == 0
+        assert scenario.days_elapsed == 3
+        assert scenario.iv_crush_scenario == "crush_1.00x"
+        assert abs(cube[1, 1, 1] - scenario.pnl) < 1e-12
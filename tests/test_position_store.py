@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Position Store Tests
+====================
+
+Unit tests for the SQLite position store and the risk engine built on it.
+"""
+
+import os
+import sys
+import json
+import threading
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.position_store import PositionStore
+from options_trader.core.risk_management import RiskManagementEngine
+
+
+def make_engine(tmp_path, store=None):
+    return RiskManagementEngine(positions_file=str(tmp_path / "positions.json"),
+                                store=store or PositionStore(str(tmp_path / "positions.db")))
+
+
+def brute_force(positions):
+    """Recompute aggregates from the full open-position list."""
+    sectors, strategies = {}, {}
+    for pos in positions:
+        risk = pos.max_loss * pos.contracts
+        sectors[pos.sector] = sectors.get(pos.sector, 0.0) + risk
+        strategies[pos.strategy_type] = strategies.get(pos.strategy_type, 0.0) + risk
+    return sectors, strategies
+
+
+class TestPositionStore:
+    """Tests for PositionStore and RiskManagementEngine persistence."""
+
+    def test_reads_do_not_create_database(self, tmp_path):
+        engine = make_engine(tmp_path)
+        metrics = engine.calculate_portfolio_metrics(100000)
+        assert metrics.total_capital_at_risk == 0 and metrics.concentration_by_sector == {}
+        assert engine.check_portfolio_concentration("AAPL", position_risk=1000, account_size=100000)
+        assert not (tmp_path / "positions.db").exists()
+
+    def test_aggregates_track_adds_updates_and_closes(self, tmp_path):
+        engine = make_engine(tmp_path)
+        trades = [("AAPL", 2, 300.0, "calendar_spread"), ("MSFT", 1, 250.0, "straddle"),
+                  ("NIO", 4, 80.0, "calendar_spread"), ("XYZ", 3, 120.0, "calendar_spread"),
+                  ("AAPL", 1, 310.0, "straddle")]
+        for symbol, contracts, max_loss, strategy in trades:
+            assert engine.add_position(symbol, contracts, max_loss * 0.8, max_loss, strategy,
+                                       net_delta=0.5, net_vega=10.0, net_theta=-2.0)
+
+        engine.store.update(engine.current_positions[2].position_id, unrealized_pnl=15.0)
+        assert engine.remove_position("AAPL") and not engine.remove_position("AAPL")
+
+        open_positions = engine.current_positions
+        assert [p.symbol for p in open_positions] == ["MSFT", "NIO", "XYZ"]
+        sectors, strategies = brute_force(open_positions)
+        metrics = engine.calculate_portfolio_metrics(100000)
+        assert metrics.concentration_by_sector == pytest.approx(sectors)
+        assert metrics.concentration_by_strategy == pytest.approx(strategies)
+        assert metrics.total_capital_at_risk == pytest.approx(250 + 4 * 80 + 3 * 120)
+        assert metrics.unrealized_pnl == pytest.approx(15.0 * 4)
+        assert metrics.greeks.position_count == 3
+        assert metrics.greeks.net_vega == pytest.approx(10.0 * 8)
+
+        # Closed rows stay queryable as history through the indexed columns
+        history = engine.store.positions(status=None, symbol="AAPL")
+        assert [row["status"] for row in history] == ["closed", "closed"]
+        assert len(engine.store.positions(sector="Automotive")) == 1
+
+    def test_concentration_and_limits_use_aggregates(self, tmp_path):
+        engine = make_engine(tmp_path)
+        engine.add_position("NVDA", 10, 1500.0, 1800.0)  # $18k technology, calendar
+        assert not engine.check_portfolio_concentration("AAPL", "straddle", 3000, 100000)
+        assert engine.check_portfolio_concentration("F", "straddle", 3000, 100000)
+
+        adjusted = engine.enforce_position_limits(3, 400.0, 25000, "F")
+        assert adjusted.adjusted_contracts == 1  # 75% of 25k minus 18k at risk leaves 750
+        assert "utilization" in adjusted.adjustment_reason
+
+    def test_migrates_legacy_json_once(self, tmp_path):
+        legacy = tmp_path / "positions.json"
+        legacy.write_text(json.dumps({"positions": [
+            {"symbol": "TSLA", "contracts": 2, "entry_date": "2024-01-02", "strategy_type": "calendar_spread",
+             "net_debit": 150.0, "max_loss": 200.0, "unrealized_pnl": 0.0, "net_delta": 0.1,
+             "net_vega": 5.0, "net_theta": -1.0, "sector": "unknown"}]}))
+
+        engine = make_engine(tmp_path)
+        assert [(p.symbol, p.sector) for p in engine.current_positions] == [("TSLA", "Technology")]
+        assert not legacy.exists() and (tmp_path / "positions.json.migrated").exists()
+
+        # A restored legacy file is not imported a second time into the same store
+        (tmp_path / "positions.json.migrated").rename(legacy)
+        assert engine.store.migrate_json(str(legacy)) == 0
+        assert engine.store.totals().count == 1
+
+    def test_concurrent_writers_share_database(self, tmp_path):
+        path = str(tmp_path / "positions.db")
+        first, second = PositionStore(path), PositionStore(path)  # Separate connections
+
+        def writer(store, prefix):
+            for i in range(50):
+                store.add({"symbol": f"{prefix}{i}", "contracts": 1, "max_loss": 10.0, "sector": prefix})
+
+        threads = [threading.Thread(target=writer, args=(store, prefix))
+                   for store, prefix in ((first, "A"), (second, "B"))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each store sees the other's commits through data_version
+        for store in (first, second):
+            assert store.totals().count == 100
+            assert store.totals().capital_at_risk == pytest.approx(1000.0)
+            assert store.aggregate("sector", "B").count == 50
+        first.close()
+        second.close()
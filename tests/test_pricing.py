@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pricing Kernel Tests
+====================
+
+Unit tests for the vectorized Black-Scholes pricing and Greeks kernel.
+"""
+
+import os
+import sys
+import math
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core import pricing
+from options_trader.core.pricing import (
+    black_scholes, black_scholes_price, chain_greeks, fill_chain_iv, implied_volatility
+)
+
+
+class TestBlackScholesKernel:
+    """Tests for black_scholes and chain_greeks."""
+
+    def test_known_value(self):
+        # Hull's textbook example: S=42, K=40, r=10%, sigma=20%, T=0.5
+        call = black_scholes(42.0, 40.0, 0.20, 0.5, 0.10, "call")
+        put = black_scholes(42.0, 40.0, 0.20, 0.5, 0.10, "put")
+        assert abs(call.price - 4.76) < 0.01
+        assert abs(put.price - 0.81) < 0.01
+
+    def test_put_call_parity_vectorized(self):
+        strikes = np.linspace(80, 120, 41)
+        calls = black_scholes_price(100.0, strikes, 0.35, 30 / 365, 0.05, "call")
+        puts = black_scholes_price(100.0, strikes, 0.35, 30 / 365, 0.05, "put")
+        parity = 100.0 - strikes * math.exp(-0.05 * 30 / 365)
+        assert np.allclose(calls - puts, parity, atol=1e-9)
+
+    def test_vector_matches_scalar_fallback(self):
+        strikes = np.array([90.0, 100.0, 110.0])
+        types = np.array(["call", "put", "call"])
+        bs = black_scholes(100.0, strikes, 0.3, 0.25, 0.05, types)
+        for i, (k, kind) in enumerate(zip(strikes, types)):
+            scalar = pricing._black_scholes_scalar(100.0, k, 0.3, 0.25, 0.05, kind == "call")
+            assert abs(bs.price[i] - scalar.price) < 1e-4  # A&S CDF approximation error
+            assert abs(bs.delta[i] - scalar.delta) < 1e-5
+            assert abs(bs.theta[i] - scalar.theta) < 1e-5
+            assert abs(bs.vega[i] - scalar.vega) < 1e-5
+
+    def test_greeks_match_finite_differences(self):
+        base = black_scholes(100.0, 105.0, 0.4, 0.2, 0.05, "call")
+        h = 0.01
+        up = black_scholes_price(100.0 + h, 105.0, 0.4, 0.2, 0.05, "call")
+        down = black_scholes_price(100.0 - h, 105.0, 0.4, 0.2, 0.05, "call")
+        assert abs((up - down) / (2 * h) - base.delta) < 1e-5
+        assert abs((up - 2 * base.price + down) / (h * h) - base.gamma) < 1e-3
+
+        vol_up = black_scholes_price(100.0, 105.0, 0.41, 0.2, 0.05, "call")
+        assert abs((vol_up - base.price) - base.vega) < 2e-3
+
+    def test_expired_and_zero_vol(self):
+        expired = black_scholes(np.array([90.0, 110.0]), 100.0, 0.3, 0.0, 0.05, "call")
+        assert np.allclose(expired.price, [0.0, 10.0])
+        assert np.allclose(expired.delta, [0.0, 1.0])
+        assert np.allclose(expired.gamma, 0.0)
+
+        flat = black_scholes(110.0, 100.0, 0.0, 1.0, 0.05, "call")
+        assert abs(flat.price - (110.0 - 100.0 * math.exp(-0.05))) < 1e-9
+        assert flat.vega == 0.0
+
+    def test_chain_greeks_fills_missing_only(self):
+        chain = pd.DataFrame({
+            "strike": [95.0, 100.0, 105.0],
+            "impliedVolatility": [0.30, 0.28, 0.27],
+            "delta": [0.0, 0.55, np.nan]
+        })
+        result = chain_greeks(chain, 100.0, 30, "call")
+
+        assert "delta" in chain.columns and "gamma" not in chain.columns
+        assert result.loc[1, "delta"] == 0.55
+        assert 0.5 < result.loc[0, "delta"] < 1.0
+        assert 0.0 < result.loc[2, "delta"] < 0.5
+        assert (result["vega"] > 0).all()
+
+
+class TestImpliedVolatility:
+    """Tests for the vectorized implied volatility solver."""
+
+    def test_round_trip_across_chain(self):
+        rng = np.random.default_rng(5)
+        strikes = rng.uniform(60, 160, 2000)
+        t = rng.uniform(2 / 365, 1.5, 2000)
+        vols = rng.uniform(0.08, 1.8, 2000)
+        is_call = rng.random(2000) < 0.5
+        prices = black_scholes_price(100.0, strikes, vols, t, 0.03, is_call)
+
+        solved = implied_volatility(prices, 100.0, strikes, t, 0.03, is_call)
+
+        # A cent of time value carries enough vega to pin the volatility down
+        forward_intrinsic = np.where(is_call, 100.0 - strikes * np.exp(-0.03 * t), strikes * np.exp(-0.03 * t) - 100.0)
+        liquid = prices - np.maximum(forward_intrinsic, 0.0) > 0.01
+        assert np.isfinite(solved[liquid]).all()
+        assert np.max(np.abs(solved[liquid] - vols[liquid])) < 1e-5
+        repriced = black_scholes_price(100.0, strikes, np.nan_to_num(solved), t, 0.03, is_call)
+        assert np.nanmax(np.abs(repriced - prices)[np.isfinite(solved)]) < 1e-7
+
+    def test_arbitrage_violations_are_nan(self):
+        assert abs(implied_volatility(10.450583572185565, 100.0, 100.0, 1.0) - 0.2) < 1e-9
+        bad = implied_volatility([4.0, 120.0, -1.0, 5.0], 100.0, [95.0, 100.0, 100.0, 100.0],
+                                 [0.5, 0.5, 0.5, 0.0], 0.05, "call")
+        assert np.isnan(bad).all()  # Below intrinsic, above spot, negative, expired
+
+    def test_fill_chain_iv_only_touches_missing_rows(self):
+        strikes = np.array([90.0, 100.0, 110.0, 120.0])
+        mids = black_scholes_price(100.0, strikes, 0.4, 20 / 365, 0.05, "put")
+        chain = pd.DataFrame({
+            "strike": strikes,
+            "bid": mids - 0.02,
+            "ask": mids + 0.02,
+            "lastPrice": [np.nan, np.nan, mids[2], np.nan],
+            "impliedVolatility": [None, 0.35, 0.0, 1e-5]
+        })
+        chain.loc[2, ["bid", "ask"]] = [0.0, 0.0]  # One-sided quote falls back to last
+
+        result = fill_chain_iv(chain, 100.0, 20, "put")
+
+        assert chain["impliedVolatility"].isna().sum() == 1
+        assert result.loc[1, "impliedVolatility"] == 0.35
+        for row in (0, 2, 3):
+            assert abs(result.loc[row, "impliedVolatility"] - 0.4) < 1e-6
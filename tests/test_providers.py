@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Provider Infrastructure Tests
+=============================
+
+Unit tests for pooled HTTP sessions, rate limiting and the async provider adapter.
+"""
+
+import os
+import sys
+import asyncio
+import threading
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.providers import AsyncProviderAdapter, DemoProvider
+from options_trader.providers.http import get_session
+from options_trader.providers.rate_limit import TokenBucket
+from options_trader.providers.finnhub import FinnhubProvider
+from options_trader.providers.tradier import TradierProvider
+
+
+class TestPooledSessions:
+    """Tests for shared provider sessions."""
+
+    def test_session_shared_per_provider(self):
+        assert FinnhubProvider(api_key="x").session is FinnhubProvider(api_key="y").session
+        assert FinnhubProvider(api_key="x").session is not TradierProvider(token="t").session
+        assert get_session("finnhub") is FinnhubProvider(api_key="x").session
+
+    def test_adapter_is_pooled(self):
+        adapter = get_session("finnhub").get_adapter("https://finnhub.io")
+        assert adapter._pool_maxsize >= 1
+
+
+class TestAsyncProviderAdapter:
+    """Tests for running sync providers from asyncio."""
+
+    def test_concurrent_prices_and_chain(self):
+        adapter = AsyncProviderAdapter(DemoProvider(), max_concurrency=4)
+
+        async def scan():
+            prices = await adapter.get_prices(["aapl", "MSFT", "AAPL", ""])
+            expirations = await adapter.get_expirations("AAPL", 2)
+            chain = await adapter.get_chain("AAPL", expirations[0])
+            return prices, expirations, chain
+
+        prices, expirations, chain = asyncio.run(scan())
+        assert list(prices) == ["AAPL", "MSFT"]
+        assert all(price > 0 for price, _ in prices.values())
+        assert len(expirations) == 2
+        assert not chain.calls.empty
+
+    def test_unsupported_interface_raises(self):
+        class PriceOnly:
+            pass
+
+        adapter = AsyncProviderAdapter(PriceOnly())
+        try:
+            asyncio.run(adapter.get_chain("AAPL", "2030-01-18"))
+            assert False, "expected NotImplementedError"
+        except NotImplementedError:
+            pass
+
+
+class FakeClock:
+    """Manual monotonic clock whose sleep records the wait and advances time."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests for the per-provider token bucket."""
+
+    def test_burst_passes_then_rate_applies(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_sec=20.0, burst=3, name="test", clock=clock, sleep=clock.sleep)
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 0.0, pytest.approx(0.05), pytest.approx(0.05)]
+        assert clock.sleeps == waits[3:]
+        stats = bucket.stats()
+        assert stats["acquired"] == 5
+        assert stats["delayed"] == 2
+        assert stats["waiting"] == 0
+
+        # Idle time refills the bucket up to its capacity, not beyond
+        clock.now += 10.0
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(0.05)
+
+    def test_threads_do_not_serialize_on_lock(self):
+        clock = FakeClock()
+        sleeping = threading.Barrier(4, timeout=2.0)
+
+        def sleep(seconds):
+            # Every waiter must be asleep at once, which is impossible if sleeps held the lock
+            assert not bucket.lock.locked()
+            sleeping.wait()
+
+        bucket = TokenBucket(rate_per_sec=50.0, burst=1, name="test", clock=clock, sleep=sleep)
+        bucket.acquire()
+        waits = []
+
+        threads = [threading.Thread(target=lambda: waits.append(bucket.acquire())) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(2.0)
+
+        # Reservations queue up as 20/40/60/80 ms of debt and are slept concurrently
+        assert sorted(waits) == pytest.approx([0.02, 0.04, 0.06, 0.08])
+        assert bucket.stats()["waiting"] == 0
+
+    def test_async_acquire(self):
+        clock = FakeClock()
+        slept = []
+
+        async def async_sleep(seconds):
+            slept.append(seconds)
+
+        bucket = TokenBucket(rate_per_sec=100.0, burst=2, name="test", clock=clock, async_sleep=async_sleep)
+
+        async def burst():
+            return await asyncio.gather(*(bucket.acquire_async() for _ in range(4)))
+
+        waits = asyncio.run(burst())
+        assert waits == [0.0, 0.0, pytest.approx(0.01), pytest.approx(0.02)]
+        assert slept == waits[2:]
+        assert bucket.stats()["max_wait_sec"] == max(waits)
+
+    def test_zero_rate_disables_limiting(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_sec=0, burst=1, name="test", clock=clock, sleep=clock.sleep)
+        assert all(bucket.acquire() == 0.0 for _ in range(10))
+        assert clock.sleeps == []
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Record / Replay Tests
+=====================
+
+Unit tests for recording live provider responses and replaying them offline.
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.analyzer import analyze_symbol
+from options_trader.core.data_service import DataService, PriceCache
+from options_trader.providers.base import EarningsEvent, OptionsProvider
+from options_trader.providers.chain import OptionChain
+from options_trader.providers.replay import (
+    ReplayError, ReplayProvider, load_recording, record_provider, recording_path
+)
+
+EXPIRATIONS = ["2030-01-18", "2030-02-15", "2030-03-15"]
+
+
+class LiveProvider(OptionsProvider):
+    """Stand-in for a network provider with realistic chain sizes."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _is_enabled(self):
+        return True
+
+    def get_price(self, symbol):
+        self.calls += 1
+        return 101.25, "live.quote"
+
+    def get_expirations(self, symbol, max_count=3):
+        self.calls += 1
+        return EXPIRATIONS[:max_count]
+
+    def get_chain(self, symbol, expiration):
+        self.calls += 1
+        if expiration == "2030-03-15":
+            raise RuntimeError("HTTP 503")
+        strikes = np.arange(50.0, 150.5, 0.5)
+        iv = 0.3 + 0.01 * EXPIRATIONS.index(expiration) + 0.0005 * np.abs(strikes - 100)
+        side = pd.DataFrame({"contractSymbol": [f"{symbol}{expiration}{k}" for k in strikes], "strike": strikes,
+                             "bid": np.maximum(0.05, 101.25 - strikes), "ask": np.maximum(0.1, 101.5 - strikes),
+                             "impliedVolatility": iv, "volume": 10, "openInterest": 100})
+        return OptionChain.from_frames(side, side, symbol, expiration)
+
+    def get_history(self, symbol, start):
+        self.calls += 1
+        index = pd.bdate_range("2029-10-01", periods=60, name="Date")
+        close = 100 + np.sin(np.arange(60))
+        return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                             "Volume": 1_000_000}, index=index)
+
+    def get_next_earnings(self, symbol):
+        self.calls += 1
+        return EarningsEvent(symbol, datetime(2030, 1, 10, 16, 0), "AMC", True, "live")
+
+    def get_earnings_calendar(self, symbol, days_ahead=30):
+        return [self.get_next_earnings(symbol)]
+
+
+def record_session(directory, name="finnhub"):
+    """Record one pass over every method of a LiveProvider."""
+    live = record_provider(LiveProvider(), name, str(directory))
+    live.get_price("XYZ")
+    live.get_expirations("XYZ", 3)
+    for expiration in EXPIRATIONS:
+        try:
+            live.get_chain("XYZ", expiration)
+        except RuntimeError:
+            pass
+    live.get_history("XYZ", date(2029, 10, 1))
+    live.get_next_earnings("XYZ")
+    live._replay_recorder.close()
+    return live
+
+
+class TestRecordReplay:
+    """Tests for the recorder and ReplayProvider."""
+
+    def test_round_trip(self, tmp_path):
+        live = record_session(tmp_path)
+        assert live.calls == 7 and isinstance(live, LiveProvider)
+        assert len(load_recording(recording_path(str(tmp_path), "finnhub"))) == 7
+
+        replay = ReplayProvider("finnhub", str(tmp_path), shift_dates=False)
+        assert replay._is_enabled() and len(replay) == 7
+        assert replay.get_price("xyz") == (101.25, "live.quote")
+        assert replay.get_expirations("XYZ", 2) == EXPIRATIONS[:2]
+
+        chain = replay.get_chain("XYZ", "2030-02-15")
+        original = LiveProvider().get_chain("XYZ", "2030-02-15")
+        assert chain.n_contracts == 402 and chain.expiration == "2030-02-15"
+        assert np.array_equal(chain.call_side.column("impliedVolatility"),
+                              original.call_side.column("impliedVolatility"))
+        assert chain.call_side.row(10)["contractSymbol"] == original.call_side.row(10)["contractSymbol"]
+        assert replay.get_chain("XYZ", "2030-02-15") is not chain  # Fresh object per call
+
+        with pytest.raises(ReplayError, match="HTTP 503"):
+            replay.get_chain("XYZ", "2030-03-15")
+        with pytest.raises(ReplayError, match="no recording"):
+            replay.get_chain("XYZ", "2031-01-17")
+
+        history = replay.get_history("XYZ", date(2029, 12, 1))
+        assert history.index.min() >= pd.Timestamp("2029-12-01")
+        assert history.index.name == "Date" and list(history.columns[:4]) == ["Open", "High", "Low", "Close"]
+
+        event = replay.get_next_earnings("XYZ")
+        assert event.date == datetime(2030, 1, 10, 16, 0) and event.timing == "AMC"
+        assert replay.get_price("ABC") == (None, "finnhub.replay.none")
+
+    def test_truncated_recording_is_readable(self, tmp_path):
+        live = record_provider(LiveProvider(), "tradier", str(tmp_path))
+        live.get_price("XYZ")
+        live.get_expirations("XYZ")
+        # Flushed but not closed, as after a crash
+        assert len(load_recording(recording_path(str(tmp_path), "tradier"))) == 2
+        live._replay_recorder.close()
+
+    def test_injected_latency_and_errors(self, tmp_path):
+        record_session(tmp_path)
+
+        slow = ReplayProvider("finnhub", str(tmp_path), latency_sec=0.05, shift_dates=False)
+        start = time.perf_counter()
+        slow.get_price("XYZ")
+        assert time.perf_counter() - start >= 0.05
+
+        flaky = ReplayProvider("finnhub", str(tmp_path), error_rate=0.5, seed=3, shift_dates=False)
+        prices = [flaky.get_price("XYZ")[0] for _ in range(200)]
+        failures = prices.count(None)
+        assert 60 < failures < 140
+        with pytest.raises(ReplayError):
+            ReplayProvider("finnhub", str(tmp_path), error_rate=1.0).get_chain("XYZ", "2030-01-18")
+
+    def test_dates_shift_by_whole_weeks(self, tmp_path):
+        path = recording_path(str(tmp_path), "yahoo")
+        recorded_at = (datetime.now() - timedelta(days=23)).isoformat(timespec="seconds")
+        entries = [{"method": "get_expirations", "key": ["XYZ"], "recorded_at": recorded_at,
+                    "latency_sec": 0.1, "result": ["2030-01-18"]}]
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.writelines(json.dumps(e) + "\n" for e in entries)
+
+        replay = ReplayProvider("yahoo", str(tmp_path))
+        assert replay.shift == timedelta(weeks=3)
+        assert replay.get_expirations("XYZ") == ["2030-02-08"]  # Still a Friday
+
+    def test_data_service_replays_offline(self, tmp_path):
+        record_session(tmp_path, "finnhub")
+        service = DataService(replay_dir=str(tmp_path), chain_cache_ttl_sec=0)
+        service.price_cache = PriceCache(cache_file=str(tmp_path / "prices.json"))
+
+        assert service.yahoo is None and service.tradier is None
+        assert isinstance(service.finnhub, ReplayProvider)
+
+        result = analyze_symbol("XYZ", expirations_to_check=3, data_service=service)
+        assert result["expirations"][0]["chain_source"] == "finnhub"
+        assert "No provider could return" in result["expirations"][2]["error"]
+        assert result["timings"]["provider_calls"]["finnhub.get_chain"]["count"] == 3
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Earnings Scheduler Tests
+========================
+
+Unit tests for the timer-heap earnings window scheduler.
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.data_service import DataService, PriceCache
+from options_trader.core.earnings import EarningsCalendar
+from options_trader.core.scheduler import EarningsWindowScheduler
+from options_trader.providers.base import EarningsEvent, EarningsProvider
+
+ET = "America/New_York"
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class FixedEarnings(EarningsProvider):
+    """Earnings provider with a fixed schedule and a lookup counter."""
+
+    def __init__(self, events):
+        self.events = events
+        self.lookups = 0
+
+    def _is_enabled(self):
+        return True
+
+    def get_next_earnings(self, symbol):
+        self.lookups += 1
+        return self.events.get(symbol)
+
+    def get_earnings_calendar(self, symbol, days_ahead=30):
+        event = self.events.get(symbol)
+        return [event] if event else []
+
+
+def make_scheduler(tmp_path, events, start, **kwargs):
+    service = DataService(use_demo=True)
+    service.price_cache = PriceCache(cache_file=str(tmp_path / "prices.json"))
+    provider = FixedEarnings(events)
+    clock = FakeClock(start)
+    entries, exits = [], []
+    scheduler = EarningsWindowScheduler(
+        service, calendar=EarningsCalendar([provider], user_timezone=ET), clock=clock,
+        on_entry=lambda symbol, result: entries.append((symbol, clock(), result)),
+        on_exit=lambda symbol, windows: exits.append((symbol, clock())), **kwargs
+    )
+    return scheduler, provider, clock, entries, exits
+
+
+def et(*args):
+    from options_trader.core.earnings import ZoneInfo
+    return datetime(*args, tzinfo=ZoneInfo(ET))
+
+
+class TestEarningsWindowScheduler:
+    """Tests for EarningsWindowScheduler."""
+
+    def test_fires_only_when_windows_open(self, tmp_path):
+        events = {
+            "AAA": EarningsEvent("AAA", datetime(2030, 1, 9, 16), "AMC", True, "test"),   # Wednesday
+            "BBB": EarningsEvent("BBB", datetime(2030, 1, 10, 8), "BMO", True, "test"),   # Thursday
+            "FAR": EarningsEvent("FAR", datetime(2030, 3, 20, 16), "AMC", True, "test"),
+        }
+        scheduler, provider, clock, entries, exits = make_scheduler(
+            tmp_path, events, et(2030, 1, 8, 10, 0), symbols=["AAA", "bbb", "FAR", "NONE"], prefetch_lead_sec=60)
+
+        assert scheduler.run_pending() == [("refresh", s) for s in ("AAA", "BBB", "FAR", "NONE")]
+        assert scheduler.tracked("AAA").windows.entry_start == et(2030, 1, 9, 15, 45)
+        assert scheduler.stats()["scheduled_entries"] == 3  # FAR counts too
+
+        # Only periodic earnings lookups run until just before the first entry window
+        clock.now = et(2030, 1, 9, 15, 43)
+        assert {kind for kind, _ in scheduler.run_pending()} == {"refresh"}
+        assert scheduler.next_event_time() == et(2030, 1, 9, 15, 44)
+
+        clock.now = et(2030, 1, 9, 15, 44)
+        assert scheduler.run_pending() == [("prefetch", "AAA"), ("prefetch", "BBB")]
+        assert scheduler.data_service.chain_cache.stats()["entries"] > 0
+
+        clock.now = et(2030, 1, 9, 15, 45)
+        assert scheduler.run_pending() == [("entry", "AAA"), ("entry", "BBB")]
+        assert [(symbol, at) for symbol, at, _ in entries] == [("AAA", clock.now), ("BBB", clock.now)]
+        assert "trading_decision" in entries[0][2]
+        assert entries[0][2]["timings"]["cache"]["chain"]["hit"] >= 1  # Prefetched
+
+        clock.now = et(2030, 1, 10, 9, 30)
+        assert [e for e in scheduler.run_pending() if e[0] != "refresh"] == [("exit", "AAA"), ("exit", "BBB")]
+        fired = scheduler.stats()["fired"]
+        assert (fired["prefetch"], fired["entry"], fired["exit"]) == (2, 2, 2)
+
+    def test_idle_names_are_looked_up_rarely(self, tmp_path):
+        events = {f"S{i}": EarningsEvent(f"S{i}", datetime(2030, 3, 20, 16), "AMC", True, "test")
+                  for i in range(2000)}
+        scheduler, provider, clock, entries, _ = make_scheduler(
+            tmp_path, events, et(2030, 1, 7, 10, 0), symbols=list(events), refresh_interval_sec=86400)
+        scheduler.run_pending()
+        assert provider.lookups == 2000
+
+        # A simulated week of polling every half hour costs one lookup per name per day
+        for minute in range(30, 7 * 24 * 60, 30):
+            clock.now = et(2030, 1, 7, 10, 0) + timedelta(minutes=minute)
+            scheduler.run_pending()
+        assert provider.lookups == 2000 * 7
+        assert entries == []
+        assert scheduler.stats()["pending"] <= 2000 * 4
+
+    def test_moved_event_reschedules(self, tmp_path):
+        events = {"AAA": EarningsEvent("AAA", datetime(2030, 1, 16, 16), "AMC", True, "test")}
+        scheduler, provider, clock, entries, _ = make_scheduler(
+            tmp_path, events, et(2030, 1, 7, 10, 0), symbols=["AAA"], refresh_interval_sec=3600,
+            prefetch_lead_sec=0)
+        scheduler.run_pending()
+
+        events["AAA"] = EarningsEvent("AAA", datetime(2030, 1, 23, 16), "AMC", True, "test")
+        clock.now = et(2030, 1, 7, 11, 0)
+        assert scheduler.run_pending() == [("refresh", "AAA")]
+
+        clock.now = et(2030, 1, 16, 15, 50)  # Old entry window: stale, nothing fires
+        assert ("entry", "AAA") not in scheduler.run_pending()
+        clock.now = et(2030, 1, 23, 15, 45)
+        assert ("entry", "AAA") in scheduler.run_pending()
+        assert len(entries) == 1
+
+    def test_untrack_and_weekend_windows(self, tmp_path):
+        events = {"AAA": EarningsEvent("AAA", datetime(2030, 1, 9, 16), "AMC", True, "test"),
+                  "MON": EarningsEvent("MON", datetime(2030, 1, 14, 8), "BMO", True, "test")}  # Entry on Sunday
+        scheduler, _, clock, entries, exits = make_scheduler(
+            tmp_path, events, et(2030, 1, 8, 10, 0), symbols=["AAA", "MON"], prefetch_lead_sec=0)
+        scheduler.run_pending()
+        assert scheduler.untrack("AAA") and not scheduler.untrack("AAA")
+
+        clock.now = et(2030, 1, 14, 9, 45)
+        ran = scheduler.run_pending()
+        assert ("entry", "MON") not in ran and ("exit", "MON") in ran
+        assert entries == [] and [s for s, _ in exits] == ["MON"]
+
+    def test_run_loop_wakes_for_due_events(self, tmp_path):
+        start = datetime.now(timezone.utc)
+        events = {"AAA": EarningsEvent("AAA", datetime(2030, 1, 9, 16), "AMC", True, "test")}
+        service = DataService(use_demo=True)
+        service.price_cache = PriceCache(cache_file=str(tmp_path / "prices.json"))
+        provider = FixedEarnings(events)
+        scheduler = EarningsWindowScheduler(service, calendar=EarningsCalendar([provider], user_timezone=ET))
+        worker = threading.Thread(target=scheduler.run, daemon=True)
+        worker.start()
+
+        scheduler.track(["AAA"])  # Wakes the sleeping loop
+        deadline = time.time() + 5
+        while provider.lookups == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        scheduler.stop()
+        worker.join(5)
+        assert provider.lookups == 1 and not worker.is_alive()
+        assert scheduler.next_event_time() > start
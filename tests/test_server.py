@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analysis Server Tests
+=====================
+
+Unit tests for the resident analysis server and its JSON API.
+"""
+
+import http.client
+import json
+import os
+import socket
+import sys
+import threading
+from datetime import date
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.data_service import DataService, PriceCache
+from options_trader.core.server import AnalysisServer, parse_address
+from options_trader.providers.synthetic import SyntheticMarketProvider
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def start_server(address, tmp_path, **defaults):
+    service = DataService(synthetic=SyntheticMarketProvider(seed=3, as_of=date(2030, 1, 7)))
+    service.price_cache = PriceCache(cache_file=str(tmp_path / "prices.json"))
+    server = AnalysisServer(address, max_workers=2, defaults=defaults, data_service=service)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, service
+
+
+def request(connection, method, path, body=None):
+    connection.request(method, path, body=json.dumps(body) if body is not None else None,
+                       headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, response.read().decode("utf-8")
+
+
+@pytest.fixture
+def server(tmp_path):
+    server, service = start_server("127.0.0.1:0", tmp_path, expirations=2)
+    yield server, service
+    server.shutdown()
+    server.close()
+
+
+class TestAnalysisServer:
+    """Tests for AnalysisServer routes."""
+
+    def test_parse_address(self):
+        assert parse_address("8765") == ("tcp", ("127.0.0.1", 8765))
+        assert parse_address("0.0.0.0:9000") == ("tcp", ("0.0.0.0", 9000))
+        assert parse_address("unix:/tmp/ot.sock") == ("unix", "/tmp/ot.sock")
+        with pytest.raises(ValueError):
+            parse_address("localhost:http")
+
+    def test_analyze_reuses_warm_service(self, server):
+        server, service = server
+        connection = http.client.HTTPConnection(server.httpd.server_address[0], server.httpd.server_address[1])
+
+        status, body = request(connection, "GET", "/analyze/xyz?earnings=1")
+        first = json.loads(body)
+        assert status == 200 and first["symbol"] == "XYZ"
+        assert len(first["expirations"]) == 2  # Server default
+        assert "earnings_analysis" in first
+
+        # Same keep-alive connection, chains served from the warm cache
+        hits = service.chain_cache.stats()["hits"]
+        status, body = request(connection, "POST", "/analyze", {"symbol": "XYZ", "expirations": 3})
+        second = json.loads(body)
+        assert status == 200 and len(second["expirations"]) == 3
+        assert "earnings_analysis" not in second
+        assert service.chain_cache.stats()["hits"] >= hits + 2
+
+        status, body = request(connection, "GET", "/health")
+        assert status == 200 and json.loads(body)["requests"] == 3
+        connection.close()
+
+    def test_scan_streams_json_lines(self, server):
+        server, _ = server
+        connection = http.client.HTTPConnection(*server.httpd.server_address[:2])
+
+        status, body = request(connection, "POST", "/scan", {"symbols": ["aaa", "BBB", "aaa", "CCC"]})
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert status == 200
+        assert sorted(line["symbol"] for line in lines) == ["AAA", "BBB", "CCC"]
+        assert all("price" in line["result"] for line in lines)
+
+        status, body = request(connection, "GET", "/stats")
+        assert status == 200 and json.loads(body)["caches"]["live"]["chain"]["entries"] >= 6
+        connection.close()
+
+    def test_errors(self, server):
+        server, _ = server
+        connection = http.client.HTTPConnection(*server.httpd.server_address[:2])
+
+        assert request(connection, "POST", "/scan", {"symbols": []})[0] == 400
+        assert request(connection, "POST", "/analyze", {"expirations": 2})[0] == 400
+        assert request(connection, "POST", "/analyze", {"symbol": "XYZ", "expirations": "many"})[0] == 400
+        assert request(connection, "POST", "/analyze", {"symbol": "../../X"})[0] == 400
+        assert request(connection, "POST", "/scan", {"symbols": ["AAA", "a/b"]})[0] == 400
+        assert request(connection, "GET", "/nothing/here")[0] == 404
+        connection.request("POST", "/analyze", body="{not json", headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        assert response.status == 400 and "not valid JSON" in json.loads(response.read())["error"]
+
+        status, body = request(connection, "GET", "/metrics")
+        assert status == 200 and 'server_requests_total{route="other",status="404"}' in body
+        connection.close()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+    def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "ot.sock")
+        server, _ = start_server(f"unix:{path}", tmp_path)
+        try:
+            assert server.address == f"unix:{path}"
+            assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+            status, body = request(UnixHTTPConnection(path), "GET", "/analyze/XYZ")
+            assert status == 200 and json.loads(body)["symbol"] == "XYZ"
+        finally:
+            server.shutdown()
+            server.close()
+        assert not os.path.exists(path)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Portfolio Stress Tests
+======================
+
+Unit tests for the full-revaluation portfolio stress engine.
+"""
+
+import os
+import sys
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.pricing import black_scholes, black_scholes_price, days_to_expiry
+from options_trader.core.position_store import PositionStore
+from options_trader.core.risk_management import Position, RiskManagementEngine
+from options_trader.core.stress import PortfolioStressEngine, calendar_legs
+from options_trader.core.trade_construction import CalendarTrade, OptionQuote
+
+NOW = datetime(2030, 1, 7, 10)
+MOVES = np.array([-10.0, -2.0, 0.0, 3.0, 12.0])
+SHIFTS = np.array([-0.05, 0.0, 0.08])
+DAYS = np.array([0.0, 2.0, 15.0])  # 15 days rolls the front leg past expiry
+
+
+def calendar(symbol, spot, option_type="call", contracts=2):
+    legs = [{"option_type": option_type, "strike": 100.0, "expiration": "2030-01-18", "quantity": -1, "iv": 0.55},
+            {"option_type": option_type, "strike": 100.0, "expiration": "2030-02-15", "quantity": 1, "iv": 0.40}]
+    return Position(symbol, contracts, "2030-01-07", underlying_price=spot, legs=legs)
+
+
+def reference_pnl(position, spot, move, shift, day):
+    """Scalar revaluation of one scenario."""
+    total = 0.0
+    for leg in position.legs:
+        dte = days_to_expiry(leg["expiration"], NOW)
+        now_value = black_scholes_price(spot, leg["strike"], leg["iv"], dte / 365, 0.05, leg["option_type"])
+        value = black_scholes_price(spot * (1 + move / 100), leg["strike"], leg["iv"] + shift,
+                                    max(dte - day, 0.0) / 365, 0.05, leg["option_type"])
+        total += leg["quantity"] * (value - now_value)
+    return total * position.contracts * 100
+
+
+class TestPortfolioStressEngine:
+    """Tests for PortfolioStressEngine."""
+
+    def test_cube_matches_scalar_revaluation(self):
+        positions = [calendar("AAA", 98.0), calendar("BBB", 104.0, "put", contracts=3), calendar("AAA", 101.0)]
+        engine = PortfolioStressEngine(chunk_elements=7)  # Chunks split positions across batches
+        result = engine.stress(positions, spots={"bbb": 103.0}, price_moves_pct=MOVES, iv_shifts=SHIFTS,
+                               day_rolls=DAYS, now=NOW)
+
+        assert result.pnl.shape == (3, MOVES.size, SHIFTS.size, DAYS.size)
+        assert result.methods == ["full"] * 3 and result.scenario_count == 45
+        spots = [98.0, 103.0, 101.0]  # Supplied spot overrides the entry price
+        for p, position in enumerate(positions):
+            for i, j, k in np.ndindex(MOVES.size, SHIFTS.size, DAYS.size):
+                expected = reference_pnl(position, spots[p], MOVES[i], SHIFTS[j], DAYS[k])
+                assert result.pnl[p, i, j, k] == pytest.approx(expected, abs=1e-6)
+
+        assert np.allclose(result.pnl[:, 2, 1, 0], 0.0)  # Unshocked scenario is flat
+        assert np.allclose(result.by_symbol()["AAA"], result.pnl[0] + result.pnl[2])
+        worst = result.worst_case()
+        assert worst["pnl"] == pytest.approx(result.portfolio_pnl().min())
+
+    def test_taylor_fallback_and_skips(self):
+        leg_position = calendar("AAA", 100.0)
+        greeks = {"net_delta": 0.0, "net_vega": 0.0, "net_theta": 0.0}
+        for leg in leg_position.legs:
+            bs = black_scholes(100.0, leg["strike"], leg["iv"], days_to_expiry(leg["expiration"], NOW) / 365,
+                               0.05, leg["option_type"])
+            greeks["net_delta"] += leg["quantity"] * bs.delta
+            greeks["net_vega"] += leg["quantity"] * bs.vega
+            greeks["net_theta"] += leg["quantity"] * bs.theta
+        greek_position = Position("AAA", 2, "2030-01-07", underlying_price=100.0, **greeks)
+
+        result = PortfolioStressEngine().stress(
+            [greek_position, leg_position, Position("NOPX", 1, "2030-01-07")],
+            price_moves_pct=[-0.5, 0.5], iv_shifts=[-0.005, 0.005], day_rolls=[0.0, 0.25], now=NOW)
+        assert result.methods == ["taylor", "full"] and result.skipped == ["NOPX"]
+        # First-order estimate tracks full revaluation for small shocks
+        assert np.allclose(result.pnl[0], result.pnl[1], atol=2.0)
+
+    def test_engine_stresses_stored_positions(self, tmp_path):
+        # A database from the first schema version gains the new columns on open
+        legacy = sqlite3.connect(str(tmp_path / "positions.db"))
+        legacy.execute("CREATE TABLE positions (id INTEGER PRIMARY KEY AUTOINCREMENT, symbol TEXT NOT NULL, "
+                       "contracts INTEGER NOT NULL, entry_date TEXT NOT NULL, strategy_type TEXT NOT NULL "
+                       "DEFAULT 'calendar_spread', net_debit REAL NOT NULL DEFAULT 0, max_loss REAL NOT NULL "
+                       "DEFAULT 0, unrealized_pnl REAL NOT NULL DEFAULT 0, net_delta REAL NOT NULL DEFAULT 0, "
+                       "net_vega REAL NOT NULL DEFAULT 0, net_theta REAL NOT NULL DEFAULT 0, sector TEXT NOT NULL "
+                       "DEFAULT 'unknown', status TEXT NOT NULL DEFAULT 'open', closed_date TEXT)")
+        legacy.commit()
+        legacy.close()
+
+        engine = RiskManagementEngine(positions_file=str(tmp_path / "positions.json"),
+                                      store=PositionStore(str(tmp_path / "positions.db")))
+        front = OptionQuote("XYZ", 100.0, "2099-01-16", "call", 2.9, 3.1, 3.0, 0.50)
+        back = OptionQuote("XYZ", 100.0, "2099-02-20", "call", 4.4, 4.6, 4.5, 0.40)
+        trade = CalendarTrade("XYZ", 100.0, 100.0, "2099-01-16", "2099-02-20", front, back)
+        assert engine.add_position("XYZ", 3, trade.net_debit, trade.max_loss, underlying_price=100.0,
+                                   legs=calendar_legs(trade))
+
+        stored = engine.current_positions[0]
+        assert stored.legs == calendar_legs(trade) and stored.underlying_price == 100.0
+        result = engine.stress_portfolio(spots={"XYZ": 100.0})
+        assert result.methods == ["full"] and result.position_ids == [stored.position_id]
+        summary = result.to_dict()
+        assert summary["positions"] == 1 and summary["worst_case"]["pnl"] < 0
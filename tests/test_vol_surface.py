@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Volatility Surface Tests
+========================
+
+Unit tests for smile fitting, time interpolation and surface caching.
+"""
+
+import os
+import sys
+import math
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.analysis import build_term_structure
+from options_trader.core.data_service import DataService
+from options_trader.core.trade_construction import CalendarTrade, CalendarTradeConstructor, OptionQuote
+from options_trader.core.vol_surface import VolSurface, fit_smile
+
+NOW = datetime(2024, 3, 1, 10, 0)
+
+
+def smile_iv(strikes, forward, dte, atm, skew=-0.05, curvature=0.02):
+    x = np.log(np.asarray(strikes) / forward) / math.sqrt(dte / 365.0)
+    return atm + skew * x + curvature * x * x
+
+
+def make_chain(spot, dte, atm):
+    strikes = np.arange(70.0, 131.0, 2.5)
+    forward = spot * math.exp(0.05 * dte / 365.0)
+    ivs = smile_iv(strikes, forward, dte, atm)
+    frame = pd.DataFrame({"strike": strikes, "impliedVolatility": ivs, "bid": 1.0, "ask": 1.1})
+    return SimpleNamespace(calls=frame.copy(), puts=frame.copy())
+
+
+def expiration_in(days):
+    return (NOW + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+class TestVolSurface:
+    """Tests for VolSurface construction and lookups."""
+
+    def test_fit_recovers_quadratic_smile(self):
+        strikes = np.linspace(80, 120, 17)
+        fit = fit_smile(strikes, smile_iv(strikes, 101.0, 30.0, 0.35), 101.0, 30.0)
+        assert abs(fit.a - 0.35) < 1e-9 and abs(fit.b + 0.05) < 1e-9 and abs(fit.c - 0.02) < 1e-9
+        assert fit.rmse < 1e-9
+
+        # Wings are flat beyond the fitted strikes
+        assert abs(fit.iv(200.0) - fit.iv(120.0)) < 1e-12
+        assert fit_smile([100.0], [0.3], 100.0, 30.0).iv(150.0) == 0.3
+        assert fit_smile([100.0], [np.nan], 100.0, 30.0) is None
+
+    def test_surface_interpolates_total_variance_in_time(self):
+        chains = {expiration_in(d): make_chain(100.0, d + 0.25, iv) for d, iv in ((10, 0.60), (40, 0.35))}
+        surface = VolSurface.from_chains("XYZ", 100.0, chains, now=NOW)
+
+        assert len(surface) == 2
+        front, back = surface.smiles
+        assert abs(front.atm_iv - 0.60) < 1e-6
+
+        mid_dte = 25.0
+        weight = (mid_dte - front.dte) / (back.dte - front.dte)
+        expected = math.sqrt(((1 - weight) * front.iv(95.0) ** 2 * front.dte
+                              + weight * back.iv(95.0) ** 2 * back.dte) / mid_dte)
+        assert abs(surface.iv(95.0, mid_dte) - expected) < 1e-12
+
+        # Flat beyond the fitted tenors, exact at the fitted tenors, vectorized
+        assert abs(surface.iv(95.0, 1.0) - front.iv(95.0)) < 1e-12
+        assert abs(surface.iv(95.0, 365.0) - back.iv(95.0)) < 1e-12
+        grid = surface.iv(np.array([[90.0], [110.0]]), np.array([front.dte, back.dte]))
+        assert grid.shape == (2, 2)
+        assert abs(grid[1, 1] - back.iv(110.0)) < 1e-12
+
+    def test_data_service_caches_surface_per_snapshot(self):
+        service = DataService(use_demo=False, chain_cache_ttl_sec=60)
+        expirations = [(datetime.now() + timedelta(days=d)).strftime("%Y-%m-%d") for d in (10, 40)]
+        fetches = []
+
+        def fetch_chain(symbol, expiration):
+            fetches.append(expiration)
+            return make_chain(100.0, 30.0, 0.4), "test"
+
+        service._fetch_chain = fetch_chain
+        first = service.get_vol_surface("xyz", expirations, spot=100.0)
+        second = service.get_vol_surface("XYZ", list(reversed(expirations)), spot=100.0)
+
+        assert first is second
+        assert len(first) == 2 and len(fetches) == 2
+        assert service.cache_stats()["surface"]["hits"] == 1
+
+    def test_greeks_and_pnl_legs_priced_off_surface(self):
+        service = DataService(use_demo=False, chain_cache_ttl_sec=60)
+        front_exp, back_exp = [(datetime.now() + timedelta(days=d)).strftime("%Y-%m-%d") for d in (10, 40)]
+        service._fetch_chain = lambda symbol, expiration: (
+            make_chain(100.0, 10.0 if expiration == front_exp else 40.0, 0.4), "test")
+
+        # Quoted IVs are off the fitted smile; the trade keeps them, the priced copy does not
+        front = OptionQuote("XYZ", 100.0, front_exp, "call", 2.4, 2.6, 2.5, 0.55)
+        back = OptionQuote("XYZ", 100.0, back_exp, "call", 4.4, 4.6, 4.5, 0.30)
+        trade = CalendarTrade("XYZ", 100.0, 100.0, front_exp, back_exp, front, back)
+        priced = CalendarTradeConstructor(service).with_surface_ivs(trade)
+
+        surface = service.get_vol_surface("XYZ", [front_exp, back_exp], 100.0)
+        assert abs(priced.front_option.implied_volatility - surface.iv_for_expiration(100.0, front_exp)) < 1e-9
+        assert abs(priced.back_option.implied_volatility - surface.iv_for_expiration(100.0, back_exp)) < 1e-9
+        assert (trade.front_option.implied_volatility, trade.back_option.implied_volatility) == (0.55, 0.30)
+        assert priced.net_debit == trade.net_debit
+        assert CalendarTradeConstructor(object()).with_surface_ivs(trade) is trade  # No surface available
+
+
+class TestTermStructure:
+    """Tests for the ATM term structure interpolator."""
+
+    def test_linear_inside_flat_outside(self):
+        spline = build_term_structure([45, 10, 30], [0.30, 0.50, 0.40])
+        assert abs(spline(20) - 0.45) < 1e-12
+        assert spline(5) == 0.50
+        assert spline(60) == 0.30
+        assert build_term_structure([10], [0.5]) is None
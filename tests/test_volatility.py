@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Realized Volatility Tests
+=========================
+
+Unit tests for the vectorized and streaming Yang-Zhang estimators.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from options_trader.core.analysis import yang_zhang_volatility
+from options_trader.core.volatility import (
+    RollingYangZhang, realized_vol_term_structure, rolling_yang_zhang
+)
+
+
+def make_ohlc(symbols: int, days: int, seed: int = 3):
+    """Random-walk OHLC arrays of shape (symbols, days)."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (symbols, days)), axis=1))
+    open_ = close * np.exp(rng.normal(0, 0.01, (symbols, days)))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, 0.01, (symbols, days))))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, 0.01, (symbols, days))))
+    return open_, high, low, close
+
+
+def legacy_yang_zhang(o, h, l, c):
+    """Reference implementation of the original pandas estimator."""
+    o, h, l, c = (np.log(pd.Series(x)) for x in (o, h, l, c))
+    overnight = o[1:].values - c[:-1].values
+    co = (o - c.shift(1)).dropna()
+    n = len(o)
+    overnight_var = np.var(overnight, ddof=1) if len(overnight) > 1 else 0
+    co_var = np.var(co, ddof=1) if len(co) > 1 else 0
+    k = 0.34 / (1.34 + (n + 1) / (n - 1))
+    yz_var = overnight_var + k * co_var + (1 - k) * (np.mean((h - l) ** 2) + np.var(c - o, ddof=1))
+    return np.sqrt(yz_var * 252)
+
+
+class TestRollingYangZhang:
+    """Tests for the batch and streaming Yang-Zhang engines."""
+
+    def test_rolling_windows_match_legacy_estimator(self):
+        o, h, l, c = make_ohlc(3, 80)
+        series = rolling_yang_zhang(o, h, l, c, windows=(2, 10, 30))
+
+        for window, values in series.items():
+            assert values.shape == (3, 80)
+            assert np.all(np.isnan(values[:, :window - 1]))
+            for row in range(3):
+                for t in (window - 1, 45, 79):
+                    s = slice(t - window + 1, t + 1)
+                    expected = legacy_yang_zhang(o[row, s], h[row, s], l[row, s], c[row, s])
+                    assert abs(values[row, t] - expected) < 1e-12
+
+    def test_yang_zhang_volatility_delegates(self):
+        o, h, l, c = make_ohlc(1, 30)
+        df = pd.DataFrame({"Open": o[0], "High": h[0], "Low": l[0], "Close": c[0]})
+        assert abs(yang_zhang_volatility(df) - legacy_yang_zhang(o[0], h[0], l[0], c[0])) < 1e-12
+        assert yang_zhang_volatility(df.head(1)) == 0.0
+
+    def test_missing_bar_invalidates_covering_windows(self):
+        o, h, l, c = make_ohlc(1, 40)
+        c[0, 20] = np.nan
+        values = rolling_yang_zhang(o, h, l, c, windows=(5,))[5][0]
+
+        # Bar 20 (and bar 21's overnight return) only fall inside windows ending 20..24
+        assert np.all(np.isnan(values[20:25]))
+        assert np.all(np.isfinite(values[4:20]))
+        assert np.all(np.isfinite(values[25:]))
+
+    def test_streaming_matches_batch(self):
+        o, h, l, c = make_ohlc(4, 120, seed=9)
+        c[2, 50] = np.nan
+        windows = (10, 20, 60)
+        batch = rolling_yang_zhang(o, h, l, c, windows)
+
+        rv = RollingYangZhang(["A", "B", "C", "D"], windows)
+        rv.extend(o[:, :100], h[:, :100], l[:, :100], c[:, :100])
+        for t in range(100, 120):
+            latest = rv.update(o[:, t], h[:, t], l[:, t], c[:, t])
+            for window in windows:
+                np.testing.assert_allclose(latest[window], batch[window][:, t], rtol=1e-9, equal_nan=True)
+
+        assert rv.bars_seen == 120
+        assert list(rv.to_frame().columns) == ["rv10", "rv20", "rv60"]
+
+    def test_term_structure_right_aligns_histories(self):
+        o, h, l, c = make_ohlc(2, 70)
+        frames = {
+            "LONG": pd.DataFrame({"Open": o[0], "High": h[0], "Low": l[0], "Close": c[0]}),
+            "SHORT": pd.DataFrame({"Open": o[1, :25], "High": h[1, :25], "Low": l[1, :25], "Close": c[1, :25]}),
+            "EMPTY": None
+        }
+        table = realized_vol_term_structure(frames, windows=(10, 20, 30))
+
+        assert list(table.index) == ["LONG", "SHORT"]
+        assert abs(table.loc["SHORT", "rv20"] - legacy_yang_zhang(o[1, 5:25], h[1, 5:25], l[1, 5:25], c[1, 5:25])) < 1e-12
+        assert np.isnan(table.loc["SHORT", "rv30"])
+        assert abs(table.loc["LONG", "rv30"] - legacy_yang_zhang(o[0, 40:], h[0, 40:], l[0, 40:], c[0, 40:])) < 1e-12